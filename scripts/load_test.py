@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+HTTP load generator for the request service examples (asyncio, stdlib only).
+
+Targets:
+  hexagonal  tasks/02_hexagonal_architecture/examples/src_python/main.py
+             POST /api/requests, POST /api/requests:batch
+  layered    tasks/05_infrastructure_layer router (/api/requests)
+             POST /api/requests, GET /api/requests/{id}
+
+Start the app first, e.g. the hexagonal one:
+
+  cd tasks/02_hexagonal_architecture/examples/src_python && uvicorn main:app --port 8000
+
+then:
+
+  # closed loop: 64 connections, as fast as the server answers
+  python scripts/load_test.py --profile hexagonal --concurrency 64 --duration 30
+
+  # open loop: 500 req/s regardless of response time, 80% create / 20% get
+  python scripts/load_test.py --profile layered --rate 500 --mix create=80,get=20 \
+      --json results/layered-500rps.json
+
+  # compare two runs
+  python scripts/load_test.py --compare results/before.json results/after.json
+
+In open-loop mode latency is measured from the scheduled send time, so
+time spent waiting for a free connection counts (no coordinated
+omission). Latencies are recorded in log-linear (HDR-style) histograms
+with ~1% relative precision.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ZONES = ["NORTH", "SOUTH", "EAST", "WEST"]
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+# === Histogram ===
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in microseconds (HdrHistogram layout).
+
+    Values below 2**sub_bucket_bits are exact; above that every power of two
+    is split into 2**(sub_bucket_bits - 1) linear sub-buckets, so the
+    relative error stays below 2 / 2**sub_bucket_bits (~1.6% for 7 bits).
+    """
+
+    def __init__(self, sub_bucket_bits=7, max_value_us=3_600_000_000):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        buckets = max(1, math.ceil(math.log2(max_value_us + 1)) - sub_bucket_bits + 1)
+        self.counts = [0] * (self.sub_bucket_count + buckets * self.sub_bucket_half)
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        # power-of-two bucket above the exact range, then the linear sub-bucket
+        bucket = value.bit_length() - self.sub_bucket_bits
+        sub = value >> bucket
+        return self.sub_bucket_count + (bucket - 1) * self.sub_bucket_half + (sub - self.sub_bucket_half)
+
+    def _value_at(self, index):
+        """Highest value that maps to the given slot."""
+        if index < self.sub_bucket_count:
+            return index
+        offset = index - self.sub_bucket_count
+        bucket = offset // self.sub_bucket_half + 1
+        sub = offset % self.sub_bucket_half + self.sub_bucket_half
+        return ((sub + 1) << bucket) - 1
+
+    def record(self, value_us):
+        value = max(0, int(value_us))
+        index = min(self._index(value), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.total += 1
+        self.max = max(self.max, value)
+        self.min = value if self.min is None else min(self.min, value)
+
+    def merge(self, other):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def value_at_percentile(self, percentile):
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(self.total * percentile / 100.0))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._value_at(index), self.max)
+        return self.max
+
+    def mean(self):
+        if not self.total:
+            return 0.0
+        return sum(
+            min(self._value_at(i), self.max) * c for i, c in enumerate(self.counts) if c
+        ) / self.total
+
+    def distribution(self, ticks_per_half=5):
+        """Rows (value_us, percentile, total_count) in HdrHistogram's
+        percentile-distribution layout: ticks_per_half rows per halving
+        of the distance to 100%, so the tail gets more rows."""
+        rows = []
+        if not self.total:
+            return rows
+        percentile = 0.0
+        while True:
+            value = self.value_at_percentile(percentile)
+            rows.append((value, percentile, math.ceil(self.total * percentile / 100.0)))
+            if percentile >= 100.0:
+                return rows
+            halvings = int(math.log2(100.0 / (100.0 - percentile))) + 1
+            percentile += 100.0 / (ticks_per_half * 2 ** halvings)
+            # past the resolution of the sample count, or already at max
+            if value >= self.max or 100.0 - percentile < 100.0 / self.total:
+                percentile = 100.0
+
+    def to_dict(self):
+        return {
+            "unit": "us",
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "total": self.total,
+            "min": self.min or 0,
+            "max": self.max,
+            "mean": round(self.mean(), 1),
+            "percentiles": {
+                f"p{p:g}": self.value_at_percentile(p) for p in PERCENTILES
+            },
+            # sparse buckets: [upper value, count]
+            "buckets": [
+                [self._value_at(i), c] for i, c in enumerate(self.counts) if c
+            ],
+        }
+
+
+# === Minimal HTTP/1.1 client (keep-alive) ===
+
+class HttpError(Exception):
+    pass
+
+
+class Connection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        payload = json.dumps(body).encode() if body is not None else b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+        )
+        if body is not None:
+            head += "Content-Type: application/json\r\n"
+        self.writer.write(head.encode() + b"\r\n" + payload)
+        try:
+            return await self._read_response()
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            self.close()
+            raise HttpError(f"connection lost: {e}") from e
+
+    async def _read_response(self):
+        header_block = await self.reader.readuntil(b"\r\n\r\n")
+        lines = header_block.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            data = b"".join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+# === Workload profiles ===
+
+def _volunteers(rng):
+    # distinct ids: a group rejects the same volunteer twice (HTTP 400)
+    return [f"vol-{n:04d}" for n in rng.sample(range(1, 10000), rng.randint(3, 5))]
+
+
+class HexagonalProfile:
+    """Lab 2 hexagonal FastAPI app."""
+    operations = ("create", "batch")
+
+    def __init__(self, rng, batch_size):
+        self.rng = rng
+        self.batch_size = batch_size
+
+    def build(self, operation, created_ids):
+        if operation == "create":
+            return "POST", "/api/requests", self._command()
+        if operation == "batch":
+            return "POST", "/api/requests:batch", {
+                "requests": [self._command() for _ in range(self.batch_size)]
+            }
+        raise ValueError(f"operation {operation!r} is not supported by the hexagonal app")
+
+    def _command(self):
+        return {
+            "coordinator_id": f"coordinator-{self.rng.randint(1, 50):03d}",
+            "zone": self.rng.choice(ZONES),
+            "volunteer_ids": _volunteers(self.rng),
+        }
+
+
+class LayeredProfile:
+    """Lab 5 infrastructure-layer router."""
+    operations = ("create", "get")
+
+    def __init__(self, rng, batch_size):
+        self.rng = rng
+
+    def build(self, operation, created_ids):
+        if operation == "create":
+            lat = self.rng.uniform(51.5, 52.5)
+            lon = self.rng.uniform(23.5, 24.5)
+            return "POST", "/api/requests", {
+                "coordinator_id": f"COORD-{self.rng.randint(1, 50)}",
+                "zone_name": self.rng.choice(ZONES).title(),
+                "zone_bounds": [lat, lat + 0.1, lon, lon + 0.1],
+            }
+        if operation == "get":
+            if not created_ids:
+                return None  # nothing to read yet: turned into a create
+            request_id = self.rng.choice(created_ids)
+            return "GET", f"/api/requests/{request_id}", None
+        raise ValueError(f"operation {operation!r} is not supported by the layered app")
+
+
+PROFILES = {"hexagonal": HexagonalProfile, "layered": LayeredProfile}
+
+
+def parse_mix(text, profile_cls):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in profile_cls.operations:
+            raise SystemExit(
+                f"unknown operation {name!r}; {profile_cls.__name__} supports: "
+                + ", ".join(profile_cls.operations)
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+# === Runner ===
+
+class Stats:
+    def __init__(self):
+        self.histograms = {}
+        self.statuses = Counter()
+        self.errors = Counter()
+
+    def histogram(self, operation):
+        if operation not in self.histograms:
+            self.histograms[operation] = LatencyHistogram()
+        return self.histograms[operation]
+
+
+class LoadTest:
+    def __init__(self, args):
+        url = urlsplit(args.url)
+        self.host = url.hostname or "localhost"
+        self.port = url.port or 80
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.profile = PROFILES[args.profile](self.rng, args.batch_size)
+        self.mix = parse_mix(args.mix or ",".join(self.profile.operations[:1]), type(self.profile))
+        self.operations = list(self.mix)
+        self.weights = [self.mix[name] for name in self.operations]
+        self.created_ids = []
+        self.stats = Stats()
+        self.recording = False
+        self.completed = 0
+
+    async def run(self):
+        self.pool = asyncio.Queue()
+        for _ in range(self.args.concurrency):
+            self.pool.put_nowait(Connection(self.host, self.port))
+
+        if self.args.warmup:
+            await self._phase(self.args.warmup)
+        self.recording = True
+        started = time.perf_counter()
+        await self._phase(self.args.duration)
+        elapsed = time.perf_counter() - started
+
+        while not self.pool.empty():
+            self.pool.get_nowait().close()
+        return elapsed
+
+    async def _phase(self, duration):
+        deadline = time.perf_counter() + duration
+        if self.args.rate:
+            await self._open_loop(deadline)
+        else:
+            await asyncio.gather(*(
+                self._closed_loop_worker(deadline) for _ in range(self.args.concurrency)
+            ))
+
+    async def _closed_loop_worker(self, deadline):
+        while time.perf_counter() < deadline:
+            await self._one(time.perf_counter())
+
+    async def _open_loop(self, deadline):
+        """Send at the configured rate whether or not responses keep up."""
+        interval = 1.0 / self.args.rate
+        tasks = set()
+        next_send = time.perf_counter()
+        while next_send < deadline:
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(self._one(next_send))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            if self.args.poisson:
+                next_send += self.rng.expovariate(self.args.rate)
+            else:
+                next_send += interval
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _one(self, scheduled):
+        operation = self.rng.choices(self.operations, self.weights)[0]
+        built = self.profile.build(operation, self.created_ids)
+        if built is None:
+            operation = "create"
+            built = self.profile.build(operation, self.created_ids)
+        method, path, body = built
+
+        connection = await self.pool.get()
+        try:
+            status, data = await connection.request(method, path, body)
+            error = None
+        except (HttpError, OSError, ValueError) as e:
+            status, data, error = None, b"", type(e).__name__
+        finally:
+            self.pool.put_nowait(connection)
+        latency_us = (time.perf_counter() - scheduled) * 1e6
+
+        if operation == "create" and status is not None and 200 <= status < 300:
+            self._remember_id(data)
+        if not self.recording:
+            return
+        self.completed += 1
+        if error is not None:
+            self.stats.errors[f"{operation}:{error}"] += 1
+            return
+        self.stats.statuses[f"{operation}:{status}"] += 1
+        if 200 <= status < 300:
+            self.stats.histogram(operation).record(latency_us)
+        else:
+            self.stats.errors[f"{operation}:HTTP {status}"] += 1
+
+    def _remember_id(self, data):
+        try:
+            request_id = json.loads(data).get("request_id")
+        except (ValueError, AttributeError):
+            return
+        if request_id:
+            if len(self.created_ids) < 100_000:
+                self.created_ids.append(request_id)
+            else:
+                self.created_ids[self.rng.randrange(len(self.created_ids))] = request_id
+
+
+# === Reporting ===
+
+def build_report(test, elapsed):
+    args = test.args
+    overall = LatencyHistogram()
+    for histogram in test.stats.histograms.values():
+        overall.merge(histogram)
+    errors = sum(test.stats.errors.values())
+    return {
+        "config": {
+            "url": args.url,
+            "profile": args.profile,
+            "mix": test.mix,
+            "concurrency": args.concurrency,
+            "rate": args.rate,
+            "poisson": args.poisson,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "batch_size": args.batch_size,
+        },
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        "elapsed_s": round(elapsed, 3),
+        "completed": test.completed,
+        "errors": errors,
+        "throughput_rps": round(overall.total / elapsed, 1) if elapsed else 0.0,
+        "statuses": dict(test.stats.statuses),
+        "error_kinds": dict(test.stats.errors),
+        "latency": {
+            "all": overall.to_dict(),
+            **{name: h.to_dict() for name, h in test.stats.histograms.items()},
+        },
+    }
+
+
+def print_report(report, histograms):
+    cfg = report["config"]
+    mode = f"open loop {cfg['rate']:g} req/s" if cfg["rate"] else "closed loop"
+    print(f"\n{cfg['profile']} @ {cfg['url']}  ({mode}, {cfg['concurrency']} connections)")
+    print(f"completed {report['completed']:,} in {report['elapsed_s']:.1f}s, "
+          f"{report['throughput_rps']:,.1f} ok req/s, {report['errors']:,} errors")
+    for kind, count in sorted(report["error_kinds"].items()):
+        print(f"  {kind}: {count:,}")
+
+    print(f"\n{'operation':<10} {'count':>9} {'mean':>9} "
+          + " ".join(f"{'p' + format(p, 'g'):>9}" for p in PERCENTILES) + f" {'max':>9}   (ms)")
+    for name, data in report["latency"].items():
+        if not data["total"]:
+            continue
+        values = [data["percentiles"][f"p{p:g}"] for p in PERCENTILES]
+        print(f"{name:<10} {data['total']:>9,} {data['mean'] / 1e3:>9.2f} "
+              + " ".join(f"{v / 1e3:>9.2f}" for v in values) + f" {data['max'] / 1e3:>9.2f}")
+
+    overall = histograms.get("all")
+    if overall is not None and overall.total:
+        print(f"\n{'Value(ms)':>12} {'Percentile':>12} {'TotalCount':>12} {'1/(1-P)':>10}")
+        for value, percentile, count in overall.distribution():
+            inverse = "inf" if percentile >= 100 else f"{1 / (1 - percentile / 100):.2f}"
+            print(f"{value / 1e3:>12.3f} {percentile / 100:>12.6f} {count:>12,} {inverse:>10}")
+
+
+def compare(paths):
+    runs = [json.loads(Path(p).read_text(encoding="utf-8")) for p in paths]
+    base = runs[0]
+    keys = ["throughput_rps"] + [f"p{p:g}" for p in PERCENTILES]
+    print(f"{'run':<40} " + " ".join(f"{k:>16}" for k in keys))
+    for path, run in zip(paths, runs):
+        cells = []
+        for key in keys:
+            if key == "throughput_rps":
+                value, ref, unit = run[key], base[key], ""
+            else:
+                value = run["latency"]["all"]["percentiles"][key] / 1e3
+                ref = base["latency"]["all"]["percentiles"][key] / 1e3
+                unit = "ms"
+            delta = "" if run is base or not ref else f" {(value - ref) / ref:+.0%}"
+            cells.append(f"{value:,.1f}{unit}{delta}")
+        print(f"{Path(path).name:<40} " + " ".join(f"{c:>16}" for c in cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load generator for the request service")
+    parser.add_argument("--url", default="http://localhost:8000", help="base URL of the running app")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="hexagonal")
+    parser.add_argument("--mix", help="operation weights, e.g. create=80,get=20 (default: create)")
+    parser.add_argument("--concurrency", type=int, default=32, help="connections (closed-loop workers)")
+    parser.add_argument("--rate", type=float, help="open-loop arrival rate, req/s (default: closed loop)")
+    parser.add_argument("--poisson", action="store_true", help="exponential inter-arrival times")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before the run")
+    parser.add_argument("--batch-size", type=int, default=10, help="commands per batch request")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the report (with histogram buckets) to this file")
+    parser.add_argument("--compare", nargs="+", metavar="REPORT", help="compare saved JSON reports and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    test = LoadTest(args)
+    try:
+        elapsed = asyncio.run(test.run())
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    report = build_report(test, elapsed)
+    overall = LatencyHistogram()
+    for histogram in test.stats.histograms.values():
+        overall.merge(histogram)
+    print_report(report, {"all": overall})
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nreport written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +0,0 @@
-"""Application Layer: Inbound Ports"""
-from .create_request_use_case import CreateRequestUseCase, CreateRequestCommand
-
-__all__ = ['CreateRequestUseCase', 'CreateRequestCommand']
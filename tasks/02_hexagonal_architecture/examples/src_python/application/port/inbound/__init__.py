@@ -0,0 +1,16 @@
+"""Application Layer: Inbound Ports"""
+from .create_request_use_case import CreateRequestUseCase, CreateRequestCommand
+from .create_requests_use_case import CreateRequestsUseCase, CreateRequestResult
+from .async_create_request_use_case import (
+    AsyncCreateRequestUseCase,
+    AsyncCreateRequestsUseCase,
+)
+
+__all__ = [
+    'CreateRequestUseCase',
+    'CreateRequestCommand',
+    'CreateRequestsUseCase',
+    'CreateRequestResult',
+    'AsyncCreateRequestUseCase',
+    'AsyncCreateRequestsUseCase',
+]
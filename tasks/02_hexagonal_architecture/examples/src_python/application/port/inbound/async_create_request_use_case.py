@@ -0,0 +1,46 @@
+"""
+Application Layer: AsyncCreateRequestUseCase (Входящий порт)
+
+Асинхронные варианты use-case создания заявок.
+Используются входящими адаптерами на asyncio (FastAPI), чтобы
+ожидание репозитория и SMS-шлюза не блокировало event loop.
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+from .create_request_use_case import CreateRequestCommand
+from .create_requests_use_case import CreateRequestResult
+
+
+class AsyncCreateRequestUseCase(ABC):
+    """Входящий порт: Создание заявки (async)"""
+    
+    @abstractmethod
+    async def create_request(self, command: CreateRequestCommand) -> str:
+        """
+        Создать заявку на поисково-спасательную операцию
+        
+        Returns:
+            ID созданной заявки
+            
+        Raises:
+            ValueError: если данные некорректны
+        """
+        pass
+
+
+class AsyncCreateRequestsUseCase(ABC):
+    """Входящий порт: Пакетное создание заявок (async)"""
+    
+    @abstractmethod
+    async def create_requests(
+        self,
+        commands: List[CreateRequestCommand]
+    ) -> List[CreateRequestResult]:
+        """
+        Создать несколько заявок за один вызов
+        
+        Returns:
+            Результаты в том же порядке, что и команды
+        """
+        pass
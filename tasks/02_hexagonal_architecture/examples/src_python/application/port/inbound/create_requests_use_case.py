@@ -0,0 +1,46 @@
+"""
+Application Layer: CreateRequestsUseCase (Входящий порт)
+
+Интерфейс пакетного создания заявок.
+Во время крупных происшествий координатор подаёт десятки заявок
+за один вызов вместо десятков отдельных.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .create_request_use_case import CreateRequestCommand
+
+
+@dataclass
+class CreateRequestResult:
+    """DTO: Результат создания одной заявки из пакета"""
+    request_id: Optional[str] = None  # ID, если заявка создана
+    error: Optional[str] = None       # Причина отказа, если нет
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+class CreateRequestsUseCase(ABC):
+    """Входящий порт: Пакетное создание заявок"""
+    
+    @abstractmethod
+    def create_requests(
+        self,
+        commands: List[CreateRequestCommand]
+    ) -> List[CreateRequestResult]:
+        """
+        Создать несколько заявок за один вызов
+        
+        Некорректная команда не прерывает пакет: для неё
+        возвращается результат с ошибкой.
+        
+        Args:
+            commands: Команды с данными заявок
+            
+        Returns:
+            Результаты в том же порядке, что и команды
+        """
+        pass
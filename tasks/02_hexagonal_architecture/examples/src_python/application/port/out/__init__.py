@@ -0,0 +1,16 @@
+"""Application Layer: Outbound Ports"""
+from .request_repository import RequestRepository
+from .notification_service import NotificationService, SmsMessage, DeliveryStatus
+from .request_id_allocator import RequestIdAllocator
+from .async_request_repository import AsyncRequestRepository
+from .async_notification_service import AsyncNotificationService
+
+__all__ = [
+    'RequestRepository',
+    'NotificationService',
+    'SmsMessage',
+    'DeliveryStatus',
+    'RequestIdAllocator',
+    'AsyncRequestRepository',
+    'AsyncNotificationService',
+]
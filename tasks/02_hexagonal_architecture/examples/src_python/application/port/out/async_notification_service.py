@@ -0,0 +1,30 @@
+"""
+Application Layer: AsyncNotificationService (Исходящий порт)
+
+Асинхронный вариант NotificationService для сервисов на asyncio.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List
+
+from .notification_service import SmsMessage
+
+
+class AsyncNotificationService(ABC):
+    """Исходящий порт: Уведомления участников (async)"""
+    
+    @abstractmethod
+    async def send_sms(self, phone: str, message: str) -> None:
+        """Отправить SMS"""
+        pass
+    
+    async def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        """
+        Отправить пакет SMS
+        
+        Реализация по умолчанию отправляет сообщения конкурентно;
+        адаптеры с пакетным API переопределяют метод.
+        """
+        await asyncio.gather(*(
+            self.send_sms(sms.phone, sms.message) for sms in messages
+        ))
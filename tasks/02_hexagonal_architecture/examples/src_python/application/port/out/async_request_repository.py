@@ -0,0 +1,43 @@
+"""
+Application Layer: AsyncRequestRepository (Исходящий порт)
+
+Асинхронный вариант RequestRepository для сервисов на asyncio.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from domain import Request, RequestStatus, Zone
+
+
+class AsyncRequestRepository(ABC):
+    """Исходящий порт: Хранилище заявок (async)"""
+    
+    @abstractmethod
+    async def save(self, request: Request) -> None:
+        """Сохранить заявку (создать или обновить)"""
+        pass
+    
+    @abstractmethod
+    async def save_many(self, requests: List[Request]) -> None:
+        """Сохранить несколько заявок за одну операцию записи"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, request_id: str) -> Optional[Request]:
+        """Найти заявку по ID (None, если не найдена)"""
+        pass
+    
+    @abstractmethod
+    async def find_all(self) -> List[Request]:
+        """Получить все заявки"""
+        pass
+    
+    @abstractmethod
+    async def find_by(
+        self,
+        status: Optional[RequestStatus] = None,
+        zone: Optional[Zone] = None,
+        coordinator_id: Optional[str] = None
+    ) -> List[Request]:
+        """Найти заявки по статусу, зоне и/или координатору (AND)"""
+        pass
@@ -0,0 +1,55 @@
+"""
+Application Layer: NotificationService (Исходящий порт)
+
+Интерфейс отправки уведомлений участникам.
+Реализуется адаптерами инфраструктуры (SMS-шлюз, mock, очередь, ...).
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List
+from uuid import uuid4
+
+
+class DeliveryStatus(Enum):
+    """Статус доставки уведомления"""
+    
+    PENDING = "PENDING"  # Ожидает отправки (или повтора)
+    SENT = "SENT"        # Принято шлюзом
+    FAILED = "FAILED"    # Попытки исчерпаны
+
+
+@dataclass(frozen=True)
+class SmsMessage:
+    """DTO: SMS-сообщение"""
+    phone: str
+    message: str
+    message_id: str = field(default_factory=lambda: uuid4().hex)
+
+
+class NotificationService(ABC):
+    """Исходящий порт: Уведомления участников"""
+    
+    @abstractmethod
+    def send_sms(self, phone: str, message: str) -> None:
+        """
+        Отправить SMS
+        
+        Args:
+            phone: Номер телефона получателя
+            message: Текст сообщения
+        """
+        pass
+    
+    def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        """
+        Отправить пакет SMS
+        
+        Реализация по умолчанию отправляет сообщения по одному;
+        адаптеры шлюзов с пакетным API переопределяют метод.
+        
+        Args:
+            messages: Сообщения для отправки
+        """
+        for sms in messages:
+            self.send_sms(sms.phone, sms.message)
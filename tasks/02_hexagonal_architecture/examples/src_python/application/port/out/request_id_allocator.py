@@ -0,0 +1,38 @@
+"""
+Application Layer: RequestIdAllocator (Исходящий порт)
+
+Интерфейс выдачи ID заявок.
+
+Требования:
+- ID формата REQ-YYYY-NNNN
+- ID никогда не повторяется (в том числе между процессами и после рестарта)
+- Выдача ID не требует повторных попыток и глобальной блокировки
+- try_next_id() не блокирует: async-сервисы вызывают его прямо в
+  event loop, а next_id() — в пуле потоков, если try_next_id() не смог
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class RequestIdAllocator(ABC):
+    """Исходящий порт: Выдача уникальных ID заявок"""
+    
+    @abstractmethod
+    def next_id(self) -> str:
+        """
+        Выдать следующий ID заявки
+        
+        Returns:
+            Уникальный ID (например, "REQ-2024-0042")
+        """
+        pass
+    
+    def try_next_id(self) -> Optional[str]:
+        """
+        Выдать ID, только если для этого не нужен ввод-вывод
+        
+        Returns:
+            ID или None, если нужно обращение к источнику номеров
+            (тогда вызывающий вызывает next_id() вне event loop)
+        """
+        return None
@@ -0,0 +1,75 @@
+"""
+Application Layer: RequestRepository (Исходящий порт)
+
+Интерфейс хранилища заявок.
+Реализуется адаптерами инфраструктуры (in-memory, PostgreSQL, ...).
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from domain import Request, RequestStatus, Zone
+
+
+class RequestRepository(ABC):
+    """Исходящий порт: Хранилище заявок"""
+    
+    @abstractmethod
+    def save(self, request: Request) -> None:
+        """
+        Сохранить заявку (создать или обновить)
+        
+        Args:
+            request: Агрегат заявки
+        """
+        pass
+    
+    @abstractmethod
+    def save_many(self, requests: List[Request]) -> None:
+        """
+        Сохранить несколько заявок за одну операцию записи
+        
+        Args:
+            requests: Агрегаты заявок
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_id(self, request_id: str) -> Optional[Request]:
+        """
+        Найти заявку по ID
+        
+        Args:
+            request_id: ID заявки (например, "REQ-2024-0042")
+            
+        Returns:
+            Заявка или None, если не найдена
+        """
+        pass
+    
+    @abstractmethod
+    def find_all(self) -> List[Request]:
+        """Получить все заявки"""
+        pass
+    
+    def find_by(
+        self,
+        status: Optional[RequestStatus] = None,
+        zone: Optional[Zone] = None,
+        coordinator_id: Optional[str] = None
+    ) -> List[Request]:
+        """
+        Найти заявки по статусу, зоне и/или координатору
+        
+        Критерии объединяются через AND; None — критерий не задан.
+        Реализация по умолчанию просматривает все заявки;
+        адаптеры с индексами переопределяют метод.
+        
+        Пример: все активные заявки в северной зоне
+            repository.find_by(status=RequestStatus.ACTIVE, zone=Zone.NORTH)
+        """
+        return [
+            request for request in self.find_all()
+            if (status is None or request.status == status)
+            and (zone is None or request.zone == zone)
+            and (coordinator_id is None or request.coordinator_id == coordinator_id)
+        ]
@@ -1,4 +1,6 @@
 """Application Layer: Services"""
 from .request_service import RequestService
+from .async_request_service import AsyncRequestService
+from .sync_request_service import SyncRequestService
 
-__all__ = ['RequestService']
+__all__ = ['RequestService', 'AsyncRequestService', 'SyncRequestService']
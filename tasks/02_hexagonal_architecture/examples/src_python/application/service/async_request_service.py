@@ -0,0 +1,95 @@
+"""
+Application Layer: AsyncRequestService
+
+Асинхронная реализация use-case создания заявок.
+Тот же сценарий, что и в RequestService, но ожидание репозитория
+и уведомлений не блокирует event loop: пока одна заявка ждёт
+ввода-вывода, обрабатываются другие.
+
+ID заявки берётся через try_next_id() прямо в event loop; аренда
+нового блока номеров (файловая блокировка, fsync) уходит в пул
+потоков.
+"""
+import asyncio
+from typing import List, Tuple
+
+from application.port.inbound import (
+    AsyncCreateRequestUseCase,
+    AsyncCreateRequestsUseCase,
+    CreateRequestCommand,
+    CreateRequestResult,
+)
+from application.port.out import (
+    AsyncRequestRepository,
+    AsyncNotificationService,
+    RequestIdAllocator,
+)
+from domain import Request
+
+from .request_assembler import RequestAssembler
+
+
+class AsyncRequestService(AsyncCreateRequestUseCase, AsyncCreateRequestsUseCase):
+    """Application Service: Управление заявками (async)"""
+    
+    def __init__(
+        self,
+        repository: AsyncRequestRepository,
+        notifications: AsyncNotificationService,
+        request_ids: RequestIdAllocator
+    ):
+        """
+        Args:
+            repository: Репозиторий заявок (исходящий порт, async)
+            notifications: Сервис уведомлений (исходящий порт, async)
+            request_ids: Выдача ID заявок (исходящий порт)
+        """
+        self._repository = repository
+        self._notifications = notifications
+        self._request_ids = request_ids
+        self._assembler = RequestAssembler(request_ids)
+    
+    async def create_request(self, command: CreateRequestCommand) -> str:
+        """Создать заявку (шаги — как в RequestService.create_request)"""
+        request = await self._build_request(command)
+        
+        await self._repository.save(request)
+        
+        await self._notifications.send_sms_many(
+            self._assembler.build_notifications([(request, command)])
+        )
+        
+        return request.id
+    
+    async def create_requests(
+        self,
+        commands: List[CreateRequestCommand]
+    ) -> List[CreateRequestResult]:
+        """Создать пакет заявок (шаги — как в RequestService.create_requests)"""
+        results: List[CreateRequestResult] = []
+        created: List[Tuple[Request, CreateRequestCommand]] = []
+        
+        for command in commands:
+            try:
+                request = await self._build_request(command)
+            except ValueError as e:
+                results.append(CreateRequestResult(error=str(e)))
+                continue
+            created.append((request, command))
+            results.append(CreateRequestResult(request_id=request.id))
+        
+        if created:
+            await self._repository.save_many([request for request, _ in created])
+            await self._notifications.send_sms_many(
+                self._assembler.build_notifications(created)
+            )
+        
+        return results
+    
+    async def _build_request(self, command: CreateRequestCommand) -> Request:
+        """Собрать заявку, не блокируя event loop выдачей ID"""
+        zone, group = self._assembler.build_group(command)
+        request_id = self._request_ids.try_next_id()
+        if request_id is None:
+            request_id = await asyncio.to_thread(self._request_ids.next_id)
+        return self._assembler.assemble(zone, group, command, request_id)
@@ -0,0 +1,105 @@
+"""
+Application Layer: RequestAssembler
+
+Общая часть use-case создания заявки для синхронного
+и асинхронного сервисов: сборка агрегата и текстов SMS.
+Не выполняет ввод-вывод, кроме build_request: выдача ID может
+обратиться к источнику блоков. Асинхронный сервис получает ID
+сам (см. AsyncRequestService) и вызывает build_group и assemble.
+"""
+from typing import Iterable, List, Tuple
+
+from application.port.inbound import CreateRequestCommand
+from application.port.out import SmsMessage, RequestIdAllocator
+from domain import Request, Group, Zone
+
+
+class RequestAssembler:
+    """Сборка заявок и уведомлений из команд"""
+    
+    def __init__(self, request_ids: RequestIdAllocator):
+        """
+        Args:
+            request_ids: Выдача ID заявок (исходящий порт)
+        """
+        self._request_ids = request_ids
+    
+    def build_request(self, command: CreateRequestCommand) -> Request:
+        """
+        Собрать активированную заявку с группой
+        
+        Raises:
+            ValueError: если данные команды нарушают бизнес-правила
+        """
+        zone, group = self.build_group(command)
+        return self.assemble(zone, group, command, self._request_ids.next_id())
+    
+    @staticmethod
+    def build_group(command: CreateRequestCommand) -> Tuple[Zone, Group]:
+        """
+        Проверить зону и сформировать группу с участниками
+        
+        Выполняется до выдачи ID, чтобы некорректные команды
+        не тратили номера: здесь же проверяется размер группы
+        (то же правило, что в Request.assign_group).
+        
+        Raises:
+            ValueError: если зона или участники некорректны
+        """
+        zone = Zone.from_string(command.zone)
+        
+        group_id = f"G-{len(command.volunteer_ids):02d}"
+        group = Group(group_id)
+        
+        for volunteer_id in command.volunteer_ids:
+            group.add_member(volunteer_id)
+        
+        if not group.is_ready:
+            raise ValueError(
+                f"Размер группы должен быть от 3 до 5 участников, "
+                f"текущий: {group.member_count}"
+            )
+        
+        return zone, group
+    
+    @staticmethod
+    def assemble(
+        zone: Zone,
+        group: Group,
+        command: CreateRequestCommand,
+        request_id: str
+    ) -> Request:
+        """
+        Создать агрегат Request (Domain Layer), назначить группу и активировать
+        
+        Raises:
+            ValueError: если группа нарушает бизнес-правила заявки
+        """
+        request = Request(
+            request_id=request_id,
+            coordinator_id=command.coordinator_id,
+            zone=zone
+        )
+        
+        request.assign_group(group)
+        request.activate()
+        
+        return request
+    
+    @staticmethod
+    def build_notifications(
+        created: Iterable[Tuple[Request, CreateRequestCommand]]
+    ) -> List[SmsMessage]:
+        """SMS участникам созданных заявок"""
+        messages: List[SmsMessage] = []
+        for request, command in created:
+            message = (
+                f"Вы назначены в группу {request.group.id} "
+                f"для поиска в зоне {request.zone.display_name}"
+            )
+            for volunteer_id in command.volunteer_ids:
+                # В реальной системе здесь нужно получить номер телефона
+                # через VolunteerRepository, но для примера упростим
+                phone = f"+375-29-XXX-{volunteer_id[-4:]}"
+                messages.append(SmsMessage(phone=phone, message=message))
+        return messages
@@ -4,12 +4,25 @@ Application Layer: RequestService
 Реализация use-case создания заявки.
 Оркестрирует Domain Layer и вызывает внешние сервисы через порты.
 """
-from application.port.in import CreateRequestUseCase, CreateRequestCommand
-from application.port.out import RequestRepository, NotificationService
-from domain import Request, Group, Zone
+from typing import List, Tuple
 
+from application.port.inbound import (
+    CreateRequestUseCase,
+    CreateRequestCommand,
+    CreateRequestsUseCase,
+    CreateRequestResult,
+)
+from application.port.out import (
+    RequestRepository,
+    NotificationService,
+    RequestIdAllocator,
+)
+from domain import Request
 
-class RequestService(CreateRequestUseCase):
+from .request_assembler import RequestAssembler
+
+
+class RequestService(CreateRequestUseCase, CreateRequestsUseCase):
     """
     Application Service: Управление заявками
     
@@ -20,7 +33,8 @@ class RequestService(CreateRequestUseCase):
     def __init__(
         self,
         repository: RequestRepository,
-        notifications: NotificationService
+        notifications: NotificationService,
+        request_ids: RequestIdAllocator
     ):
         """
         Инициализация сервиса
@@ -28,9 +42,11 @@ class RequestService(CreateRequestUseCase):
         Args:
             repository: Репозиторий заявок (исходящий порт)
             notifications: Сервис уведомлений (исходящий порт)
+            request_ids: Выдача ID заявок (исходящий порт)
         """
         self._repository = repository
         self._notifications = notifications
+        self._assembler = RequestAssembler(request_ids)
     
     def create_request(self, command: CreateRequestCommand) -> str:
         """
@@ -42,8 +58,8 @@ class RequestService(CreateRequestUseCase):
         3. Назначить группу к заявке
         4. Активировать заявку
         5. Сохранить через репозиторий (исходящий порт)
-        6. Отправить SMS уведомления (исходящий порт)
-        7. Вернуть ID заявки
+        6. Поставить SMS уведомления в очередь (исходящий порт)
+        7. Вернуть ID заявки (не дожидаясь SMS-шлюза)
         
         Args:
             command: Команда создания заявки
@@ -54,39 +70,64 @@ class RequestService(CreateRequestUseCase):
         Raises:
             ValueError: если данные некорректны
         """
-        # 1. Создать агрегат Request (Domain Layer)
-        zone = Zone.from_string(command.zone)
-        request = Request(
-            coordinator_id=command.coordinator_id,
-            zone=zone
-        )
-        
-        # 2. Сформировать группу с участниками
-        group_id = f"G-{len(command.volunteer_ids):02d}"
-        group = Group(group_id)
-        
-        for volunteer_id in command.volunteer_ids:
-            group.add_member(volunteer_id)
-        
-        # 3. Назначить группу к заявке
-        request.assign_group(group)
-        
-        # 4. Активировать заявку
-        request.activate()
+        # 1-4. Собрать активированный агрегат (Domain Layer)
+        request = self._assembler.build_request(command)
         
         # 5. Сохранить через репозиторий (исходящий порт)
         self._repository.save(request)
         
-        # 6. Отправить SMS уведомления участникам (исходящий порт)
-        for volunteer_id in command.volunteer_ids:
-            message = (
-                f"Вы назначены в группу {group.id} "
-                f"для поиска в зоне {zone.display_name}"
-            )
-            # В реальной системе здесь нужно получить номер телефона
-            # через VolunteerRepository, но для примера упростим
-            phone = f"+375-29-XXX-{volunteer_id[-4:]}"
-            self._notifications.send_sms(phone, message)
+        # 6. Поставить SMS уведомления участникам в очередь (исходящий порт)
+        self._notify_volunteers([(request, command)])
         
         # 7. Вернуть ID заявки
         return request.id
+    
+    def create_requests(
+        self,
+        commands: List[CreateRequestCommand]
+    ) -> List[CreateRequestResult]:
+        """
+        Создать пакет заявок
+        
+        Шаги:
+        1. Собрать агрегат для каждой команды (ошибки — в результат)
+        2. Сохранить все корректные заявки одним save_many
+        3. Отправить уведомления один раз на весь пакет
+        
+        Args:
+            commands: Команды создания заявок
+        
+        Returns:
+            Результаты в порядке команд: ID или текст ошибки
+        """
+        results: List[CreateRequestResult] = []
+        created: List[Tuple[Request, CreateRequestCommand]] = []
+        
+        # 1. Валидация и сборка агрегатов
+        for command in commands:
+            try:
+                request = self._assembler.build_request(command)
+            except ValueError as e:
+                results.append(CreateRequestResult(error=str(e)))
+                continue
+            created.append((request, command))
+            results.append(CreateRequestResult(request_id=request.id))
+        
+        if created:
+            # 2. Одна операция записи на весь пакет
+            self._repository.save_many([request for request, _ in created])
+            
+            # 3. Уведомления после сохранения всего пакета
+            self._notify_volunteers(created)
+        
+        return results
+    
+    def _notify_volunteers(
+        self,
+        created: List[Tuple[Request, CreateRequestCommand]]
+    ) -> None:
+        """Поставить SMS участникам созданных заявок одним пакетом"""
+        messages = self._assembler.build_notifications(created)
+        
+        # Доставка (очередь, повторы, статусы) — забота адаптера
+        self._notifications.send_sms_many(messages)
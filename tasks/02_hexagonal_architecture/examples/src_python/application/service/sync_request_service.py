@@ -0,0 +1,61 @@
+"""
+Application Layer: SyncRequestService
+
+Синхронная обёртка (shim) над асинхронным сервисом заявок.
+Позволяет вызывать AsyncRequestService из обычного кода
+(например, example_cli.py) без собственного event loop.
+"""
+import asyncio
+import threading
+from typing import Coroutine, List, TypeVar
+
+from application.port.inbound import (
+    CreateRequestUseCase,
+    CreateRequestsUseCase,
+    AsyncCreateRequestUseCase,
+    AsyncCreateRequestsUseCase,
+    CreateRequestCommand,
+    CreateRequestResult,
+)
+
+T = TypeVar("T")
+
+
+class SyncRequestService(CreateRequestUseCase, CreateRequestsUseCase):
+    """
+    Shim: синхронные use-case поверх асинхронных
+
+    Корутины выполняются в отдельном потоке со своим event loop,
+    поэтому обёртку можно вызывать и из кода, где уже работает
+    другой event loop.
+    """
+    
+    def __init__(
+        self,
+        use_case: AsyncCreateRequestUseCase,
+        batch_use_case: AsyncCreateRequestsUseCase
+    ):
+        self._use_case = use_case
+        self._batch_use_case = batch_use_case
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever,
+            name="sync-request-service-loop",
+            daemon=True
+        ).start()
+    
+    def create_request(self, command: CreateRequestCommand) -> str:
+        return self._run(self._use_case.create_request(command))
+    
+    def create_requests(
+        self,
+        commands: List[CreateRequestCommand]
+    ) -> List[CreateRequestResult]:
+        return self._run(self._batch_use_case.create_requests(commands))
+    
+    def close(self) -> None:
+        """Остановить фоновый event loop"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+    
+    def _run(self, coroutine: Coroutine[None, None, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
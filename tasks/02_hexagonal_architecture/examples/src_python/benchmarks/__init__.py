@@ -0,0 +1 @@
+"""Бенчмарки примера (запуск: python -m benchmarks.<имя>)"""
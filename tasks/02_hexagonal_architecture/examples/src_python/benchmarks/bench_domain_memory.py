@@ -0,0 +1,146 @@
+"""
+Benchmark: память и скорость создания Request/Group
+
+Сравнение компактных доменных объектов (__slots__, кортеж участников,
+интернированные ID) с прежним представлением (__dict__, список
+участников, копия списка при каждом чтении member_ids).
+
+Запуск (из каталога src_python):
+    python -m benchmarks.bench_domain_memory
+    python -m benchmarks.bench_domain_memory --count 200000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from domain import Request, Group, Zone, RequestStatus
+
+ZONES = list(Zone)
+MEMBERS_PER_GROUP = 4
+
+
+class LegacyGroup:
+    """Прежняя Group: __dict__ и список участников"""
+
+    def __init__(self, group_id: str):
+        self._id = group_id
+        self._member_ids: List[str] = []
+        self._leader_id: Optional[str] = None
+
+    def add_member(self, member_id: str) -> None:
+        if len(self._member_ids) >= 5:
+            raise ValueError("Группа уже полная (максимум 5 участников)")
+        if member_id in self._member_ids:
+            raise ValueError(f"Участник {member_id} уже в группе")
+        self._member_ids.append(member_id)
+        if len(self._member_ids) == 1:
+            self._leader_id = member_id
+
+    @property
+    def member_ids(self) -> List[str]:
+        return self._member_ids.copy()
+
+    @property
+    def member_count(self) -> int:
+        return len(self._member_ids)
+
+
+class LegacyRequest:
+    """Прежний Request: __dict__, ID координатора не интернируется"""
+
+    def __init__(self, request_id: str, coordinator_id: str, zone: Zone):
+        self._id = request_id
+        self._coordinator_id = coordinator_id
+        self._zone = zone
+        self._group: Optional[LegacyGroup] = None
+        self._status = RequestStatus.DRAFT
+        self._created_at = datetime.now()
+
+    def assign_group(self, group: LegacyGroup) -> None:
+        member_count = group.member_count
+        if member_count < 3 or member_count > 5:
+            raise ValueError("Размер группы должен быть от 3 до 5 участников")
+        self._group = group
+
+    def activate(self) -> None:
+        self._status = RequestStatus.ACTIVE
+
+    @property
+    def group(self) -> Optional[LegacyGroup]:
+        return self._group
+
+
+def build(count: int, request_cls, group_cls) -> list:
+    """
+    Заявки с собственной группой у каждой
+
+    ID координаторов и участников формируются заново для каждой заявки
+    (как при чтении из JSON/БД), поэтому одинаковые значения — разные
+    строки, пока их не интернирует доменный объект.
+    """
+    requests = []
+    for i in range(count):
+        group = group_cls(f"G-{MEMBERS_PER_GROUP:02d}")
+        for m in range(MEMBERS_PER_GROUP):
+            group.add_member(f"volunteer-{(i + m) % 500:04d}")
+        request = request_cls(
+            f"REQ-2024-{i:07d}",
+            f"coordinator-{i % 100:03d}",
+            ZONES[i % len(ZONES)]
+        )
+        request.assign_group(group)
+        request.activate()
+        requests.append(request)
+    return requests
+
+
+def measure_memory(count: int, factory: Callable[[], list]) -> float:
+    """Байт на заявку (вместе с группой и строками)"""
+    gc.collect()
+    tracemalloc.start()
+    objects = factory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / count
+
+
+def measure_rate(count: int, factory: Callable[[], list]) -> float:
+    """Заявок в секунду"""
+    gc.collect()
+    start = time.perf_counter()
+    factory()
+    return count / (time.perf_counter() - start)
+
+
+def measure_member_reads(requests: list) -> float:
+    """Чтений member_ids в секунду"""
+    start = time.perf_counter()
+    for request in requests:
+        request.group.member_ids
+    return len(requests) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    count = args.count
+
+    print(f"{'model':<8} {'bytes/request':>14} {'created/s':>12} {'member_ids/s':>14}")
+    for name, request_cls, group_cls in (
+        ("legacy", LegacyRequest, LegacyGroup),
+        ("slots", Request, Group),
+    ):
+        factory = lambda: build(count, request_cls, group_cls)
+        bytes_per_request = measure_memory(count, factory)
+        rate = measure_rate(count, factory)
+        reads = measure_member_reads(factory())
+        print(f"{name:<8} {bytes_per_request:>14,.0f} {rate:>12,.0f} {reads:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
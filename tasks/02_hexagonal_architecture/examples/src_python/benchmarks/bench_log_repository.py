@@ -0,0 +1,108 @@
+"""
+Benchmark: AppendOnlyLogRequestRepository
+
+Запись N заявок в журнал, затем время перезапуска:
+- после штатного close (снимок индекса полный)
+- после «сбоя» — хвост из --tail записей не попал в снимок
+  и перечитывается из журнала
+
+Запуск (из каталога src_python):
+    python -m benchmarks.bench_log_repository
+    python -m benchmarks.bench_log_repository --count 100000 --tail 10000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from domain import Request, Group, Zone
+from infrastructure.adapter.out.append_only_log_request_repository import (
+    AppendOnlyLogRequestRepository,
+)
+
+ZONES = list(Zone)
+BATCH = 1_000
+
+
+def build_requests(start: int, count: int) -> List[Request]:
+    group = Group("G-03")
+    for member_id in ("vol-1", "vol-2", "vol-3"):
+        group.add_member(member_id)
+    requests = []
+    for i in range(start, start + count):
+        request = Request(
+            request_id=f"REQ-2024-{i:07d}",
+            coordinator_id=f"coordinator-{i % 100:03d}",
+            zone=ZONES[i % len(ZONES)]
+        )
+        request.assign_group(group)
+        request.activate()
+        requests.append(request)
+    return requests
+
+
+def timed_open(directory: str) -> tuple:
+    start = time.perf_counter()
+    repository = AppendOnlyLogRequestRepository(directory)
+    return repository, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--tail", type=int, default=50_000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="request_log_")
+    try:
+        repository = AppendOnlyLogRequestRepository(directory)
+
+        # Пакетная запись: один fsync на save_many
+        requests = build_requests(0, args.count)
+        start = time.perf_counter()
+        for i in range(0, len(requests), BATCH):
+            repository.save_many(requests[i:i + BATCH])
+        batch_seconds = time.perf_counter() - start
+
+        # Одиночные save из 32 потоков: group commit объединяет fsync
+        singles = build_requests(args.count, 2_000)
+        with ThreadPoolExecutor(32) as pool:
+            start = time.perf_counter()
+            list(pool.map(repository.save, singles))
+            single_seconds = time.perf_counter() - start
+        repository.close()
+
+        repository, clean_restart = timed_open(directory)
+        probe = f"REQ-2024-{args.count // 2:07d}"
+        assert repository.find_by_id(probe).id == probe
+
+        # «Сбой»: хвост записан в журнал, но не слит в снимок
+        tail = build_requests(args.count + 2_000, args.tail)
+        for i in range(0, len(tail), BATCH):
+            repository.save_many(tail[i:i + BATCH])
+        repository.close(snapshot=False)
+
+        repository, crash_restart = timed_open(directory)
+        assert repository.find_by_id(tail[-1].id).id == tail[-1].id
+
+        start = time.perf_counter()
+        for request in requests[::max(1, args.count // 10_000)]:
+            repository.find_by_id(request.id)
+        lookups = len(requests[::max(1, args.count // 10_000)])
+        lookup_us = (time.perf_counter() - start) / lookups * 1e6
+        repository.close()
+
+        print(f"requests:                 {args.count:,}")
+        print(f"save_many ({BATCH}):         {args.count / batch_seconds:,.0f} req/s")
+        print(f"save x32 threads:         {len(singles) / single_seconds:,.0f} req/s")
+        print(f"restart after close:      {clean_restart * 1e3:,.1f} ms")
+        print(f"restart, {args.tail:,} tail:    {crash_restart * 1e3:,.1f} ms")
+        print(f"find_by_id:               {lookup_us:,.1f} µs")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
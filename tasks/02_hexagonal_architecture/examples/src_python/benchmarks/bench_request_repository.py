@@ -0,0 +1,130 @@
+"""
+Benchmark: InMemoryRequestRepository
+
+Сравнение шардированного репозитория и прежнего адаптера (один
+dict, поиск перебором) на 10k / 100k / 1M заявок:
+- sharded — find_by до записи не вызывался: save без индексов
+- indexed — индексы построены заранее: save их обновляет
+Запрос ACTIVE∩NORTH замеряется после одного прогревочного вызова
+(он строит индексы у sharded).
+
+Запуск (из каталога src_python):
+    python -m benchmarks.bench_request_repository
+    python -m benchmarks.bench_request_repository --sizes 10000 100000
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from application.port.out import RequestRepository
+from domain import Request, Group, Zone, RequestStatus
+from infrastructure.adapter.out.in_memory_request_repository import (
+    InMemoryRequestRepository,
+)
+
+ZONES = list(Zone)
+THREADS = 8
+
+
+class LegacyDictRequestRepository(RequestRepository):
+    """Прежний адаптер: один dict, find_by — полный перебор (порт по умолчанию)"""
+
+    def __init__(self):
+        self._storage: Dict[str, Request] = {}
+
+    def save(self, request: Request) -> None:
+        self._storage[request.id] = request
+
+    def save_many(self, requests: List[Request]) -> None:
+        self._storage.update((request.id, request) for request in requests)
+
+    def find_by_id(self, request_id: str) -> Optional[Request]:
+        return self._storage.get(request_id)
+
+    def find_all(self) -> List[Request]:
+        return list(self._storage.values())
+
+
+def build_requests(count: int) -> List[Request]:
+    """Заявки в разных статусах, зонах и у 100 координаторов"""
+    group = Group("G-03")
+    for member_id in ("vol-1", "vol-2", "vol-3"):
+        group.add_member(member_id)
+
+    requests = []
+    for i in range(count):
+        request = Request(
+            request_id=f"REQ-2024-{i:07d}",
+            coordinator_id=f"coordinator-{i % 100:03d}",
+            zone=ZONES[i % len(ZONES)]
+        )
+        if i % 3:
+            request.assign_group(group)
+            request.activate()
+            if i % 3 == 2:
+                request.complete()
+        requests.append(request)
+    return requests
+
+
+def timed(action: Callable[[], object], repeat: int = 1) -> float:
+    """Среднее время одного выполнения, секунды"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(name: str, repository: RequestRepository, requests: List[Request]) -> Dict[str, float]:
+    count = len(requests)
+
+    save_seconds = timed(lambda: [repository.save(r) for r in requests])
+
+    chunks = [requests[i::THREADS] for i in range(THREADS)]
+    with ThreadPoolExecutor(THREADS) as pool:
+        parallel_seconds = timed(
+            lambda: list(pool.map(lambda chunk: [repository.save(r) for r in chunk], chunks))
+        )
+
+    ids = [r.id for r in requests[::max(1, count // 10_000)]]
+    lookup_seconds = timed(lambda: [repository.find_by_id(i) for i in ids]) / len(ids)
+
+    repeat = 20 if isinstance(repository, InMemoryRequestRepository) else 3
+    query = lambda: repository.find_by(status=RequestStatus.ACTIVE, zone=Zone.NORTH)
+    query()
+    query_seconds = timed(query, repeat)
+
+    return {
+        "save_per_sec": count / save_seconds,
+        "parallel_save_per_sec": count / parallel_seconds,
+        "find_by_id_us": lookup_seconds * 1e6,
+        "active_in_north_ms": query_seconds * 1e3,
+        "active_in_north_rows": len(query()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'adapter':<10} {'save/s':>12} {'save/s x8':>12} "
+          f"{'by_id µs':>9} {'ACTIVE∩NORTH ms':>16}")
+    for size in args.sizes:
+        requests = build_requests(size)
+        indexed = InMemoryRequestRepository(verbose=False)
+        indexed.find_by(status=RequestStatus.ACTIVE)
+        for name, repository in (
+            ("legacy", LegacyDictRequestRepository()),
+            ("sharded", InMemoryRequestRepository(verbose=False)),
+            ("indexed", indexed),
+        ):
+            r = run(name, repository, requests)
+            print(f"{size:>9} {name:<10} {r['save_per_sec']:>12,.0f} "
+                  f"{r['parallel_save_per_sec']:>12,.0f} {r['find_by_id_us']:>9.2f} "
+                  f"{r['active_in_north_ms']:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
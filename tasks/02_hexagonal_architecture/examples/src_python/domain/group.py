@@ -7,13 +7,19 @@ Business Rules:
 - ID формата: G-NN
 - Минимум 3 участника, максимум 5
 - Один участник назначается лидером
+
+Представление компактное: __slots__ вместо __dict__, участники —
+кортеж (не больше 5 элементов), ID участников интернируются.
 """
-from typing import List
+import sys
+from typing import Iterable, Optional, Tuple
 
 
 class Group:
     """Entity: Поисковая группа"""
     
+    __slots__ = ("_id", "_member_ids", "_leader_id")
+    
     def __init__(self, group_id: str):
         """
         Создать группу
@@ -22,8 +28,21 @@ class Group:
             group_id: ID группы (например, "G-01")
         """
         self._id = group_id
-        self._member_ids: List[str] = []
-        self._leader_id: str | None = None
+        self._member_ids: Tuple[str, ...] = ()
+        self._leader_id: Optional[str] = None
+    
+    @classmethod
+    def restore(
+        cls,
+        group_id: str,
+        member_ids: Iterable[str],
+        leader_id: Optional[str]
+    ) -> 'Group':
+        """Восстановить группу из хранилища (без повторных проверок)"""
+        group = cls(group_id)
+        group._member_ids = tuple(sys.intern(member_id) for member_id in member_ids)
+        group._leader_id = leader_id
+        return group
     
     def add_member(self, member_id: str) -> None:
         """
@@ -45,7 +64,8 @@ class Group:
                 f"Участник {member_id} уже в группе"
             )
         
-        self._member_ids.append(member_id)
+        member_id = sys.intern(member_id)
+        self._member_ids += (member_id,)
         
         # Первый участник автоматически становится лидером
         if len(self._member_ids) == 1:
@@ -75,14 +95,21 @@ class Group:
             member_id: ID участника
             
         Raises:
-            ValueError: если это лидер группы
+            ValueError: если это лидер группы или участника нет в группе
         """
         if member_id == self._leader_id:
             raise ValueError(
                 "Нельзя удалить лидера группы. Сначала назначьте другого лидера."
             )
         
-        self._member_ids.remove(member_id)
+        if member_id not in self._member_ids:
+            raise ValueError(
+                f"Участник {member_id} не найден в группе"
+            )
+        
+        self._member_ids = tuple(
+            existing for existing in self._member_ids if existing != member_id
+        )
     
     @property
     def is_ready(self) -> bool:
@@ -102,16 +129,16 @@ class Group:
         return self._id
     
     @property
-    def member_ids(self) -> List[str]:
-        """Возвращает копию списка участников"""
-        return self._member_ids.copy()
+    def member_ids(self) -> Tuple[str, ...]:
+        """Участники группы (кортеж неизменяем, копия не нужна)"""
+        return self._member_ids
     
     @property
     def member_count(self) -> int:
         return len(self._member_ids)
     
     @property
-    def leader_id(self) -> str | None:
+    def leader_id(self) -> Optional[str]:
         return self._leader_id
     
     def __str__(self) -> str:
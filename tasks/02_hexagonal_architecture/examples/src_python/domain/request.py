@@ -5,14 +5,18 @@ Domain Layer: Request (Заявка)
 Предметная область: ПСО «Юго-Запад»
 
 Business Rules:
-- ID формата: REQ-YYYY-NNNN
+- ID формата: REQ-YYYY-NNNN (выдаётся через порт RequestIdAllocator)
 - Создаётся в статусе DRAFT
 - Группа должна содержать 3-5 участников
 - После формирования группы → статус ACTIVE
+
+Заявок в памяти много (история операций), поэтому агрегат хранится
+в __slots__, а ID координатора интернируется: у тысяч заявок
+одного координатора — одна строка.
 """
+import sys
 from datetime import datetime
 from typing import Optional
-import random
 
 from .group import Group
 from .zone import Zone
@@ -22,21 +26,51 @@ from .request_status import RequestStatus
 class Request:
     """Агрегат: Заявка на поисково-спасательную операцию"""
     
-    def __init__(self, coordinator_id: str, zone: Zone):
+    __slots__ = (
+        "_id", "_coordinator_id", "_zone", "_group", "_status", "_created_at",
+    )
+    
+    def __init__(self, request_id: str, coordinator_id: str, zone: Zone):
         """
         Создать новую заявку
         
         Args:
+            request_id: ID заявки (уникальность гарантирует RequestIdAllocator)
             coordinator_id: ID координатора
             zone: Зона поиска
         """
-        self._id = self._generate_request_id()
-        self._coordinator_id = coordinator_id
+        self._id = request_id
+        self._coordinator_id = sys.intern(coordinator_id)
         self._zone = zone
         self._group: Optional[Group] = None
         self._status = RequestStatus.DRAFT
         self._created_at = datetime.now()
     
+    @classmethod
+    def restore(
+        cls,
+        request_id: str,
+        coordinator_id: str,
+        zone: Zone,
+        status: RequestStatus,
+        created_at: datetime,
+        group: Optional[Group] = None
+    ) -> 'Request':
+        """
+        Восстановить заявку из хранилища
+        
+        Состояние уже прошло проверки при создании, поэтому
+        бизнес-правила повторно не применяются.
+        """
+        request = cls.__new__(cls)
+        request._id = request_id
+        request._coordinator_id = sys.intern(coordinator_id)
+        request._zone = zone
+        request._group = group
+        request._status = status
+        request._created_at = created_at
+        return request
+    
     def assign_group(self, group: Group) -> None:
         """
         Сформировать поисковую группу
@@ -104,13 +138,6 @@ class Request:
             )
         self._zone = new_zone
     
-    @staticmethod
-    def _generate_request_id() -> str:
-        """Генерация ID заявки формата REQ-YYYY-NNNN"""
-        year = datetime.now().year
-        random_num = random.randint(0, 9999)
-        return f"REQ-{year}-{random_num:04d}"
-    
     # Properties
     
     @property
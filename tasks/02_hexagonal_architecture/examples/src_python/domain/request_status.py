@@ -7,6 +7,7 @@ Enum для статусов жизненного цикла заявки.
 DRAFT → ACTIVE → COMPLETED
 """
 from enum import Enum
+from typing import Dict, FrozenSet
 
 
 class RequestStatus(Enum):
@@ -26,16 +27,18 @@ class RequestStatus(Enum):
         Returns:
             True если переход допустим
         """
-        if self == RequestStatus.DRAFT:
-            return target == RequestStatus.ACTIVE
-        elif self == RequestStatus.ACTIVE:
-            return target == RequestStatus.COMPLETED
-        elif self == RequestStatus.COMPLETED:
-            return False  # Из завершённой заявки никуда нельзя перейти
-        return False
+        return target in _TRANSITIONS[self]
     
     def __str__(self) -> str:
         return self.value
     
     def __repr__(self) -> str:
         return f"RequestStatus.{self.name}"
+
+
+# Допустимые переходы (из завершённой заявки никуда нельзя перейти)
+_TRANSITIONS: Dict[RequestStatus, FrozenSet[RequestStatus]] = {
+    RequestStatus.DRAFT: frozenset({RequestStatus.ACTIVE}),
+    RequestStatus.ACTIVE: frozenset({RequestStatus.COMPLETED}),
+    RequestStatus.COMPLETED: frozenset(),
+}
@@ -12,9 +12,13 @@ Value Object для зон поиска.
 Свойства Value Object:
 - Immutable (неизменяемый)
 - Equality by value (сравнение по значению)
+
+Члены Enum — единственные экземпляры своих значений, поэтому
+сравнение по значению совпадает со сравнением по идентичности,
+а хэш и __eq__ берутся встроенные (быстрые) из Enum.
 """
 from enum import Enum
-from typing import Any
+from typing import Dict
 
 
 class Zone(Enum):
@@ -47,10 +51,9 @@ class Zone(Enum):
         Raises:
             ValueError: если имя неизвестно
         """
-        name_upper = name.upper()
-        for zone in cls:
-            if zone._name_value == name_upper:
-                return zone
+        zone = _ZONES_BY_NAME.get(name.upper())
+        if zone is not None:
+            return zone
         
         raise ValueError(
             f"Неизвестная зона: {name}. "
@@ -62,12 +65,6 @@ class Zone(Enum):
     
     def __repr__(self) -> str:
         return f"Zone.{self.name}"
-    
-    # Value Object: сравнение по значению (автоматически в Enum)
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, Zone):
-            return False
-        return self._name_value == other._name_value
-    
-    def __hash__(self) -> int:
-        return hash(self._name_value)
+
+
+_ZONES_BY_NAME: Dict[str, Zone] = {zone._name_value: zone for zone in Zone}
@@ -2,48 +2,150 @@
 CLI Example: Демонстрация работы без REST API
 
 Простой пример использования сервиса через командную строку.
+
+    python example_cli.py [--startup-report]
+    python example_cli.py import --file commands.jsonl [--concurrency 8]
+        [--chunk-size 500] [--results results.jsonl]
 """
-from application.port.in import CreateRequestCommand
-from infrastructure.config import get_container
+import argparse
+import sys
 
+from application.port.inbound import CreateRequestCommand
+from infrastructure.config import DependencyContainer, get_container
 
-def main():
-    """Главная функция CLI примера"""
+
+def run_demo(container) -> None:
+    """Создать одну заявку (пример use-case)"""
     print("=" * 60)
     print("Request Service - ПСО «Юго-Запад»")
     print("Пример использования гексагональной архитектуры")
     print("=" * 60)
     print()
-    
-    # Получить DI-контейнер
-    container = get_container()
+
     service = container.get_request_service()
-    
+
     # Создать команду
     command = CreateRequestCommand(
         coordinator_id="coordinator-001",
         zone="NORTH",
         volunteer_ids=["vol-123", "vol-456", "vol-789"]
     )
-    
+
     print("📋 Создание заявки...")
     print(f"   Координатор: {command.coordinator_id}")
     print(f"   Зона: {command.zone}")
     print(f"   Волонтёры: {', '.join(command.volunteer_ids)}")
     print()
-    
+
     # Вызвать use-case
     try:
         request_id = service.create_request(command)
-        
+
         print("=" * 60)
         print(f"✅ Заявка успешно создана!")
         print(f"   ID: {request_id}")
         print("=" * 60)
-        
+
     except ValueError as e:
         print(f"❌ Ошибка: {e}")
 
 
+def run_import(container, args: argparse.Namespace) -> int:
+    """
+    Массовый импорт команд из JSONL/CSV
+
+    Прогресс и итог — в stderr, результаты по строкам — в файл.
+
+    Returns:
+        Код выхода: 0 — все строки импортированы, 1 — были ошибки
+    """
+    from infrastructure.adapter.inbound.bulk_importer import BulkImporter, ImportStats
+    from infrastructure.adapter.inbound.command_file_reader import open_commands
+
+    def report(stats: ImportStats) -> None:
+        print(
+            f"\r⏳ прочитано {stats.read:,}  создано {stats.created:,}  "
+            f"ошибок {stats.failed:,}  {stats.rate:,.0f} строк/с",
+            end="", file=sys.stderr, flush=True
+        )
+
+    importer = BulkImporter(
+        container.get_async_request_service(),
+        concurrency=args.concurrency,
+        chunk_size=args.chunk_size
+    )
+    with open_commands(args.file, args.format) as lines, \
+            open(args.results, "w", encoding="utf-8") as results:
+        stats = importer.run(lines, results, on_progress=report)
+
+    print(file=sys.stderr)
+    print(
+        f"{'✅' if not stats.failed else '⚠️'} Импорт завершён за {stats.elapsed:.1f} с: "
+        f"создано {stats.created:,}, ошибок {stats.failed:,}. "
+        f"Результаты: {args.results}",
+        file=sys.stderr
+    )
+    return 1 if stats.failed else 0
+
+
+def main():
+    """Главная функция CLI примера"""
+    parser = argparse.ArgumentParser(description="Request Service CLI")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="показать время импорта и создания компонентов"
+    )
+    commands = parser.add_subparsers(dest="command")
+    import_parser = commands.add_parser(
+        "import",
+        help="создать заявки из файла команд (JSONL или CSV)"
+    )
+    import_parser.add_argument(
+        "--file", required=True, help="файл команд; - — stdin"
+    )
+    import_parser.add_argument(
+        "--format", choices=("jsonl", "csv"),
+        help="формат файла (по умолчанию — по расширению)"
+    )
+    import_parser.add_argument(
+        "--concurrency", "--workers", dest="concurrency", type=int, default=4,
+        help="пакетов в работе одновременно"
+    )
+    import_parser.add_argument(
+        "--chunk-size", type=int, default=500,
+        help="команд в одном пакетном вызове"
+    )
+    import_parser.add_argument(
+        "--results", default="import_results.jsonl",
+        help="файл результатов (JSONL: line + request_id или error)"
+    )
+    args = parser.parse_args()
+
+    # Получить DI-контейнер
+    if args.command == "import":
+        # Без печати каждой заявки и SMS: на миллионах строк это
+        # стало бы узким местом
+        container = DependencyContainer(verbose=False)
+    else:
+        container = get_container()
+
+    exit_code = 0
+    try:
+        if args.command == "import":
+            exit_code = run_import(container, args)
+        else:
+            run_demo(container)
+    finally:
+        # Дождаться отправки SMS из очереди
+        container.shutdown()
+
+    if args.startup_report:
+        print()
+        print(container.startup_report())
+
+    return exit_code
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,12 +1,21 @@
 """Infrastructure Layer"""
-from .adapter import RequestController, InMemoryRequestRepository, MockSmsService
-from .config import DependencyContainer, get_container, reset_container
-
-__all__ = [
-    'RequestController',
-    'InMemoryRequestRepository',
-    'MockSmsService',
-    'DependencyContainer',
-    'get_container',
-    'reset_container'
-]
+import importlib
+
+# Экспорты загружаются лениво (PEP 562): импорт пакета не тянет
+# FastAPI и адаптеры, которые процессу могут не понадобиться
+_EXPORTS = {
+    'RequestController': '.adapter',
+    'InMemoryRequestRepository': '.adapter',
+    'MockSmsService': '.adapter',
+    'DependencyContainer': '.config',
+    'get_container': '.config',
+    'reset_container': '.config',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -1,10 +1,18 @@
 """Infrastructure Layer: Adapters"""
-# Используем 'in as in_adapter' чтобы избежать конфликта с reserved keyword
-from .in import RequestController
-from .out import InMemoryRequestRepository, MockSmsService
-
-__all__ = [
-    'RequestController',
-    'InMemoryRequestRepository',
-    'MockSmsService'
-]
+import importlib
+
+# Экспорты загружаются лениво (PEP 562): входящий адаптер тянет
+# FastAPI, и импорт исходящих адаптеров не должен его загружать
+_EXPORTS = {
+    'RequestController': '.inbound',
+    'InMemoryRequestRepository': '.out',
+    'MockSmsService': '.out',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -1,4 +0,0 @@
-"""Infrastructure: Inbound Adapters"""
-from .request_controller import RequestController
-
-__all__ = ['RequestController']
@@ -0,0 +1,25 @@
+"""Infrastructure: Inbound Adapters"""
+import importlib
+
+# Экспорты загружаются лениво (PEP 562): REST-адаптер тянет FastAPI,
+# а CLI-импорт (example_cli.py import) его не использует
+_EXPORTS = {
+    'RequestController': '.request_controller',
+    'IdempotencyGuard': '.idempotency_guard',
+    'IdempotencyKeyReuseError': '.idempotency_guard',
+    'IdempotencyRecord': '.idempotency_store',
+    'IdempotencyStore': '.idempotency_store',
+    'InMemoryIdempotencyStore': '.idempotency_store',
+    'SqliteIdempotencyStore': '.idempotency_store',
+    'BulkImporter': '.bulk_importer',
+    'ImportStats': '.bulk_importer',
+    'open_commands': '.command_file_reader',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,180 @@
+"""
+Infrastructure Layer: BulkImporter
+
+Массовое создание заявок из потока команд (example_cli.py import).
+
+- команды режутся на пакеты и уходят в AsyncCreateRequestsUseCase
+  (один save_many и одна рассылка SMS на пакет)
+- пакеты выполняются в одном event loop: пока один ждёт хранилища
+  или SMS, идут другие; одновременно в работе не больше concurrency
+  пакетов, поэтому память не растёт с размером файла
+- результат каждой строки сразу пишется в файл результатов (JSONL)
+  в порядке завершения пакетов: {"line": 7, "request_id": "..."}
+  или {"line": 8, "error": "..."}
+"""
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Set, TextIO, Tuple
+
+from application.port.inbound import (
+    AsyncCreateRequestsUseCase,
+    CreateRequestCommand,
+    CreateRequestResult,
+)
+
+from .command_file_reader import ParsedLine
+
+Chunk = List[Tuple[int, CreateRequestCommand]]
+
+
+@dataclass
+class ImportStats:
+    """Счётчики импорта"""
+    read: int = 0
+    created: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.created + self.failed
+
+    @property
+    def rate(self) -> float:
+        """Обработано строк в секунду"""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+class BulkImporter:
+    """Импорт команд через асинхронный пакетный use-case"""
+
+    def __init__(
+        self,
+        use_case: AsyncCreateRequestsUseCase,
+        concurrency: int = 4,
+        chunk_size: int = 500,
+        progress_interval: float = 1.0
+    ):
+        """
+        Args:
+            use_case: Пакетное создание заявок (входящий порт, async)
+            concurrency: Пакетов в работе одновременно
+            chunk_size: Команд в одном вызове create_requests
+            progress_interval: Как часто вызывать on_progress, секунды
+        """
+        if concurrency < 1 or chunk_size < 1:
+            raise ValueError("concurrency и chunk_size должны быть положительными")
+        self._use_case = use_case
+        self._concurrency = concurrency
+        self._chunk_size = chunk_size
+        self._progress_interval = progress_interval
+
+    def run(
+        self,
+        lines: Iterable[ParsedLine],
+        results: TextIO,
+        on_progress: Optional[Callable[[ImportStats], None]] = None
+    ) -> ImportStats:
+        """
+        Импортировать команды (свой event loop, для CLI)
+
+        Args:
+            lines: (номер строки, команда или ошибка разбора)
+            results: Куда писать результаты (JSONL)
+            on_progress: Вызывается не чаще progress_interval и в конце
+
+        Returns:
+            Итоговые счётчики
+        """
+        return asyncio.run(self.run_async(lines, results, on_progress))
+
+    async def run_async(
+        self,
+        lines: Iterable[ParsedLine],
+        results: TextIO,
+        on_progress: Optional[Callable[[ImportStats], None]] = None
+    ) -> ImportStats:
+        """Импортировать команды в текущем event loop (аргументы — как у run)"""
+        stats = ImportStats()
+        started = time.perf_counter()
+        last_report = started
+
+        def collect(done: Set["asyncio.Task[List[Tuple[int, CreateRequestResult]]]"]) -> None:
+            nonlocal last_report
+            for task in done:
+                for line_no, result in task.result():
+                    self._write(results, stats, line_no, result)
+            now = time.perf_counter()
+            stats.elapsed = now - started
+            if on_progress is not None and now - last_report >= self._progress_interval:
+                last_report = now
+                on_progress(stats)
+
+        pending: Set[asyncio.Task] = set()
+        try:
+            for chunk in self._chunks(lines, results, stats):
+                pending.add(asyncio.create_task(self._create(chunk)))
+                if len(pending) >= self._concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    collect(done)
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                collect(done)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        stats.elapsed = time.perf_counter() - started
+        if on_progress is not None:
+            on_progress(stats)
+        return stats
+
+    def _chunks(
+        self,
+        lines: Iterable[ParsedLine],
+        results: TextIO,
+        stats: ImportStats
+    ) -> Iterable[Chunk]:
+        """Пакеты команд; ошибки разбора сразу уходят в результаты"""
+        chunk: Chunk = []
+        for line_no, command in lines:
+            stats.read += 1
+            if isinstance(command, str):
+                self._write(results, stats, line_no, CreateRequestResult(error=command))
+                continue
+            chunk.append((line_no, command))
+            if len(chunk) == self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def _create(self, chunk: Chunk) -> List[Tuple[int, CreateRequestResult]]:
+        """Выполнить пакет"""
+        try:
+            outcomes = await self._use_case.create_requests([command for _, command in chunk])
+        except Exception as e:
+            # Отказ хранилища: весь пакет не создан, импорт продолжается
+            failure = CreateRequestResult(error=f"Пакет не создан: {e}")
+            outcomes = [failure] * len(chunk)
+        return [(line_no, outcome) for (line_no, _), outcome in zip(chunk, outcomes)]
+
+    @staticmethod
+    def _write(
+        results: TextIO,
+        stats: ImportStats,
+        line_no: int,
+        result: CreateRequestResult
+    ) -> None:
+        if result.is_success:
+            stats.created += 1
+            record = {"line": line_no, "request_id": result.request_id}
+        else:
+            stats.failed += 1
+            record = {"line": line_no, "error": result.error}
+        results.write(json.dumps(record, ensure_ascii=False))
+        results.write("\n")
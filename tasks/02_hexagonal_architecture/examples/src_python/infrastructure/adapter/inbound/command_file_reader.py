@@ -0,0 +1,102 @@
+"""
+Infrastructure Layer: CommandFileReader
+
+Потоковое чтение команд CreateRequestCommand из файла для
+массового импорта (учения, перенос данных).
+
+Форматы:
+- JSONL — по объекту на строку:
+  {"coordinator_id": "coordinator-001", "zone": "NORTH",
+   "volunteer_ids": ["vol-1", "vol-2", "vol-3"]}
+- CSV — заголовок coordinator_id,zone,volunteer_ids; участники
+  через «;»
+
+Файл читается построчно: в памяти только текущая строка, поэтому
+размер входа не ограничен.
+"""
+import csv
+import json
+import sys
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Tuple, Union
+
+from application.port.inbound import CreateRequestCommand
+
+# (номер строки, команда или текст ошибки разбора)
+ParsedLine = Tuple[int, Union[CreateRequestCommand, str]]
+
+FORMATS = ("jsonl", "csv")
+
+
+def detect_format(path: str) -> str:
+    """Формат по расширению файла (по умолчанию jsonl)"""
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+@contextmanager
+def open_commands(path: str, file_format: Optional[str] = None) -> Iterator[Iterator[ParsedLine]]:
+    """
+    Открыть файл команд ("-" — stdin)
+
+    Использование:
+        with open_commands("commands.jsonl") as lines:
+            for line_no, command in lines:
+                ...
+
+    Строка, которую не удалось разобрать, не прерывает чтение:
+    вместо команды возвращается текст ошибки.
+    """
+    file_format = file_format or detect_format(path)
+    if file_format not in FORMATS:
+        raise ValueError(f"Неизвестный формат: {file_format}. Допустимые: jsonl, csv")
+
+    if path == "-":
+        yield _parse(sys.stdin, file_format)
+        return
+    with open(path, encoding="utf-8", newline="") as stream:
+        yield _parse(stream, file_format)
+
+
+def _parse(stream: IO[str], file_format: str) -> Iterator[ParsedLine]:
+    return _parse_csv(stream) if file_format == "csv" else _parse_jsonl(stream)
+
+
+def _parse_jsonl(stream: IO[str]) -> Iterator[ParsedLine]:
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            volunteer_ids = record["volunteer_ids"]
+            if not isinstance(volunteer_ids, list):
+                raise ValueError("volunteer_ids должен быть списком")
+            yield line_no, CreateRequestCommand(
+                coordinator_id=str(record["coordinator_id"]),
+                zone=str(record["zone"]),
+                volunteer_ids=[str(v) for v in volunteer_ids]
+            )
+        except (ValueError, TypeError, KeyError) as e:
+            yield line_no, _describe(e)
+
+
+def _parse_csv(stream: IO[str]) -> Iterator[ParsedLine]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        # Номер строки файла (с учётом заголовка)
+        line_no = reader.line_num
+        try:
+            yield line_no, CreateRequestCommand(
+                coordinator_id=row["coordinator_id"],
+                zone=row["zone"],
+                volunteer_ids=[
+                    v.strip() for v in row["volunteer_ids"].split(";") if v.strip()
+                ]
+            )
+        except (KeyError, AttributeError) as e:
+            yield line_no, _describe(e)
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f"Нет поля {error}"
+    return f"Некорректная строка: {error}"
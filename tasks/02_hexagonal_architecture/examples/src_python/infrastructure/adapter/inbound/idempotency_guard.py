@@ -0,0 +1,115 @@
+"""
+Infrastructure Layer: IdempotencyGuard
+
+Повтор запроса с тем же Idempotency-Key не выполняет операцию
+заново, а получает сохранённый ответ:
+- ответ уже в хранилище → вернуть его (без use-case, без SMS)
+- первый запрос с этим ключом ещё выполняется → дождаться его
+  результата, а не запускать операцию второй раз
+- ключ пришёл с другим телом запроса → ошибка (IdempotencyKeyReuseError)
+
+Ожидание «первого» запроса работает в пределах процесса; между
+воркерами повтор увидит ответ, как только он сохранён в общем
+хранилище (SqliteIdempotencyStore).
+
+Блокирующее хранилище (store.blocking, например SQLite) вызывается
+через asyncio.to_thread: чтение и запись ключа не останавливают
+event loop.
+"""
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from .idempotency_store import IdempotencyRecord, IdempotencyStore
+
+# Операция: (HTTP-статус, тело ответа)
+Outcome = Tuple[int, Any]
+
+
+class IdempotencyKeyReuseError(Exception):
+    """Ключ уже использован для запроса с другим содержимым"""
+    pass
+
+
+class IdempotencyGuard:
+    """Выполнение операции не более одного раза на ключ"""
+
+    def __init__(self, store: IdempotencyStore):
+        """
+        Args:
+            store: Хранилище сохранённых ответов
+        """
+        self._store = store
+        self._in_flight: Dict[str, "asyncio.Future[IdempotencyRecord]"] = {}
+
+    @staticmethod
+    def fingerprint(operation: str, payload: str) -> str:
+        """Отпечаток запроса: операция + тело"""
+        return hashlib.sha256(f"{operation}\n{payload}".encode("utf-8")).hexdigest()
+
+    async def execute(
+        self,
+        key: str,
+        fingerprint: str,
+        operation: Callable[[], Awaitable[Outcome]]
+    ) -> Tuple[int, Any, bool]:
+        """
+        Выполнить операцию или вернуть сохранённый ответ
+
+        Ответы 5xx не сохраняются: такой запрос можно повторить.
+
+        Returns:
+            (статус, тело, replayed) — replayed=True, если ответ
+            взят из хранилища или у параллельного запроса
+
+        Raises:
+            IdempotencyKeyReuseError: ключ использован с другим телом
+        """
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            record = await asyncio.shield(pending)
+            return self._replay(record, fingerprint)
+
+        # Future регистрируется до обращения к хранилищу: параллельный
+        # запрос с тем же ключом ждёт его, пока идёт чтение в потоке
+        future: "asyncio.Future[IdempotencyRecord]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        # Исключение может остаться без ожидающих: пометить как полученное
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        try:
+            record = await self._call(self._store.get, key)
+            replayed = record is not None
+            if not replayed:
+                status_code, body = await operation()
+                record = IdempotencyRecord(fingerprint, status_code, body)
+                if status_code < 500:
+                    await self._call(self._store.put, key, record)
+            future.set_result(record)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._in_flight[key]
+
+        if replayed:
+            return self._replay(record, fingerprint)
+        return record.status_code, record.body, False
+
+    async def _call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Вызов хранилища: блокирующее — в пуле потоков"""
+        if self._store.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    @staticmethod
+    def _replay(record: IdempotencyRecord, fingerprint: str) -> Tuple[int, Any, bool]:
+        if record.fingerprint != fingerprint:
+            raise IdempotencyKeyReuseError(
+                "Idempotency-Key уже использован для другого запроса"
+            )
+        return record.status_code, record.body, True
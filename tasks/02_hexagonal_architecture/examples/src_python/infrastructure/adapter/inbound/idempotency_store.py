@@ -0,0 +1,149 @@
+"""
+Infrastructure Layer: IdempotencyStore
+
+Хранилище ответов по ключу Idempotency-Key для REST-адаптера.
+
+- InMemoryIdempotencyStore — ограниченный кэш в памяти процесса
+  (LRU + TTL)
+- SqliteIdempotencyStore — локальный файл: переживает перезапуск
+  и общий для воркеров (main.py --workers N)
+"""
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """Сохранённый ответ на запрос с ключом идемпотентности"""
+    fingerprint: str
+    status_code: int
+    body: Any
+
+
+class IdempotencyStore(ABC):
+    """Хранилище ответов по ключу идемпотентности"""
+
+    # get/put ходят на диск или в сеть: IdempotencyGuard вызывает их
+    # в пуле потоков, а не в event loop
+    blocking = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        """Ответ по ключу или None (нет или истёк TTL)"""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, record: IdempotencyRecord) -> None:
+        """Сохранить ответ по ключу"""
+        pass
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Кэш в памяти: не больше max_entries ключей, каждый живёт ttl секунд"""
+
+    blocking = False
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        ttl: float = 24 * 3600,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Сколько ключей помнить (старейшие вытесняются)
+            ttl: Время жизни ключа, секунды
+            clock: Источник времени (для тестов)
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key → (срок действия, запись); порядок — от давних к свежим
+        self._records: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            entry = self._records.get(key)
+            if entry is None:
+                return None
+            expires_at, record = entry
+            if expires_at <= self._clock():
+                del self._records[key]
+                return None
+            self._records.move_to_end(key)
+            return record
+
+    def put(self, key: str, record: IdempotencyRecord) -> None:
+        with self._lock:
+            self._records[key] = (self._clock() + self._ttl, record)
+            self._records.move_to_end(key)
+            while len(self._records) > self._max_entries:
+                self._records.popitem(last=False)
+
+
+class SqliteIdempotencyStore(IdempotencyStore):
+    """Ключи в файле SQLite (общий для процессов, переживает перезапуск)"""
+
+    # Раз в столько записей удалять истёкшие ключи
+    _PURGE_EVERY = 1_000
+
+    def __init__(self, path: str, ttl: float = 24 * 3600):
+        """
+        Args:
+            path: Путь к файлу БД
+            ttl: Время жизни ключа, секунды
+        """
+        self._path = path
+        self._ttl = ttl
+        self._local = threading.local()
+        self._puts = 0
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+            "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, "
+            "status_code INTEGER NOT NULL, body TEXT NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[IdempotencyRecord]:
+        row = self._connection().execute(
+            "SELECT fingerprint, status_code, body FROM idempotency_keys "
+            "WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        fingerprint, status_code, body = row
+        return IdempotencyRecord(fingerprint, status_code, json.loads(body))
+
+    def put(self, key: str, record: IdempotencyRecord) -> None:
+        connection = self._connection()
+        now = time.time()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO idempotency_keys "
+                "(key, fingerprint, status_code, body, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, record.fingerprint, record.status_code,
+                 json.dumps(record.body, ensure_ascii=False), now + self._ttl)
+            )
+            self._puts += 1
+            if self._puts % self._PURGE_EVERY == 0:
+                connection.execute(
+                    "DELETE FROM idempotency_keys WHERE expires_at <= ?", (now,)
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=5.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
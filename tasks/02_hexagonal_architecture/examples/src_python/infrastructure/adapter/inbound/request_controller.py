@@ -0,0 +1,217 @@
+"""
+Infrastructure Layer: RequestController (FastAPI)
+
+Входящий адаптер для REST API.
+Использует AsyncCreateRequestUseCase и AsyncCreateRequestsUseCase
+(входящие порты): обработчики ожидают use-case через await и не
+блокируют event loop.
+
+Заголовок Idempotency-Key: повтор POST с тем же ключом возвращает
+сохранённый ответ (с заголовком Idempotent-Replayed: true) и не
+создаёт заявку и SMS повторно.
+"""
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from application.port.inbound import (
+    AsyncCreateRequestUseCase,
+    AsyncCreateRequestsUseCase,
+    CreateRequestCommand,
+)
+
+from .idempotency_guard import IdempotencyGuard, IdempotencyKeyReuseError
+
+# Ограничение длины ключа (как у распространённых платёжных API)
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+# Заявок в одном POST /api/requests:batch: каждая берёт ID и ставит SMS
+# в очередь, поэтому размер пакета ограничен (больше — 422)
+MAX_BATCH_SIZE = 500
+
+
+# DTO для REST API
+class CreateRequestDto(BaseModel):
+    """DTO: Запрос на создание заявки"""
+    coordinator_id: str
+    zone: str
+    volunteer_ids: List[str]
+
+
+class CreateRequestResponseDto(BaseModel):
+    """DTO: Ответ после создания заявки"""
+    request_id: str
+
+
+class CreateRequestsDto(BaseModel):
+    """DTO: Пакет заявок (не больше MAX_BATCH_SIZE)"""
+    requests: List[CreateRequestDto] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class CreateRequestResultDto(BaseModel):
+    """DTO: Результат по одной заявке пакета"""
+    request_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class CreateRequestsResponseDto(BaseModel):
+    """DTO: Ответ на пакетное создание (в порядке заявок)"""
+    results: List[CreateRequestResultDto]
+
+
+class RequestController:
+    """
+    Адаптер: REST API контроллер (FastAPI)
+    
+    Входящий адаптер, который вызывает систему через
+    AsyncCreateRequestUseCase и AsyncCreateRequestsUseCase (входящие порты)
+    """
+    
+    def __init__(
+        self,
+        app: FastAPI,
+        use_case: AsyncCreateRequestUseCase,
+        batch_use_case: AsyncCreateRequestsUseCase,
+        idempotency: Optional[IdempotencyGuard] = None
+    ):
+        """
+        Инициализация контроллера
+        
+        Args:
+            app: FastAPI приложение
+            use_case: Use-case создания заявки (входящий порт)
+            batch_use_case: Use-case пакетного создания (входящий порт)
+            idempotency: Обработка Idempotency-Key (None — заголовок
+                игнорируется)
+        """
+        self._use_case = use_case
+        self._batch_use_case = batch_use_case
+        self._idempotency = idempotency
+        
+        # Регистрация маршрутов
+        @app.post("/api/requests", response_model=CreateRequestResponseDto)
+        async def create_request(
+            dto: CreateRequestDto,
+            idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
+        ):
+            """
+            POST /api/requests - Создать заявку
+            
+            Body:
+            {
+              "coordinator_id": "coordinator-001",
+              "zone": "NORTH",
+              "volunteer_ids": ["vol-123", "vol-456", "vol-789"]
+            }
+            
+            Response:
+            {
+              "request_id": "REQ-2024-0042"
+            }
+            """
+            async def handle() -> Tuple[int, Any]:
+                try:
+                    # Преобразовать DTO → Command
+                    command = CreateRequestCommand(
+                        coordinator_id=dto.coordinator_id,
+                        zone=dto.zone,
+                        volunteer_ids=dto.volunteer_ids
+                    )
+                    
+                    # Вызвать use-case (входящий порт)
+                    request_id = await self._use_case.create_request(command)
+                    
+                except ValueError as e:
+                    return 400, {"detail": str(e)}
+                
+                return 200, CreateRequestResponseDto(request_id=request_id).model_dump()
+            
+            return await self._respond("create_request", dto, idempotency_key, handle)
+        
+        @app.post(
+            "/api/requests:batch",
+            response_model=CreateRequestsResponseDto
+        )
+        async def create_requests(
+            dto: CreateRequestsDto,
+            idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
+        ):
+            """
+            POST /api/requests:batch - Создать пакет заявок
+            
+            Body:
+            {
+              "requests": [
+                {"coordinator_id": "coordinator-001", "zone": "NORTH",
+                 "volunteer_ids": ["vol-123", "vol-456", "vol-789"]},
+                {"coordinator_id": "coordinator-001", "zone": "MARS",
+                 "volunteer_ids": ["vol-321", "vol-654", "vol-987"]}
+              ]
+            }
+            
+            Не больше MAX_BATCH_SIZE заявок, иначе 422.
+            
+            Response (результаты в порядке заявок):
+            {
+              "results": [
+                {"request_id": "REQ-2024-0042", "error": null},
+                {"request_id": null, "error": "Неизвестная зона: MARS. ..."}
+              ]
+            }
+            """
+            async def handle() -> Tuple[int, Any]:
+                commands = [
+                    CreateRequestCommand(
+                        coordinator_id=item.coordinator_id,
+                        zone=item.zone,
+                        volunteer_ids=item.volunteer_ids
+                    )
+                    for item in dto.requests
+                ]
+                
+                results = await self._batch_use_case.create_requests(commands)
+                
+                return 200, CreateRequestsResponseDto(results=[
+                    CreateRequestResultDto(
+                        request_id=result.request_id,
+                        error=result.error
+                    )
+                    for result in results
+                ]).model_dump()
+            
+            return await self._respond("create_requests", dto, idempotency_key, handle)
+        
+        @app.get("/api/health")
+        async def health_check():
+            """GET /api/health - Health check"""
+            return {"status": "OK", "service": "Request Service (ПСО Юго-Запад)"}
+    
+    async def _respond(
+        self,
+        operation: str,
+        dto: BaseModel,
+        idempotency_key: Optional[str],
+        handle: Callable[[], Awaitable[Tuple[int, Any]]]
+    ) -> JSONResponse:
+        """Выполнить обработчик с учётом Idempotency-Key"""
+        if idempotency_key is None or self._idempotency is None:
+            status_code, body = await handle()
+            return JSONResponse(status_code=status_code, content=body)
+        
+        if not idempotency_key or len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Idempotency-Key: от 1 до {MAX_IDEMPOTENCY_KEY_LENGTH} символов"
+            )
+        
+        fingerprint = IdempotencyGuard.fingerprint(operation, dto.model_dump_json())
+        try:
+            status_code, body, replayed = await self._idempotency.execute(
+                idempotency_key, fingerprint, handle
+            )
+        except IdempotencyKeyReuseError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        
+        headers = {"Idempotent-Replayed": "true"} if replayed else None
+        return JSONResponse(status_code=status_code, content=body, headers=headers)
@@ -0,0 +1,27 @@
+"""Infrastructure: Outbound Adapters"""
+import importlib
+
+# Экспорты загружаются лениво (PEP 562): провайдер репозитория
+# импортирует только свой модуль, а не все адаптеры пакета
+_EXPORTS = {
+    'InMemoryRequestRepository': '.in_memory_request_repository',
+    'SqliteRequestRepository': '.sqlite_request_repository',
+    'AppendOnlyLogRequestRepository': '.append_only_log_request_repository',
+    'MockSmsService': '.mock_sms_service',
+    'QueuedNotificationService': '.queued_notification_service',
+    'AsyncMockSmsService': '.async_mock_sms_service',
+    'ThreadPoolRequestRepository': '.thread_pool_request_repository',
+    'ThreadPoolNotificationService': '.thread_pool_notification_service',
+    'BlockLeasingRequestIdAllocator': '.block_leasing_request_id_allocator',
+    'SequenceBlockSource': '.block_leasing_request_id_allocator',
+    'InMemorySequenceBlockSource': '.block_leasing_request_id_allocator',
+    'FileSequenceBlockSource': '.block_leasing_request_id_allocator',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,583 @@
+"""
+Infrastructure Layer: AppendOnlyLogRequestRepository
+
+Исходящий адаптер: заявки в журнале (append-only log) на диске.
+Реализует RequestRepository (исходящий порт).
+
+Устройство каталога:
+- 00000000.log, 00000001.log, ... — сегменты журнала. Каждый save
+  дописывает агрегат целиком в конец текущего сегмента; запись —
+  заголовок (crc32, длины) + ID + JSON (request_serializer).
+  Запись на диск только последовательная
+- <позиция>.snap — снимок индекса «ID → позиция в журнале»:
+  записи фиксированной ширины, отсортированные по ID
+- LOCK — журнал пишет только один процесс
+
+Group commit: save ставит запись в очередь и ждёт; поток-писатель
+забирает всё накопившееся, пишет одним write и делает один fsync
+на всю пачку. save возвращается, когда запись уже на диске.
+Ошибка write или fsync: сегмент обрезается до конца последней
+подтверждённой пачки, и журнал больше не принимает записей (иначе
+позиции в индексе разошлись бы с файлом).
+
+Индекс в памяти — только записи после последнего снимка; остальное
+ищется двоичным поиском прямо в отображённом (mmap) снимке.
+Поэтому перезапуск не зависит от числа заявок: открыть снимок и
+перечитать хвост журнала после него. Каждые snapshot_every записей
+фоновый поток сливает старый снимок с новыми записями в новый.
+
+Старые версии заявок остаются в сегментах (компактизация не
+делается). Несколько воркеров — SqliteRequestRepository.
+"""
+import bisect
+import mmap
+import os
+import struct
+import threading
+import zlib
+from queue import Queue
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from application.port.out import RequestRepository
+from domain import Request
+
+from .request_serializer import dumps, loads
+
+try:  # Linux / macOS
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Запись журнала: crc32(ID + payload), длина payload, длина ID
+_RECORD_HEADER = struct.Struct("<IIH")
+# Снимок: magic, число записей, позиция журнала, до которой он полон
+_SNAPSHOT_HEADER = struct.Struct("<8sQQ")
+# Запись снимка: ID (дополнен \0 до KEY_SIZE байт), позиция
+_SNAPSHOT_ENTRY = struct.Struct("<32sQ")
+_SNAPSHOT_MAGIC = b"REQSNAP1"
+KEY_SIZE = 32
+
+# Позиция = номер сегмента << 40 | смещение в сегменте
+_OFFSET_BITS = 40
+_OFFSET_MASK = (1 << _OFFSET_BITS) - 1
+
+
+def _position(segment: int, offset: int) -> int:
+    return (segment << _OFFSET_BITS) | offset
+
+
+def _key(request_id: str) -> bytes:
+    """ID в ключ снимка фиксированной ширины"""
+    raw = request_id.encode("utf-8")
+    if len(raw) > KEY_SIZE:
+        raise ValueError(f"ID заявки длиннее {KEY_SIZE} байт: {request_id}")
+    return raw.ljust(KEY_SIZE, b"\0")
+
+
+class _Snapshot:
+    """Снимок индекса в mmap: двоичный поиск без загрузки в dict"""
+
+    __slots__ = ("path", "count", "log_position", "_file", "_mmap")
+
+    def __init__(self, path: Optional[str] = None):
+        """Без path — пустой снимок (журнал ещё ни разу не сливался)"""
+        self.path = path
+        self.count = 0
+        self.log_position = 0
+        self._file = None
+        self._mmap = None
+        if path is None:
+            return
+
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.log_position = _SNAPSHOT_HEADER.unpack_from(self._mmap)
+        expected = _SNAPSHOT_HEADER.size + self.count * _SNAPSHOT_ENTRY.size
+        if magic != _SNAPSHOT_MAGIC or len(self._mmap) != expected:
+            self.close()
+            raise ValueError(f"Повреждённый снимок индекса: {path}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> bytes:
+        """Ключ i-й записи (для bisect)"""
+        start = _SNAPSHOT_HEADER.size + i * _SNAPSHOT_ENTRY.size
+        return self._mmap[start:start + KEY_SIZE]
+
+    def get(self, key: bytes) -> Optional[int]:
+        """Позиция в журнале по ключу или None"""
+        i = bisect.bisect_left(self, key)
+        if i < self.count and self[i] == key:
+            start = _SNAPSHOT_HEADER.size + i * _SNAPSHOT_ENTRY.size
+            return _SNAPSHOT_ENTRY.unpack_from(self._mmap, start)[1]
+        return None
+
+    def entries(self) -> Iterator[Tuple[bytes, int]]:
+        """Все записи (ключ, позиция) в порядке ключей"""
+        if not self.count:
+            return iter(())
+        return _SNAPSHOT_ENTRY.iter_unpack(self._mmap[_SNAPSHOT_HEADER.size:])
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+
+class _PendingWrite:
+    """Пачка записей одного вызова save/save_many"""
+
+    __slots__ = ("records", "done", "error")
+
+    def __init__(self, records: List[Tuple[str, bytes]]):
+        self.records = records
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class AppendOnlyLogRequestRepository(RequestRepository):
+    """Адаптер: Репозиторий заявок в журнале со снимками индекса"""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 64 * 1024 * 1024,
+        snapshot_every: int = 100_000
+    ):
+        """
+        Args:
+            directory: Каталог журнала (создаётся при необходимости)
+            segment_size: Размер сегмента, после которого начинается новый
+            snapshot_every: Сколько записей журнала между снимками индекса
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._segment_size = segment_size
+        self._snapshot_every = snapshot_every
+        self._lock_file = self._lock_directory(directory)
+
+        # Индекс: overlay (после снимка) → frozen (сливается в снимок) → снимок
+        self._index_lock = threading.Lock()
+        self._overlay: Dict[str, int] = {}
+        self._frozen: Dict[str, int] = {}
+        self._snapshot = self._open_latest_snapshot()
+        self._snapshot_thread: Optional[threading.Thread] = None
+
+        try:
+            self._segment, self._offset = self._replay(self._snapshot.log_position)
+        except BaseException:
+            # Повреждённый журнал: отпустить LOCK, чтобы его можно было чинить
+            self._snapshot.close()
+            self._lock_file.close()
+            raise
+        self._since_snapshot = len(self._overlay)
+        # Без буфера: при ошибке в файле нет данных, дописанных позже
+        self._file = open(self._segment_path(self._segment), "ab", buffering=0)
+        self._write_error: Optional[BaseException] = None
+        self._readers: Dict[int, int] = {}
+        self._readers_lock = threading.Lock()
+
+        self._queue: "Queue[Optional[_PendingWrite]]" = Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="request-log-writer", daemon=True
+        )
+        self._writer.start()
+        self._closed = False
+
+    def save(self, request: Request) -> None:
+        """Дописать заявку в журнал (возврат после fsync)"""
+        self._submit([request])
+
+    def save_many(self, requests: List[Request]) -> None:
+        """Дописать пакет заявок (одна запись и один fsync)"""
+        if requests:
+            self._submit(requests)
+
+    def find_by_id(self, request_id: str) -> Optional[Request]:
+        """Найти заявку по ID (позиция из индекса → чтение записи)"""
+        with self._index_lock:
+            position = self._overlay.get(request_id)
+            if position is None:
+                position = self._frozen.get(request_id)
+            snapshot = self._snapshot
+        if position is None:
+            if len(request_id.encode("utf-8")) > KEY_SIZE:
+                return None
+            position = snapshot.get(_key(request_id))
+            if position is None:
+                return None
+        return self._read(position)
+
+    def find_all(self) -> List[Request]:
+        """Получить все заявки (последние версии)"""
+        with self._index_lock:
+            newer = {**self._frozen, **self._overlay}
+            snapshot = self._snapshot
+
+        positions = [
+            position for key, position in snapshot.entries()
+            if key.rstrip(b"\0").decode("utf-8") not in newer
+        ]
+        positions.extend(newer.values())
+        return [self._read(position) for position in positions]
+
+    def close(self, snapshot: bool = True) -> None:
+        """
+        Дописать очередь и закрыть файлы
+
+        Args:
+            snapshot: Слить индекс в снимок, чтобы следующий старт
+                не перечитывал журнал
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+        if snapshot and self._overlay:
+            self._start_snapshot()
+            self._snapshot_thread.join()
+
+        self._file.close()
+        with self._readers_lock:
+            for fd in self._readers.values():
+                os.close(fd)
+            self._readers.clear()
+        self._snapshot.close()
+        self._lock_file.close()
+
+    # Запись
+
+    def _submit(self, requests: List[Request]) -> None:
+        if self._closed:
+            raise ValueError("Репозиторий закрыт")
+        self._check_writable()
+        records = []
+        for request in requests:
+            _key(request.id)  # проверить длину ID до записи
+            records.append((request.id, dumps(request).encode("utf-8")))
+        write = _PendingWrite(records)
+        self._queue.put(write)
+        write.done.wait()
+        if write.error is not None:
+            raise write.error
+
+    def _write_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if None in batch:
+                stopping = True
+                batch = [write for write in batch if write is not None]
+            if not batch:
+                continue
+
+            try:
+                self._append(batch)
+            except BaseException as e:
+                for write in batch:
+                    write.error = e
+            finally:
+                for write in batch:
+                    write.done.set()
+
+    def _check_writable(self) -> None:
+        if self._write_error is not None:
+            raise RuntimeError(
+                f"Журнал {self._directory} не принимает записи после ошибки: "
+                f"{self._write_error!r}"
+            ) from self._write_error
+
+    def _append(self, batch: List[_PendingWrite]) -> None:
+        """Одна последовательная запись и один fsync на всю пачку"""
+        self._check_writable()
+        if self._offset >= self._segment_size:
+            self._rotate()
+
+        chunks: List[bytes] = []
+        positions: List[Tuple[str, int]] = []
+        offset = self._offset
+        for write in batch:
+            for request_id, payload in write.records:
+                raw_id = request_id.encode("utf-8")
+                crc = zlib.crc32(payload, zlib.crc32(raw_id))
+                header = _RECORD_HEADER.pack(crc, len(payload), len(raw_id))
+                chunks += (header, raw_id, payload)
+                positions.append((request_id, _position(self._segment, offset)))
+                offset += len(header) + len(raw_id) + len(payload)
+
+        try:
+            data = memoryview(b"".join(chunks))
+            while data:
+                data = data[self._file.write(data):]
+            os.fsync(self._file.fileno())
+        except BaseException as e:
+            self._fail(e)
+            raise
+        self._offset = offset
+
+        with self._index_lock:
+            self._overlay.update(positions)
+        self._since_snapshot += len(positions)
+        if self._since_snapshot >= self._snapshot_every and not self._frozen:
+            self._start_snapshot()
+
+    def _fail(self, error: BaseException) -> None:
+        """
+        Остановить запись после ошибки write/fsync
+
+        Часть пачки могла попасть в файл: сегмент обрезается до
+        последней подтверждённой записи. Если и это не удалось, хвост
+        отрежет проверка при следующем старте (_replay).
+        """
+        self._write_error = error
+        try:
+            os.ftruncate(self._file.fileno(), self._offset)
+        except OSError:
+            pass
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._segment += 1
+        self._offset = 0
+        self._file = open(self._segment_path(self._segment), "ab", buffering=0)
+        _fsync_directory(self._directory)
+
+    # Снимки индекса
+
+    def _start_snapshot(self) -> None:
+        """Заморозить overlay и слить его со снимком в фоне"""
+        with self._index_lock:
+            self._frozen, self._overlay = self._overlay, {}
+            frozen = self._frozen
+        covers = _position(self._segment, self._offset)
+        self._since_snapshot = 0
+        self._snapshot_thread = threading.Thread(
+            target=self._write_snapshot, args=(frozen, covers),
+            name="request-log-snapshot", daemon=True
+        )
+        self._snapshot_thread.start()
+
+    def _write_snapshot(self, frozen: Dict[str, int], covers: int) -> None:
+        try:
+            self._merge_snapshot(frozen, covers)
+        except BaseException:
+            # Вернуть замороженные позиции в overlay: иначе _frozen
+            # остался бы непустым и новый снимок больше не начался бы
+            with self._index_lock:
+                self._overlay = {**self._frozen, **self._overlay}
+                self._frozen = {}
+            raise
+
+    def _merge_snapshot(self, frozen: Dict[str, int], covers: int) -> None:
+        path = os.path.join(self._directory, f"{covers:020d}.snap")
+        tmp_path = f"{path}.tmp"
+        old = self._snapshot
+        newer = sorted((_key(request_id), position) for request_id, position in frozen.items())
+
+        count = 0
+        pack = _SNAPSHOT_ENTRY.pack
+        with open(tmp_path, "wb") as f:
+            f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, 0, covers))
+            buffer: List[bytes] = []
+            for key, position in _merge(old.entries(), newer):
+                buffer.append(pack(key, position))
+                if len(buffer) == 65_536:
+                    f.write(b"".join(buffer))
+                    count += len(buffer)
+                    buffer.clear()
+            f.write(b"".join(buffer))
+            count += len(buffer)
+            f.seek(0)
+            f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, count, covers))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _fsync_directory(self._directory)
+
+        snapshot = _Snapshot(path)
+        with self._index_lock:
+            self._snapshot = snapshot
+            self._frozen = {}
+
+        # Старый снимок может ещё читаться другим потоком: mmap закроется
+        # сборщиком мусора, файл удаляется (на Windows — при следующем старте)
+        if old.path is not None:
+            try:
+                os.remove(old.path)
+            except OSError:
+                pass
+
+    def _open_latest_snapshot(self) -> _Snapshot:
+        names = sorted(
+            (name for name in os.listdir(self._directory) if name.endswith(".snap")),
+            reverse=True
+        )
+        for i, name in enumerate(names):
+            try:
+                snapshot = _Snapshot(os.path.join(self._directory, name))
+            except (ValueError, struct.error, OSError):
+                continue
+            for stale in names[i + 1:]:
+                try:
+                    os.remove(os.path.join(self._directory, stale))
+                except OSError:
+                    pass
+            return snapshot
+        return _Snapshot()
+
+    # Чтение
+
+    def _replay(self, position: int) -> Tuple[int, int]:
+        """
+        Перечитать журнал после снимка в overlay
+
+        Returns:
+            (сегмент, смещение) конца журнала
+        """
+        start_segment, start_offset = position >> _OFFSET_BITS, position & _OFFSET_MASK
+        segments = sorted(
+            int(name[:-4]) for name in os.listdir(self._directory)
+            if name.endswith(".log") and name[:-4].isdigit()
+        )
+        segments = [segment for segment in segments if segment >= start_segment]
+        if not segments:
+            return start_segment, start_offset
+
+        end = start_offset
+        for segment in segments:
+            offset = start_offset if segment == start_segment else 0
+            end = self._replay_segment(segment, offset, last=segment == segments[-1])
+        return segments[-1], end
+
+    def _replay_segment(self, segment: int, offset: int, last: bool) -> int:
+        path = self._segment_path(segment)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        header_size = _RECORD_HEADER.size
+        overlay = self._overlay
+        size = len(data)
+        while offset + header_size <= size:
+            crc, payload_length, id_length = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + header_size
+            end = start + id_length + payload_length
+            if not id_length or end > size or zlib.crc32(data[start:end]) != crc:
+                break
+            overlay[data[start:start + id_length].decode("utf-8")] = _position(segment, offset)
+            offset = end
+
+        if offset != size:
+            # Отрезать можно только оборванный хвост (сбой во время write).
+            # Битая запись, за которой есть ещё данные, — повреждение:
+            # после неё могут идти записи, уже подтверждённые fsync
+            if not last or not _is_torn_tail(data, offset):
+                raise ValueError(f"Повреждён сегмент журнала: {path} @ {offset}")
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return offset
+
+    def _read(self, position: int) -> Request:
+        segment, offset = position >> _OFFSET_BITS, position & _OFFSET_MASK
+        fd = self._reader(segment)
+        header = _read_at(fd, _RECORD_HEADER.size, offset)
+        crc, payload_length, id_length = _RECORD_HEADER.unpack(header)
+        body = _read_at(fd, id_length + payload_length, offset + len(header))
+        if zlib.crc32(body) != crc:
+            raise ValueError(f"Повреждена запись журнала: сегмент {segment} @ {offset}")
+        return loads(body[id_length:].decode("utf-8"))
+
+    def _reader(self, segment: int) -> int:
+        fd = self._readers.get(segment)
+        if fd is None:
+            with self._readers_lock:
+                fd = self._readers.get(segment)
+                if fd is None:
+                    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+                    fd = os.open(self._segment_path(segment), flags)
+                    self._readers[segment] = fd
+        return fd
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._directory, f"{segment:08d}.log")
+
+    @staticmethod
+    def _lock_directory(directory: str):
+        lock_file = open(os.path.join(directory, "LOCK"), "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise RuntimeError(f"Журнал {directory} уже открыт другим процессом")
+        return lock_file
+
+
+def _is_torn_tail(data: bytes, offset: int) -> bool:
+    """
+    Недописанная последняя запись: с offset до конца файла только она
+
+    Признаки: заголовок не поместился, запись по заголовку доходит до
+    конца файла или дальше, или вместо записи нули (файл расширен, а
+    данные не дошли до диска).
+    """
+    if not data[offset:].strip(b"\0"):
+        return True
+    if offset + _RECORD_HEADER.size > len(data):
+        return True
+    _, payload_length, id_length = _RECORD_HEADER.unpack_from(data, offset)
+    return offset + _RECORD_HEADER.size + id_length + payload_length >= len(data)
+
+
+def _merge(
+    old: Iterable[Tuple[bytes, int]],
+    newer: List[Tuple[bytes, int]]
+) -> Iterator[Tuple[bytes, int]]:
+    """Слить две отсортированные последовательности; newer важнее"""
+    newer_iter = iter(newer)
+    pending = next(newer_iter, None)
+    for key, position in old:
+        while pending is not None and pending[0] < key:
+            yield pending
+            pending = next(newer_iter, None)
+        if pending is not None and pending[0] == key:
+            yield pending
+            pending = next(newer_iter, None)
+        else:
+            yield key, position
+    if pending is not None:
+        yield pending
+        yield from newer_iter
+
+
+if hasattr(os, "pread"):
+    def _read_at(fd: int, size: int, offset: int) -> bytes:
+        return os.pread(fd, size, offset)
+else:  # Windows: pread нет, seek + read под блокировкой
+    _seek_lock = threading.Lock()
+
+    def _read_at(fd: int, size: int, offset: int) -> bytes:
+        with _seek_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.read(fd, size)
+
+
+def _fsync_directory(directory: str) -> None:
+    """fsync каталога: новое имя файла переживёт сбой (только POSIX)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,45 @@
+"""
+Infrastructure Layer: AsyncMockSmsService
+
+Исходящий адаптер: асинхронная имитация SMS-шлюза.
+Реализует AsyncNotificationService (исходящий порт).
+
+Задержка шлюза имитируется через asyncio.sleep: пока одно
+сообщение «в пути», event loop обслуживает другие запросы.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Dict, List
+
+from application.port.out import AsyncNotificationService, SmsMessage
+
+
+class AsyncMockSmsService(AsyncNotificationService):
+    """Адаптер: SMS-сервис-заглушка (async)"""
+    
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency: Имитация времени ответа шлюза, секунды
+        """
+        self._latency = latency
+    
+    async def send_sms(self, phone: str, message: str) -> None:
+        await self._send_bulk([phone], message)
+    
+    async def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        """Один вызов шлюза на каждый уникальный текст"""
+        by_text: Dict[str, List[str]] = defaultdict(list)
+        for sms in messages:
+            by_text[sms.message].append(sms.phone)
+        
+        await asyncio.gather(*(
+            self._send_bulk(phones, message)
+            for message, phones in by_text.items()
+        ))
+    
+    async def _send_bulk(self, phones: List[str], message: str) -> None:
+        await asyncio.sleep(self._latency)
+        print(f"📱 [SMS] Кому: {', '.join(phones)}")
+        print(f"   Сообщение: {message}")
+        print()
@@ -0,0 +1,261 @@
+"""
+Infrastructure Layer: BlockLeasingRequestIdAllocator
+
+Исходящий адаптер: выдача ID заявок блоками (block leasing).
+Реализует RequestIdAllocator (исходящий порт).
+
+Идея:
+- Процесс (uvicorn worker) арендует у источника диапазон номеров,
+  например [101, 201), и раздаёт их из памяти без блокировок
+- Источник (SequenceBlockSource) гарантирует, что диапазоны
+  не пересекаются ни между процессами, ни между перезапусками
+- Следующий блок подгружается в фоне, когда текущий почти исчерпан
+
+Неиспользованные номера блока при остановке процесса теряются
+(в нумерации появляются пропуски), но повторов не бывает.
+"""
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Optional
+
+from application.port.out import RequestIdAllocator
+
+try:  # Linux / macOS
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class SequenceBlockSource(ABC):
+    """Источник непересекающихся диапазонов номеров"""
+
+    @abstractmethod
+    def lease(self, year: int, size: int) -> range:
+        """
+        Арендовать диапазон номеров на указанный год
+
+        Args:
+            year: Год (нумерация REQ-YYYY-NNNN начинается заново каждый год)
+            size: Размер блока
+
+        Returns:
+            Диапазон номеров, который больше никому не будет выдан
+        """
+        pass
+
+
+class InMemorySequenceBlockSource(SequenceBlockSource):
+    """Источник блоков в памяти (один процесс, без сохранения)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next: Dict[int, int] = {}
+
+    def lease(self, year: int, size: int) -> range:
+        with self._lock:
+            start = self._next.get(year, 1)
+            self._next[year] = start + size
+        return range(start, start + size)
+
+
+class FileSequenceBlockSource(SequenceBlockSource):
+    """
+    Источник блоков в файле (переживает перезапуск)
+
+    Файл хранит следующий свободный номер по годам: {"2024": 401}.
+    Несколько процессов на одной машине согласуются через
+    файловую блокировку (<path>.lock); запись атомарная
+    (временный файл + os.replace + fsync).
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock_path = f"{path}.lock"
+        self._thread_lock = threading.Lock()
+
+    def lease(self, year: int, size: int) -> range:
+        with self._thread_lock, open(self._lock_path, "a+b") as lock_file:
+            self._acquire(lock_file)
+            try:
+                state = self._read_state()
+                start = state.get(str(year), 1)
+                state[str(year)] = start + size
+                self._write_state(state)
+            finally:
+                self._release(lock_file)
+        return range(start, start + size)
+
+    def _read_state(self) -> Dict[str, int]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_state(self, state: Dict[str, int]) -> None:
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+
+    @staticmethod
+    def _acquire(lock_file) -> None:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _release(lock_file) -> None:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class _Block:
+    """Арендованный блок номеров на конкретный год"""
+
+    __slots__ = ("year", "numbers", "refill_at")
+
+    def __init__(self, year: int, numbers: range, refill_ratio: float):
+        self.year = year
+        self.numbers: Iterator[int] = iter(numbers)
+        # Номер, после выдачи которого пора подгружать следующий блок
+        self.refill_at = numbers.start + int(len(numbers) * (1 - refill_ratio))
+
+
+class BlockLeasingRequestIdAllocator(RequestIdAllocator):
+    """
+    Адаптер: Выдача ID заявок из арендованных блоков
+
+    Горячий путь — next() по итератору range: атомарно под GIL,
+    поэтому потоки не ждут друг друга. Блокировка берётся только
+    на границе блоков.
+    """
+
+    def __init__(
+        self,
+        source: SequenceBlockSource,
+        block_size: int = 100,
+        refill_ratio: float = 0.2,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Args:
+            source: Источник непересекающихся блоков
+            block_size: Сколько номеров арендовать за одно обращение
+            refill_ratio: Доля остатка блока, при которой начинается
+                фоновая подгрузка следующего блока
+            clock: Источник текущего времени (для тестов)
+        """
+        if block_size < 1:
+            raise ValueError("block_size должен быть положительным")
+
+        self._source = source
+        self._block_size = block_size
+        self._refill_ratio = refill_ratio
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._block: Optional[_Block] = None
+        self._next_block: Optional[_Block] = None
+        self._refilling = False
+
+    def next_id(self) -> str:
+        """Выдать следующий ID формата REQ-YYYY-NNNN"""
+        year = self._clock().year
+        return self._take(year) or self._next_id_slow(year)
+
+    def try_next_id(self) -> Optional[str]:
+        """
+        Выдать ID без обращения к источнику
+
+        Берёт номер из текущего блока или из блока, уже подгруженного
+        в фоне. None — блоков нет (или их сейчас меняет другой поток):
+        нужен next_id(), который может ждать файловую блокировку.
+        """
+        year = self._clock().year
+        request_id = self._take(year)
+        if request_id is None and self._switch_to_prefetched(year):
+            request_id = self._take(year)
+        return request_id
+
+    def _take(self, year: int) -> Optional[str]:
+        """Горячий путь: номер из текущего блока без блокировок"""
+        block = self._block
+        if block is None or block.year != year:
+            return None
+        number = next(block.numbers, None)
+        if number is None:
+            return None
+        if number >= block.refill_at:
+            self._schedule_refill(year)
+        return f"REQ-{year}-{number:04d}"
+
+    def _switch_to_prefetched(self, year: int) -> bool:
+        """Сделать текущим блок из фоновой подгрузки (без ожидания блокировки)"""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            prefetched = self._next_block
+            if prefetched is None or prefetched.year != year:
+                return False
+            self._block, self._next_block = prefetched, None
+            return True
+        finally:
+            self._lock.release()
+
+    def _next_id_slow(self, year: int) -> str:
+        """Текущий блок исчерпан (или сменился год): переключиться на новый"""
+        with self._lock:
+            while True:
+                block = self._block
+                if block is not None and block.year == year:
+                    number = next(block.numbers, None)
+                    if number is not None:
+                        return f"REQ-{year}-{number:04d}"
+
+                prefetched, self._next_block = self._next_block, None
+                if prefetched is not None and prefetched.year == year:
+                    self._block = prefetched
+                else:
+                    self._block = self._lease(year)
+
+    def _schedule_refill(self, year: int) -> None:
+        """Запустить фоновую аренду следующего блока (не более одной)"""
+        # Блокировку может держать поток, арендующий блок в
+        # _next_id_slow: горячий путь его не ждёт, подгрузку
+        # запустит следующий номер
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._refilling or self._next_block is not None:
+                return
+            self._refilling = True
+        finally:
+            self._lock.release()
+
+        threading.Thread(
+            target=self._refill, args=(year,), daemon=True
+        ).start()
+
+    def _refill(self, year: int) -> None:
+        try:
+            block = self._lease(year)
+            with self._lock:
+                self._next_block = block
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    def _lease(self, year: int) -> _Block:
+        numbers = self._source.lease(year, self._block_size)
+        return _Block(year, numbers, self._refill_ratio)
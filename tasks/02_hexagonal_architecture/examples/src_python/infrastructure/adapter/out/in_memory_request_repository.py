@@ -0,0 +1,197 @@
+"""
+Infrastructure Layer: InMemoryRequestRepository
+
+Исходящий адаптер: хранение заявок в памяти процесса.
+Реализует RequestRepository (исходящий порт).
+
+Устройство:
+- Заявки разбиты на шарды по хэшу ID, у каждого шарда своя
+  блокировка (lock striping): потоки, сохраняющие разные заявки,
+  как правило, не ждут друг друга
+- В каждом шарде — вторичные индексы по статусу, зоне и
+  координатору, поэтому запрос «все ACTIVE в NORTH» — пересечение
+  множеств, а не полный перебор
+- Индексы строятся при первом find_by и дальше обновляются при
+  save. Пока find_by не вызывали, save — запись в dict без
+  блокировки: горячий путь не платит за индексы, которые никто
+  не читает
+
+Индексы отражают состояние заявки на момент последнего save:
+после изменения агрегата его нужно сохранить снова.
+"""
+import threading
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from application.port.out import RequestRepository
+from domain import Request, RequestStatus, Zone
+
+# Ключ индексов заявки: (статус, зона, координатор). Статус и зона
+# хранятся по имени: строки хэшируются и сравниваются быстрее Enum
+_IndexKey = Tuple[str, str, str]
+_EMPTY: Set[str] = frozenset()
+
+
+class _Shard:
+    """Шард: часть заявок, их индексы и своя блокировка"""
+
+    __slots__ = (
+        "lock", "requests", "indexed", "keys",
+        "by_status", "by_zone", "by_coordinator", "by_status_zone",
+    )
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests: Dict[str, Request] = {}
+        self.indexed = False
+        self.keys: Dict[str, _IndexKey] = {}
+        self.by_status: Dict[str, Set[str]] = {}
+        self.by_zone: Dict[str, Set[str]] = {}
+        self.by_coordinator: Dict[str, Set[str]] = {}
+        # Составной индекс для самого частого запроса «статус + зона»
+        self.by_status_zone: Dict[Tuple[str, str], Set[str]] = {}
+
+    def build_indexes(self) -> None:
+        """Построить индексы по уже сохранённым заявкам (под self.lock)"""
+        # Флаг — до копии: save без блокировки, не попавший в копию,
+        # увидит его и переиндексирует заявку сам
+        self.indexed = True
+        for request in list(self.requests.values()):
+            self.put(request)
+
+    def put(self, request: Request) -> None:
+        """Сохранить заявку и обновить индексы (под self.lock)"""
+        request_id = request.id
+        key = (request.status.name, request.zone.name, request.coordinator_id)
+        old_key = self.keys.get(request_id)
+
+        if old_key != key:
+            if old_key is not None:
+                self._unindex(old_key, request_id)
+            status, zone, coordinator_id = key
+            self.by_status.setdefault(status, set()).add(request_id)
+            self.by_zone.setdefault(zone, set()).add(request_id)
+            self.by_coordinator.setdefault(coordinator_id, set()).add(request_id)
+            self.by_status_zone.setdefault((status, zone), set()).add(request_id)
+            self.keys[request_id] = key
+
+        self.requests[request_id] = request
+
+    def _unindex(self, key: _IndexKey, request_id: str) -> None:
+        status, zone, coordinator_id = key
+        _discard(self.by_status, status, request_id)
+        _discard(self.by_zone, zone, request_id)
+        _discard(self.by_coordinator, coordinator_id, request_id)
+        _discard(self.by_status_zone, (status, zone), request_id)
+
+
+def _discard(index: Dict[Hashable, Set[str]], value: Hashable, request_id: str) -> None:
+    ids = index.get(value)
+    if ids is not None:
+        ids.discard(request_id)
+        if not ids:
+            del index[value]
+
+
+class InMemoryRequestRepository(RequestRepository):
+    """Адаптер: Репозиторий заявок в памяти (шардированный, с индексами)"""
+
+    def __init__(self, shards: int = 16, verbose: bool = True):
+        """
+        Args:
+            shards: Число шардов (блокировок)
+            verbose: Печатать сообщения о сохранении (для примеров)
+        """
+        if shards < 1:
+            raise ValueError("shards должно быть положительным")
+        self._shards = [_Shard() for _ in range(shards)]
+        self._verbose = verbose
+
+    def save(self, request: Request) -> None:
+        """Сохранить заявку"""
+        request_id = request.id
+        shard = self._shards[hash(request_id) % len(self._shards)]
+        if not shard.indexed:
+            # Индексов нет: запись в dict атомарна, блокировка не нужна
+            shard.requests[request_id] = request
+        if shard.indexed:
+            with shard.lock:
+                shard.put(request)
+        if self._verbose:
+            print(f"✅ [Repository] Сохранена заявка: {request.id}")
+
+    def save_many(self, requests: List[Request]) -> None:
+        """Сохранить пакет заявок (одна блокировка на шард)"""
+        by_shard: Dict[int, List[Request]] = {}
+        for request in requests:
+            by_shard.setdefault(self._shard_index(request.id), []).append(request)
+
+        for index, shard_requests in by_shard.items():
+            shard = self._shards[index]
+            if not shard.indexed:
+                shard.requests.update(
+                    (request.id, request) for request in shard_requests
+                )
+            if shard.indexed:
+                with shard.lock:
+                    for request in shard_requests:
+                        shard.put(request)
+        if self._verbose:
+            print(f"✅ [Repository] Сохранено заявок: {len(requests)}")
+
+    def find_by_id(self, request_id: str) -> Optional[Request]:
+        """Найти заявку по ID (чтение из dict атомарно, без блокировки)"""
+        return self._shard_for(request_id).requests.get(request_id)
+
+    def find_all(self) -> List[Request]:
+        """Получить все заявки"""
+        result: List[Request] = []
+        for shard in self._shards:
+            with shard.lock:
+                result.extend(shard.requests.values())
+        return result
+
+    def find_by(
+        self,
+        status: Optional[RequestStatus] = None,
+        zone: Optional[Zone] = None,
+        coordinator_id: Optional[str] = None
+    ) -> List[Request]:
+        """Найти заявки по индексам (пересечение множеств ID)"""
+        if status is None and zone is None and coordinator_id is None:
+            return self.find_all()
+
+        status_name = status.name if status is not None else None
+        zone_name = zone.name if zone is not None else None
+
+        result: List[Request] = []
+        for shard in self._shards:
+            with shard.lock:
+                if not shard.indexed:
+                    shard.build_indexes()
+                candidates: List[Set[str]] = []
+                if status_name is not None and zone_name is not None:
+                    candidates.append(
+                        shard.by_status_zone.get((status_name, zone_name), _EMPTY)
+                    )
+                elif status_name is not None:
+                    candidates.append(shard.by_status.get(status_name, _EMPTY))
+                elif zone_name is not None:
+                    candidates.append(shard.by_zone.get(zone_name, _EMPTY))
+                if coordinator_id is not None:
+                    candidates.append(shard.by_coordinator.get(coordinator_id, _EMPTY))
+
+                # Пересекать, начиная с самого маленького множества
+                candidates.sort(key=len)
+                ids = candidates[0]
+                if len(candidates) > 1:
+                    ids = ids.intersection(*candidates[1:])
+
+                requests = shard.requests
+                result.extend([requests[request_id] for request_id in ids])
+        return result
+
+    def _shard_index(self, request_id: str) -> int:
+        return hash(request_id) % len(self._shards)
+
+    def _shard_for(self, request_id: str) -> _Shard:
+        return self._shards[hash(request_id) % len(self._shards)]
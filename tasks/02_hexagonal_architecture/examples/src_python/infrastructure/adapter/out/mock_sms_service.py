@@ -0,0 +1,47 @@
+"""
+Infrastructure Layer: MockSmsService
+
+Исходящий адаптер: имитация SMS-шлюза (вывод в консоль).
+Реализует NotificationService (исходящий порт).
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+from application.port.out import NotificationService, SmsMessage
+
+
+class MockSmsService(NotificationService):
+    """Адаптер: SMS-сервис-заглушка"""
+    
+    def __init__(self, verbose: bool = True):
+        """
+        Args:
+            verbose: Печатать сообщения (выключается для массового импорта)
+        """
+        self._verbose = verbose
+    
+    def send_sms(self, phone: str, message: str) -> None:
+        """Отправить SMS (вывод в консоль)"""
+        self._send_bulk([phone], message)
+    
+    def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        """
+        Отправить пакет SMS
+        
+        Сообщения с одинаковым текстом уходят одним вызовом шлюза
+        (типичный bulk API: один текст — список получателей).
+        """
+        by_text: Dict[str, List[str]] = defaultdict(list)
+        for sms in messages:
+            by_text[sms.message].append(sms.phone)
+        
+        for message, phones in by_text.items():
+            self._send_bulk(phones, message)
+    
+    def _send_bulk(self, phones: List[str], message: str) -> None:
+        """Один вызов шлюза на группу получателей"""
+        if not self._verbose:
+            return
+        print(f"📱 [SMS] Кому: {', '.join(phones)}")
+        print(f"   Сообщение: {message}")
+        print()
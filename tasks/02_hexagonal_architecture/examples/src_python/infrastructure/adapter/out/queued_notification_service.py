@@ -0,0 +1,280 @@
+"""
+Infrastructure Layer: QueuedNotificationService
+
+Исходящий адаптер: очередь исходящих SMS в памяти с пулом воркеров.
+Реализует NotificationService (исходящий порт) поверх другого
+NotificationService — реального шлюза.
+
+Зачем:
+- create_request не ждёт SMS-шлюз: сообщения кладутся в очередь,
+  и вызов сразу возвращается
+- Воркеры забирают сообщения пачками и отправляют их через
+  send_sms_many шлюза (меньше сетевых вызовов)
+- Сбой шлюза → повтор с экспоненциальной задержкой,
+  статус доставки хранится по message_id
+
+Это не transactional outbox: очередь живёт только в памяти процесса,
+и при падении недоставленные SMS теряются. Надёжная доставка —
+таблица outbox в той же транзакции, что и заявка (лекция 10).
+"""
+import random
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+from typing import Dict, List, Optional
+
+from application.port.out import NotificationService, SmsMessage, DeliveryStatus
+
+
+@dataclass
+class _QueuedSms:
+    """Сообщение в очереди и состояние его доставки"""
+    sms: SmsMessage
+    status: DeliveryStatus = DeliveryStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+
+class QueuedNotificationService(NotificationService):
+    """
+    Адаптер: Асинхронная отправка SMS через очередь в памяти
+
+    Очередь ограничена (max_pending): при переполнении вызывающий
+    ждёт освобождения места — это backpressure, а не потеря сообщений.
+    После close() новые сообщения не принимаются.
+    """
+
+    def __init__(
+        self,
+        provider: NotificationService,
+        workers: int = 4,
+        batch_size: int = 50,
+        max_pending: int = 10_000,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        history_size: int = 100_000
+    ):
+        """
+        Args:
+            provider: Реальный шлюз (например, MockSmsService)
+            workers: Размер пула воркеров
+            batch_size: Максимум сообщений в одном вызове шлюза
+            max_pending: Ёмкость очереди
+            max_attempts: Сколько раз пытаться доставить сообщение
+            base_delay: Задержка перед первым повтором, секунды
+            max_delay: Потолок задержки между повторами, секунды
+            history_size: Сколько статусов доставки помнить
+        """
+        self._provider = provider
+        self._workers = workers
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._history_size = history_size
+
+        # None в очереди — сигнал воркеру остановиться
+        self._queue: "Queue[Optional[_QueuedSms]]" = Queue(maxsize=max_pending)
+        self._records: "OrderedDict[str, _QueuedSms]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._unfinished = 0
+        self._threads: List[threading.Thread] = []
+        # Повторы, ждущие таймера: close() отменяет их
+        self._retries: Dict[threading.Timer, List[_QueuedSms]] = {}
+        self._closed = False
+        self._stopping = False
+
+    def send_sms(self, phone: str, message: str) -> None:
+        """Поставить одно SMS в очередь"""
+        self.send_sms_many([SmsMessage(phone=phone, message=message)])
+
+    def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        """
+        Поставить пакет SMS в очередь (возврат без ожидания шлюза)
+
+        Raises:
+            RuntimeError: если сервис уже закрыт
+        """
+        records = [_QueuedSms(sms=sms) for sms in messages]
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Очередь SMS закрыта: новые сообщения не принимаются")
+            if not self._threads:
+                self._start_workers()
+            # Учтены до close(): close дождётся их доставки
+            self._unfinished += len(records)
+            for record in records:
+                self._remember(record)
+        for record in records:
+            self._queue.put(record)
+
+    def get_status(self, message_id: str) -> Optional[DeliveryStatus]:
+        """Статус доставки сообщения (None — неизвестный message_id)"""
+        with self._lock:
+            record = self._records.get(message_id)
+            return record.status if record else None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Дождаться обработки всех сообщений (включая повторы)
+
+        Returns:
+            True, если очередь пуста; False — истёк timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: self._unfinished == 0, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Перестать принимать сообщения, доотправить очередь и
+        остановить воркеры
+
+        Сообщения, не доставленные за timeout (в том числе ждущие
+        повтора), получают статус FAILED.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.flush(timeout)
+
+        with self._lock:
+            self._stopping = True
+            retries, self._retries = self._retries, {}
+        for timer, records in retries.items():
+            timer.cancel()
+            self._abandon(records)
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except Full:
+                break  # воркеры заметят _stopping по таймауту get
+        for thread in self._threads:
+            thread.join()
+
+        # Не успели за timeout: больше их никто не отправит
+        abandoned: List[_QueuedSms] = []
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except Empty:
+                break
+            if record is not None:
+                abandoned.append(record)
+        self._abandon(abandoned)
+
+    def _start_workers(self) -> None:
+        """Вызывается под self._lock при первом сообщении"""
+        for i in range(self._workers):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name=f"sms-queue-{i}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker_loop(self) -> None:
+        while not self._stopping:
+            try:
+                first = self._queue.get(timeout=0.5)
+            except Empty:
+                continue
+            if first is None:
+                return
+
+            batch = [first]
+            stop = False
+            while len(batch) < self._batch_size:
+                try:
+                    record = self._queue.get_nowait()
+                except Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+
+            self._deliver(batch)
+            if stop:
+                return
+
+    def _deliver(self, batch: List[_QueuedSms]) -> None:
+        """Один вызов шлюза на пачку; при сбое — повтор с backoff"""
+        try:
+            self._provider.send_sms_many([record.sms for record in batch])
+        except Exception as e:
+            self._handle_failure(batch, e)
+            return
+
+        with self._lock:
+            for record in batch:
+                record.attempts += 1
+                record.status = DeliveryStatus.SENT
+            self._finish(len(batch))
+
+    def _handle_failure(self, batch: List[_QueuedSms], error: Exception) -> None:
+        retry: List[_QueuedSms] = []
+        with self._lock:
+            for record in batch:
+                record.attempts += 1
+                record.last_error = str(error)
+                if record.attempts >= self._max_attempts:
+                    record.status = DeliveryStatus.FAILED
+                else:
+                    retry.append(record)
+            self._finish(len(batch) - len(retry))
+
+        if not retry:
+            return
+
+        # Экспоненциальная задержка с джиттером
+        attempts = max(record.attempts for record in retry)
+        delay = min(self._max_delay, self._base_delay * 2 ** (attempts - 1))
+        delay *= random.uniform(0.5, 1.0)
+        with self._lock:
+            if self._stopping:
+                timer = None
+            else:
+                timer = threading.Timer(delay, lambda: self._requeue(timer))
+                timer.daemon = True
+                self._retries[timer] = retry
+                timer.start()
+        if timer is None:
+            self._abandon(retry)
+
+    def _requeue(self, timer: threading.Timer) -> None:
+        with self._lock:
+            records = self._retries.pop(timer, None)
+        if records is None:
+            return  # отменён в close()
+        for record in records:
+            self._queue.put(record)
+
+    def _abandon(self, records: List[_QueuedSms]) -> None:
+        """Сообщения, которые уже не будут отправлены (после close)"""
+        if not records:
+            return
+        with self._lock:
+            for record in records:
+                record.status = DeliveryStatus.FAILED
+                record.last_error = record.last_error or "Очередь закрыта до доставки"
+            self._finish(len(records))
+
+    def _remember(self, record: _QueuedSms) -> None:
+        """Запомнить запись (старейшие статусы вытесняются)"""
+        self._records[record.sms.message_id] = record
+        while len(self._records) > self._history_size:
+            self._records.popitem(last=False)
+
+    def _finish(self, count: int) -> None:
+        """Вызывается под self._lock"""
+        if count:
+            self._unfinished -= count
+            if self._unfinished == 0:
+                self._idle.notify_all()
@@ -0,0 +1,58 @@
+"""
+Infrastructure Layer: Request serializer
+
+Преобразование агрегата Request в JSON и обратно для адаптеров,
+хранящих заявки вне памяти процесса.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+from domain import Request, Group, Zone, RequestStatus
+
+
+def request_to_dict(request: Request) -> Dict[str, Any]:
+    """Состояние заявки в виде словаря (только JSON-типы)"""
+    group = request.group
+    return {
+        "id": request.id,
+        "coordinator_id": request.coordinator_id,
+        "zone": request.zone.name,
+        "status": request.status.name,
+        "created_at": request.created_at.isoformat(),
+        "group": None if group is None else {
+            "id": group.id,
+            "member_ids": list(group.member_ids),
+            "leader_id": group.leader_id,
+        },
+    }
+
+
+def request_from_dict(data: Dict[str, Any]) -> Request:
+    """Восстановить заявку из словаря request_to_dict"""
+    group_data = data["group"]
+    group = None if group_data is None else Group.restore(
+        group_id=group_data["id"],
+        member_ids=group_data["member_ids"],
+        leader_id=group_data["leader_id"]
+    )
+    return Request.restore(
+        request_id=data["id"],
+        coordinator_id=data["coordinator_id"],
+        zone=Zone[data["zone"]],
+        status=RequestStatus[data["status"]],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        group=group
+    )
+
+
+def dumps(request: Request) -> str:
+    """Заявка → компактный JSON"""
+    return json.dumps(
+        request_to_dict(request), ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def loads(payload: str) -> Request:
+    """JSON → заявка"""
+    return request_from_dict(json.loads(payload))
@@ -0,0 +1,133 @@
+"""
+Infrastructure Layer: SqliteRequestRepository
+
+Исходящий адаптер: хранение заявок во встроенной БД SQLite.
+Реализует RequestRepository (исходящий порт).
+
+Нужен для режима с несколькими воркерами (main.py --workers N):
+InMemoryRequestRepository у каждого процесса свой, а файл SQLite
+общий для всех воркеров на машине.
+
+- Журнал WAL: читатели не блокируют писателя и наоборот
+- save возвращается после COMMIT, поэтому следующий запрос —
+  в том же или другом воркере — видит запись (read-your-writes)
+- Статус, зона и координатор — отдельные индексированные колонки
+  для find_by; агрегат целиком хранится в JSON (request_serializer)
+
+Вызовы блокирующие: в async-коде адаптер оборачивается
+ThreadPoolRequestRepository с offload=True.
+"""
+import sqlite3
+import threading
+from typing import List, Optional
+
+from application.port.out import RequestRepository
+from domain import Request, RequestStatus, Zone
+
+from .request_serializer import dumps, loads
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    zone TEXT NOT NULL,
+    coordinator_id TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_requests_status_zone ON requests (status, zone);
+CREATE INDEX IF NOT EXISTS ix_requests_coordinator ON requests (coordinator_id);
+"""
+
+_UPSERT = (
+    "INSERT INTO requests (id, status, zone, coordinator_id, body) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET status = excluded.status, "
+    "zone = excluded.zone, coordinator_id = excluded.coordinator_id, "
+    "body = excluded.body"
+)
+
+
+class SqliteRequestRepository(RequestRepository):
+    """Адаптер: Репозиторий заявок в SQLite (общий для процессов)"""
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        """
+        Args:
+            path: Путь к файлу БД
+            busy_timeout: Сколько ждать блокировку записи другим
+                процессом, секунды
+        """
+        self._path = path
+        self._busy_timeout = busy_timeout
+        # Соединение SQLite нельзя делить между потоками
+        self._local = threading.local()
+        self._connection().executescript(_SCHEMA)
+
+    def save(self, request: Request) -> None:
+        """Сохранить заявку (создать или обновить)"""
+        connection = self._connection()
+        with connection:
+            connection.execute(_UPSERT, self._row(request))
+
+    def save_many(self, requests: List[Request]) -> None:
+        """Сохранить пакет заявок одной транзакцией"""
+        connection = self._connection()
+        with connection:
+            connection.executemany(_UPSERT, [self._row(r) for r in requests])
+
+    def find_by_id(self, request_id: str) -> Optional[Request]:
+        """Найти заявку по ID"""
+        row = self._connection().execute(
+            "SELECT body FROM requests WHERE id = ?", (request_id,)
+        ).fetchone()
+        return loads(row[0]) if row else None
+
+    def find_all(self) -> List[Request]:
+        """Получить все заявки"""
+        rows = self._connection().execute("SELECT body FROM requests")
+        return [loads(body) for (body,) in rows]
+
+    def find_by(
+        self,
+        status: Optional[RequestStatus] = None,
+        zone: Optional[Zone] = None,
+        coordinator_id: Optional[str] = None
+    ) -> List[Request]:
+        """Найти заявки по индексированным колонкам"""
+        conditions: List[str] = []
+        params: List[str] = []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status.name)
+        if zone is not None:
+            conditions.append("zone = ?")
+            params.append(zone.name)
+        if coordinator_id is not None:
+            conditions.append("coordinator_id = ?")
+            params.append(coordinator_id)
+
+        query = "SELECT body FROM requests"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        rows = self._connection().execute(query, params)
+        return [loads(body) for (body,) in rows]
+
+    @staticmethod
+    def _row(request: Request) -> tuple:
+        return (
+            request.id,
+            request.status.name,
+            request.zone.name,
+            request.coordinator_id,
+            dumps(request),
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=self._busy_timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # В WAL режим NORMAL не теряет целостность при сбое процесса
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
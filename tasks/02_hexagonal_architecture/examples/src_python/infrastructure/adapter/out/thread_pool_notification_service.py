@@ -0,0 +1,49 @@
+"""
+Infrastructure Layer: ThreadPoolNotificationService
+
+Исходящий адаптер: асинхронные уведомления поверх синхронного сервиса.
+Реализует AsyncNotificationService (исходящий порт).
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional
+
+from application.port.out import (
+    AsyncNotificationService,
+    NotificationService,
+    SmsMessage,
+)
+
+
+class ThreadPoolNotificationService(AsyncNotificationService):
+    """Адаптер: NotificationService → AsyncNotificationService"""
+    
+    def __init__(
+        self,
+        notifications: NotificationService,
+        executor: Optional[Executor] = None,
+        offload: bool = True
+    ):
+        """
+        Args:
+            notifications: Синхронный сервис уведомлений
+            executor: Пул потоков (None — пул event loop по умолчанию)
+            offload: False — вызывать напрямую; только для сервисов,
+                которые никогда не ждут (QueuedNotificationService при
+                полной очереди ждёт места — его вызывать через пул)
+        """
+        self._notifications = notifications
+        self._executor = executor
+        self._offload = offload
+    
+    async def send_sms(self, phone: str, message: str) -> None:
+        await self.send_sms_many([SmsMessage(phone=phone, message=message)])
+    
+    async def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        if not self._offload:
+            self._notifications.send_sms_many(messages)
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor, self._notifications.send_sms_many, messages
+        )
@@ -0,0 +1,66 @@
+"""
+Infrastructure Layer: ThreadPoolRequestRepository
+
+Исходящий адаптер: асинхронный репозиторий поверх синхронного.
+Реализует AsyncRequestRepository (исходящий порт).
+
+Блокирующие вызовы (драйвер БД, файл) выполняются в пуле потоков,
+и event loop продолжает обслуживать другие запросы.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, List, Optional, TypeVar
+
+from application.port.out import AsyncRequestRepository, RequestRepository
+from domain import Request, RequestStatus, Zone
+
+T = TypeVar("T")
+
+
+class ThreadPoolRequestRepository(AsyncRequestRepository):
+    """Адаптер: RequestRepository → AsyncRequestRepository"""
+    
+    def __init__(
+        self,
+        repository: RequestRepository,
+        executor: Optional[Executor] = None,
+        offload: bool = True
+    ):
+        """
+        Args:
+            repository: Синхронный репозиторий
+            executor: Пул потоков (None — пул event loop по умолчанию)
+            offload: False — вызывать напрямую (для репозиториев
+                в памяти, которые не блокируют)
+        """
+        self._repository = repository
+        self._executor = executor
+        self._offload = offload
+    
+    async def save(self, request: Request) -> None:
+        await self._call(self._repository.save, request)
+    
+    async def save_many(self, requests: List[Request]) -> None:
+        await self._call(self._repository.save_many, requests)
+    
+    async def find_by_id(self, request_id: str) -> Optional[Request]:
+        return await self._call(self._repository.find_by_id, request_id)
+    
+    async def find_all(self) -> List[Request]:
+        return await self._call(self._repository.find_all)
+    
+    async def find_by(
+        self,
+        status: Optional[RequestStatus] = None,
+        zone: Optional[Zone] = None,
+        coordinator_id: Optional[str] = None
+    ) -> List[Request]:
+        return await self._call(
+            self._repository.find_by, status, zone, coordinator_id
+        )
+    
+    async def _call(self, method: Callable[..., T], *args) -> T:
+        if not self._offload:
+            return method(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, method, *args)
@@ -2,55 +2,265 @@
 Infrastructure Layer: Dependency Injection Configuration
 
 Конфигурация Dependency Injection (DI).
-Здесь создаются экземпляры адаптеров и сервисов.
+Здесь описывается граф провайдеров адаптеров и сервисов.
+
+Компоненты создаются лениво, при первом обращении: CLI не
+импортирует FastAPI и не поднимает то, что ему не нужно.
+Модули адаптеров указываются строками "module:attr" и загружаются
+только вместе со своим провайдером.
+
+Переменные окружения:
+- REQUEST_REPOSITORY: memory (по умолчанию), sqlite — общий
+  файл для нескольких воркеров (main.py --workers N) или log —
+  журнал на диске для одного процесса
+- REQUEST_DB_PATH: файл SQLite (по умолчанию requests.db)
+- REQUEST_LOG_DIR: каталог журнала (по умолчанию request_log)
+- REQUEST_ID_STATE_FILE: файл блоков номеров заявок
+- IDEMPOTENCY_STORE: memory (по умолчанию) или sqlite — ключи
+  Idempotency-Key в файле IDEMPOTENCY_DB_PATH (idempotency.db)
+- IDEMPOTENCY_TTL_SECONDS: сколько помнить ключ (по умолчанию сутки)
 """
-from fastapi import FastAPI
+import os
+import sys
+from typing import TYPE_CHECKING, Iterator
+
+from .providers import Lifetime, ProviderGraph, Ref, Resolver
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from application.port.out import RequestRepository
+    from application.service import AsyncRequestService, SyncRequestService
+
+_IN = "infrastructure.adapter.inbound"
+_OUT = "infrastructure.adapter.out"
+_SERVICE = "application.service"
 
-from application.port.out import RequestRepository, NotificationService
-from application.service import RequestService
-from infrastructure.adapter.out import InMemoryRequestRepository, MockSmsService
-from infrastructure.adapter.in import RequestController
+# Тяжёлые зависимости, загрузку которых показывает отчёт о старте
+_HEAVY_MODULES = ("fastapi", "uvicorn", "pydantic", "sqlalchemy", "pika")
 
 
 class DependencyContainer:
     """
     DI-контейнер: Управление зависимостями
-    
-    Создаёт и связывает все компоненты системы.
+
+    Описывает, как создавать и связывать компоненты системы;
+    создаёт их по требованию.
     """
-    
-    def __init__(self):
-        """Инициализация контейнера"""
-        # Создать исходящие адаптеры (реализации портов)
-        self._repository: RequestRepository = InMemoryRequestRepository()
-        self._notifications: NotificationService = MockSmsService()
-        
-        # Создать application service (инжектируем зависимости)
-        self._request_service = RequestService(
-            repository=self._repository,
-            notifications=self._notifications
+
+    def __init__(self, verbose: bool = True):
+        """
+        Инициализация контейнера (только регистрация провайдеров)
+
+        Args:
+            verbose: Печать заглушек (репозиторий в памяти, SMS);
+                массовый импорт выключает её
+        """
+        graph = ProviderGraph()
+
+        # Исходящие адаптеры (реализации портов)
+        backend = os.getenv("REQUEST_REPOSITORY", "memory")
+        if backend == "memory":
+            graph.register(
+                "repository",
+                f"{_OUT}.in_memory_request_repository:InMemoryRequestRepository",
+                verbose=verbose
+            )
+        elif backend == "sqlite":
+            # Общее хранилище для всех воркеров на машине
+            graph.register(
+                "repository",
+                f"{_OUT}.sqlite_request_repository:SqliteRequestRepository",
+                path=os.getenv("REQUEST_DB_PATH", "requests.db")
+            )
+        elif backend == "log":
+            # Журнал со снимками индекса: данные переживают перезапуск
+            graph.register(
+                "repository",
+                f"{_OUT}.append_only_log_request_repository:AppendOnlyLogRequestRepository",
+                directory=os.getenv("REQUEST_LOG_DIR", "request_log")
+            )
+        else:
+            raise ValueError(
+                f"Неизвестный REQUEST_REPOSITORY: {backend}. "
+                f"Допустимые: memory, sqlite, log"
+            )
+        graph.register(
+            "sms_gateway",
+            f"{_OUT}.mock_sms_service:MockSmsService",
+            verbose=verbose
+        )
+        # SMS уходят через очередь в памяти: create_request не ждёт шлюз
+        graph.register(
+            "notifications",
+            f"{_OUT}.queued_notification_service:QueuedNotificationService",
+            provider=Ref("sms_gateway")
+        )
+
+        # ID заявок: блоки номеров из файла, общего для всех воркеров
+        graph.register(
+            "request_id_source",
+            f"{_OUT}.block_leasing_request_id_allocator:FileSequenceBlockSource",
+            path=os.getenv("REQUEST_ID_STATE_FILE", "request_ids.json")
+        )
+        graph.register(
+            "request_ids",
+            f"{_OUT}.block_leasing_request_id_allocator:BlockLeasingRequestIdAllocator",
+            source=Ref("request_id_source")
+        )
+
+        # Async-варианты портов для FastAPI. Репозиторий в памяти не
+        # блокирует и вызывается без пула потоков; адаптеры с
+        # сетевым/дисковым I/O подключаются с offload=True. Очередь SMS
+        # тоже: при переполнении send_sms_many ждёт места (backpressure),
+        # и ждать должен поток пула, а не event loop
+        graph.register(
+            "async_repository",
+            f"{_OUT}.thread_pool_request_repository:ThreadPoolRequestRepository",
+            repository=Ref("repository"),
+            offload=backend != "memory"
+        )
+        graph.register(
+            "async_notifications",
+            f"{_OUT}.thread_pool_notification_service:ThreadPoolNotificationService",
+            notifications=Ref("notifications"),
+            offload=True
+        )
+
+        # Application service (инжектируем зависимости)
+        graph.register(
+            "async_request_service",
+            f"{_SERVICE}.async_request_service:AsyncRequestService",
+            repository=Ref("async_repository"),
+            notifications=Ref("async_notifications"),
+            request_ids=Ref("request_ids")
         )
-    
-    def get_request_service(self) -> RequestService:
-        """Получить RequestService (use-case)"""
-        return self._request_service
-    
-    def get_repository(self) -> RequestRepository:
+        # Синхронный shim для CLI и скриптов
+        graph.register(
+            "request_service",
+            f"{_SERVICE}.sync_request_service:SyncRequestService",
+            use_case=Ref("async_request_service"),
+            batch_use_case=Ref("async_request_service")
+        )
+
+        # Idempotency-Key: повтор POST возвращает сохранённый ответ
+        ttl = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", 24 * 3600))
+        idempotency_store = os.getenv("IDEMPOTENCY_STORE", "memory")
+        if idempotency_store == "memory":
+            graph.register(
+                "idempotency_store",
+                f"{_IN}.idempotency_store:InMemoryIdempotencyStore",
+                ttl=ttl
+            )
+        elif idempotency_store == "sqlite":
+            graph.register(
+                "idempotency_store",
+                f"{_IN}.idempotency_store:SqliteIdempotencyStore",
+                path=os.getenv("IDEMPOTENCY_DB_PATH", "idempotency.db"),
+                ttl=ttl
+            )
+        else:
+            raise ValueError(
+                f"Неизвестный IDEMPOTENCY_STORE: {idempotency_store}. "
+                f"Допустимые: memory, sqlite"
+            )
+        graph.register(
+            "idempotency",
+            f"{_IN}.idempotency_guard:IdempotencyGuard",
+            store=Ref("idempotency_store")
+        )
+
+        # Входящий адаптер (REST API): FastAPI загружается только здесь
+        graph.register(
+            "request_controller",
+            f"{_IN}.request_controller:RequestController",
+            lifetime=Lifetime.TRANSIENT,
+            app=Ref("web_app"),
+            use_case=Ref("async_request_service"),
+            batch_use_case=Ref("async_request_service"),
+            idempotency=Ref("idempotency")
+        )
+
+        self._graph = graph
+
+    @property
+    def providers(self) -> ProviderGraph:
+        """Граф провайдеров (для регистрации дополнительных компонентов)"""
+        return self._graph
+
+    def scope(self) -> Iterator[Resolver]:
+        """Область для scoped-компонентов (например, на HTTP-запрос)"""
+        return self._graph.scope()
+
+    def get_request_service(self) -> "SyncRequestService":
+        """Получить синхронный сервис заявок (use-case)"""
+        return self._graph.resolve("request_service")
+
+    def get_async_request_service(self) -> "AsyncRequestService":
+        """Получить асинхронный сервис заявок (use-case)"""
+        return self._graph.resolve("async_request_service")
+
+    def get_repository(self) -> "RequestRepository":
         """Получить репозиторий"""
-        return self._repository
-    
-    def configure_web_app(self, app: FastAPI) -> None:
+        return self._graph.resolve("repository")
+
+    def shutdown(self) -> None:
+        """Доотправить очередь уведомлений перед остановкой"""
+        # Закрывать только то, что успели создать
+        if self._graph.is_resolved("notifications"):
+            self._graph.resolve("notifications").close()
+        if self._graph.is_resolved("request_service"):
+            self._graph.resolve("request_service").close()
+        # Файловые репозитории дописывают очередь и снимок индекса
+        if self._graph.is_resolved("repository"):
+            close = getattr(self._graph.resolve("repository"), "close", None)
+            if close is not None:
+                close()
+
+    def configure_web_app(self, app: "FastAPI") -> None:
         """
         Настроить FastAPI приложение
-        
+
         Args:
             app: FastAPI приложение
         """
+        self._graph.register_instance("web_app", app)
+
         # Создать входящий адаптер (REST API)
-        RequestController(
-            app=app,
-            use_case=self._request_service
+        self._graph.resolve("request_controller")
+
+        app.add_event_handler("shutdown", self.shutdown)
+
+    def startup_report(self) -> str:
+        """
+        Отчёт о старте: время импорта и создания каждого провайдера
+
+        Время создания не включает зависимости (они — своими строками).
+        """
+        stats = sorted(
+            self._graph.stats(),
+            key=lambda s: s.import_seconds + s.build_seconds,
+            reverse=True
+        )
+        lines = [
+            f"{'provider':<24} {'lifetime':<10} {'import ms':>10} "
+            f"{'build ms':>10} {'instances':>9}"
+        ]
+        for s in stats:
+            lines.append(
+                f"{s.name:<24} {s.lifetime.value:<10} "
+                f"{s.import_seconds * 1e3:>10.2f} {s.build_seconds * 1e3:>10.2f} "
+                f"{s.instances:>9}"
+            )
+        total_import = sum(s.import_seconds for s in stats)
+        total_build = sum(s.build_seconds for s in stats)
+        lines.append(
+            f"{'total':<24} {'':<10} {total_import * 1e3:>10.2f} "
+            f"{total_build * 1e3:>10.2f}"
         )
+        loaded = [name for name in _HEAVY_MODULES if name in sys.modules]
+        lines.append(f"heavy modules loaded: {', '.join(loaded) or 'none'}")
+        return "\n".join(lines)
 
 
 # Глобальный экземпляр контейнера
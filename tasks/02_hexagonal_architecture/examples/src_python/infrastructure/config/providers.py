@@ -0,0 +1,211 @@
+"""
+Infrastructure Layer: ProviderGraph
+
+Ленивый граф провайдеров для DI-контейнера.
+
+- Провайдер — имя, фабрика, её аргументы и время жизни (Lifetime);
+  аргумент Ref("имя") — зависимость от другого провайдера
+- Компонент создаётся при первом resolve, а не при старте процесса
+- Фабрику можно задать строкой "module:attr": модуль (а с ним
+  FastAPI, SQLAlchemy, pika и т.п.) импортируется только при первом
+  обращении к провайдеру
+- Для каждого провайдера замеряется время импорта и создания
+  (отчёт --startup-report)
+"""
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+
+class Lifetime(Enum):
+    """Время жизни компонента"""
+
+    SINGLETON = "singleton"  # Один экземпляр на контейнер
+    SCOPED = "scoped"        # Один экземпляр на область (например, HTTP-запрос)
+    TRANSIENT = "transient"  # Новый экземпляр при каждом resolve
+
+
+Factory = Callable[..., Any]
+
+
+class Ref:
+    """Ссылка на другой провайдер (аргумент фабрики)"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Ref({self.name!r})"
+
+
+@dataclass
+class ProviderStats:
+    """Замеры провайдера для отчёта о старте"""
+    name: str
+    lifetime: Lifetime
+    import_seconds: float = 0.0
+    build_seconds: float = 0.0
+    instances: int = 0
+
+
+class _Provider:
+    """Провайдер: фабрика компонента и её время жизни"""
+
+    __slots__ = ("name", "lifetime", "kwargs", "_target", "_factory", "stats")
+
+    def __init__(
+        self,
+        name: str,
+        target: Union[str, Factory],
+        lifetime: Lifetime,
+        kwargs: Dict[str, Any]
+    ):
+        self.name = name
+        self.lifetime = lifetime
+        self.kwargs = kwargs
+        self._target = target
+        self._factory: Optional[Factory] = None if isinstance(target, str) else target
+        self.stats = ProviderStats(name=name, lifetime=lifetime)
+
+    def factory(self) -> Factory:
+        """Фабрика провайдера (импорт "module:attr" при первом вызове)"""
+        if self._factory is None:
+            module_name, _, attr = self._target.partition(":")
+            start = time.perf_counter()
+            module = importlib.import_module(module_name)
+            self._factory = getattr(module, attr)
+            self.stats.import_seconds += time.perf_counter() - start
+        return self._factory
+
+
+class Resolver:
+    """Получение компонентов по имени провайдера (корень или область)"""
+
+    def __init__(self, graph: "ProviderGraph", scope_cache: Optional[Dict[str, Any]]):
+        self._graph = graph
+        self._scope_cache = scope_cache
+
+    def resolve(self, name: str) -> Any:
+        """
+        Получить компонент
+
+        Raises:
+            KeyError: если провайдер не зарегистрирован
+            ValueError: если scoped-компонент запрошен вне области
+                или зависимости образуют цикл
+        """
+        return self._graph._resolve(name, self._scope_cache)
+
+
+class ProviderGraph(Resolver):
+    """
+    Граф провайдеров
+
+    Singleton-компоненты создаются под блокировкой ровно один раз,
+    даже если к ним одновременно обращаются несколько потоков.
+    """
+
+    def __init__(self):
+        super().__init__(self, scope_cache=None)
+        self._providers: Dict[str, _Provider] = {}
+        self._singletons: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def register(
+        self,
+        name: str,
+        target: Union[str, Factory],
+        lifetime: Lifetime = Lifetime.SINGLETON,
+        **kwargs: Any
+    ) -> None:
+        """
+        Зарегистрировать провайдер
+
+        Args:
+            name: Имя компонента
+            target: Фабрика (класс/функция) или путь "module:attr" к ней
+            lifetime: Время жизни компонента
+            **kwargs: Аргументы фабрики; Ref("имя") — зависимость
+        """
+        self._providers[name] = _Provider(name, target, lifetime, kwargs)
+
+    def register_instance(self, name: str, instance: Any) -> None:
+        """Зарегистрировать готовый объект как singleton"""
+        self.register(name, lambda: instance)
+        self._singletons[name] = instance
+
+    @contextmanager
+    def scope(self) -> Iterator[Resolver]:
+        """Область для scoped-компонентов (например, на HTTP-запрос)"""
+        yield Resolver(self, scope_cache={})
+
+    def is_resolved(self, name: str) -> bool:
+        """Создан ли уже singleton-компонент"""
+        return name in self._singletons
+
+    def stats(self) -> List[ProviderStats]:
+        """Замеры провайдеров, к которым уже обращались"""
+        return [
+            provider.stats for provider in self._providers.values()
+            if provider.stats.instances
+        ]
+
+    def _resolve(self, name: str, scope_cache: Optional[Dict[str, Any]]) -> Any:
+        singleton = self._singletons.get(name)
+        if singleton is not None:
+            return singleton
+
+        provider = self._providers[name]
+        if provider.lifetime is Lifetime.SINGLETON:
+            with self._lock:
+                if name not in self._singletons:
+                    self._singletons[name] = self._build(provider, self)
+                return self._singletons[name]
+
+        if provider.lifetime is Lifetime.SCOPED:
+            if scope_cache is None:
+                raise ValueError(f"Компонент {name} доступен только внутри scope()")
+            if name not in scope_cache:
+                scope_cache[name] = self._build(
+                    provider, Resolver(self, scope_cache)
+                )
+            return scope_cache[name]
+
+        return self._build(provider, Resolver(self, scope_cache))
+
+    def _build(self, provider: _Provider, resolver: Resolver) -> Any:
+        """Создать компонент; время зависимостей не входит в build_seconds"""
+        stack: List[List[Any]] = getattr(self._local, "stack", None) or []
+        self._local.stack = stack
+        if any(frame[0] == provider.name for frame in stack):
+            chain = " → ".join([frame[0] for frame in stack] + [provider.name])
+            raise ValueError(f"Циклическая зависимость: {chain}")
+
+        # Кадр: [имя, время зависимостей]
+        frame = [provider.name, 0.0]
+        stack.append(frame)
+        import_before = provider.stats.import_seconds
+        start = time.perf_counter()
+        try:
+            kwargs = {
+                key: resolver.resolve(value.name) if isinstance(value, Ref) else value
+                for key, value in provider.kwargs.items()
+            }
+            instance = provider.factory()(**kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+
+        imported = provider.stats.import_seconds - import_before
+        provider.stats.build_seconds += elapsed - frame[1] - imported
+        provider.stats.instances += 1
+        return instance
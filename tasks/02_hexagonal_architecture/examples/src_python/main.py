@@ -2,9 +2,19 @@
 Main Application: FastAPI Entry Point
 
 Точка входа для REST API приложения (FastAPI).
+
+    python main.py [--startup-report]          # разработка: 1 процесс, reload
+    python main.py --workers 4 [--port 8000]   # N процессов, общее хранилище
+
+В режиме --workers заявки хранятся в общем файле SQLite
+(REQUEST_REPOSITORY=sqlite), а не в памяти каждого процесса:
+запись, сделанная одним воркером, сразу видна остальным.
+Ключи Idempotency-Key — тоже в SQLite (IDEMPOTENCY_STORE=sqlite).
 """
+import argparse
+import os
+
 from fastapi import FastAPI
-import uvicorn
 
 from infrastructure.config import get_container
 
@@ -34,14 +44,45 @@ app = create_app()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Request Service API")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="показать время импорта и создания компонентов"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="число процессов uvicorn (без reload, общее хранилище SQLite)"
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    
+    if args.startup_report:
+        print(get_container().startup_report())
+        print()
+    
+    import uvicorn
+    
     # Запустить сервер
     print("🚀 Запуск Request Service...")
-    print("📖 Документация API: http://localhost:8000/docs")
-    print()
+    print(f"📖 Документация API: http://localhost:{args.port}/docs")
     
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
+    if args.workers is None:
+        print()
+        uvicorn.run("main:app", host=args.host, port=args.port, reload=True)
+    else:
+        # Воркеры — дочерние процессы: настройки передаются через окружение
+        os.environ.setdefault("REQUEST_REPOSITORY", "sqlite")
+        os.environ.setdefault("IDEMPOTENCY_STORE", "sqlite")
+        print(f"⚙️  Воркеров: {args.workers}, "
+              f"хранилище: {os.environ['REQUEST_REPOSITORY']}")
+        print()
+        uvicorn.run(
+            "main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers
+        )
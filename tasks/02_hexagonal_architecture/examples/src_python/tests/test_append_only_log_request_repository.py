@@ -0,0 +1,164 @@
+"""
+Тесты AppendOnlyLogRequestRepository
+
+Восстановление после перезапуска: оборванный хвост отрезается,
+повреждение посреди сегмента — ошибка, а не потеря записей
+"""
+import os
+
+import pytest
+
+from domain import Request, Zone
+from infrastructure.adapter.out.append_only_log_request_repository import (
+    AppendOnlyLogRequestRepository,
+)
+
+
+def make_request(i: int) -> Request:
+    return Request(f"REQ-2024-{i:04d}", "coordinator-001", Zone.NORTH)
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    directory = str(tmp_path / "request_log")
+    repository = AppendOnlyLogRequestRepository(directory)
+    for i in range(3):
+        repository.save(make_request(i))
+    repository.close(snapshot=False)  # при старте журнал перечитывается
+    return directory
+
+
+def segment(directory: str) -> str:
+    return os.path.join(directory, "00000000.log")
+
+
+def test_requests_survive_restart(log_dir):
+    repository = AppendOnlyLogRequestRepository(log_dir)
+
+    assert repository.find_by_id("REQ-2024-0001").zone is Zone.NORTH
+    assert len(repository.find_all()) == 3
+    repository.close()
+
+
+@pytest.mark.parametrize("tail", [b"\x01\x02\x03", b"\0" * 64])
+def test_torn_tail_is_truncated(log_dir, tail):
+    path = segment(log_dir)
+    size = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(tail)
+
+    repository = AppendOnlyLogRequestRepository(log_dir)
+
+    assert len(repository.find_all()) == 3
+    assert os.path.getsize(path) == size
+    repository.close()
+
+
+def test_partially_written_last_record_is_truncated(log_dir):
+    path = segment(log_dir)
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.truncate(size - 5)
+
+    repository = AppendOnlyLogRequestRepository(log_dir)
+
+    assert repository.find_by_id("REQ-2024-0002") is None
+    assert len(repository.find_all()) == 2
+    repository.close()
+
+
+def test_corruption_before_committed_records_raises(log_dir):
+    path = segment(log_dir)
+    with open(path, "r+b") as f:
+        data = bytearray(f.read())
+        data[20] ^= 0xFF  # первая запись; за ней — ещё две
+        f.seek(0)
+        f.write(data)
+    size = os.path.getsize(path)
+
+    with pytest.raises(ValueError, match="Повреждён сегмент"):
+        AppendOnlyLogRequestRepository(log_dir)
+
+    assert os.path.getsize(path) == size
+
+
+class PartialWriteFile:
+    """Файл сегмента, который пишет половину данных и падает"""
+
+    def __init__(self, file):
+        self._file = file
+
+    def write(self, data) -> int:
+        self._file.write(data[:len(data) // 2])
+        raise OSError("No space left on device")
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+def test_partial_write_truncates_segment_and_stops_writer(log_dir):
+    repository = AppendOnlyLogRequestRepository(log_dir)
+    size = os.path.getsize(segment(log_dir))
+    repository._file = PartialWriteFile(repository._file)
+
+    with pytest.raises(OSError, match="No space"):
+        repository.save(make_request(3))
+
+    assert os.path.getsize(segment(log_dir)) == size
+    with pytest.raises(RuntimeError, match="не принимает записи"):
+        repository.save(make_request(4))
+    assert repository.find_by_id("REQ-2024-0002").id == "REQ-2024-0002"
+    repository.close()
+
+    reopened = AppendOnlyLogRequestRepository(log_dir)
+    assert sorted(r.id for r in reopened.find_all()) == [
+        "REQ-2024-0000", "REQ-2024-0001", "REQ-2024-0002"
+    ]
+    reopened.close()
+
+
+def test_fsync_failure_truncates_written_batch(log_dir, monkeypatch):
+    repository = AppendOnlyLogRequestRepository(log_dir)
+    size = os.path.getsize(segment(log_dir))
+
+    def failing_fsync(fd):
+        raise OSError("Input/output error")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    with pytest.raises(OSError, match="Input/output"):
+        repository.save(make_request(3))
+    monkeypatch.undo()
+
+    # Байты пачки уже были в файле — их нет, индекс не тронут
+    assert os.path.getsize(segment(log_dir)) == size
+    assert repository.find_by_id("REQ-2024-0003") is None
+    with pytest.raises(RuntimeError):
+        repository.save(make_request(4))
+    repository.close()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_failed_snapshot_returns_positions_to_overlay(tmp_path, monkeypatch):
+    from infrastructure.adapter.out import append_only_log_request_repository as module
+
+    def failing_merge(old, newer):
+        raise OSError("No space left on device")
+
+    directory = str(tmp_path / "request_log")
+    repository = AppendOnlyLogRequestRepository(directory, snapshot_every=2)
+    monkeypatch.setattr(module, "_merge", failing_merge)
+    repository.save(make_request(0))
+    repository.save(make_request(1))  # запускает снимок, он падает
+    repository._snapshot_thread.join()
+
+    assert repository._frozen == {}
+    assert repository.find_by_id("REQ-2024-0000") is not None
+
+    # Следующий снимок начинается и включает все записи
+    monkeypatch.undo()
+    repository.save(make_request(2))
+    repository.save(make_request(3))
+    repository._snapshot_thread.join()
+    assert repository._overlay == {}
+    assert len(repository._snapshot) == 4
+    repository.close()
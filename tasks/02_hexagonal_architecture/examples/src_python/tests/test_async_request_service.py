@@ -0,0 +1,84 @@
+"""
+Тесты AsyncRequestService
+
+Выдача ID не блокирует event loop: аренда блока — в пуле потоков
+"""
+import asyncio
+import threading
+from typing import List, Optional
+
+import pytest
+
+from application.port.inbound import CreateRequestCommand
+from application.port.out import RequestIdAllocator
+from application.service import AsyncRequestService
+from infrastructure.adapter.out.async_mock_sms_service import AsyncMockSmsService
+from infrastructure.adapter.out.in_memory_request_repository import InMemoryRequestRepository
+from infrastructure.adapter.out.thread_pool_request_repository import ThreadPoolRequestRepository
+
+
+class RecordingAllocator(RequestIdAllocator):
+    """Готовые ID из памяти, пока есть; потом next_id() с записью потока"""
+
+    def __init__(self, ready: List[str]):
+        self._ready = list(ready)
+        self.next_id_threads: List[threading.Thread] = []
+
+    def try_next_id(self) -> Optional[str]:
+        return self._ready.pop(0) if self._ready else None
+
+    def next_id(self) -> str:
+        self.next_id_threads.append(threading.current_thread())
+        return f"REQ-2024-{len(self.next_id_threads) + 1000:04d}"
+
+
+class SilentSms(AsyncMockSmsService):
+    async def _send_bulk(self, phones, message) -> None:
+        pass
+
+
+def make_service(allocator: RequestIdAllocator) -> AsyncRequestService:
+    repository = ThreadPoolRequestRepository(
+        InMemoryRequestRepository(verbose=False), offload=False
+    )
+    return AsyncRequestService(repository, SilentSms(), allocator)
+
+
+def command(zone: str = "NORTH") -> CreateRequestCommand:
+    return CreateRequestCommand("C-1", zone, ["v-1", "v-2", "v-3"])
+
+
+def test_ready_ids_are_taken_on_the_loop():
+    allocator = RecordingAllocator(["REQ-2024-0001"])
+
+    request_id = asyncio.run(make_service(allocator).create_request(command()))
+
+    assert request_id == "REQ-2024-0001"
+    assert allocator.next_id_threads == []
+
+
+def test_exhausted_block_is_leased_off_the_loop():
+    allocator = RecordingAllocator([])
+
+    async def create() -> str:
+        loop_thread = threading.current_thread()
+        request_id = await make_service(allocator).create_request(command())
+        assert allocator.next_id_threads[0] is not loop_thread
+        return request_id
+
+    assert asyncio.run(create()) == "REQ-2024-1001"
+
+
+@pytest.mark.parametrize("invalid", [
+    command("NOWHERE"),
+    CreateRequestCommand("C-1", "NORTH", ["v-1", "v-2"]),  # группа меньше 3
+])
+def test_invalid_command_does_not_take_an_id(invalid):
+    allocator = RecordingAllocator(["REQ-2024-0001"])
+    service = make_service(allocator)
+
+    results = asyncio.run(service.create_requests([invalid, command()]))
+
+    assert results[0].error is not None
+    assert results[1].request_id == "REQ-2024-0001"
+    assert allocator.next_id_threads == []
@@ -0,0 +1,166 @@
+"""
+Тесты BlockLeasingRequestIdAllocator и источников блоков
+
+Формат и уникальность ID, смена года, фоновая подгрузка блока,
+общий файл для нескольких процессов
+"""
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from infrastructure.adapter.out.block_leasing_request_id_allocator import (
+    BlockLeasingRequestIdAllocator,
+    FileSequenceBlockSource,
+    InMemorySequenceBlockSource,
+)
+
+
+class CountingSource(InMemorySequenceBlockSource):
+    """Источник в памяти, который запоминает обращения"""
+
+    def __init__(self):
+        super().__init__()
+        self.leases: List[range] = []
+
+    def lease(self, year: int, size: int) -> range:
+        numbers = super().lease(year, size)
+        self.leases.append(numbers)
+        return numbers
+
+
+class Clock:
+    def __init__(self, year: int):
+        self.now = datetime(year, 6, 1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def wait_for(condition, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = condition()
+        if result:
+            return result
+        time.sleep(0.001)
+    raise AssertionError("условие не выполнилось")
+
+
+def test_ids_are_sequential_and_formatted():
+    allocator = BlockLeasingRequestIdAllocator(
+        InMemorySequenceBlockSource(), clock=Clock(2024)
+    )
+
+    assert [allocator.next_id() for _ in range(3)] == [
+        "REQ-2024-0001", "REQ-2024-0002", "REQ-2024-0003"
+    ]
+
+
+def test_numbers_past_9999_widen():
+    source = InMemorySequenceBlockSource()
+    source.lease(2024, 9998)
+    allocator = BlockLeasingRequestIdAllocator(source, clock=Clock(2024))
+
+    assert [allocator.next_id() for _ in range(2)] == ["REQ-2024-9999", "REQ-2024-10000"]
+
+
+def test_source_is_called_once_per_block():
+    source = CountingSource()
+    allocator = BlockLeasingRequestIdAllocator(
+        source, block_size=10, refill_ratio=0.0, clock=Clock(2024)
+    )
+
+    ids = [allocator.next_id() for _ in range(25)]
+
+    assert len(set(ids)) == 25
+    assert source.leases == [range(1, 11), range(11, 21), range(21, 31)]
+
+
+def test_new_year_restarts_numbering():
+    clock = Clock(2024)
+    allocator = BlockLeasingRequestIdAllocator(InMemorySequenceBlockSource(), clock=clock)
+    allocator.next_id()
+
+    clock.now = datetime(2025, 1, 1)
+
+    assert allocator.next_id() == "REQ-2025-0001"
+
+
+def test_next_block_is_prefetched_in_background():
+    source = CountingSource()
+    allocator = BlockLeasingRequestIdAllocator(
+        source, block_size=10, refill_ratio=0.5, clock=Clock(2024)
+    )
+    for _ in range(10):
+        allocator.next_id()
+    wait_for(lambda: len(source.leases) == 2)
+
+    # Блок уже подгружен: try_next_id берёт его без обращения к источнику
+    assert wait_for(allocator.try_next_id) == "REQ-2024-0011"
+    assert len(source.leases) == 2
+
+
+def test_try_next_id_never_leases():
+    source = CountingSource()
+    allocator = BlockLeasingRequestIdAllocator(
+        source, block_size=2, refill_ratio=0.0, clock=Clock(2024)
+    )
+
+    assert allocator.try_next_id() is None
+    allocator.next_id()
+    assert allocator.try_next_id() == "REQ-2024-0002"
+    assert allocator.try_next_id() is None
+    assert len(source.leases) == 1
+
+
+def test_concurrent_threads_get_unique_ids():
+    allocator = BlockLeasingRequestIdAllocator(
+        InMemorySequenceBlockSource(), block_size=50, clock=Clock(2024)
+    )
+    ids: List[str] = []
+    lock = threading.Lock()
+
+    def worker():
+        taken = [allocator.next_id() for _ in range(1000)]
+        with lock:
+            ids.extend(taken)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(ids)) == 8000
+
+
+def test_file_source_blocks_do_not_overlap_between_allocators(tmp_path):
+    path = str(tmp_path / "request_ids.json")
+    first = BlockLeasingRequestIdAllocator(
+        FileSequenceBlockSource(path), block_size=5, refill_ratio=0.0, clock=Clock(2024)
+    )
+    second = BlockLeasingRequestIdAllocator(
+        FileSequenceBlockSource(path), block_size=5, refill_ratio=0.0, clock=Clock(2024)
+    )
+
+    assert first.next_id() == "REQ-2024-0001"
+    assert second.next_id() == "REQ-2024-0006"
+
+
+def test_file_source_survives_restart(tmp_path):
+    path = str(tmp_path / "request_ids.json")
+    FileSequenceBlockSource(path).lease(2024, 100)
+
+    restarted = FileSequenceBlockSource(path)
+
+    assert restarted.lease(2024, 100) == range(101, 201)
+    assert restarted.lease(2025, 100) == range(1, 101)
+
+
+def test_block_size_must_be_positive():
+    with pytest.raises(ValueError):
+        BlockLeasingRequestIdAllocator(InMemorySequenceBlockSource(), block_size=0)
+
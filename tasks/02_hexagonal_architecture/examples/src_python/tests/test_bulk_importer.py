@@ -0,0 +1,81 @@
+"""
+Тесты BulkImporter
+
+Пакеты идут в асинхронный use-case параллельно, но не больше
+concurrency одновременно
+"""
+import asyncio
+import io
+import json
+from typing import List
+
+from application.port.inbound import (
+    AsyncCreateRequestsUseCase,
+    CreateRequestCommand,
+    CreateRequestResult,
+)
+from infrastructure.adapter.inbound.bulk_importer import BulkImporter
+
+
+class SlowBatchUseCase(AsyncCreateRequestsUseCase):
+    """Пакетный use-case, который ждёт «хранилище» и считает параллелизм"""
+
+    def __init__(self, fail_batch: int = -1):
+        self.active = 0
+        self.max_active = 0
+        self.batches = 0
+        self._fail_batch = fail_batch
+
+    async def create_requests(
+        self,
+        commands: List[CreateRequestCommand]
+    ) -> List[CreateRequestResult]:
+        batch = self.batches
+        self.batches += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if batch == self._fail_batch:
+                raise OSError("диск недоступен")
+            return [
+                CreateRequestResult(request_id=f"REQ-2024-{batch:02d}{i:02d}")
+                for i in range(len(commands))
+            ]
+        finally:
+            self.active -= 1
+
+
+def lines(count: int):
+    command = CreateRequestCommand("C-1", "NORTH", ["v-1", "v-2", "v-3"])
+    return [(line_no, command) for line_no in range(1, count + 1)]
+
+
+def read_results(results: io.StringIO) -> List[dict]:
+    return [json.loads(line) for line in results.getvalue().splitlines()]
+
+
+def test_batches_run_concurrently_up_to_limit():
+    use_case = SlowBatchUseCase()
+    results = io.StringIO()
+
+    stats = BulkImporter(use_case, concurrency=3, chunk_size=10).run(lines(100), results)
+
+    assert use_case.batches == 10
+    assert use_case.max_active == 3
+    assert stats.created == 100
+    assert sorted(record["line"] for record in read_results(results)) == list(range(1, 101))
+
+
+def test_parse_errors_and_failed_batches_are_reported():
+    use_case = SlowBatchUseCase(fail_batch=1)
+    results = io.StringIO()
+    parsed = lines(4) + [(5, "Строка 5: не JSON")]
+
+    stats = BulkImporter(use_case, concurrency=2, chunk_size=2).run(parsed, results)
+
+    assert (stats.read, stats.created, stats.failed) == (5, 2, 3)
+    errors = {record["line"]: record["error"] for record in read_results(results)
+              if "error" in record}
+    assert errors[5] == "Строка 5: не JSON"
+    assert errors[3].startswith("Пакет не создан")
@@ -0,0 +1,201 @@
+"""
+Юнит-тесты Domain Layer: Request, Group, Zone, RequestStatus
+
+Инварианты, переходы статусов и компактное представление
+(__slots__, интернирование строк)
+"""
+from datetime import datetime
+
+import pytest
+
+from domain import Group, Request, RequestStatus, Zone
+
+
+def make_group(size: int = 3) -> Group:
+    group = Group("G-01")
+    for i in range(size):
+        group.add_member(f"vol-{i}")
+    return group
+
+
+class TestGroup:
+    """Инварианты сущности Group"""
+
+    def test_first_member_becomes_leader(self):
+        group = make_group(3)
+
+        assert group.leader_id == "vol-0"
+        assert group.member_ids == ("vol-0", "vol-1", "vol-2")
+
+    def test_should_not_exceed_five_members(self):
+        group = make_group(5)
+
+        with pytest.raises(ValueError, match="полная"):
+            group.add_member("vol-5")
+
+    def test_should_not_add_member_twice(self):
+        group = make_group(1)
+
+        with pytest.raises(ValueError, match="уже в группе"):
+            group.add_member("vol-0")
+
+    def test_should_not_remove_leader(self):
+        group = make_group(3)
+
+        with pytest.raises(ValueError, match="лидера"):
+            group.remove_member("vol-0")
+
+    def test_remove_member_after_leader_change(self):
+        group = make_group(4)
+
+        group.assign_leader("vol-1")
+        group.remove_member("vol-0")
+
+        assert group.member_ids == ("vol-1", "vol-2", "vol-3")
+
+    def test_should_not_assign_unknown_leader(self):
+        group = make_group(3)
+
+        with pytest.raises(ValueError, match="не найден"):
+            group.assign_leader("vol-9")
+
+    @pytest.mark.parametrize("size, ready", [(2, False), (3, True), (5, True)])
+    def test_is_ready_requires_three_to_five_members(self, size, ready):
+        assert make_group(size).is_ready is ready
+
+    def test_member_ids_are_interned(self):
+        first, second = Group("G-01"), Group("G-02")
+
+        first.add_member("".join(["vol-", "42"]))
+        second.add_member("".join(["vol-", "42"]))
+
+        assert first.member_ids[0] is second.member_ids[0]
+
+    def test_restore_skips_checks(self):
+        group = Group.restore("G-07", ["vol-1", "vol-2"], leader_id="vol-2")
+
+        assert group.member_ids == ("vol-1", "vol-2")
+        assert group.leader_id == "vol-2"
+        assert not group.is_ready
+
+    def test_has_no_instance_dict(self):
+        with pytest.raises(AttributeError):
+            make_group().extra = 1
+
+
+class TestRequest:
+    """Инварианты и переходы агрегата Request"""
+
+    def test_new_request_is_draft(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+
+        assert request.status is RequestStatus.DRAFT
+        assert not request.has_group
+
+    def test_lifecycle_draft_active_completed(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+
+        request.assign_group(make_group(3))
+        request.activate()
+        assert request.status is RequestStatus.ACTIVE
+
+        request.complete()
+        assert request.status is RequestStatus.COMPLETED
+
+    @pytest.mark.parametrize("size", [2, 6])
+    def test_group_size_must_be_three_to_five(self, size):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+        group = Group.restore("G-01", [f"vol-{i}" for i in range(size)], "vol-0")
+
+        with pytest.raises(ValueError, match="от 3 до 5"):
+            request.assign_group(group)
+
+    def test_should_not_activate_without_group(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+
+        with pytest.raises(ValueError, match="без сформированной группы"):
+            request.activate()
+
+    def test_should_not_change_group_after_activation(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+        request.assign_group(make_group(3))
+        request.activate()
+
+        with pytest.raises(ValueError):
+            request.assign_group(make_group(4))
+        with pytest.raises(ValueError):
+            request.activate()
+
+    def test_should_not_complete_draft(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+
+        with pytest.raises(ValueError, match="завершить"):
+            request.complete()
+
+    def test_should_not_change_zone_of_completed_request(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+        request.change_zone(Zone.SOUTH)
+        request.assign_group(make_group(3))
+        request.activate()
+        request.complete()
+
+        assert request.zone is Zone.SOUTH
+        with pytest.raises(ValueError):
+            request.change_zone(Zone.EAST)
+
+    def test_coordinator_id_is_interned(self):
+        first = Request("REQ-2024-0001", "".join(["coord", "inator-1"]), Zone.NORTH)
+        second = Request("REQ-2024-0002", "".join(["coord", "inator-1"]), Zone.NORTH)
+
+        assert first.coordinator_id is second.coordinator_id
+
+    def test_restore_keeps_stored_state(self):
+        created_at = datetime(2024, 5, 1, 12, 0)
+        group = make_group(3)
+
+        request = Request.restore(
+            "REQ-2024-0042", "coordinator-001", Zone.WEST,
+            RequestStatus.COMPLETED, created_at, group
+        )
+
+        assert request.status is RequestStatus.COMPLETED
+        assert request.created_at == created_at
+        assert request.group is group
+
+    def test_has_no_instance_dict(self):
+        request = Request("REQ-2024-0001", "coordinator-001", Zone.NORTH)
+
+        with pytest.raises(AttributeError):
+            request.extra = 1
+
+
+class TestZone:
+    """Value Object Zone"""
+
+    @pytest.mark.parametrize("name", ["NORTH", "north", "North"])
+    def test_from_string_is_case_insensitive(self, name):
+        assert Zone.from_string(name) is Zone.NORTH
+
+    def test_from_string_rejects_unknown_zone(self):
+        with pytest.raises(ValueError, match="Неизвестная зона"):
+            Zone.from_string("CENTER")
+
+    def test_equality_by_value(self):
+        assert Zone.from_string("SOUTH") == Zone.SOUTH
+        assert hash(Zone.from_string("SOUTH")) == hash(Zone.SOUTH)
+        assert Zone.SOUTH.display_name == "Южная зона"
+
+
+class TestRequestStatus:
+    """Допустимые переходы статусов"""
+
+    @pytest.mark.parametrize("source, target, allowed", [
+        (RequestStatus.DRAFT, RequestStatus.ACTIVE, True),
+        (RequestStatus.DRAFT, RequestStatus.COMPLETED, False),
+        (RequestStatus.ACTIVE, RequestStatus.COMPLETED, True),
+        (RequestStatus.ACTIVE, RequestStatus.DRAFT, False),
+        (RequestStatus.COMPLETED, RequestStatus.ACTIVE, False),
+        (RequestStatus.COMPLETED, RequestStatus.DRAFT, False),
+    ])
+    def test_can_transition_to(self, source, target, allowed):
+        assert source.can_transition_to(target) is allowed
@@ -0,0 +1,93 @@
+"""
+Тесты IdempotencyGuard
+
+Блокирующее хранилище (SQLite) вызывается вне event loop; повтор
+ключа не выполняет операцию второй раз
+"""
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from infrastructure.adapter.inbound.idempotency_guard import (
+    IdempotencyGuard,
+    IdempotencyKeyReuseError,
+)
+from infrastructure.adapter.inbound.idempotency_store import (
+    InMemoryIdempotencyStore,
+    SqliteIdempotencyStore,
+)
+
+
+class RecordingSqliteStore(SqliteIdempotencyStore):
+    """SQLite-хранилище с записью потоков, из которых его вызывали"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.threads: List[threading.Thread] = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return super().get(key)
+
+    def put(self, key, record):
+        self.threads.append(threading.current_thread())
+        super().put(key, record)
+
+
+def counting_operation(calls: List[int]):
+    async def operation():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return 200, {"request_id": f"REQ-2024-{len(calls):04d}"}
+    return operation
+
+
+def test_blocking_store_is_called_off_the_loop(tmp_path):
+    store = RecordingSqliteStore(str(tmp_path / "idempotency.db"))
+    guard = IdempotencyGuard(store)
+    calls: List[int] = []
+
+    async def scenario():
+        first = await guard.execute("key-1", "fp", counting_operation(calls))
+        second = await guard.execute("key-1", "fp", counting_operation(calls))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == (200, {"request_id": "REQ-2024-0001"}, False)
+    assert second == (200, {"request_id": "REQ-2024-0001"}, True)
+    assert len(calls) == 1
+    assert len(store.threads) == 3  # get, put, get
+    assert threading.main_thread() not in store.threads
+
+
+def test_concurrent_duplicates_run_operation_once(tmp_path):
+    guard = IdempotencyGuard(SqliteIdempotencyStore(str(tmp_path / "idempotency.db")))
+    calls: List[int] = []
+
+    async def scenario():
+        return await asyncio.gather(*(
+            guard.execute("key-1", "fp", counting_operation(calls))
+            for _ in range(5)
+        ))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert [replayed for _, _, replayed in results].count(False) == 1
+    assert {status for status, _, _ in results} == {200}
+
+
+def test_key_reuse_with_other_body_is_rejected():
+    guard = IdempotencyGuard(InMemoryIdempotencyStore())
+    calls: List[int] = []
+
+    async def scenario():
+        await guard.execute("key-1", "fp-1", counting_operation(calls))
+        await guard.execute("key-1", "fp-2", counting_operation(calls))
+
+    with pytest.raises(IdempotencyKeyReuseError):
+        asyncio.run(scenario())
+    assert len(calls) == 1
@@ -0,0 +1,89 @@
+"""
+Тесты InMemoryRequestRepository
+
+find_by по индексам совпадает с перебором, в том числе для
+заявок, сохранённых до и после построения индексов
+"""
+import threading
+
+from domain import Group, Request, RequestStatus, Zone
+from infrastructure.adapter.out.in_memory_request_repository import InMemoryRequestRepository
+
+
+def make_request(i: int, status: RequestStatus = RequestStatus.DRAFT) -> Request:
+    request = Request(f"REQ-2024-{i:04d}", f"coordinator-{i % 3}", list(Zone)[i % 4])
+    if status is not RequestStatus.DRAFT:
+        group = Group("G-03")
+        for member_id in ("vol-1", "vol-2", "vol-3"):
+            group.add_member(member_id)
+        request.assign_group(group)
+        request.activate()
+        if status is RequestStatus.COMPLETED:
+            request.complete()
+    return request
+
+
+def ids(requests):
+    return sorted(request.id for request in requests)
+
+
+def test_find_by_matches_scan_for_saves_before_and_after_indexing():
+    repository = InMemoryRequestRepository(shards=4, verbose=False)
+    statuses = list(RequestStatus)
+    before = [make_request(i, statuses[i % 3]) for i in range(60)]
+    repository.save_many(before)
+
+    assert ids(repository.find_by(status=RequestStatus.ACTIVE, zone=Zone.NORTH)) == ids(
+        r for r in before if r.status is RequestStatus.ACTIVE and r.zone is Zone.NORTH
+    )
+
+    after = [make_request(i, statuses[i % 3]) for i in range(60, 100)]
+    for request in after:
+        repository.save(request)
+    everything = before + after
+
+    assert ids(repository.find_by(coordinator_id="coordinator-1")) == ids(
+        r for r in everything if r.coordinator_id == "coordinator-1"
+    )
+    assert ids(repository.find_by(status=RequestStatus.DRAFT, zone=Zone.EAST)) == ids(
+        r for r in everything if r.status is RequestStatus.DRAFT and r.zone is Zone.EAST
+    )
+
+
+def test_resave_moves_request_between_indexes():
+    repository = InMemoryRequestRepository(verbose=False)
+    request = make_request(0, RequestStatus.ACTIVE)
+    repository.save(request)
+    assert ids(repository.find_by(status=RequestStatus.ACTIVE)) == [request.id]
+
+    request.complete()
+    repository.save(request)
+
+    assert repository.find_by(status=RequestStatus.ACTIVE) == []
+    assert ids(repository.find_by(status=RequestStatus.COMPLETED)) == [request.id]
+
+
+def test_saves_racing_with_index_build_are_indexed():
+    repository = InMemoryRequestRepository(shards=2, verbose=False)
+    requests = [make_request(i) for i in range(20_000)]
+    half = len(requests) // 2
+
+    writer = threading.Thread(
+        target=lambda: [repository.save(r) for r in requests[half:]]
+    )
+    repository.save_many(requests[:half])
+    writer.start()
+    repository.find_by(status=RequestStatus.DRAFT)  # строит индексы во время записи
+    writer.join()
+
+    assert len(repository.find_by(status=RequestStatus.DRAFT)) == len(requests)
+
+
+def test_find_by_id_and_find_all():
+    repository = InMemoryRequestRepository(verbose=False)
+    requests = [make_request(i) for i in range(10)]
+    repository.save_many(requests)
+
+    assert repository.find_by_id("REQ-2024-0003") is requests[3]
+    assert repository.find_by_id("REQ-2024-9999") is None
+    assert ids(repository.find_all()) == ids(requests)
@@ -0,0 +1,45 @@
+"""
+Тесты ленивой загрузки адаптеров
+
+Провайдер загружает только модуль своего адаптера
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent
+
+
+def loaded_modules(code: str) -> set:
+    """Модули проекта, загруженные после выполнения code в чистом процессе"""
+    script = code + (
+        "\nimport sys\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('infrastructure')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SRC, capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_repository_provider_loads_only_its_adapter():
+    modules = loaded_modules(
+        "from infrastructure.config import DependencyContainer\n"
+        "DependencyContainer(verbose=False).get_repository()"
+    )
+
+    assert "infrastructure.adapter.out.in_memory_request_repository" in modules
+    assert "infrastructure.adapter.out.append_only_log_request_repository" not in modules
+    assert "infrastructure.adapter.out.sqlite_request_repository" not in modules
+    assert "infrastructure.adapter.inbound.request_controller" not in modules
+
+
+def test_package_exports_resolve_on_access():
+    modules = loaded_modules(
+        "from infrastructure.adapter.out import MockSmsService\n"
+        "assert MockSmsService.__name__ == 'MockSmsService'"
+    )
+
+    assert "infrastructure.adapter.out.mock_sms_service" in modules
+    assert "infrastructure.adapter.out.queued_notification_service" not in modules
@@ -0,0 +1,149 @@
+"""
+Тесты QueuedNotificationService
+
+Доставка пачками, повторы, закрытие очереди
+"""
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from application.port.out import DeliveryStatus, NotificationService, SmsMessage
+from infrastructure.adapter.out.queued_notification_service import QueuedNotificationService
+from infrastructure.adapter.out.thread_pool_notification_service import (
+    ThreadPoolNotificationService,
+)
+
+
+class RecordingGateway(NotificationService):
+    """Шлюз, который запоминает пачки и может падать первые N вызовов"""
+
+    def __init__(self, failures: int = 0):
+        self.batches: List[List[SmsMessage]] = []
+        self._failures = failures
+        self._lock = threading.Lock()
+
+    def send_sms(self, phone: str, message: str) -> None:
+        self.send_sms_many([SmsMessage(phone, message)])
+
+    def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        with self._lock:
+            if self._failures:
+                self._failures -= 1
+                raise ConnectionError("шлюз недоступен")
+            self.batches.append(list(messages))
+
+
+def messages(count: int) -> List[SmsMessage]:
+    return [SmsMessage(f"+375-29-000-{i:04d}", "текст") for i in range(count)]
+
+
+def test_messages_are_delivered_in_batches():
+    gateway = RecordingGateway()
+    service = QueuedNotificationService(gateway, workers=1, batch_size=10)
+    sent = messages(25)
+
+    service.send_sms_many(sent)
+    service.close()
+
+    assert sum(len(batch) for batch in gateway.batches) == 25
+    assert all(len(batch) <= 10 for batch in gateway.batches)
+    assert {service.get_status(sms.message_id) for sms in sent} == {DeliveryStatus.SENT}
+
+
+def test_failed_batch_is_retried():
+    gateway = RecordingGateway(failures=2)
+    service = QueuedNotificationService(gateway, workers=1, base_delay=0.001)
+    sms = messages(1)[0]
+
+    service.send_sms_many([sms])
+
+    assert service.flush(timeout=5)
+    assert service.get_status(sms.message_id) is DeliveryStatus.SENT
+    service.close()
+
+
+def test_attempts_are_limited():
+    gateway = RecordingGateway(failures=10)
+    service = QueuedNotificationService(
+        gateway, workers=1, max_attempts=2, base_delay=0.001
+    )
+    sms = messages(1)[0]
+
+    service.send_sms_many([sms])
+
+    assert service.flush(timeout=5)
+    assert service.get_status(sms.message_id) is DeliveryStatus.FAILED
+    service.close()
+
+
+def test_send_after_close_raises():
+    service = QueuedNotificationService(RecordingGateway())
+    service.send_sms_many(messages(1))
+    service.close()
+
+    with pytest.raises(RuntimeError):
+        service.send_sms_many(messages(1))
+    assert service.flush() is True
+
+
+def test_close_stops_worker_threads():
+    service = QueuedNotificationService(RecordingGateway(), workers=3)
+    service.send_sms_many(messages(5))
+
+    service.close()
+
+    assert not [t for t in threading.enumerate() if t.name.startswith("sms-queue-")]
+
+
+def test_messages_waiting_for_retry_fail_on_close():
+    gateway = RecordingGateway(failures=1)
+    service = QueuedNotificationService(gateway, workers=1, base_delay=60)
+    sms = messages(1)[0]
+    service.send_sms_many([sms])
+
+    service.close(timeout=0.2)
+
+    assert service.flush(timeout=0) is True
+    assert service.get_status(sms.message_id) is DeliveryStatus.FAILED
+
+
+class BlockedGateway(NotificationService):
+    """Шлюз, который не отвечает, пока не открыт release"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def send_sms(self, phone: str, message: str) -> None:
+        self.send_sms_many([SmsMessage(phone, message)])
+
+    def send_sms_many(self, messages: List[SmsMessage]) -> None:
+        self.release.wait()
+
+
+def test_full_queue_does_not_block_event_loop():
+    # Контейнер подключает очередь к async-сервису с offload=True:
+    # ожидание места в очереди — в пуле потоков, event loop свободен
+    gateway = BlockedGateway()
+    service = QueuedNotificationService(gateway, workers=1, batch_size=1, max_pending=1)
+    notifications = ThreadPoolNotificationService(service, offload=True)
+
+    # Страховка: если loop всё же заблокирован, тест падает, а не виснет
+    safety = threading.Timer(2.0, gateway.release.set)
+    safety.start()
+
+    async def scenario() -> int:
+        ticks = 0
+        send = asyncio.ensure_future(notifications.send_sms_many(messages(4)))
+        while ticks < 20:
+            await asyncio.sleep(0.005)
+            ticks += 1
+        assert not send.done()  # очередь полна: ждём место
+        gateway.release.set()
+        await send
+        return ticks
+
+    assert asyncio.run(scenario()) == 20
+    safety.cancel()
+    service.close()
@@ -0,0 +1,95 @@
+"""
+Тесты RequestController: POST /api/requests:batch по HTTP
+
+Результаты в порядке заявок, ошибка одной заявки не мешает
+остальным, размер пакета ограничен
+"""
+import itertools
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from application.port.out import RequestIdAllocator
+from application.service import AsyncRequestService
+from infrastructure.adapter.inbound.request_controller import MAX_BATCH_SIZE, RequestController
+from infrastructure.adapter.out.async_mock_sms_service import AsyncMockSmsService
+from infrastructure.adapter.out.in_memory_request_repository import InMemoryRequestRepository
+from infrastructure.adapter.out.thread_pool_request_repository import ThreadPoolRequestRepository
+
+
+class CountingAllocator(RequestIdAllocator):
+    """ID подряд из памяти"""
+
+    def __init__(self):
+        self._numbers = itertools.count(1)
+        self.issued = 0
+
+    def try_next_id(self) -> Optional[str]:
+        return self.next_id()
+
+    def next_id(self) -> str:
+        self.issued += 1
+        return f"REQ-2024-{next(self._numbers):04d}"
+
+
+class SilentSms(AsyncMockSmsService):
+    async def _send_bulk(self, phones, message) -> None:
+        pass
+
+
+@pytest.fixture
+def allocator():
+    return CountingAllocator()
+
+
+@pytest.fixture
+def client(allocator):
+    repository = ThreadPoolRequestRepository(
+        InMemoryRequestRepository(verbose=False), offload=False
+    )
+    service = AsyncRequestService(repository, SilentSms(), allocator)
+    app = FastAPI()
+    RequestController(app, use_case=service, batch_use_case=service)
+    return TestClient(app)
+
+
+def item(zone: str = "NORTH", volunteers=("vol-1", "vol-2", "vol-3")) -> dict:
+    return {"coordinator_id": "coordinator-001", "zone": zone, "volunteer_ids": list(volunteers)}
+
+
+def test_batch_returns_results_in_request_order(client):
+    response = client.post("/api/requests:batch", json={"requests": [
+        item("NORTH"),
+        item("MARS"),
+        item("SOUTH", volunteers=("vol-1", "vol-2")),
+        item("EAST"),
+    ]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["request_id"] for r in results] == [
+        "REQ-2024-0001", None, None, "REQ-2024-0002"
+    ]
+    assert "MARS" in results[1]["error"]
+    assert "от 3 до 5" in results[2]["error"]
+    assert results[0]["error"] is None and results[3]["error"] is None
+
+
+def test_batch_accepts_max_size(client, allocator):
+    response = client.post(
+        "/api/requests:batch", json={"requests": [item()] * MAX_BATCH_SIZE}
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == MAX_BATCH_SIZE
+
+
+def test_batch_above_limit_is_rejected_before_use_case(client, allocator):
+    response = client.post(
+        "/api/requests:batch", json={"requests": [item()] * (MAX_BATCH_SIZE + 1)}
+    )
+
+    assert response.status_code == 422
+    assert allocator.issued == 0
@@ -0,0 +1,74 @@
+"""
+Smoke-тесты: точки входа запускаются из дерева как есть
+
+main.py (FastAPI) и example_cli.py (демо и массовый импорт)
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+SRC = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Файлы состояния (request_ids.json и т.п.) — во временном каталоге"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def run_cli(*args: str, cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SRC / "example_cli.py"), *args],
+        cwd=cwd, capture_output=True, text=True, timeout=60
+    )
+
+
+def test_main_app_creates_request(workdir):
+    """main импортируется, POST /api/requests создаёт заявку"""
+    from infrastructure.config import reset_container
+    reset_container()
+    import main
+
+    with TestClient(main.create_app()) as client:
+        response = client.post("/api/requests", json={
+            "coordinator_id": "coordinator-001",
+            "zone": "NORTH",
+            "volunteer_ids": ["vol-123", "vol-456", "vol-789"],
+        })
+
+    assert response.status_code == 200
+    assert response.json()["request_id"].startswith("REQ-")
+    reset_container()
+
+
+def test_example_cli_demo(workdir):
+    result = run_cli(cwd=workdir)
+
+    assert result.returncode == 0, result.stderr
+    assert "Заявка успешно создана" in result.stdout
+
+
+def test_example_cli_import(workdir):
+    commands = workdir / "commands.jsonl"
+    lines = [
+        {"coordinator_id": "C-1", "zone": "NORTH", "volunteer_ids": ["v-1", "v-2", "v-3"]},
+        {"coordinator_id": "C-1", "zone": "NOWHERE", "volunteer_ids": ["v-1", "v-2", "v-3"]},
+        {"coordinator_id": "C-2", "zone": "SOUTH", "volunteer_ids": ["v-4", "v-5", "v-6"]},
+    ]
+    commands.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+    result = run_cli("import", "--file", str(commands), cwd=workdir)
+
+    assert result.returncode == 1, result.stderr  # одна строка с ошибкой
+    results = [
+        json.loads(line)
+        for line in (workdir / "import_results.jsonl").read_text().splitlines()
+    ]
+    assert [("request_id" in r, "error" in r) for r in results] == [
+        (True, False), (False, True), (True, False)
+    ]
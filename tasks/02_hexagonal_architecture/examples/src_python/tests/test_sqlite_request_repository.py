@@ -0,0 +1,185 @@
+"""
+Тесты SqliteRequestRepository
+
+Сохранение и поиск, общий файл для нескольких соединений (воркеров),
+ожидание блокировки записи (busy_timeout), режим main.py --workers
+"""
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from domain import Group, Request, RequestStatus, Zone
+from infrastructure.adapter.out.sqlite_request_repository import SqliteRequestRepository
+
+SRC = Path(__file__).resolve().parent.parent
+
+
+def make_request(i: int, status: RequestStatus = RequestStatus.DRAFT) -> Request:
+    request = Request(f"REQ-2024-{i:04d}", f"coordinator-{i % 3}", list(Zone)[i % 4])
+    if status is not RequestStatus.DRAFT:
+        group = Group("G-03")
+        for member_id in ("vol-1", "vol-2", "vol-3"):
+            group.add_member(member_id)
+        request.assign_group(group)
+        request.activate()
+    return request
+
+
+def ids(requests):
+    return sorted(request.id for request in requests)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "requests.db")
+
+
+def test_save_and_find_by_id_round_trip(db_path):
+    repository = SqliteRequestRepository(db_path)
+    request = make_request(1, RequestStatus.ACTIVE)
+
+    repository.save(request)
+    found = repository.find_by_id(request.id)
+
+    assert found.id == request.id
+    assert found.status is RequestStatus.ACTIVE
+    assert found.zone is request.zone
+    assert found.group.member_ids == request.group.member_ids
+    assert repository.find_by_id("REQ-2024-9999") is None
+
+
+def test_save_many_find_all_and_find_by(db_path):
+    repository = SqliteRequestRepository(db_path)
+    requests = [make_request(i, RequestStatus.ACTIVE if i % 2 else RequestStatus.DRAFT)
+                for i in range(12)]
+
+    repository.save_many(requests)
+
+    assert ids(repository.find_all()) == ids(requests)
+    assert ids(repository.find_by(status=RequestStatus.ACTIVE, zone=Zone.EAST)) == ids(
+        r for r in requests if r.status is RequestStatus.ACTIVE and r.zone is Zone.EAST
+    )
+    assert ids(repository.find_by(coordinator_id="coordinator-2")) == ids(
+        r for r in requests if r.coordinator_id == "coordinator-2"
+    )
+    assert ids(repository.find_by()) == ids(requests)
+
+
+def test_resave_updates_indexed_columns(db_path):
+    repository = SqliteRequestRepository(db_path)
+    request = make_request(0, RequestStatus.ACTIVE)
+    repository.save(request)
+
+    request.complete()
+    repository.save(request)
+
+    assert repository.find_by(status=RequestStatus.ACTIVE) == []
+    assert ids(repository.find_by(status=RequestStatus.COMPLETED)) == [request.id]
+    assert len(repository.find_all()) == 1
+
+
+def test_write_in_one_connection_is_read_in_another(db_path):
+    # Два экземпляра — два соединения, как у двух воркеров
+    first = SqliteRequestRepository(db_path)
+    second = SqliteRequestRepository(db_path)
+    assert second.find_by_id("REQ-2024-0001") is None
+
+    first.save(make_request(1))
+
+    assert second.find_by_id("REQ-2024-0001").id == "REQ-2024-0001"
+    second.save(make_request(2))
+    assert ids(first.find_all()) == ["REQ-2024-0001", "REQ-2024-0002"]
+
+
+def test_connections_are_per_thread(db_path):
+    repository = SqliteRequestRepository(db_path)
+    errors = []
+
+    def save(i):
+        try:
+            repository.save(make_request(i))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(repository.find_all()) == 8
+
+
+def lock_for_writing(db_path: str) -> sqlite3.Connection:
+    """Соединение другого «воркера», держащее блокировку записи"""
+    SqliteRequestRepository(db_path)  # схема и режим WAL
+    connection = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    connection.execute("BEGIN IMMEDIATE")
+    return connection
+
+
+def test_save_waits_for_write_lock_within_busy_timeout(db_path):
+    holder = lock_for_writing(db_path)
+    repository = SqliteRequestRepository(db_path, busy_timeout=5.0)
+    # Чтение в WAL не ждёт писателя
+    assert repository.find_all() == []
+
+    releaser = threading.Timer(0.2, holder.execute, args=("COMMIT",))
+    releaser.start()
+    started = time.perf_counter()
+    repository.save(make_request(1))
+    waited = time.perf_counter() - started
+    releaser.join()
+
+    assert waited >= 0.15
+    assert repository.find_by_id("REQ-2024-0001") is not None
+
+
+def test_save_fails_after_busy_timeout(db_path):
+    holder = lock_for_writing(db_path)
+    repository = SqliteRequestRepository(db_path, busy_timeout=0.1)
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        repository.save(make_request(1))
+
+    holder.execute("ROLLBACK")
+    repository.save(make_request(1))
+    assert repository.find_by_id("REQ-2024-0001") is not None
+
+
+def test_workers_mode_uses_shared_sqlite_storage(tmp_path):
+    # main.py --workers N: uvicorn.run подменён, проверяются окружение
+    # для дочерних процессов и аргументы запуска
+    script = (
+        "import os, runpy, sys, uvicorn\n"
+        "calls = []\n"
+        "uvicorn.run = lambda *args, **kwargs: calls.append(kwargs)\n"
+        "sys.argv = ['main.py', '--workers', '3', '--port', '8123']\n"
+        "runpy.run_path('main.py', run_name='__main__')\n"
+        "from infrastructure.config import DependencyContainer\n"
+        "repository = DependencyContainer(verbose=False).get_repository()\n"
+        "print(calls[0]['workers'], calls[0]['port'], os.environ['REQUEST_REPOSITORY'],\n"
+        "      os.environ['IDEMPOTENCY_STORE'], type(repository).__name__)\n"
+    )
+    env = {
+        key: value for key, value in os.environ.items()
+        if key not in ("REQUEST_REPOSITORY", "IDEMPOTENCY_STORE")
+    }
+    env["REQUEST_DB_PATH"] = str(tmp_path / "requests.db")
+    env["IDEMPOTENCY_DB_PATH"] = str(tmp_path / "idempotency.db")
+    env["REQUEST_ID_STATE_FILE"] = str(tmp_path / "request_ids.json")
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SRC, env=env, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split()[-5:] == [
+        "3", "8123", "sqlite", "sqlite", "SqliteRequestRepository"
+    ]
@@ -0,0 +1,230 @@
+"""
+Benchmark: Жизненные циклы агрегатов Domain Layer
+
+- request_lifecycle: Request.create → assign_group → activate →
+  change_zone → complete → drain_events
+- group_formation: Group → 3 × add_member → mark_ready → deploy
+
+Для каждого сценария:
+- ops/s — медиана --repeat прогонов без tracemalloc (медиана, а не
+  лучший: так два запуска одного кода расходятся меньше)
+- alloc B/op — сколько памяти операция занимает на пике (tracemalloc:
+  пик минус память до вызова), результат сразу отбрасывается — это
+  цена самой операции, а не размер того, что от неё осталось
+- blocks/op, B/op — сколько блоков и байт остаётся на одну операцию
+  (результаты операций удерживаются: размер агрегата в памяти)
+- peak — пик памяти tracemalloc на прогоне с удержанием
+
+Базовая линия и сравнение:
+    python -m benchmarks.bench_domain --save baseline.json
+    python -m benchmarks.bench_domain --compare baseline.json
+Сравнение завершается с кодом 1, если ops/s упали или alloc B/op,
+blocks/op выросли больше чем на --tolerance (по умолчанию 15%).
+Для --save и --compare нужно --repeat не меньше MIN_BASELINE_REPEAT:
+один прогон шумит сильнее допуска.
+
+Запуск (из каталога examples):
+    python -m benchmarks.bench_domain
+    python -m benchmarks.bench_domain --iterations 5000000
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from domain.models.group import Group
+from domain.models.request import Request
+from domain.models.zone import NORTH_ZONE, SOUTH_ZONE
+
+# Сценарий: функция одной операции (номер операции → результат)
+Scenario = Callable[[int], object]
+
+# Минимум прогонов скорости для базовой линии и сравнения с ней
+MIN_BASELINE_REPEAT = 5
+
+
+def make_ready_group() -> Group:
+    group = Group("G-01", "LEADER-1")
+    for i in range(3):
+        group.add_member(f"VOL-{i}")
+    group.mark_ready()
+    return group
+
+
+def request_lifecycle() -> Scenario:
+    group = make_ready_group()
+
+    def run(i: int) -> Request:
+        request = Request.create(f"REQ-{i}", "COORD-1", NORTH_ZONE)
+        request.assign_group(group)
+        request.activate()
+        request.change_zone(SOUTH_ZONE)
+        request.complete("SUCCESS")
+        request.drain_events()
+        return request
+    return run
+
+
+def group_formation() -> Scenario:
+    def run(i: int) -> Group:
+        group = Group(f"G-{i}", "LEADER-1")
+        group.add_member("VOL-1")
+        group.add_member("VOL-2")
+        group.add_member("VOL-3")
+        group.mark_ready()
+        group.deploy()
+        return group
+    return run
+
+
+SCENARIOS: Dict[str, Callable[[], Scenario]] = {
+    "request_lifecycle": request_lifecycle,
+    "group_formation": group_formation,
+}
+
+
+def measure_speed(run: Scenario, iterations: int, repeat: int) -> float:
+    """Медиана ops/s по repeat прогонам"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(iterations):
+            run(i)
+        timings.append(time.perf_counter() - start)
+    return iterations / statistics.median(timings)
+
+
+def measure_allocations(run: Scenario, iterations: int) -> float:
+    """
+    Байт на операцию на пике, результаты не удерживаются (tracemalloc)
+
+    Перед каждой операцией пик сбрасывается; пик минус память до
+    вызова — временные объекты и результат, пока он жив.
+    """
+    run(0)  # прогрев: ленивые кэши не должны попасть в замер
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for i in range(iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            run(i)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - before
+    finally:
+        tracemalloc.stop()
+    return allocated / iterations
+
+
+def measure_memory(run: Scenario, iterations: int) -> Dict[str, float]:
+    """Удерживаемые блоки и байты на операцию и пик памяти (tracemalloc)"""
+    run(0)  # прогрев: ленивые кэши не должны попасть в замер
+    results: List[object] = [None] * iterations
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(iterations):
+            results[i] = run(i)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return {
+        "blocks_per_op": blocks / iterations,
+        "bytes_per_op": size / iterations,
+        "peak_kib": peak / 1024,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict,
+            tolerance: float) -> List[str]:
+    """Сообщения о регрессиях относительно базовой линии"""
+    regressions = []
+    for name, current in results.items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        if current["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: ops/s {current['ops_per_sec']:,.0f} < "
+                f"{base['ops_per_sec']:,.0f} (базовая линия)"
+            )
+        base_alloc = base.get("alloc_bytes_per_op")
+        if base_alloc is not None and \
+                current["alloc_bytes_per_op"] > base_alloc * (1 + tolerance):
+            regressions.append(
+                f"{name}: alloc B/op {current['alloc_bytes_per_op']:,.0f} > "
+                f"{base_alloc:,.0f} (базовая линия)"
+            )
+        # + 0.5: дробные blocks/op от разовых аллокаций не считаются ростом
+        if current["blocks_per_op"] > base["blocks_per_op"] * (1 + tolerance) + 0.5:
+            regressions.append(
+                f"{name}: blocks/op {current['blocks_per_op']:.1f} > "
+                f"{base['blocks_per_op']:.1f} (базовая линия)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1_000_000,
+                        help="операций на прогон скорости")
+    parser.add_argument("--alloc-iterations", type=int, default=20_000,
+                        help="операций на прогон tracemalloc")
+    parser.add_argument("--repeat", type=int, default=MIN_BASELINE_REPEAT,
+                        help="прогонов скорости (берётся медиана)")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="только указанные сценарии (по умолчанию все)")
+    parser.add_argument("--save", metavar="JSON", help="сохранить базовую линию")
+    parser.add_argument("--compare", metavar="JSON", help="сравнить с базовой линией")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args(argv)
+    if (args.save or args.compare) and args.repeat < MIN_BASELINE_REPEAT:
+        parser.error(
+            f"--save/--compare: нужно --repeat >= {MIN_BASELINE_REPEAT} "
+            f"(один прогон шумит сильнее допуска)"
+        )
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name in args.scenario or SCENARIOS:
+        run = SCENARIOS[name]()
+        result = {"ops_per_sec": measure_speed(run, args.iterations, args.repeat)}
+        result["alloc_bytes_per_op"] = measure_allocations(run, args.alloc_iterations)
+        result.update(measure_memory(run, args.alloc_iterations))
+        results[name] = result
+        print(f"{name:<20} {result['ops_per_sec']:>12,.0f} ops/s  "
+              f"alloc {result['alloc_bytes_per_op']:>8,.0f} B/op  "
+              f"{result['blocks_per_op']:>6.1f} blocks/op  "
+              f"{result['bytes_per_op']:>8,.0f} B/op  "
+              f"peak {result['peak_kib']:>9,.0f} KiB")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as stream:
+            json.dump({
+                "python": platform.python_version(),
+                "iterations": args.iterations,
+                "scenarios": results,
+            }, stream, indent=2)
+        print(f"базовая линия сохранена: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            baseline = json.load(stream)
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"РЕГРЕССИЯ {message}")
+        if regressions:
+            return 1
+        print(f"регрессий нет (допуск {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
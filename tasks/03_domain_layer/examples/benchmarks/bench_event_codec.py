@@ -0,0 +1,113 @@
+"""
+Benchmark: Бинарный EventCodec против JSON (схема RabbitMQPublisher, лаб. 08)
+
+- скорость кодирования и декодирования (событий/с)
+- размер кадра (байт на событие) на смеси событий заявки
+
+Запуск (из каталога examples):
+    python -m benchmarks.bench_event_codec
+    python -m benchmarks.bench_event_codec --events 500000
+"""
+import argparse
+import json
+import time
+from dataclasses import fields
+from datetime import datetime, timedelta
+
+from domain.events.event_codec import request_event_codec
+from domain.events.request_events import (
+    GroupAssignedToRequest,
+    RequestActivated,
+    RequestCompleted,
+    RequestCreated,
+    RequestZoneChanged,
+)
+
+EVENT_TYPES = {
+    cls.__name__: cls
+    for cls in (RequestCreated, GroupAssignedToRequest, RequestActivated,
+                RequestZoneChanged, RequestCompleted)
+}
+
+
+def json_encode(event) -> bytes:
+    """Текущий путь: словарь с ISO-датами → json.dumps (RabbitMQPublisher)"""
+    payload = {}
+    for f in fields(event):
+        value = getattr(event, f.name)
+        payload[f.name] = value.isoformat() if isinstance(value, datetime) else value
+    return json.dumps({
+        "event_type": type(event).__name__,
+        "occurred_at": event.occurred_at.isoformat(),
+        "payload": payload,
+    }).encode("utf-8")
+
+
+def json_decode(data: bytes):
+    message = json.loads(data)
+    payload = message["payload"]
+    for name, value in payload.items():
+        if name == "occurred_at":
+            payload[name] = datetime.fromisoformat(value)
+        elif isinstance(value, list):
+            payload[name] = tuple(value)
+    return EVENT_TYPES[message["event_type"]](**payload)
+
+
+def make_events(count: int) -> list:
+    """Поток событий: на каждую заявку создание, группа, старт, зона, итог"""
+    started = datetime(2024, 6, 1, 8, 0)
+    events = []
+    for i in range(count // 5 + 1):
+        request_id = f"REQ-2024-{i:04d}"
+        at = started + timedelta(seconds=i)
+        events += [
+            RequestCreated(request_id, "COORD-1", "North", (52.0, 52.5, 23.5, 24.0), at),
+            GroupAssignedToRequest(request_id, f"G-{i % 50:02d}", "LEADER-1",
+                                   ("VOL-1", "VOL-2", "VOL-3", "VOL-4"), at),
+            RequestActivated(request_id, f"G-{i % 50:02d}", "North", at),
+            RequestZoneChanged(request_id, "North", "South",
+                               (51.5, 52.0, 23.5, 24.0), at),
+            RequestCompleted(request_id, "SUCCESS", at),
+        ]
+    return events[:count]
+
+
+def timed(function) -> tuple:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    codec = request_event_codec()
+
+    json_frames, json_encode_seconds = timed(lambda: [json_encode(e) for e in events])
+    json_events, json_decode_seconds = timed(lambda: [json_decode(f) for f in json_frames])
+    frames, encode_seconds = timed(lambda: [codec.encode(e) for e in events])
+    decoded, decode_seconds = timed(lambda: [codec.decode(f) for f in frames])
+    assert decoded == events and json_events == events
+
+    json_bytes = sum(map(len, json_frames))
+    binary_bytes = sum(map(len, frames))
+    n = len(events)
+
+    print(f"events:            {n:,}")
+    print(f"JSON   encode:     {n / json_encode_seconds:,.0f} ev/s")
+    print(f"JSON   decode:     {n / json_decode_seconds:,.0f} ev/s")
+    print(f"binary encode:     {n / encode_seconds:,.0f} ev/s "
+          f"(x{json_encode_seconds / encode_seconds:,.1f})")
+    print(f"binary decode:     {n / decode_seconds:,.0f} ev/s "
+          f"(x{json_decode_seconds / decode_seconds:,.1f})")
+    print(f"JSON   size:       {json_bytes / n:,.1f} B/event")
+    print(f"binary size:       {binary_bytes / n:,.1f} B/event "
+          f"({binary_bytes / json_bytes:.0%} of JSON)")
+
+
+if __name__ == "__main__":
+    main()
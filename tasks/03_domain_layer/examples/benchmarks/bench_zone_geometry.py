@@ -0,0 +1,68 @@
+"""
+Benchmark: Пакетная геометрия Zone (NumPy) против скалярных методов
+
+- contains_point в цикле против Zone.contains_points на GPS-треке
+- area_km2 в цикле против zones_area_km2 на наборе зон
+
+Запуск (из каталога examples):
+    python -m benchmarks.bench_zone_geometry
+    python -m benchmarks.bench_zone_geometry --points 5000000 --zones 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from domain.models.zone import NORTH_ZONE, Zone, zones_area_km2
+
+
+def timed(function) -> tuple:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--zones", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+
+    # GPS-трек вокруг северной зоны
+    lats = rng.uniform(51.8, 52.7, args.points)
+    lons = rng.uniform(23.3, 24.2, args.points)
+    lat_list, lon_list = lats.tolist(), lons.tolist()
+
+    scalar, scalar_seconds = timed(lambda: [
+        NORTH_ZONE.contains_point(lat, lon) for lat, lon in zip(lat_list, lon_list)
+    ])
+    vector, vector_seconds = timed(lambda: NORTH_ZONE.contains_points(lats, lons))
+    assert vector.tolist() == scalar
+
+    # Зоны по всей Брестской области
+    lat_min = rng.uniform(51.0, 53.0, args.zones)
+    lon_min = rng.uniform(23.0, 26.0, args.zones)
+    bounds = np.column_stack([
+        lat_min, lat_min + rng.uniform(0.01, 0.5, args.zones),
+        lon_min, lon_min + rng.uniform(0.01, 0.5, args.zones),
+    ])
+    zones = [Zone(f"Z-{i}", tuple(b)) for i, b in enumerate(bounds.tolist())]
+
+    areas, area_scalar_seconds = timed(lambda: [zone.area_km2() for zone in zones])
+    batch, area_vector_seconds = timed(lambda: zones_area_km2(bounds))
+    assert np.allclose(batch, areas)
+
+    print(f"points:                    {args.points:,}")
+    print(f"contains_point (loop):     {scalar_seconds * 1e3:,.1f} ms")
+    print(f"contains_points (NumPy):   {vector_seconds * 1e3:,.1f} ms "
+          f"(x{scalar_seconds / vector_seconds:,.0f})")
+    print(f"zones:                     {args.zones:,}")
+    print(f"area_km2 (loop):           {area_scalar_seconds * 1e3:,.1f} ms")
+    print(f"zones_area_km2 (NumPy):    {area_vector_seconds * 1e3:,.1f} ms "
+          f"(x{area_scalar_seconds / area_vector_seconds:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Domain Events: EventBuffer (Буфер событий агрегата)
+
+Неопубликованные события агрегата с порядковыми номерами
+Предметная область: ПСО «Юго-Запад»
+"""
+from typing import Any, Iterable, Iterator, List, NamedTuple, Tuple
+
+
+class SequencedEvent(NamedTuple):
+    """Событие с порядковым номером внутри агрегата (1, 2, 3, ...)"""
+    sequence: int
+    event: Any
+
+
+class EventBuffer:
+    """
+    Буфер доменных событий одного агрегата
+
+    - record() присваивает событию следующий номер; номер последнего
+      события — версия агрегата (для оптимистичной блокировки)
+    - drain() забирает все накопленные события без копирования:
+      список подменяется новым, и события, записанные после вызова,
+      попадут в следующий drain(), а не потеряются
+    - requeue() возвращает забранные события, если сохранить или
+      опубликовать их не удалось
+    """
+
+    __slots__ = ("_pending", "_version")
+
+    def __init__(self, version: int = 0):
+        """
+        Args:
+            version: Версия агрегата, загруженного из хранилища
+        """
+        if version < 0:
+            raise ValueError(f"version must be >= 0: {version}")
+        self._pending: List[SequencedEvent] = []
+        self._version = version
+
+    @property
+    def version(self) -> int:
+        """Номер последнего записанного события (0 — событий не было)"""
+        return self._version
+
+    def record(self, event: Any) -> int:
+        """
+        Записать событие
+
+        Returns:
+            Порядковый номер события
+        """
+        self._version += 1
+        self._pending.append(SequencedEvent(self._version, event))
+        return self._version
+
+    def pending(self) -> Tuple[Any, ...]:
+        """
+        Снимок неопубликованных событий (кортеж, без номеров)
+
+        Последующие record()/drain() снимок не меняют; для публикации
+        без копирования — drain().
+        """
+        return tuple(entry.event for entry in self._pending)
+
+    def drain(self) -> Iterator[SequencedEvent]:
+        """
+        Забрать неопубликованные события для публикации
+
+        Буфер очищается сразу при вызове, даже если итератор не
+        дочитан до конца.
+        """
+        drained, self._pending = self._pending, []
+        return iter(drained)
+
+    def requeue(self, entries: Iterable[SequencedEvent]) -> None:
+        """
+        Вернуть забранные drain() события в начало буфера
+
+        События, записанные после drain(), остаются за ними: порядок
+        номеров сохраняется.
+        """
+        self._pending = list(entries) + self._pending
+
+    def clear(self) -> None:
+        """Отбросить неопубликованные события (версия не меняется)"""
+        self._pending = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
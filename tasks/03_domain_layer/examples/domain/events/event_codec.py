@@ -0,0 +1,285 @@
+"""
+Domain Events: EventCodec (Бинарный формат событий)
+
+Компактная сериализация доменных событий для шины и хранилища
+Предметная область: ПСО «Юго-Запад»
+
+Кадр: [тег типа: B][версия схемы: B][поля в порядке dataclass][строки]
+
+- str             — длина >H в голове, UTF-8 в хвосте
+- int / float     — >q / >d
+- datetime        — микросекунды от 1970-01-01, >q (наивное время,
+                    как в событиях Request; часовой пояс не хранится)
+- Tuple[float, …] фиксированной длины (bounds) — >4d
+- Tuple[str, ...] — количество >H в голове; в хвосте длины >H и строки
+
+Схема каждого типа компилируется один раз при регистрации. Когда
+событие меняется: поднять version в register(), а старый набор полей
+описать через register_legacy() с функцией-upcaster (dict → dict
+следующей версии). Старые кадры декодируются и поднимаются по цепочке.
+
+Кодек знает только зарегистрированные dataclass-события этой
+лабораторной. Сервисы лабораторной 08 публикуют свои DomainEvent в
+JSON, и их подписчики читают только JSON: подключать кодек к шине
+можно, лишь зарегистрировав те события и научив подписчиков
+выбирать формат по content_type.
+"""
+import struct
+import typing
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+
+from domain.events.request_events import (
+    GroupAssignedToRequest,
+    RequestActivated,
+    RequestCompleted,
+    RequestCreated,
+    RequestZoneChanged,
+)
+
+_HEADER = struct.Struct(">BB")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Виды полей
+_STR, _INT, _FLOAT, _DATETIME, _FLOATS, _STRS = range(6)
+
+# Upcaster: поля версии N → поля версии N + 1
+Upcaster = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def _field_kind(annotation: Any) -> Tuple[int, int]:
+    """(вид поля, число float для кортежей) по аннотации типа"""
+    if annotation is str:
+        return _STR, 0
+    if annotation is int:
+        return _INT, 0
+    if annotation is float:
+        return _FLOAT, 0
+    if annotation is datetime:
+        return _DATETIME, 0
+    if typing.get_origin(annotation) is tuple:
+        args = typing.get_args(annotation)
+        if args == (str, Ellipsis):
+            return _STRS, 0
+        if args and all(arg is float for arg in args):
+            return _FLOATS, len(args)
+    raise ValueError(f"Тип поля не поддерживается кодеком: {annotation!r}")
+
+
+# Фрагмент формата struct для поля каждого вида (в «голове» кадра)
+_HEAD_FORMAT = {_STR: "H", _INT: "q", _FLOAT: "d", _DATETIME: "q", _STRS: "H"}
+
+
+class _Schema:
+    """
+    Скомпилированная схема одной версии события
+
+    Кадр = голова одним struct (тег, версия, числа, даты, bounds, длины
+    строк) + хвост (байты строк по порядку полей). Так на событие
+    приходится один pack/unpack_from вместо вызова на каждое поле.
+    """
+
+    def __init__(self, event_type: type, tag: int, version: int,
+                 spec: Sequence[Tuple[str, Any]]):
+        self.event_type = event_type
+        self.tag = tag
+        self.version = version
+        self.names = tuple(name for name, _ in spec)
+        self.kinds = tuple(_field_kind(annotation) for _, annotation in spec)
+        head_format = ">BB" + "".join(
+            f"{width}d" if kind == _FLOATS else _HEAD_FORMAT[kind]
+            for kind, width in self.kinds
+        )
+        self.head = struct.Struct(head_format)
+
+    def encode(self, event: Any) -> bytes:
+        try:
+            return self._encode(event)
+        except struct.error as e:
+            # Строка длиннее 65535 байт, больше 65535 элементов,
+            # число вне диапазона >q
+            raise ValueError(
+                f"{self.event_type.__name__} не помещается в формат кадра: {e}"
+            ) from e
+
+    def _encode(self, event: Any) -> bytes:
+        head: List[Any] = [self.tag, self.version]
+        tail: List[bytes] = []
+        for name, (kind, _) in zip(self.names, self.kinds):
+            value = getattr(event, name)
+            if kind == _STR:
+                data = value.encode("utf-8")
+                head.append(len(data))
+                tail.append(data)
+            elif kind == _DATETIME:
+                if value.tzinfo is not None:
+                    raise ValueError(f"Ожидалось время без часового пояса: {value!r}")
+                head.append((value - _EPOCH) // _MICROSECOND)
+            elif kind == _FLOATS:
+                head.extend(value)
+            elif kind == _STRS:
+                items = [item.encode("utf-8") for item in value]
+                head.append(len(items))
+                tail.append(struct.pack(f">{len(items)}H", *map(len, items)))
+                tail.extend(items)
+            else:
+                head.append(value)
+        return self.head.pack(*head) + b"".join(tail)
+
+    def decode_values(self, data: bytes) -> List[Any]:
+        try:
+            return self._decode_values(data)
+        except struct.error as e:
+            raise ValueError(
+                f"Кадр {self.event_type.__name__} обрезан или повреждён: {e}"
+            ) from e
+
+    def _decode_values(self, data: bytes) -> List[Any]:
+        head = self.head.unpack_from(data)
+        offset = self.head.size
+        index = 2
+        values: List[Any] = []
+        for kind, width in self.kinds:
+            if kind == _STR:
+                end = offset + head[index]
+                values.append(data[offset:end].decode("utf-8"))
+                offset = end
+            elif kind == _DATETIME:
+                values.append(_EPOCH + _MICROSECOND * head[index])
+            elif kind == _FLOATS:
+                values.append(head[index:index + width])
+                index += width
+                continue
+            elif kind == _STRS:
+                count = head[index]
+                lengths = struct.unpack_from(f">{count}H", data, offset)
+                offset += 2 * count
+                items = []
+                for length in lengths:
+                    items.append(data[offset:offset + length].decode("utf-8"))
+                    offset += length
+                values.append(tuple(items))
+            else:
+                values.append(head[index])
+            index += 1
+        if offset != len(data):
+            raise ValueError(
+                f"Длина кадра {self.event_type.__name__} не совпадает со схемой"
+            )
+        return values
+
+
+class EventCodec:
+    """Реестр схем событий: кодирование, декодирование, upcasting"""
+
+    CONTENT_TYPE = "application/x-pso-event"
+
+    def __init__(self):
+        self._by_type: Dict[type, _Schema] = {}
+        self._by_key: Dict[Tuple[int, int], _Schema] = {}
+        self._current: Dict[int, _Schema] = {}
+        self._upcasters: Dict[Tuple[int, int], Upcaster] = {}
+
+    def register(self, event_type: Type, tag: int, version: int = 1) -> None:
+        """
+        Зарегистрировать текущую схему события
+
+        Args:
+            event_type: Frozen dataclass события
+            tag: Номер типа в кадре (0-255, не меняется никогда)
+            version: Версия схемы (поднимается при изменении полей)
+        """
+        if not is_dataclass(event_type):
+            raise ValueError(f"{event_type.__name__} не dataclass")
+        if event_type in self._by_type:
+            raise ValueError(f"{event_type.__name__} уже зарегистрирован")
+        if tag in self._current:
+            raise ValueError(
+                f"Тег {tag} уже занят {self._current[tag].event_type.__name__}"
+            )
+        hints = typing.get_type_hints(event_type)
+        spec = [(f.name, hints[f.name]) for f in fields(event_type)]
+        schema = self._add(event_type, tag, version, spec)
+        self._by_type[event_type] = schema
+        self._current[tag] = schema
+
+    def register_legacy(
+        self,
+        event_type: Type,
+        version: int,
+        spec: Sequence[Tuple[str, Any]],
+        upcaster: Upcaster
+    ) -> None:
+        """
+        Описать устаревшую версию события
+
+        Args:
+            event_type: Событие (уже зарегистрированное через register)
+            version: Устаревшая версия (меньше текущей)
+            spec: Поля версии по порядку: [(имя, тип), ...]
+            upcaster: Поля версии → поля версии + 1
+        """
+        current = self._by_type.get(event_type)
+        if current is None:
+            raise ValueError(f"{event_type.__name__} не зарегистрирован")
+        if version >= current.version:
+            raise ValueError(
+                f"Версия {version} не старше текущей {current.version}"
+            )
+        tag = current.tag
+        self._add(event_type, tag, version, spec)
+        self._upcasters[(tag, version)] = upcaster
+
+    def encode(self, event: Any) -> bytes:
+        """Событие → кадр текущей версии"""
+        schema = self._by_type.get(type(event))
+        if schema is None:
+            raise ValueError(f"Событие не зарегистрировано: {type(event).__name__}")
+        return schema.encode(event)
+
+    def decode(self, data: bytes) -> Any:
+        """Кадр любой известной версии → событие текущей версии"""
+        if len(data) < _HEADER.size:
+            raise ValueError("Кадр события короче заголовка")
+        tag, version = data[0], data[1]
+        schema = self._by_key.get((tag, version))
+        if schema is None:
+            raise ValueError(f"Неизвестная схема события: тег {tag}, версия {version}")
+        values = schema.decode_values(data)
+        current = self._current[tag]
+        if version == current.version:
+            return current.event_type(*values)
+
+        fields_ = dict(zip(schema.names, values))
+        for step in range(version, current.version):
+            upcaster = self._upcasters.get((tag, step))
+            if upcaster is None:
+                raise ValueError(
+                    f"Нет upcaster {current.event_type.__name__} v{step} → v{step + 1}"
+                )
+            fields_ = upcaster(fields_)
+        return current.event_type(**fields_)
+
+    def _add(self, event_type: type, tag: int, version: int,
+             spec: Sequence[Tuple[str, Any]]) -> _Schema:
+        if not (0 <= tag <= 255 and 0 <= version <= 255):
+            raise ValueError(f"Тег и версия — 0..255: {tag}, {version}")
+        if (tag, version) in self._by_key:
+            raise ValueError(f"Схема {event_type.__name__} v{version} уже описана")
+        schema = _Schema(event_type, tag, version, spec)
+        self._by_key[(tag, version)] = schema
+        return schema
+
+
+def request_event_codec() -> EventCodec:
+    """Кодек событий заявки (теги типов фиксированы навсегда)"""
+    codec = EventCodec()
+    codec.register(RequestCreated, tag=1)
+    codec.register(GroupAssignedToRequest, tag=2)
+    codec.register(RequestActivated, tag=3)
+    codec.register(RequestZoneChanged, tag=4)
+    codec.register(RequestCompleted, tag=5)
+    return codec
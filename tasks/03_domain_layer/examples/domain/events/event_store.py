@@ -0,0 +1,154 @@
+"""
+Domain Events: EventStore (Хранилище событий и снимков)
+
+Event Sourcing для агрегата Request
+Предметная область: ПСО «Юго-Запад»
+
+- InMemoryEventStore — потоки событий по ID агрегата и последний
+  снимок каждого потока; запись с ожидаемой версией
+- SnapshotPolicy — когда сохранять снимок (каждые N событий)
+- EventSourcedRequestRepository — загрузка: снимок + хвост событий
+  после него, поэтому время загрузки не зависит от длины истории
+"""
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from domain.events.request_events import RequestCreated
+from domain.exceptions.domain_exceptions import ConcurrencyException
+from domain.models.request import Request, RequestSnapshot
+
+
+class InMemoryEventStore:
+    """Потоки событий в памяти"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams: Dict[str, List] = {}
+        self._snapshots: Dict[str, RequestSnapshot] = {}
+
+    def append(self, stream_id: str, events: Sequence, expected_version: int) -> int:
+        """
+        Дописать события в поток
+
+        Args:
+            stream_id: ID агрегата
+            events: Новые события по порядку
+            expected_version: Версия потока, от которой строились события
+
+        Returns:
+            Новая версия потока
+
+        Raises:
+            ConcurrencyException: поток уже изменён другим писателем
+        """
+        with self._lock:
+            stream = self._streams.setdefault(stream_id, [])
+            if len(stream) != expected_version:
+                raise ConcurrencyException(
+                    f"Заявка {stream_id} изменена параллельно: "
+                    f"ожидалась версия {expected_version}, текущая {len(stream)}"
+                )
+            stream.extend(events)
+            return len(stream)
+
+    def load(self, stream_id: str, after_version: int = 0) -> List:
+        """События потока с номерами больше after_version"""
+        with self._lock:
+            return self._streams.get(stream_id, [])[after_version:]
+
+    def version(self, stream_id: str) -> int:
+        """Текущая версия потока (0 — потока нет)"""
+        with self._lock:
+            return len(self._streams.get(stream_id, ()))
+
+    def save_snapshot(self, stream_id: str, snapshot: RequestSnapshot) -> None:
+        """Сохранить снимок (более старый снимок не заменяет новый)"""
+        with self._lock:
+            current = self._snapshots.get(stream_id)
+            if current is None or current.version < snapshot.version:
+                self._snapshots[stream_id] = snapshot
+
+    def latest_snapshot(self, stream_id: str) -> Optional[RequestSnapshot]:
+        """Последний снимок потока или None"""
+        with self._lock:
+            return self._snapshots.get(stream_id)
+
+
+class SnapshotPolicy:
+    """Снимок каждые every событий"""
+
+    def __init__(self, every: int = 50):
+        if every < 1:
+            raise ValueError(f"every must be >= 1: {every}")
+        self.every = every
+
+    def should_snapshot(self, old_version: int, new_version: int) -> bool:
+        """Пересекла ли запись границу кратную every"""
+        return new_version // self.every > old_version // self.every
+
+
+class EventSourcedRequestRepository:
+    """Репозиторий заявок поверх хранилища событий"""
+
+    def __init__(
+        self,
+        store: InMemoryEventStore,
+        policy: Optional[SnapshotPolicy] = None
+    ):
+        """
+        Args:
+            store: Хранилище событий
+            policy: Когда сохранять снимок (по умолчанию каждые 50 событий)
+        """
+        self._store = store
+        self._policy = policy or SnapshotPolicy()
+
+    def save(self, request: Request) -> None:
+        """
+        Сохранить новые события заявки
+
+        События забираются drain_events(); если записать их не
+        удалось, они возвращаются в заявку (requeue_events) — повтор
+        после ошибки ничего не теряет.
+
+        Raises:
+            ConcurrencyException: заявку успели изменить после загрузки
+            ValueError: новый поток начинается не с RequestCreated
+                (заявка создана конструктором, а не Request.create) —
+                такую заявку потом нельзя было бы загрузить
+        """
+        entries = list(request.drain_events())
+        if not entries:
+            return
+        # Версию считаем по номерам событий, а не по request.version:
+        # события, записанные во время save, в эту запись не входят
+        expected_version = entries[0].sequence - 1
+        new_version = entries[-1].sequence
+        try:
+            if expected_version == 0 and not isinstance(entries[0].event, RequestCreated):
+                raise ValueError(
+                    f"Поток событий заявки {request.request_id} должен начинаться "
+                    f"с RequestCreated: создавайте заявку через Request.create"
+                )
+            # При ConcurrencyException ничего не записано: загрузить
+            # заявку заново и повторить команду
+            self._store.append(
+                request.request_id, [entry.event for entry in entries], expected_version
+            )
+        except BaseException:
+            request.requeue_events(entries)
+            raise
+        # Снимок — только если он совпадает с записанной версией
+        if request.version == new_version and self._policy.should_snapshot(
+            expected_version, new_version
+        ):
+            self._store.save_snapshot(request.request_id, request.to_snapshot())
+
+    def find_by_id(self, request_id: str) -> Optional[Request]:
+        """Загрузить заявку: последний снимок + события после него"""
+        snapshot = self._store.latest_snapshot(request_id)
+        after = snapshot.version if snapshot else 0
+        events = self._store.load(request_id, after_version=after)
+        if snapshot is None and not events:
+            return None
+        return Request.from_events(events, snapshot=snapshot)
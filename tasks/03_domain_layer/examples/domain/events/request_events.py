@@ -6,6 +6,20 @@ Domain Events: События для Request
 """
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Tuple
+
+# События хранят всё, что нужно для восстановления агрегата
+# (Request.from_events): не только ID, но и данные группы и зоны
+
+
+@dataclass(frozen=True)
+class RequestCreated:
+    """Событие: Заявка создана (первое событие потока заявки)"""
+    request_id: str
+    coordinator_id: str
+    zone_name: str
+    zone_bounds: Tuple[float, float, float, float]
+    occurred_at: datetime
 
 
 @dataclass(frozen=True)
@@ -13,6 +27,8 @@ class GroupAssignedToRequest:
     """Событие: Группа назначена на заявку"""
     request_id: str
     group_id: str
+    leader_id: str
+    member_ids: Tuple[str, ...]
     occurred_at: datetime
 
 
@@ -31,6 +47,7 @@ class RequestZoneChanged:
     request_id: str
     old_zone: str
     new_zone: str
+    new_zone_bounds: Tuple[float, float, float, float]
     occurred_at: datetime
 
 
@@ -19,3 +19,13 @@ class InvalidRequestStateException(DomainException):
 class InvalidGroupSizeException(DomainException):
     """Исключение: Некорректный размер группы"""
     pass
+
+
+class ConcurrencyException(DomainException):
+    """Исключение: Агрегат изменён параллельно (версия не совпала)"""
+    pass
+
+
+class ZoneOverlapException(DomainException):
+    """Исключение: Зона пересекается с зоной другой активной заявки"""
+    pass
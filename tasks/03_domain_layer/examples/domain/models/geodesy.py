@@ -0,0 +1,87 @@
+"""
+Domain Layer: Geodesy (Площадь зоны на эллипсоиде WGS84)
+
+Единственная формула площади зоны для всех слоёв:
+- Zone.area_km2 (доменная модель)
+- RequestProjection (Read Model, CQRS)
+- geodesic_area_km2 в sql/materialized_view.sql (та же формула на SQL)
+
+Зона — «прямоугольник» между двумя параллелями и двумя меридианами.
+Его площадь на эллипсоиде считается точно (без приближения плоскостью):
+
+    A = a² (1 − e²) Δλ [F(sin φ2) − F(sin φ1)]
+    F(s) = s / (2 (1 − e² s²)) + artanh(e s) / (2 e)
+
+Предметная область: ПСО «Юго-Запад»
+"""
+import math
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+try:  # NumPy ускоряет пакетный расчёт, но не обязателен
+    import numpy as np
+except ImportError:
+    np = None
+
+# Эллипсоид WGS84 (км)
+WGS84_A_KM = 6378.137
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+WGS84_E = math.sqrt(WGS84_E2)
+
+Bounds = Tuple[float, float, float, float]  # (lat_min, lat_max, lon_min, lon_max)
+
+
+def _authalic(sin_lat: float) -> float:
+    """F(s): первообразная элемента площади эллипсоида по sin(широты)"""
+    return (
+        sin_lat / (2 * (1 - WGS84_E2 * sin_lat * sin_lat))
+        + math.atanh(WGS84_E * sin_lat) / (2 * WGS84_E)
+    )
+
+
+@lru_cache(maxsize=4096)
+def rectangle_area_km2(
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float
+) -> float:
+    """
+    Площадь зоны между параллелями и меридианами, км²
+
+    Результат кэшируется по границам: одни и те же зоны (North,
+    South, ...) встречаются в тысячах заявок.
+    """
+    lon_span = math.radians(abs(lon_max - lon_min))
+    band = abs(
+        _authalic(math.sin(math.radians(lat_max)))
+        - _authalic(math.sin(math.radians(lat_min)))
+    )
+    return WGS84_A_KM ** 2 * (1 - WGS84_E2) * lon_span * band
+
+
+def rectangle_areas_km2(bounds) -> Sequence[float]:
+    """
+    Площади многих зон за один проход (для проекций и отчётов)
+
+    Args:
+        bounds: Последовательность или массив формы (n, 4)
+
+    Returns:
+        Площади в км² (массив NumPy, если NumPy установлен)
+    """
+    if np is None:
+        return [rectangle_area_km2(*b) for b in bounds]
+
+    bounds = np.asarray(bounds, dtype=np.float64)
+    if bounds.ndim != 2 or bounds.shape[1] != 4:
+        raise ValueError(f"bounds must have shape (n, 4): {bounds.shape}")
+    lat_min, lat_max, lon_min, lon_max = np.radians(bounds).T
+
+    def authalic(lat):
+        s = np.sin(lat)
+        return s / (2 * (1 - WGS84_E2 * s * s)) + np.arctanh(WGS84_E * s) / (2 * WGS84_E)
+
+    band = np.abs(authalic(lat_max) - authalic(lat_min))
+    return WGS84_A_KM ** 2 * (1 - WGS84_E2) * np.abs(lon_max - lon_min) * band
@@ -6,6 +6,8 @@ Entity: Группа волонтёров для выполнения поиск
 """
 from typing import List
 
+from domain.models.group_status import GROUP_LIFECYCLE, GroupStatus
+
 
 class Group:
     """
@@ -37,7 +39,7 @@ class Group:
         self._id = group_id
         self._leader_id = leader_id
         self._members: List[str] = []  # IDs волонтёров
-        self._status = "FORMING"  # FORMING → READY → DEPLOYED
+        self._status = GroupStatus.FORMING  # FORMING → READY → DEPLOYED
     
     @property
     def id(self) -> str:
@@ -57,7 +59,7 @@ class Group:
         return len(self._members)
     
     @property
-    def status(self) -> str:
+    def status(self) -> GroupStatus:
         return self._status
     
     def add_member(self, volunteer_id: str) -> None:
@@ -71,7 +73,7 @@ class Group:
             ValueError: если нарушен инвариант
         """
         # Инвариант: нельзя изменить готовую группу
-        if self._status != "FORMING":
+        if self._status != GroupStatus.FORMING:
             raise ValueError(
                 f"Cannot modify group in status {self._status}"
             )
@@ -101,7 +103,7 @@ class Group:
             ValueError: если нарушен инвариант
         """
         # Инвариант: нельзя изменить готовую группу
-        if self._status != "FORMING":
+        if self._status != GroupStatus.FORMING:
             raise ValueError(
                 f"Cannot modify group in status {self._status}"
             )
@@ -118,21 +120,9 @@ class Group:
         Пометить группу как готовую к выходу
         
         Raises:
-            ValueError: если недостаточно участников
+            ValueError: если недостаточно участников или группа не в FORMING
         """
-        # Инвариант: минимум участников
-        if len(self._members) < self.MIN_MEMBERS:
-            raise ValueError(
-                f"Group must have at least {self.MIN_MEMBERS} members, "
-                f"current: {len(self._members)}"
-            )
-        
-        if self._status != "FORMING":
-            raise ValueError(
-                f"Cannot mark group as ready from status {self._status}"
-            )
-        
-        self._status = "READY"
+        GROUP_LIFECYCLE.fire(self, GroupStatus.READY)
     
     def deploy(self) -> None:
         """
@@ -141,18 +131,13 @@ class Group:
         Raises:
             ValueError: если группа не готова
         """
-        if self._status != "READY":
-            raise ValueError(
-                f"Cannot deploy group in status {self._status}"
-            )
-        
-        self._status = "DEPLOYED"
+        GROUP_LIFECYCLE.fire(self, GroupStatus.DEPLOYED)
     
     def is_ready(self) -> bool:
         """Проверка готовности группы"""
         return (
             len(self._members) >= self.MIN_MEMBERS 
-            and self._status == "READY"
+            and self._status == GroupStatus.READY
         )
     
     def __eq__(self, other):
@@ -170,3 +155,13 @@ class Group:
             f"Group(id={self._id}, leader={self._leader_id}, "
             f"members={len(self._members)}, status={self._status})"
         )
+
+
+@GROUP_LIFECYCLE.guard(GroupStatus.FORMING, GroupStatus.READY)
+def _require_min_members(group: Group) -> None:
+    # Инвариант: минимум участников
+    if group.member_count < Group.MIN_MEMBERS:
+        raise ValueError(
+            f"Group must have at least {Group.MIN_MEMBERS} members, "
+            f"current: {group.member_count}"
+        )
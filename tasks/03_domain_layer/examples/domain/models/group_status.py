@@ -0,0 +1,32 @@
+"""
+Domain Layer: GroupStatus (Статус группы)
+
+Value Object (Enum): Статус поисковой группы
+Предметная область: ПСО «Юго-Запад»
+"""
+from enum import Enum
+
+from domain.models.state_machine import StateMachine, Transition
+
+
+class GroupStatus(Enum):
+    """
+    Статусы жизненного цикла группы
+    
+    Transitions:
+        FORMING → READY → DEPLOYED
+    """
+    
+    FORMING = "FORMING"     # Формируется (состав можно менять)
+    READY = "READY"         # Готова к выходу
+    DEPLOYED = "DEPLOYED"   # На операции
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+# Жизненный цикл группы; guard-проверки регистрирует Group
+GROUP_LIFECYCLE: StateMachine[GroupStatus] = StateMachine(GroupStatus, [
+    Transition(GroupStatus.FORMING, GroupStatus.READY),
+    Transition(GroupStatus.READY, GroupStatus.DEPLOYED),
+], state_attr="_status")
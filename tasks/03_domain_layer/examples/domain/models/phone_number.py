@@ -4,7 +4,21 @@ Domain Layer: PhoneNumber (Телефонный номер)
 Value Object: Телефонный номер для SMS-уведомлений
 Предметная область: ПСО «Юго-Запад»
 """
+import weakref
 from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from domain.models.country_codes import COUNTRY_CODES
+
+# Символы-разделители, которые люди пишут в номерах
+_SEPARATORS = str.maketrans("", "", " -()./\t")
+
+# Префиксы междугородней связи внутри страны (набор без '+')
+_TRUNK_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    "375": ("80", "0"),  # Беларусь: 8 029 123-45-67, 029 123-45-67
+    "7": ("8",),     # Россия: 8 912 345-67-89
+}
+_DEFAULT_TRUNK_PREFIXES = ("0",)
 
 
 @dataclass(frozen=True)
@@ -18,6 +32,7 @@ class PhoneNumber:
         - Начинается с '+'
         - Содержит только цифры после '+'
         - Длина 10-15 цифр
+        - Начинается с кода страны ITU-T E.164
     """
     
     number: str
@@ -41,26 +56,54 @@ class PhoneNumber:
             raise ValueError(
                 f"Phone number must be 10-15 digits, got {len(digits)}: {self.number}"
             )
+        
+        if COUNTRY_CODES.match(digits) is None:
+            raise ValueError(
+                f"Unknown country code: {self.number}"
+            )
+    
+    @classmethod
+    def parse(cls, raw: str, default_country_code: str = "375") -> "PhoneNumber":
+        """
+        Разобрать номер в свободной записи и вернуть общий экземпляр
+        
+        Понимает "+375 (29) 123-45-67", "00375291234567",
+        "8 029 123-45-67" (номер внутри страны default_country_code).
+        Одинаковые номера возвращаются одним объектом (интернирование):
+        в ростере на 100k волонтёров не будет копий одного номера.
+        
+        Raises:
+            ValueError: если номер некорректен
+        """
+        return cls._intern_normalized(normalize_phone(raw, default_country_code))
+    
+    @classmethod
+    def intern(cls, number: str) -> "PhoneNumber":
+        """Общий экземпляр для номера в формате +XXXXXXXXXXX"""
+        phone = _INTERNED.get(number)
+        if phone is None:
+            phone = cls(number)
+            _INTERNED[number] = phone
+        return phone
+    
+    @classmethod
+    def _intern_normalized(cls, number: str) -> "PhoneNumber":
+        """intern() для результата normalize_phone: без повторной проверки"""
+        phone = _INTERNED.get(number)
+        if phone is None:
+            phone = object.__new__(cls)
+            object.__setattr__(phone, "number", number)
+            _INTERNED[number] = phone
+        return phone
     
     @property
     def country_code(self) -> str:
         """
-        Получить код страны (первые 1-3 цифры)
+        Получить код страны (1-3 цифры, по таблице ITU-T E.164)
         
         Например: +375 → "375" (Беларусь)
         """
-        digits = self.number[1:]
-        
-        # Попытка определить длину кода страны
-        if digits.startswith("375"):  # Беларусь
-            return "375"
-        elif digits.startswith("7"):  # Россия
-            return "7"
-        elif digits.startswith("380"):  # Украина
-            return "380"
-        else:
-            # По умолчанию берём первые 3 цифры
-            return digits[:3]
+        return COUNTRY_CODES.match(self.number[1:])
     
     @property
     def national_number(self) -> str:
@@ -89,3 +132,44 @@ class PhoneNumber:
     
     # Равенство и хэш генерируются автоматически в @dataclass
     # Два PhoneNumber с одинаковым number - ОДНО И ТО ЖЕ
+
+
+# Интернированные номера; неиспользуемые удаляются сборщиком мусора
+_INTERNED: "weakref.WeakValueDictionary[str, PhoneNumber]" = weakref.WeakValueDictionary()
+
+
+def normalize_phone(raw: str, default_country_code: str = "375") -> str:
+    """
+    Привести номер к виду +XXXXXXXXXXX без создания PhoneNumber
+    
+    Используется и в PhoneNumber.parse, и в пакетном импорте
+    (в процессах-воркерах).
+    
+    Raises:
+        ValueError: если номер некорректен
+    """
+    cleaned = raw.strip().translate(_SEPARATORS)
+    if cleaned.startswith("+"):
+        digits = cleaned[1:]
+    elif cleaned.startswith("00"):
+        digits = cleaned[2:]
+    else:
+        # Номер внутри страны: убрать префикс междугородней связи
+        national = cleaned
+        for prefix in _TRUNK_PREFIXES.get(default_country_code, _DEFAULT_TRUNK_PREFIXES):
+            if national.startswith(prefix):
+                national = national[len(prefix):]
+                break
+        if national.startswith("0"):
+            # Лишний 0 (8 0 029 ...) или неизвестный префикс: после кода
+            # страны получился бы номер вида +3750...
+            raise ValueError(f"National number must not start with 0: {raw!r}")
+        digits = default_country_code + national
+    
+    if not digits.isdigit():
+        raise ValueError(f"Phone number must contain only digits: {raw!r}")
+    if len(digits) < 10 or len(digits) > 15:
+        raise ValueError(f"Phone number must be 10-15 digits, got {len(digits)}: {raw!r}")
+    if COUNTRY_CODES.match(digits) is None:
+        raise ValueError(f"Unknown country code: {raw!r}")
+    return "+" + digits
@@ -6,16 +6,38 @@ Request (Aggregate Root): Заявка на поисково-спасатель
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, Tuple
 from domain.models.group import Group
 from domain.models.zone import Zone
-from domain.models.request_status import RequestStatus
+from domain.models.request_status import REQUEST_LIFECYCLE, RequestStatus
 from domain.events.request_events import (
+    RequestCreated,
     GroupAssignedToRequest,
     RequestActivated,
     RequestZoneChanged,
     RequestCompleted
 )
+from domain.events.event_buffer import EventBuffer, SequencedEvent
+
+
+@dataclass(frozen=True)
+class RequestSnapshot:
+    """
+    Снимок состояния заявки на момент события с номером version
+    
+    Загрузка: снимок + события после него (Request.from_events)
+    """
+    request_id: str
+    coordinator_id: str
+    zone: Zone
+    status: RequestStatus
+    group_id: Optional[str]
+    leader_id: Optional[str]
+    member_ids: Tuple[str, ...]
+    created_at: datetime
+    activated_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    version: int
 
 
 @dataclass
@@ -28,6 +50,10 @@ class Request:
     2. Нельзя назначить группу для заявки, которая уже активна/завершена
     3. Нельзя изменить зону для завершённой заявки
     4. Группа должна быть готова (3-5 участников) при назначении
+    
+    Состояние меняется только в apply(): команды проверяют
+    инварианты и создают событие, apply() его применяет. Поэтому
+    from_events() восстанавливает заявку теми же методами.
     """
     request_id: str
     coordinator_id: str
@@ -37,7 +63,80 @@ class Request:
     created_at: datetime = field(default_factory=datetime.now)
     activated_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    _events: List = field(default_factory=list, repr=False, compare=False)
+    _events: EventBuffer = field(default_factory=EventBuffer, repr=False, compare=False)
+    
+    @classmethod
+    def create(cls, request_id: str, coordinator_id: str, zone: Zone) -> "Request":
+        """
+        Создать новую заявку с событием RequestCreated
+        
+        Для event sourcing: поток событий заявки начинается с RequestCreated
+        """
+        event = RequestCreated(
+            request_id=request_id,
+            coordinator_id=coordinator_id,
+            zone_name=zone.name,
+            zone_bounds=zone.bounds,
+            occurred_at=datetime.now()
+        )
+        request = cls(request_id, coordinator_id, zone, created_at=event.occurred_at)
+        request._events.record(event)
+        return request
+    
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable,
+        snapshot: Optional[RequestSnapshot] = None
+    ) -> "Request":
+        """
+        Восстановить заявку из событий
+        
+        Args:
+            events: События по порядку; без снимка первое — RequestCreated
+            snapshot: Снимок; тогда events — только события после него
+        
+        Returns:
+            Заявка с версией = номер последнего события
+        """
+        events = iter(events)
+        if snapshot is not None:
+            request = cls._from_snapshot(snapshot)
+        else:
+            first = next(events, None)
+            if not isinstance(first, RequestCreated):
+                raise ValueError("Поток событий заявки должен начинаться с RequestCreated")
+            request = cls(
+                first.request_id,
+                first.coordinator_id,
+                Zone(first.zone_name, first.zone_bounds),
+                created_at=first.occurred_at,
+                _events=EventBuffer(version=1)
+            )
+        
+        version = request.version
+        for event in events:
+            request.apply(event)
+            version += 1
+        request._events = EventBuffer(version=version)
+        return request
+    
+    def to_snapshot(self) -> RequestSnapshot:
+        """Снимок текущего состояния (вместе с версией)"""
+        group = self.assigned_group
+        return RequestSnapshot(
+            request_id=self.request_id,
+            coordinator_id=self.coordinator_id,
+            zone=self.zone,
+            status=self.status,
+            group_id=group.id if group else None,
+            leader_id=group.leader_id if group else None,
+            member_ids=tuple(group.members) if group else (),
+            created_at=self.created_at,
+            activated_at=self.activated_at,
+            completed_at=self.completed_at,
+            version=self.version
+        )
     
     def assign_group(self, group: Group) -> None:
         """
@@ -51,16 +150,19 @@ class Request:
             raise ValueError("Нельзя назначить группу для заявки в статусе не DRAFT")
         
         if not group.is_ready():
-            raise ValueError(f"Группа {group.group_id} не готова (нужно 3-5 участников)")
+            raise ValueError(f"Группа {group.id} не готова (нужно 3-5 участников)")
         
         self.assigned_group = group
         
         event = GroupAssignedToRequest(
             request_id=self.request_id,
-            group_id=group.group_id,
+            group_id=group.id,
+            leader_id=group.leader_id,
+            member_ids=tuple(group.members),
             occurred_at=datetime.now()
         )
-        self._events.append(event)
+        # Группу (с её текущим статусом) назначаем сами, а не через apply
+        self._events.record(event)
     
     def activate(self) -> None:
         """
@@ -70,22 +172,8 @@ class Request:
         - Должна быть назначена группа
         - Статус должен быть DRAFT
         """
-        if self.assigned_group is None:
-            raise ValueError("Нельзя активировать заявку без назначенной группы")
-        
-        if self.status != RequestStatus.DRAFT:
-            raise ValueError(f"Нельзя активировать заявку в статусе {self.status.value}")
-        
-        self.status = RequestStatus.ACTIVE
-        self.activated_at = datetime.now()
-        
-        event = RequestActivated(
-            request_id=self.request_id,
-            group_id=self.assigned_group.group_id,
-            zone_name=self.zone.name,
-            occurred_at=self.activated_at
-        )
-        self._events.append(event)
+        for event in REQUEST_LIFECYCLE.fire(self, RequestStatus.ACTIVE):
+            self._raise(event)
     
     def change_zone(self, new_zone: Zone) -> None:
         """
@@ -94,19 +182,16 @@ class Request:
         Инварианты:
         - Нельзя изменить для завершённой заявки
         """
-        if self.status == RequestStatus.COMPLETED:
+        if self.status.is_final:
             raise ValueError("Нельзя изменить зону для завершённой заявки")
         
-        old_zone_name = self.zone.name
-        self.zone = new_zone
-        
-        event = RequestZoneChanged(
+        self._raise(RequestZoneChanged(
             request_id=self.request_id,
-            old_zone=old_zone_name,
+            old_zone=self.zone.name,
             new_zone=new_zone.name,
+            new_zone_bounds=new_zone.bounds,
             occurred_at=datetime.now()
-        )
-        self._events.append(event)
+        ))
     
     def complete(self, outcome: str) -> None:
         """
@@ -114,26 +199,106 @@ class Request:
         
         Args:
             outcome: "SUCCESS" или "ABORTED"
+        
+        Инварианты:
+        - Статус должен быть ACTIVE
         """
         if outcome not in ("SUCCESS", "ABORTED"):
             raise ValueError("Outcome должен быть SUCCESS или ABORTED")
         
-        if self.status == RequestStatus.COMPLETED:
-            raise ValueError("Заявка уже завершена")
-        
+        for event in REQUEST_LIFECYCLE.fire(self, RequestStatus.COMPLETED, outcome):
+            self._raise(event)
+    
+    # === Event Sourcing ===
+    
+    def apply(self, event) -> None:
+        """
+        Применить событие к состоянию (без проверки инвариантов:
+        событие уже произошло)
+        """
+        handler = self._APPLIERS.get(type(event))
+        if handler is None:
+            raise ValueError(f"Неизвестное событие заявки: {type(event).__name__}")
+        handler(self, event)
+    
+    def _apply_group_assigned(self, event: GroupAssignedToRequest) -> None:
+        group = Group(event.group_id, event.leader_id)
+        for member_id in event.member_ids:
+            group.add_member(member_id)
+        group.mark_ready()
+        self.assigned_group = group
+    
+    def _apply_activated(self, event: RequestActivated) -> None:
+        self.status = RequestStatus.ACTIVE
+        self.activated_at = event.occurred_at
+    
+    def _apply_zone_changed(self, event: RequestZoneChanged) -> None:
+        self.zone = Zone(event.new_zone, event.new_zone_bounds)
+    
+    def _apply_completed(self, event: RequestCompleted) -> None:
         self.status = RequestStatus.COMPLETED
-        self.completed_at = datetime.now()
-        
-        event = RequestCompleted(
-            request_id=self.request_id,
-            outcome=outcome,
-            occurred_at=self.completed_at
+        self.completed_at = event.occurred_at
+    
+    _APPLIERS = {
+        GroupAssignedToRequest: _apply_group_assigned,
+        RequestActivated: _apply_activated,
+        RequestZoneChanged: _apply_zone_changed,
+        RequestCompleted: _apply_completed,
+    }
+    
+    def _raise(self, event) -> None:
+        """Применить новое событие и записать его для публикации"""
+        self.apply(event)
+        self._events.record(event)
+    
+    @classmethod
+    def _from_snapshot(cls, snapshot: RequestSnapshot) -> "Request":
+        group = None
+        if snapshot.group_id is not None:
+            group = Group(snapshot.group_id, snapshot.leader_id)
+            for member_id in snapshot.member_ids:
+                group.add_member(member_id)
+            group.mark_ready()
+        return cls(
+            snapshot.request_id,
+            snapshot.coordinator_id,
+            snapshot.zone,
+            status=snapshot.status,
+            assigned_group=group,
+            created_at=snapshot.created_at,
+            activated_at=snapshot.activated_at,
+            completed_at=snapshot.completed_at,
+            _events=EventBuffer(version=snapshot.version)
         )
-        self._events.append(event)
     
-    def get_events(self) -> List:
-        """Получить доменные события"""
-        return self._events.copy()
+    # === Доменные события ===
+    
+    @property
+    def version(self) -> int:
+        """Версия агрегата: номер последнего события (оптимистичная блокировка)"""
+        return self._events.version
+    
+    def get_events(self) -> Tuple:
+        """
+        Получить неопубликованные доменные события
+
+        Возвращает снимок (кортеж): события, записанные позже, в него
+        не попадут. Забрать события без копирования — drain_events().
+        """
+        return self._events.pending()
+    
+    def drain_events(self) -> Iterator[SequencedEvent]:
+        """
+        Забрать события для публикации (вместо get_events + clear_events)
+        
+        События, записанные во время публикации, не теряются:
+        они достанутся следующему вызову.
+        """
+        return self._events.drain()
+    
+    def requeue_events(self, entries: Iterable[SequencedEvent]) -> None:
+        """Вернуть события, забранные drain_events(), если их не сохранили"""
+        self._events.requeue(entries)
     
     def clear_events(self) -> None:
         """Очистить события после публикации"""
@@ -147,3 +312,30 @@ class Request:
     
     def __hash__(self):
         return hash(self.request_id)
+
+
+# === Жизненный цикл: guard-проверки и события переходов ===
+
+@REQUEST_LIFECYCLE.guard(RequestStatus.DRAFT, RequestStatus.ACTIVE)
+def _require_assigned_group(request: Request) -> None:
+    if request.assigned_group is None:
+        raise ValueError("Нельзя активировать заявку без назначенной группы")
+
+
+@REQUEST_LIFECYCLE.on_transition(RequestStatus.DRAFT, RequestStatus.ACTIVE)
+def _activated(request: Request) -> RequestActivated:
+    return RequestActivated(
+        request_id=request.request_id,
+        group_id=request.assigned_group.id,
+        zone_name=request.zone.name,
+        occurred_at=datetime.now()
+    )
+
+
+@REQUEST_LIFECYCLE.on_transition(RequestStatus.ACTIVE, RequestStatus.COMPLETED)
+def _completed(request: Request, outcome: str) -> RequestCompleted:
+    return RequestCompleted(
+        request_id=request.request_id,
+        outcome=outcome,
+        occurred_at=datetime.now()
+    )
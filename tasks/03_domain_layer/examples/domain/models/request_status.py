@@ -6,6 +6,8 @@ Value Object (Enum): Статус поисково-спасательной за
 """
 from enum import Enum
 
+from domain.models.state_machine import StateMachine, Transition
+
 
 class RequestStatus(Enum):
     """
@@ -35,19 +37,12 @@ class RequestStatus(Enum):
         Returns:
             True если переход допустим
         """
-        valid_transitions = {
-            RequestStatus.DRAFT: {RequestStatus.ACTIVE, RequestStatus.CANCELLED},
-            RequestStatus.ACTIVE: {RequestStatus.COMPLETED, RequestStatus.CANCELLED},
-            RequestStatus.COMPLETED: set(),  # Финальный статус
-            RequestStatus.CANCELLED: set(),  # Финальный статус
-        }
-        
-        return new_status in valid_transitions.get(self, set())
+        return REQUEST_LIFECYCLE.can_transition(self, new_status)
     
     @property
     def is_final(self) -> bool:
         """Проверка финального статуса (нельзя изменить)"""
-        return self in {RequestStatus.COMPLETED, RequestStatus.CANCELLED}
+        return REQUEST_LIFECYCLE.is_final(self)
     
     @property
     def is_active(self) -> bool:
@@ -64,3 +59,12 @@ class RequestStatus(Enum):
             RequestStatus.CANCELLED: "Отменена",
         }
         return names[self]
+
+
+# Жизненный цикл заявки (единственное место, где описаны переходы)
+REQUEST_LIFECYCLE: StateMachine[RequestStatus] = StateMachine(RequestStatus, [
+    Transition(RequestStatus.DRAFT, RequestStatus.ACTIVE),
+    Transition(RequestStatus.DRAFT, RequestStatus.CANCELLED),
+    Transition(RequestStatus.ACTIVE, RequestStatus.COMPLETED),
+    Transition(RequestStatus.ACTIVE, RequestStatus.CANCELLED),
+])
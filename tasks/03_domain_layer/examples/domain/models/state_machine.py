@@ -0,0 +1,154 @@
+"""
+Domain Layer: StateMachine (Жизненный цикл сущности)
+
+Декларативное описание переходов статусов для Request и Group
+Предметная область: ПСО «Юго-Запад»
+
+Переходы описываются один раз и компилируются в целочисленную
+таблицу: проверка перехода — два поиска номера статуса и индекс
+в списке, без создания словарей и множеств на каждый вызов.
+
+Сам граф переходов объявляется рядом с Enum статусов, а guard-проверки
+и hooks (события перехода) регистрирует сущность-владелец:
+
+    @REQUEST_LIFECYCLE.guard(RequestStatus.DRAFT, RequestStatus.ACTIVE)
+    def _require_group(request): ...
+"""
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any, Callable, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
+
+S = TypeVar("S", bound=Enum)
+
+# Guard: проверяет владельца и бросает ValueError, если переход запрещён
+Guard = Callable[[Any], None]
+# Hook: вызывается до смены статуса (владелец ещё в исходном статусе);
+# возвращает событие или None (аргументы: владелец и *args из fire)
+Hook = Callable[..., Optional[Any]]
+
+
+@dataclass(frozen=True)
+class Transition:
+    """Допустимый переход source → target с проверками и реакциями"""
+    source: Enum
+    target: Enum
+    guards: Tuple[Guard, ...] = ()
+    hooks: Tuple[Hook, ...] = ()
+
+
+class StateMachine(Generic[S]):
+    """
+    Скомпилированный жизненный цикл
+
+    Args конструктора:
+        states: Enum статусов
+        transitions: Допустимые переходы
+        state_attr: Атрибут владельца, в котором хранится статус
+    """
+
+    def __init__(
+        self,
+        states: Type[S],
+        transitions: Iterable[Transition],
+        state_attr: str = "status"
+    ):
+        self._states: Tuple[S, ...] = tuple(states)
+        self._state_attr = state_attr
+        # Номер статуса по имени: _name_ — обычный атрибут строки,
+        # его хэш дешевле, чем Enum.__hash__
+        self._ordinal = {state._name_: i for i, state in enumerate(self._states)}
+        size = len(self._states)
+        self._size = size
+        self._table: List[Optional[Transition]] = [None] * (size * size)
+        for transition in transitions:
+            index = self._index(transition.source, transition.target)
+            if self._table[index] is not None:
+                raise ValueError(
+                    f"Переход {transition.source.name} → {transition.target.name} "
+                    f"описан дважды"
+                )
+            self._table[index] = transition
+        self._final = [
+            all(entry is None for entry in self._table[i * size:(i + 1) * size])
+            for i in range(size)
+        ]
+
+    def guard(self, source: S, target: S) -> Callable[[Guard], Guard]:
+        """Декоратор: добавить guard-проверку переходу source → target"""
+        index = self._existing(source, target)
+
+        def register(fn: Guard) -> Guard:
+            self._table[index] = replace(
+                self._table[index], guards=self._table[index].guards + (fn,)
+            )
+            return fn
+        return register
+
+    def on_transition(self, source: S, target: S) -> Callable[[Hook], Hook]:
+        """Декоратор: добавить hook (событие) переходу source → target"""
+        index = self._existing(source, target)
+
+        def register(fn: Hook) -> Hook:
+            self._table[index] = replace(
+                self._table[index], hooks=self._table[index].hooks + (fn,)
+            )
+            return fn
+        return register
+
+    def can_transition(self, source: S, target: S) -> bool:
+        """Есть ли переход source → target (без guard-проверок)"""
+        return self._table[self._index(source, target)] is not None
+
+    def targets(self, source: S) -> Tuple[S, ...]:
+        """Статусы, в которые можно перейти из source"""
+        row = self._ordinal[source._name_] * self._size
+        return tuple(
+            state for i, state in enumerate(self._states)
+            if self._table[row + i] is not None
+        )
+
+    def is_final(self, state: S) -> bool:
+        """Из статуса нет переходов"""
+        return self._final[self._ordinal[state._name_]]
+
+    def fire(self, owner: Any, target: S, *args: Any) -> List[Any]:
+        """
+        Перевести владельца в статус target
+
+        Шаги: проверка таблицы → guard-проверки → hooks (их события
+        возвращаются вызывающему) → смена статуса. Статус меняется
+        последним: если guard или hook бросил исключение, владелец
+        остаётся в исходном статусе и события не теряются.
+
+        Args:
+            owner: Сущность со статусом в атрибуте state_attr
+            target: Целевой статус
+            *args: Дополнительные аргументы hooks (например, outcome)
+
+        Raises:
+            ValueError: переход не описан или запрещён guard-проверкой
+        """
+        source = getattr(owner, self._state_attr)
+        transition = self._table[self._index(source, target)]
+        if transition is None:
+            raise ValueError(
+                f"Недопустимый переход статуса: {source.name} → {target.name}"
+            )
+        for guard in transition.guards:
+            guard(owner)
+        events = []
+        for hook in transition.hooks:
+            event = hook(owner, *args)
+            if event is not None:
+                events.append(event)
+        setattr(owner, self._state_attr, target)
+        return events
+
+    def _existing(self, source: S, target: S) -> int:
+        index = self._index(source, target)
+        if self._table[index] is None:
+            raise ValueError(f"Переход {source.name} → {target.name} не описан")
+        return index
+
+    def _index(self, source: S, target: S) -> int:
+        return self._ordinal[source._name_] * self._size + self._ordinal[target._name_]
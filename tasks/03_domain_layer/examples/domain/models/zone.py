@@ -5,8 +5,16 @@ Value Object: Зона поиска с географическими коорд
 Предметная область: ПСО «Юго-Запад»
 """
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Tuple
 
+from .geodesy import rectangle_area_km2, rectangle_areas_km2
+
+try:  # NumPy нужен только для пакетных методов (треки GPS)
+    import numpy as np
+except ImportError:
+    np = None
+
 
 @dataclass(frozen=True)  # frozen=True делает класс immutable
 class Zone:
@@ -70,31 +78,71 @@ class Zone:
         lat_min, lat_max, lon_min, lon_max = self.bounds
         return lat_min <= lat <= lat_max and lon_min <= lon <= lon_max
     
-    def area_km2(self) -> float:
+    def contains_points(self, lats, lons) -> "np.ndarray":
         """
-        Примерная площадь зоны в км²
+        Проверить сразу много точек (например, GPS-трек волонтёра)
         
-        Упрощённый расчёт (не учитывает кривизну Земли)
+        Args:
+            lats: Широты точек (массив или последовательность)
+            lons: Долготы точек той же длины
+        
+        Returns:
+            Массив bool: True для точек внутри зоны (границы включительно)
         """
+        _require_numpy()
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if lats.shape != lons.shape:
+            raise ValueError(
+                f"lats and lons must have the same shape: {lats.shape} != {lons.shape}"
+            )
         lat_min, lat_max, lon_min, lon_max = self.bounds
+        # Сравнения пишутся в один массив, без лишних временных
+        inside = lats >= lat_min
+        inside &= lats <= lat_max
+        inside &= lons >= lon_min
+        inside &= lons <= lon_max
+        return inside
+    
+    def area_km2(self) -> float:
+        """
+        Площадь зоны в км² на эллипсоиде WGS84 (см. geodesy.py)
         
-        # 1 градус широты ≈ 111 км
-        # 1 градус долготы ≈ 111 км * cos(latitude)
-        lat_delta = lat_max - lat_min
-        lon_delta = lon_max - lon_min
-        
-        avg_lat = (lat_min + lat_max) / 2
-        
-        import math
-        km_per_deg_lat = 111.0
-        km_per_deg_lon = 111.0 * math.cos(math.radians(avg_lat))
-        
-        return (lat_delta * km_per_deg_lat) * (lon_delta * km_per_deg_lon)
+        Зона неизменяема, поэтому площадь считается один раз
+        """
+        return self._area_km2
+    
+    @cached_property
+    def _area_km2(self) -> float:
+        # cached_property пишет прямо в __dict__, frozen не мешает
+        return rectangle_area_km2(*self.bounds)
     
     # Равенство и хэш генерируются автоматически в @dataclass
     # Два Zone с одинаковыми name и bounds - ОДНО И ТО ЖЕ
 
 
+def zones_area_km2(bounds) -> "np.ndarray":
+    """
+    Площади многих зон за один векторный проход (та же формула, что area_km2)
+    
+    Args:
+        bounds: Массив формы (n, 4): (lat_min, lat_max, lon_min, lon_max),
+            например np.array([zone.bounds for zone in zones])
+    
+    Returns:
+        Массив площадей в км² длины n
+    """
+    _require_numpy()
+    return rectangle_areas_km2(bounds)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Пакетные методы Zone требуют NumPy: pip install numpy"
+        )
+
+
 # Предопределённые зоны для ПСО «Юго-Запад»
 NORTH_ZONE = Zone(
     name="North",
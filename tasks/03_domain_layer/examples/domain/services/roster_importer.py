@@ -0,0 +1,115 @@
+"""
+Domain Service: RosterImporter (Импорт списка волонтёров)
+
+Проверка ростера волонтёров: нормализация телефонов и дедупликация
+Предметная область: ПСО «Юго-Запад»
+
+- повтор номера (по хэшу нормализованного номера) отклоняется
+  со ссылкой на первую строку с этим номером
+- PhoneNumber интернируются: один объект на номер
+
+Без ввода-вывода: чтение CSV, пул процессов и CLI — в
+infrastructure/roster_csv_importer.py. Нормализацию можно выполнить
+заранее (normalize_phones, например в другом процессе) и передать
+результаты в import_normalized.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from domain.models.phone_number import PhoneNumber, normalize_phone
+
+# (номер строки, volunteer_id, имя, телефон как в файле)
+RawRow = Tuple[int, str, str, str]
+
+# (успех, нормализованный номер или текст ошибки)
+Normalized = Tuple[bool, str]
+
+
+@dataclass(frozen=True)
+class RosterEntry:
+    """Принятая строка ростера"""
+    line: int
+    volunteer_id: str
+    name: str
+    phone: PhoneNumber
+
+
+@dataclass(frozen=True)
+class RejectedRow:
+    """Отклонённая строка ростера с причиной"""
+    line: int
+    raw_phone: str
+    reason: str
+
+
+@dataclass
+class RosterImportReport:
+    """Итог импорта"""
+    entries: List[RosterEntry] = field(default_factory=list)
+    rejected: List[RejectedRow] = field(default_factory=list)
+    rows: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def normalize_phones(
+    phones: List[str],
+    default_country_code: str = "375"
+) -> List[Normalized]:
+    """Нормализовать пакет номеров (можно выполнять в процессе пула)"""
+    return [_try_normalize(raw, default_country_code) for raw in phones]
+
+
+def _try_normalize(raw: str, default_country_code: str) -> Normalized:
+    try:
+        return True, normalize_phone(raw, default_country_code)
+    except ValueError as e:
+        return False, str(e)
+
+
+class RosterImporter:
+    """Импорт ростера: нормализация, проверка и дедупликация номеров"""
+
+    def __init__(self, default_country_code: str = "375"):
+        """
+        Args:
+            default_country_code: Страна для номеров без '+' (8 029 ...)
+        """
+        self.default_country_code = default_country_code
+
+    def import_rows(self, rows: Iterable[RawRow]) -> RosterImportReport:
+        """Импортировать строки (номер строки, id, имя, телефон)"""
+        country = self.default_country_code
+        return self.import_normalized(
+            (row, _try_normalize(row[3], country)) for row in rows
+        )
+
+    def import_normalized(
+        self,
+        rows: Iterable[Tuple[RawRow, Normalized]]
+    ) -> RosterImportReport:
+        """Импортировать строки с уже выполненной нормализацией, в порядке файла"""
+        report = RosterImportReport()
+        first_line_by_phone: Dict[PhoneNumber, int] = {}
+        started = time.perf_counter()
+
+        for (line, volunteer_id, name, raw_phone), (ok, value) in rows:
+            report.rows += 1
+            if not ok:
+                report.rejected.append(RejectedRow(line, raw_phone, value))
+                continue
+            phone = PhoneNumber._intern_normalized(value)
+            first_line = first_line_by_phone.setdefault(phone, line)
+            if first_line != line:
+                report.rejected.append(RejectedRow(
+                    line, raw_phone, f"Номер уже в ростере (строка {first_line})"
+                ))
+                continue
+            report.entries.append(RosterEntry(line, volunteer_id, name, phone))
+
+        report.elapsed = time.perf_counter() - started
+        return report
@@ -0,0 +1,157 @@
+"""
+Domain Service: ZoneIndex (Пространственный индекс зон)
+
+Поиск зон по GPS-координатам без перебора всех зон
+Предметная область: ПСО «Юго-Запад»
+"""
+import math
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from domain.models.zone import Zone
+
+Bounds = Tuple[float, float, float, float]  # (lat_min, lat_max, lon_min, lon_max)
+Cell = Tuple[int, int]
+
+
+class ZoneIndex:
+    """
+    Domain Service: Равномерная сетка над границами зон
+
+    Плоскость делится на ячейки cell_size × cell_size градусов;
+    каждая зона записывается во все ячейки, которые задевают её
+    границы. Точечный запрос смотрит одну ячейку — O(1) в среднем,
+    сколько бы зон (активных и архивных) ни было в индексе.
+
+    Зоны, которые заняли бы больше max_cells_per_zone ячеек
+    (например, весь район операции), хранятся отдельным списком и
+    проверяются перебором — их обычно единицы.
+
+    Зона — Value Object, поэтому одинаковые зоны в индексе одна.
+    """
+
+    def __init__(
+        self,
+        zones: Iterable[Zone] = (),
+        cell_size: float = 0.1,
+        max_cells_per_zone: int = 1024
+    ):
+        """
+        Args:
+            zones: Начальный набор зон
+            cell_size: Сторона ячейки в градусах (0.1° ≈ 11 км по широте)
+            max_cells_per_zone: Больше ячеек — зона идёт в общий список
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be > 0: {cell_size}")
+        self._cell_size = cell_size
+        self._max_cells_per_zone = max_cells_per_zone
+        self._cells: Dict[Cell, List[Zone]] = {}
+        self._zones: Set[Zone] = set()
+        self._oversized: Set[Zone] = set()
+        for zone in zones:
+            self.insert(zone)
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def __contains__(self, zone: object) -> bool:
+        return zone in self._zones
+
+    def __iter__(self) -> Iterator[Zone]:
+        return iter(self._zones)
+
+    def insert(self, zone: Zone) -> None:
+        """Добавить зону (повторное добавление ничего не меняет)"""
+        if zone in self._zones:
+            return
+        self._zones.add(zone)
+        if self._cell_count(zone.bounds) > self._max_cells_per_zone:
+            self._oversized.add(zone)
+            return
+        for cell in self._cells_of(zone.bounds):
+            self._cells.setdefault(cell, []).append(zone)
+
+    def remove(self, zone: Zone) -> None:
+        """
+        Убрать зону из индекса
+
+        Raises:
+            ValueError: если зоны нет в индексе
+        """
+        if zone not in self._zones:
+            raise ValueError(f"Зона {zone.name} отсутствует в индексе")
+        self._zones.remove(zone)
+        if zone in self._oversized:
+            self._oversized.remove(zone)
+            return
+        for cell in self._cells_of(zone.bounds):
+            bucket = self._cells[cell]
+            bucket.remove(zone)
+            if not bucket:
+                del self._cells[cell]
+
+    def zones_at(self, lat: float, lon: float) -> List[Zone]:
+        """
+        Зоны, в которые попадает точка (границы включительно)
+
+        Args:
+            lat: Широта точки
+            lon: Долгота точки
+        """
+        found = [
+            zone for zone in self._cells.get(self._cell_of(lat, lon), ())
+            if zone.contains_point(lat, lon)
+        ]
+        found.extend(
+            zone for zone in self._oversized if zone.contains_point(lat, lon)
+        )
+        return found
+
+    def intersecting(self, bounds: Bounds) -> List[Zone]:
+        """
+        Зоны, пересекающиеся с прямоугольником (касание считается)
+
+        Args:
+            bounds: (lat_min, lat_max, lon_min, lon_max)
+        """
+        lat_min, lat_max, lon_min, lon_max = bounds
+        if lat_min > lat_max or lon_min > lon_max:
+            raise ValueError(f"Некорректные границы: {bounds}")
+
+        # Прямоугольник больше всего индекса: дешевле перебрать зоны
+        if self._cell_count(bounds) > len(self._cells):
+            candidates: Iterable[Zone] = self._zones
+        else:
+            seen: Set[Zone] = set(self._oversized)
+            for cell in self._cells_of(bounds):
+                seen.update(self._cells.get(cell, ()))
+            candidates = seen
+
+        return [zone for zone in candidates if _overlaps(zone.bounds, bounds)]
+
+    def _cell_of(self, lat: float, lon: float) -> Cell:
+        return (
+            math.floor(lat / self._cell_size),
+            math.floor(lon / self._cell_size)
+        )
+
+    def _cell_range(self, bounds: Bounds) -> Tuple[range, range]:
+        lat_min, lat_max, lon_min, lon_max = bounds
+        row_min, col_min = self._cell_of(lat_min, lon_min)
+        row_max, col_max = self._cell_of(lat_max, lon_max)
+        return range(row_min, row_max + 1), range(col_min, col_max + 1)
+
+    def _cell_count(self, bounds: Bounds) -> int:
+        rows, cols = self._cell_range(bounds)
+        return len(rows) * len(cols)
+
+    def _cells_of(self, bounds: Bounds) -> Iterator[Cell]:
+        rows, cols = self._cell_range(bounds)
+        for row in rows:
+            for col in cols:
+                yield row, col
+
+
+def _overlaps(a: Bounds, b: Bounds) -> bool:
+    """Пересекаются ли прямоугольники (включая касание границ)"""
+    return a[0] <= b[1] and b[0] <= a[1] and a[2] <= b[3] and b[2] <= a[3]
@@ -0,0 +1,236 @@
+"""
+Domain Service: ZoneOverlapDetector (Пересечение зон активных заявок)
+
+Поиск пересекающихся зон поиска, чтобы группы не прочёсывали
+один участок дважды
+Предметная область: ПСО «Юго-Запад»
+
+- все пересекающиеся пары — заметающая прямая по широте + дерево
+  интервалов по долготе: O(n log n + k), k — число пар
+- проверка одной зоны (создание заявки, change_zone) — через ZoneIndex
+
+Соседние зоны с общей границей не пересекаются: важна общая площадь.
+"""
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from domain.exceptions.domain_exceptions import ZoneOverlapException
+from domain.models.request import Request
+from domain.models.request_status import RequestStatus
+from domain.models.zone import Zone
+from domain.services.zone_index import Bounds, ZoneIndex
+
+
+class ZoneOverlap(NamedTuple):
+    """Пара заявок с пересекающимися зонами и общий прямоугольник"""
+    first: str
+    second: str
+    bounds: Bounds
+
+
+def overlapping_pairs(rectangles: Sequence[Bounds]) -> List[Tuple[int, int]]:
+    """
+    Все пары прямоугольников с общей площадью (индексы i < j)
+
+    Прямая идёт по lat_min; активные прямоугольники (ещё не
+    закончились по широте) лежат в дереве интервалов по долготе.
+    Каждый новый прямоугольник спрашивает у дерева только
+    пересекающихся соседей, поэтому время — O(n log n + k).
+
+    Args:
+        rectangles: (lat_min, lat_max, lon_min, lon_max)
+    """
+    tree = _IntervalTree(
+        sorted({lon for r in rectangles for lon in (r[2], r[3])})
+    )
+    pairs: List[Tuple[int, int]] = []
+    ending: List[Tuple[float, int]] = []  # куча (lat_max, индекс) активных
+    for i in sorted(range(len(rectangles)), key=lambda k: rectangles[k][0]):
+        lat_min, lat_max, lon_min, lon_max = rectangles[i]
+        # Закончившиеся до lat_min (или касающиеся его) больше не пересекут
+        while ending and ending[0][0] <= lat_min:
+            _, j = heapq.heappop(ending)
+            tree.remove(j, rectangles[j][2], rectangles[j][3])
+        for j in tree.overlapping(lon_min, lon_max):
+            pairs.append((j, i) if j < i else (i, j))
+        tree.insert(i, lon_min, lon_max)
+        heapq.heappush(ending, (lat_max, i))
+    return pairs
+
+
+class _IntervalTree:
+    """
+    Дерево интервалов над заранее известными концами
+
+    Каркас — неявное сбалансированное дерево над отсортированными
+    концами (узел — середина диапазона индексов), поэтому перестраивать
+    его не нужно. Интервал хранится в верхнем узле, центр которого он
+    накрывает; в узле — два отсортированных списка (по началу и по
+    концу), из которых при запросе читаются только совпадения.
+    Поддеревья без активных интервалов запрос пропускает (счётчик
+    в каждом узле), иначе пустые узлы внутри запроса стоили бы O(n).
+    """
+
+    def __init__(self, points: List[float]):
+        self._points = points
+        self._by_start: List[List[Tuple[float, int]]] = [[] for _ in points]
+        self._by_end: List[List[Tuple[float, int]]] = [[] for _ in points]
+        self._count = [0] * len(points)  # интервалов в поддереве узла
+
+    def insert(self, key: int, start: float, end: float) -> None:
+        node = self._node(start, end, +1)
+        insort(self._by_start[node], (start, key))
+        insort(self._by_end[node], (end, key))
+
+    def remove(self, key: int, start: float, end: float) -> None:
+        node = self._node(start, end, -1)
+        by_start, by_end = self._by_start[node], self._by_end[node]
+        del by_start[bisect_left(by_start, (start, key))]
+        del by_end[bisect_left(by_end, (end, key))]
+
+    def overlapping(self, start: float, end: float) -> List[int]:
+        """Ключи интервалов с общим отрезком ненулевой длины"""
+        points = self._points
+        found: List[int] = []
+        stack = [(0, len(points))]
+        while stack:
+            lo, hi = stack.pop()
+            mid = (lo + hi) // 2
+            if lo >= hi or not self._count[mid]:
+                continue
+            center = points[mid]
+            if end <= center:
+                # Интервалы узла накрывают center ≥ end: подходят начатые до end
+                for s, key in self._by_start[mid]:
+                    if s >= end:
+                        break
+                    found.append(key)
+                stack.append((lo, mid))
+            elif start >= center:
+                for e, key in reversed(self._by_end[mid]):
+                    if e <= start:
+                        break
+                    found.append(key)
+                stack.append((mid + 1, hi))
+            else:
+                found.extend(key for _, key in self._by_start[mid])
+                stack.append((lo, mid))
+                stack.append((mid + 1, hi))
+        return found
+
+    def _node(self, start: float, end: float, delta: int) -> int:
+        """Узел интервала; счётчики на пути к нему меняются на delta"""
+        points, count = self._points, self._count
+        lo, hi = 0, len(points)
+        while True:
+            mid = (lo + hi) // 2
+            count[mid] += delta
+            if end < points[mid]:
+                hi = mid
+            elif start > points[mid]:
+                lo = mid + 1
+            else:
+                return mid
+
+
+class ZoneOverlapDetector:
+    """
+    Domain Service: Зоны активных заявок и их пересечения
+
+    Детектор хранит зону каждой активной заявки; после команды над
+    заявкой её передают в track(), чтобы набор оставался актуальным.
+
+    Application Layer (лабораторная 04): CreateRequestHandler и
+    ChangeRequestZoneHandler вызывают ensure_free() до изменения заявки
+    и track() после сохранения. Обработчики activate/complete должны
+    так же вызывать track(request) — иначе заявка не попадёт в набор
+    (или не уйдёт из него).
+    """
+
+    def __init__(self, requests: Iterable[Request] = ()):
+        self._zone_of: Dict[str, Zone] = {}
+        self._requests_in: Dict[Zone, Set[str]] = {}
+        self._index = ZoneIndex()
+        for request in requests:
+            self.track(request)
+
+    def __len__(self) -> int:
+        return len(self._zone_of)
+
+    def track(self, request: Request) -> None:
+        """Учесть текущее состояние заявки (не ACTIVE — убрать из набора)"""
+        if request.status != RequestStatus.ACTIVE:
+            self.untrack(request.request_id)
+            return
+        if self._zone_of.get(request.request_id) == request.zone:
+            return
+        self.untrack(request.request_id)
+        self._zone_of[request.request_id] = request.zone
+        holders = self._requests_in.setdefault(request.zone, set())
+        if not holders:
+            self._index.insert(request.zone)
+        holders.add(request.request_id)
+
+    def untrack(self, request_id: str) -> None:
+        """Убрать заявку из набора (если её там нет — ничего не делать)"""
+        zone = self._zone_of.pop(request_id, None)
+        if zone is None:
+            return
+        holders = self._requests_in[zone]
+        holders.discard(request_id)
+        if not holders:
+            del self._requests_in[zone]
+            self._index.remove(zone)
+
+    def overlapping(self, zone: Zone, exclude: Optional[str] = None) -> List[str]:
+        """
+        ID активных заявок, чьи зоны пересекаются с zone
+
+        Args:
+            zone: Новая зона (при создании заявки или change_zone)
+            exclude: Заявка, которой зона назначается (себя не считаем)
+        """
+        found = [
+            request_id
+            for candidate in self._index.intersecting(zone.bounds)
+            if _intersection(candidate.bounds, zone.bounds) is not None
+            for request_id in self._requests_in[candidate]
+            if request_id != exclude
+        ]
+        return sorted(found)
+
+    def ensure_free(self, zone: Zone, request_id: Optional[str] = None) -> None:
+        """
+        Проверить зону перед назначением заявке request_id
+
+        Raises:
+            ZoneOverlapException: зона пересекается с зонами активных заявок
+        """
+        conflicts = self.overlapping(zone, exclude=request_id)
+        if conflicts:
+            raise ZoneOverlapException(
+                f"Зона {zone.name} пересекается с зонами заявок: {', '.join(conflicts)}"
+            )
+
+    def find_overlaps(self) -> List[ZoneOverlap]:
+        """Все пары активных заявок с пересекающимися зонами"""
+        request_ids = list(self._zone_of)
+        rectangles = [self._zone_of[request_id].bounds for request_id in request_ids]
+        overlaps = []
+        for i, j in overlapping_pairs(rectangles):
+            first, second = sorted((request_ids[i], request_ids[j]))
+            overlaps.append(ZoneOverlap(
+                first, second, _intersection(rectangles[i], rectangles[j])
+            ))
+        overlaps.sort()
+        return overlaps
+
+
+def _intersection(a: Bounds, b: Bounds) -> Optional[Bounds]:
+    """Общий прямоугольник или None, если общей площади нет"""
+    lat_min, lat_max = max(a[0], b[0]), min(a[1], b[1])
+    lon_min, lon_max = max(a[2], b[2]), min(a[3], b[3])
+    if lat_min >= lat_max or lon_min >= lon_max:
+        return None
+    return lat_min, lat_max, lon_min, lon_max
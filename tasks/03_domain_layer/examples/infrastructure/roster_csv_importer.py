@@ -0,0 +1,134 @@
+"""
+Infrastructure: RosterCsvImporter (Импорт ростера из CSV)
+
+Чтение ростера волонтёров из файла и параллельная нормализация
+Предметная область: ПСО «Юго-Запад»
+
+CSV: заголовок volunteer_id,name,phone
+
+- файл читается потоком, строки пакетами уходят в пул процессов
+  (normalize_phones); в работе не больше 2 × workers пакетов
+- проверку и дедупликацию выполняет RosterImporter (Domain Service)
+
+Запуск (из каталога examples):
+    python -m infrastructure.roster_csv_importer roster.csv [--workers 4]
+"""
+import argparse
+import csv
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+from domain.services.roster_importer import (
+    Normalized,
+    RawRow,
+    RosterImporter,
+    RosterImportReport,
+    normalize_phones,
+)
+
+
+class RosterCsvImporter:
+    """Импорт ростера из CSV: поток строк, пул процессов, доменная проверка"""
+
+    def __init__(
+        self,
+        importer: Optional[RosterImporter] = None,
+        workers: int = 0,
+        chunk_size: int = 5_000
+    ):
+        """
+        Args:
+            importer: Доменный сервис (по умолчанию — код страны 375)
+            workers: Процессов нормализации (0 — в текущем процессе)
+            chunk_size: Строк в одном пакете
+        """
+        if workers < 0 or chunk_size < 1:
+            raise ValueError("workers must be >= 0 and chunk_size >= 1")
+        self._importer = importer or RosterImporter()
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+    def import_csv(self, path: str) -> RosterImportReport:
+        """Импортировать ростер из CSV-файла"""
+        with open(path, encoding="utf-8", newline="") as stream:
+            return self.import_rows(_read_rows(stream))
+
+    def import_rows(self, rows: Iterable[RawRow]) -> RosterImportReport:
+        """Импортировать строки (номер строки, id, имя, телефон)"""
+        if self._workers == 0:
+            return self._importer.import_rows(rows)
+        return self._importer.import_normalized(self._normalized(rows))
+
+    def _normalized(self, rows: Iterable[RawRow]) -> Iterator[Tuple[RawRow, Normalized]]:
+        """Строки с результатами нормализации из пула, в порядке файла"""
+        country = self._importer.default_country_code
+        pending: Deque[Tuple[List[RawRow], Future]] = deque()
+        with ProcessPoolExecutor(self._workers) as pool:
+            for chunk in _chunked(rows, self._chunk_size):
+                pending.append((chunk, pool.submit(
+                    normalize_phones, [row[3] for row in chunk], country
+                )))
+                if len(pending) >= 2 * self._workers:
+                    chunk, future = pending.popleft()
+                    yield from zip(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+
+
+def _read_rows(stream) -> Iterator[RawRow]:
+    # csv.reader + индексы колонок: заметно быстрее DictReader
+    reader = csv.reader(stream)
+    header = next(reader, [])
+    missing = {"volunteer_id", "name", "phone"} - set(header)
+    if missing:
+        raise ValueError(f"В CSV нет колонок: {', '.join(sorted(missing))}")
+    id_col, name_col, phone_col = (
+        header.index("volunteer_id"), header.index("name"), header.index("phone")
+    )
+    width = max(id_col, name_col, phone_col) + 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        yield reader.line_num, row[id_col], row[name_col], row[phone_col]
+
+
+def _chunked(rows: Iterable[RawRow], size: int) -> Iterator[List[RawRow]]:
+    chunk: List[RawRow] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Импорт ростера волонтёров из CSV")
+    parser.add_argument("path", help="CSV: volunteer_id,name,phone")
+    parser.add_argument("--workers", type=int, default=0, help="процессов нормализации")
+    parser.add_argument("--country", default="375", help="код страны по умолчанию")
+    parser.add_argument("--show-rejected", type=int, default=10,
+                        help="сколько отклонённых строк напечатать")
+    args = parser.parse_args(argv)
+
+    report = RosterCsvImporter(
+        RosterImporter(args.country), workers=args.workers
+    ).import_csv(args.path)
+
+    print(f"строк:       {report.rows:,}")
+    print(f"принято:     {len(report.entries):,}")
+    print(f"отклонено:   {len(report.rejected):,}")
+    print(f"скорость:    {report.rows_per_second:,.0f} строк/с")
+    for row in report.rejected[:args.show_rejected]:
+        print(f"  строка {row.line}: {row.raw_phone!r} — {row.reason}")
+    return 1 if report.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Юнит-тесты сравнения с базовой линией (benchmarks/bench_domain.py)
+"""
+import pytest
+
+from benchmarks.bench_domain import MIN_BASELINE_REPEAT, compare, main
+
+
+def scenario(ops=1_000_000.0, alloc=500.0, blocks=10.0) -> dict:
+    return {"ops_per_sec": ops, "alloc_bytes_per_op": alloc, "blocks_per_op": blocks}
+
+
+def baseline(**scenarios) -> dict:
+    return {"python": "3.11", "iterations": 1000, "scenarios": scenarios}
+
+
+class TestCompare:
+    """Тесты compare()"""
+
+    def test_should_accept_changes_within_tolerance(self):
+        current = {"request_lifecycle": scenario(ops=860_000, alloc=570, blocks=11.5)}
+
+        assert compare(current, baseline(request_lifecycle=scenario()), 0.15) == []
+
+    def test_should_report_each_regression(self):
+        current = {"request_lifecycle": scenario(ops=840_000, alloc=600, blocks=12.1)}
+
+        messages = compare(current, baseline(request_lifecycle=scenario()), 0.15)
+
+        assert len(messages) == 3
+        assert messages[0].startswith("request_lifecycle: ops/s")
+        assert "alloc B/op" in messages[1]
+        assert "blocks/op" in messages[2]
+
+    def test_should_skip_alloc_for_old_baseline(self):
+        """Базовая линия без alloc_bytes_per_op (до замера аллокаций)"""
+        old = scenario()
+        del old["alloc_bytes_per_op"]
+        current = {"request_lifecycle": scenario(alloc=10_000)}
+
+        assert compare(current, baseline(request_lifecycle=old), 0.15) == []
+
+    def test_should_skip_scenarios_missing_from_baseline(self):
+        current = {"group_formation": scenario(ops=1)}
+
+        assert compare(current, baseline(request_lifecycle=scenario()), 0.15) == []
+
+
+class TestBaselineRepeat:
+    """Базовая линия и сравнение — только по нескольким прогонам"""
+
+    @pytest.mark.parametrize("option", ["--save", "--compare"])
+    def test_should_reject_too_few_repeats(self, option, tmp_path, capsys):
+        argv = [option, str(tmp_path / "baseline.json"),
+                "--repeat", str(MIN_BASELINE_REPEAT - 1)]
+
+        with pytest.raises(SystemExit) as exit_info:
+            main(argv)
+
+        assert exit_info.value.code == 2
+        assert "--repeat" in capsys.readouterr().err
@@ -0,0 +1,145 @@
+"""
+Юнит-тесты для EventBuffer и событий агрегата Request
+
+Проверка номеров событий, версии агрегата и drain без потерь
+"""
+import pytest
+from domain.events.event_buffer import EventBuffer
+from domain.events.request_events import GroupAssignedToRequest, RequestActivated
+from domain.models.group import Group
+from domain.models.request import Request
+from domain.models.zone import NORTH_ZONE, SOUTH_ZONE
+
+
+def make_ready_group() -> Group:
+    group = Group("G-01", "LEADER-1")
+    for i in range(3):
+        group.add_member(f"VOL-{i}")
+    group.mark_ready()
+    return group
+
+
+class TestEventBuffer:
+    """Тесты буфера событий"""
+
+    def test_should_number_events_sequentially(self):
+        """Номера событий идут подряд, версия — номер последнего"""
+        # Arrange
+        buffer = EventBuffer()
+
+        # Act
+        numbers = [buffer.record(f"event-{i}") for i in range(3)]
+
+        # Assert
+        assert numbers == [1, 2, 3]
+        assert buffer.version == 3
+
+    def test_should_continue_from_loaded_version(self):
+        """Загруженный агрегат продолжает нумерацию со своей версии"""
+        buffer = EventBuffer(version=41)
+
+        assert buffer.record("event") == 42
+
+    def test_should_requeue_before_later_events(self):
+        """requeue возвращает забранные события перед записанными позже"""
+        buffer = EventBuffer()
+        buffer.record("a")
+        drained = list(buffer.drain())
+        buffer.record("b")
+
+        buffer.requeue(drained)
+
+        assert [(e.sequence, e.event) for e in buffer.drain()] == [(1, "a"), (2, "b")]
+
+    def test_should_empty_buffer_on_drain(self):
+        """drain забирает события, повторный drain пуст"""
+        # Arrange
+        buffer = EventBuffer()
+        buffer.record("a")
+        buffer.record("b")
+
+        # Act
+        drained = list(buffer.drain())
+
+        # Assert
+        assert [(e.sequence, e.event) for e in drained] == [(1, "a"), (2, "b")]
+        assert list(buffer.drain()) == []
+        assert buffer.version == 2
+
+    def test_should_keep_events_recorded_during_publishing(self):
+        """Событие, записанное во время публикации, не теряется"""
+        # Arrange
+        buffer = EventBuffer()
+        buffer.record("a")
+
+        # Act
+        published = []
+        for entry in buffer.drain():
+            published.append(entry.event)
+            buffer.record("reaction")
+
+        # Assert
+        assert published == ["a"]
+        assert [e.event for e in buffer.drain()] == ["reaction"]
+
+    def test_should_not_allow_negative_version(self):
+        """Версия не может быть отрицательной"""
+        with pytest.raises(ValueError):
+            EventBuffer(version=-1)
+
+
+class TestRequestVersion:
+    """Тесты версии и событий агрегата Request"""
+
+    def test_should_increase_version_with_each_event(self):
+        """Каждое изменение заявки увеличивает версию"""
+        # Arrange
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        assert request.version == 0
+
+        # Act
+        request.assign_group(make_ready_group())
+        request.activate()
+        request.change_zone(SOUTH_ZONE)
+
+        # Assert
+        assert request.version == 3
+
+    def test_should_drain_sequenced_events(self):
+        """drain_events отдаёт события с номерами и очищает буфер"""
+        # Arrange
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        request.assign_group(make_ready_group())
+        request.activate()
+
+        # Act
+        drained = list(request.drain_events())
+
+        # Assert
+        assert [e.sequence for e in drained] == [1, 2]
+        assert isinstance(drained[0].event, GroupAssignedToRequest)
+        assert isinstance(drained[1].event, RequestActivated)
+        assert len(request.get_events()) == 0
+        assert request.version == 2
+
+    def test_get_events_should_be_read_only(self):
+        """get_events не позволяет изменить буфер"""
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        request.assign_group(make_ready_group())
+
+        events = request.get_events()
+
+        assert isinstance(events[0], GroupAssignedToRequest)
+        assert not hasattr(events, "append")
+
+    def test_get_events_should_return_snapshot(self):
+        """get_events — снимок: последующие события в него не попадают"""
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        request.assign_group(make_ready_group())
+
+        events = request.get_events()
+        request.activate()
+        list(request.drain_events())
+
+        assert len(events) == 1
+        assert isinstance(events[0], GroupAssignedToRequest)
@@ -0,0 +1,158 @@
+"""
+Юнит-тесты для EventCodec
+
+Кодирование событий заявки, версии схем и upcasting
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Tuple
+
+import pytest
+from domain.events.event_codec import EventCodec, request_event_codec
+from domain.events.request_events import (
+    GroupAssignedToRequest,
+    RequestActivated,
+    RequestCompleted,
+    RequestCreated,
+    RequestZoneChanged,
+)
+
+AT = datetime(2024, 6, 1, 8, 30, 15, 123456)
+
+
+@dataclass(frozen=True)
+class VolunteerCheckedIn:
+    """Событие второй версии: добавлены позывной и координаты"""
+    volunteer_id: str
+    call_sign: str
+    position: Tuple[float, float]
+    occurred_at: datetime
+
+
+@dataclass(frozen=True)
+class VolunteerCheckedInV1:
+    """То же событие в первой версии"""
+    volunteer_id: str
+    occurred_at: datetime
+
+
+class TestRequestEventCodec:
+    """Тесты кодека событий заявки"""
+
+    @pytest.mark.parametrize("event", [
+        RequestCreated("REQ-2024-0001", "COORD-1", "Север", (52.0, 52.5, 23.5, 24.0), AT),
+        GroupAssignedToRequest("REQ-2024-0001", "G-01", "LEADER-1", ("VOL-1", "VOL-2"), AT),
+        GroupAssignedToRequest("REQ-2024-0001", "G-01", "LEADER-1", (), AT),
+        RequestActivated("REQ-2024-0001", "G-01", "North", AT),
+        RequestZoneChanged("REQ-2024-0001", "North", "South", (51.5, 52.0, 23.5, 24.0), AT),
+        RequestCompleted("REQ-2024-0001", "SUCCESS", AT),
+    ])
+    def test_should_round_trip_event(self, event):
+        """Событие после encode/decode совпадает с исходным"""
+        # Arrange
+        codec = request_event_codec()
+
+        # Act
+        data = codec.encode(event)
+
+        # Assert
+        assert codec.decode(data) == event
+        assert data[1] == 1  # версия схемы
+
+    def test_should_be_smaller_than_json(self):
+        """Кадр RequestCompleted короче его JSON-полей"""
+        event = RequestCompleted("REQ-2024-0001", "SUCCESS", AT)
+
+        data = request_event_codec().encode(event)
+
+        assert len(data) == 2 + 2 + 2 + 8 + len("REQ-2024-0001") + len("SUCCESS")
+
+    def test_should_reject_unknown_and_damaged_frames(self):
+        """Неизвестная схема и лишние байты — ValueError"""
+        codec = request_event_codec()
+        data = codec.encode(RequestCompleted("REQ-2024-0001", "SUCCESS", AT))
+
+        with pytest.raises(ValueError, match="тег 99"):
+            codec.decode(b"\x63\x01")
+        with pytest.raises(ValueError, match="не совпадает"):
+            codec.decode(data + b"\x00")
+        with pytest.raises(ValueError, match="не зарегистрировано"):
+            codec.encode(VolunteerCheckedIn("VOL-1", "Лис", (52.0, 23.7), AT))
+
+    def test_should_reject_truncated_frames(self):
+        """Обрезанный кадр — ValueError, а не struct.error"""
+        codec = request_event_codec()
+        data = codec.encode(GroupAssignedToRequest(
+            "REQ-2024-0001", "G-01", "LEADER-1", ("VOL-1", "VOL-2", "VOL-3"), AT
+        ))
+
+        for size in range(2, len(data)):
+            with pytest.raises(ValueError):
+                codec.decode(data[:size])
+
+    def test_should_reject_too_long_string(self):
+        """Строка длиннее 65535 байт не помещается в длину >H"""
+        event = RequestCompleted("REQ-2024-0001", "x" * 70_000, AT)
+
+        with pytest.raises(ValueError, match="не помещается"):
+            request_event_codec().encode(event)
+
+    def test_should_reject_timezone_aware_time(self):
+        """Время с часовым поясом не кодируется (пояс был бы потерян)"""
+        event = RequestCompleted("REQ-2024-0001", "SUCCESS", AT.replace(tzinfo=timezone.utc))
+
+        with pytest.raises(ValueError, match="часового пояса"):
+            request_event_codec().encode(event)
+
+
+class TestSchemaVersions:
+    """Тесты версий схем и upcasting"""
+
+    def make_codec(self) -> EventCodec:
+        codec = EventCodec()
+        codec.register(VolunteerCheckedIn, tag=1, version=3)
+        # v1: только ID и время; v2: добавлен позывной
+        codec.register_legacy(
+            VolunteerCheckedIn, 1,
+            [("volunteer_id", str), ("occurred_at", datetime)],
+            lambda f: {**f, "call_sign": f["volunteer_id"]}
+        )
+        codec.register_legacy(
+            VolunteerCheckedIn, 2,
+            [("volunteer_id", str), ("occurred_at", datetime), ("call_sign", str)],
+            lambda f: {**f, "position": (0.0, 0.0)}
+        )
+        return codec
+
+    def test_should_upcast_old_frames_to_current_version(self):
+        """Кадр v1 поднимается через v2 до текущей v3"""
+        # Arrange: кадр, записанный старым сервисом (схема v1)
+        old = EventCodec()
+        old.register(VolunteerCheckedInV1, tag=1, version=1)
+        frame = old.encode(VolunteerCheckedInV1("VOL-7", AT))
+
+        # Act
+        event = self.make_codec().decode(frame)
+
+        # Assert
+        assert event == VolunteerCheckedIn("VOL-7", "VOL-7", (0.0, 0.0), AT)
+
+    def test_should_decode_current_version_directly(self):
+        """Кадр текущей версии декодируется без upcaster"""
+        codec = self.make_codec()
+        event = VolunteerCheckedIn("VOL-1", "Лис", (52.0, 23.7), AT)
+
+        assert codec.decode(codec.encode(event)) == event
+
+    def test_should_validate_registration(self):
+        """Тег уникален, устаревшая версия старше текущей"""
+        codec = self.make_codec()
+
+        with pytest.raises(ValueError, match="Тег 1 уже занят"):
+            codec.register(RequestCompleted, tag=1)
+        with pytest.raises(ValueError, match="не старше"):
+            codec.register_legacy(VolunteerCheckedIn, 3, [], lambda f: f)
+        with pytest.raises(ValueError, match="не поддерживается"):
+            EventCodec().register(dataclass(frozen=True)(type("Bad", (), {
+                "__annotations__": {"payload": dict}
+            })), tag=1)
@@ -0,0 +1,171 @@
+"""
+Юнит-тесты для Event Sourcing агрегата Request
+
+Восстановление из событий, снимки и оптимистичная блокировка
+"""
+import pytest
+from domain.events.event_store import (
+    EventSourcedRequestRepository,
+    InMemoryEventStore,
+    SnapshotPolicy,
+)
+from domain.exceptions.domain_exceptions import ConcurrencyException
+from domain.models.group import Group
+from domain.models.request import Request
+from domain.models.request_status import RequestStatus
+from domain.models.zone import Zone, NORTH_ZONE, SOUTH_ZONE
+
+
+def make_ready_group() -> Group:
+    group = Group("G-01", "LEADER-1")
+    for i in range(3):
+        group.add_member(f"VOL-{i}")
+    group.mark_ready()
+    return group
+
+
+def make_active_request() -> Request:
+    request = Request.create("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+    request.assign_group(make_ready_group())
+    request.activate()
+    return request
+
+
+class TestFromEvents:
+    """Тесты восстановления заявки из событий"""
+
+    def test_should_rebuild_request_from_events(self):
+        """Заявка из событий совпадает с исходной"""
+        # Arrange
+        original = make_active_request()
+        original.change_zone(SOUTH_ZONE)
+        original.complete("SUCCESS")
+        events = [entry.event for entry in original.drain_events()]
+
+        # Act
+        restored = Request.from_events(events)
+
+        # Assert
+        assert restored.zone == SOUTH_ZONE
+        assert restored.status == RequestStatus.COMPLETED
+        assert restored.assigned_group.members == ["VOL-0", "VOL-1", "VOL-2"]
+        assert restored.assigned_group.leader_id == "LEADER-1"
+        assert restored.activated_at == original.activated_at
+        assert restored.completed_at == original.completed_at
+        assert restored.version == original.version == 5
+        assert len(restored.get_events()) == 0
+
+    def test_should_require_request_created_first(self):
+        """Поток без RequestCreated восстановить нельзя"""
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        request.assign_group(make_ready_group())
+
+        with pytest.raises(ValueError, match="RequestCreated"):
+            Request.from_events([entry.event for entry in request.drain_events()])
+
+    def test_should_rebuild_from_snapshot_and_tail(self):
+        """Снимок + события после него дают то же состояние"""
+        # Arrange
+        request = make_active_request()
+        snapshot = request.to_snapshot()
+        request.drain_events()
+        request.change_zone(SOUTH_ZONE)
+        tail = [entry.event for entry in request.drain_events()]
+
+        # Act
+        restored = Request.from_events(tail, snapshot=snapshot)
+
+        # Assert
+        assert restored.zone == SOUTH_ZONE
+        assert restored.status == RequestStatus.ACTIVE
+        assert restored.version == 4
+
+
+class TestEventSourcedRepository:
+    """Тесты хранилища событий и снимков"""
+
+    def test_should_load_saved_request(self):
+        """Сохранённая заявка загружается с той же версией"""
+        # Arrange
+        repository = EventSourcedRequestRepository(InMemoryEventStore())
+        request = make_active_request()
+
+        # Act
+        repository.save(request)
+        loaded = repository.find_by_id("REQ-2024-0001")
+
+        # Assert
+        assert loaded.status == RequestStatus.ACTIVE
+        assert loaded.version == 3
+        assert repository.find_by_id("REQ-2024-9999") is None
+
+    def test_should_replay_only_events_after_snapshot(self):
+        """Загрузка длинной истории читает только хвост после снимка"""
+        # Arrange
+        store = InMemoryEventStore()
+        repository = EventSourcedRequestRepository(store, SnapshotPolicy(every=10))
+        request = make_active_request()
+        zones = [Zone(f"Z-{i}", (52.0, 52.1 + i * 0.001, 23.5, 24.0)) for i in range(95)]
+        for zone in zones:
+            request.change_zone(zone)
+            repository.save(request)
+
+        # Act
+        snapshot = store.latest_snapshot("REQ-2024-0001")
+        loaded = repository.find_by_id("REQ-2024-0001")
+
+        # Assert
+        assert snapshot.version == 90
+        assert len(store.load("REQ-2024-0001", after_version=snapshot.version)) == 8
+        assert loaded.zone == zones[-1]
+        assert loaded.version == 98
+
+    def test_should_reject_new_stream_without_request_created(self):
+        """Заявку из конструктора нельзя сохранить: её не загрузить"""
+        # Arrange
+        repository = EventSourcedRequestRepository(InMemoryEventStore())
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        request.assign_group(make_ready_group())
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="RequestCreated"):
+            repository.save(request)
+        assert repository.find_by_id("REQ-2024-0001") is None
+        assert len(request.get_events()) == 1  # события не потеряны
+
+    def test_should_reject_concurrent_modification(self):
+        """Две копии одной версии: вторая запись отклоняется"""
+        # Arrange
+        repository = EventSourcedRequestRepository(InMemoryEventStore())
+        repository.save(make_active_request())
+        first = repository.find_by_id("REQ-2024-0001")
+        second = repository.find_by_id("REQ-2024-0001")
+
+        # Act
+        first.change_zone(SOUTH_ZONE)
+        repository.save(first)
+        second.complete("ABORTED")
+
+        # Assert
+        with pytest.raises(ConcurrencyException):
+            repository.save(second)
+
+    def test_should_keep_events_after_version_conflict(self):
+        """После ConcurrencyException события остаются в заявке"""
+        # Arrange
+        repository = EventSourcedRequestRepository(InMemoryEventStore())
+        repository.save(make_active_request())
+        first = repository.find_by_id("REQ-2024-0001")
+        second = repository.find_by_id("REQ-2024-0001")
+        first.change_zone(SOUTH_ZONE)
+        repository.save(first)
+        second.complete("ABORTED")
+        pending = second.get_events()
+
+        # Act
+        with pytest.raises(ConcurrencyException):
+            repository.save(second)
+
+        # Assert
+        assert second.get_events() == pending
+        assert [entry.sequence for entry in second.drain_events()] == [4]
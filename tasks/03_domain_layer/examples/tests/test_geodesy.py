@@ -0,0 +1,58 @@
+"""
+Юнит-тесты для геодезической площади зоны
+
+Проверка формулы на эллипсоиде WGS84 и кэширования в Zone
+"""
+import pytest
+from domain.models.geodesy import rectangle_area_km2, rectangle_areas_km2
+from domain.models.zone import Zone, NORTH_ZONE, SOUTH_ZONE
+
+
+class TestGeodesicArea:
+    """Тесты формулы площади"""
+
+    def test_should_match_earth_surface_area(self):
+        """Вся поверхность WGS84 ≈ 510 065 622 км²"""
+        area = rectangle_area_km2(-90.0, 90.0, -180.0, 180.0)
+
+        assert area == pytest.approx(510_065_622, rel=1e-6)
+
+    def test_should_shrink_towards_poles(self):
+        """Градус долготы у полюса уже, чем у экватора"""
+        equator = rectangle_area_km2(0.0, 1.0, 0.0, 1.0)
+        north = rectangle_area_km2(60.0, 61.0, 0.0, 1.0)
+
+        assert equator == pytest.approx(12_308, rel=1e-3)
+        assert north < equator / 1.9
+
+    def test_batch_should_match_scalar(self):
+        """Пакетный расчёт совпадает со скалярным"""
+        bounds = [NORTH_ZONE.bounds, SOUTH_ZONE.bounds, (-10.0, 5.0, 100.0, 120.0)]
+
+        areas = rectangle_areas_km2(bounds)
+
+        assert list(areas) == pytest.approx([rectangle_area_km2(*b) for b in bounds])
+
+
+class TestZoneArea:
+    """Тесты Zone.area_km2"""
+
+    def test_should_compute_area_once_per_zone(self):
+        """Площадь вычисляется один раз и хранится в зоне"""
+        # Arrange
+        zone = Zone("Cached", (52.0, 52.5, 23.5, 24.0))
+
+        # Act
+        first = zone.area_km2()
+
+        # Assert
+        assert zone.__dict__["_area_km2"] == first
+        assert zone.area_km2() is first
+
+    def test_cached_area_should_not_affect_equality(self):
+        """Кэш площади не участвует в равенстве Value Object"""
+        zone = Zone("North", (52.0, 52.5, 23.5, 24.0))
+        zone.area_km2()
+
+        assert zone == NORTH_ZONE
+        assert hash(zone) == hash(NORTH_ZONE)
@@ -0,0 +1,70 @@
+"""
+Юнит-тесты для PhoneNumber (Value Object)
+
+Разбор номеров, коды стран ITU и интернирование
+"""
+import pytest
+from domain.models.country_codes import CountryCodeTrie
+from domain.models.phone_number import PhoneNumber
+
+
+class TestPhoneNumberParse:
+    """Тесты разбора номеров в свободной записи"""
+
+    @pytest.mark.parametrize("raw", [
+        "+375 (29) 123-45-67",
+        "00375291234567",
+        "8 029 123-45-67",
+        "029 123-45-67",
+        "0291234567",
+        "+375291234567",
+    ])
+    def test_should_normalize_belarus_formats(self, raw):
+        """Разные записи одного номера дают один номер"""
+        assert PhoneNumber.parse(raw).number == "+375291234567"
+
+    def test_should_return_same_instance_for_same_number(self):
+        """Одинаковые номера интернируются"""
+        first = PhoneNumber.parse("+375 29 765-43-21")
+        second = PhoneNumber.parse("8 029 765 43 21")
+
+        assert first is second
+
+    def test_should_reject_unknown_country_code(self):
+        """Код страны должен быть в таблице ITU"""
+        with pytest.raises(ValueError, match="Unknown country code"):
+            PhoneNumber("+2891234567890")
+
+    @pytest.mark.parametrize("raw", ["8 0 029 123-45-67", "800 29 123 45 67"])
+    def test_should_reject_national_number_starting_with_zero(self, raw):
+        """После префикса междугородней связи не может идти 0"""
+        with pytest.raises(ValueError):
+            PhoneNumber.parse(raw)
+
+    def test_should_reject_letters(self):
+        """Буквы в номере недопустимы"""
+        with pytest.raises(ValueError, match="only digits"):
+            PhoneNumber.parse("+375 29 ABC-45-67")
+
+
+class TestCountryCode:
+    """Тесты определения кода страны"""
+
+    @pytest.mark.parametrize("number, code", [
+        ("+375291234567", "375"),
+        ("+79123456789", "7"),
+        ("+380441234567", "380"),
+        ("+12125550100", "1"),
+        ("+442079460958", "44"),
+        ("+35312345678", "353"),
+    ])
+    def test_should_detect_country_code(self, number, code):
+        """Код страны находится по префиксному дереву"""
+        assert PhoneNumber(number).country_code == code
+
+    def test_trie_should_return_none_for_unknown_prefix(self):
+        """Неизвестный префикс — None"""
+        trie = CountryCodeTrie(["375", "7"])
+
+        assert trie.match("380441234567") is None
+        assert trie.match("375291234567") == "375"
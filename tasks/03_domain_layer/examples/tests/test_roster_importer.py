@@ -0,0 +1,61 @@
+"""
+Юнит-тесты для RosterImporter (Domain Service) и RosterCsvImporter
+
+Нормализация, отклонение и дедупликация строк ростера
+"""
+from domain.models.phone_number import PhoneNumber
+from domain.services.roster_importer import RosterImporter
+from infrastructure.roster_csv_importer import RosterCsvImporter
+
+ROSTER = """volunteer_id,name,phone
+VOL-1,Анна,+375 (29) 111-22-33
+VOL-2,Борис,8 029 111 22 33
+VOL-3,Вера,not a phone
+VOL-4,Глеб,+375 44 555-66-77
+"""
+
+
+class TestRosterImporter:
+    """Тесты импорта ростера"""
+
+    def test_should_accept_valid_and_reject_invalid_rows(self, tmp_path):
+        """Корректные строки приняты, остальные — с причиной"""
+        # Arrange
+        path = tmp_path / "roster.csv"
+        path.write_text(ROSTER, encoding="utf-8")
+
+        # Act
+        report = RosterCsvImporter().import_csv(str(path))
+
+        # Assert
+        assert report.rows == 4
+        assert [e.volunteer_id for e in report.entries] == ["VOL-1", "VOL-4"]
+        assert [r.line for r in report.rejected] == [3, 4]
+        assert "строка 2" in report.rejected[0].reason
+
+    def test_should_share_phone_instances(self):
+        """Номер в ростере — интернированный PhoneNumber"""
+        # Arrange
+        rows = [(2, "VOL-1", "Анна", "+375 29 999-88-77")]
+
+        # Act
+        report = RosterImporter().import_rows(rows)
+
+        # Assert
+        assert report.entries[0].phone is PhoneNumber.parse("80299998877")
+
+    def test_should_give_same_result_with_process_pool(self):
+        """Пул процессов не меняет результат и порядок строк"""
+        # Arrange
+        rows = [
+            (i + 2, f"VOL-{i}", "Имя", f"+375 29 {i % 500:03d}-00-{i % 97:02d}")
+            for i in range(2_000)
+        ]
+
+        # Act
+        sequential = RosterImporter().import_rows(rows)
+        parallel = RosterCsvImporter(workers=2, chunk_size=100).import_rows(rows)
+
+        # Assert
+        assert [e.line for e in parallel.entries] == [e.line for e in sequential.entries]
+        assert [r.line for r in parallel.rejected] == [r.line for r in sequential.rejected]
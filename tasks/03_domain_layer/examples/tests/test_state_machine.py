@@ -0,0 +1,174 @@
+"""
+Юнит-тесты для StateMachine и жизненных циклов Request/Group
+
+Проверка таблицы переходов, guard-проверок и событий переходов
+"""
+from enum import Enum
+
+import pytest
+from domain.events.request_events import RequestActivated, RequestCompleted
+from domain.models.group import Group
+from domain.models.group_status import GroupStatus
+from domain.models.request import Request
+from domain.models.request_status import RequestStatus
+from domain.models.state_machine import StateMachine, Transition
+from domain.models.zone import NORTH_ZONE
+
+
+class Light(Enum):
+    RED = "RED"
+    GREEN = "GREEN"
+    OFF = "OFF"
+
+
+class Lamp:
+    def __init__(self):
+        self.status = Light.RED
+
+
+def make_machine() -> StateMachine:
+    return StateMachine(Light, [
+        Transition(Light.RED, Light.GREEN),
+        Transition(Light.GREEN, Light.RED),
+        Transition(Light.GREEN, Light.OFF),
+    ])
+
+
+class TestStateMachine:
+    """Тесты скомпилированной таблицы переходов"""
+
+    def test_should_answer_from_transition_table(self):
+        """Переходы и финальные статусы берутся из таблицы"""
+        # Arrange
+        machine = make_machine()
+
+        # Act & Assert
+        assert machine.can_transition(Light.RED, Light.GREEN)
+        assert not machine.can_transition(Light.RED, Light.OFF)
+        assert machine.targets(Light.GREEN) == (Light.RED, Light.OFF)
+        assert machine.is_final(Light.OFF)
+        assert not machine.is_final(Light.RED)
+
+    def test_should_reject_duplicate_transition(self):
+        """Один переход нельзя описать дважды"""
+        with pytest.raises(ValueError, match="описан дважды"):
+            StateMachine(Light, [
+                Transition(Light.RED, Light.GREEN),
+                Transition(Light.RED, Light.GREEN),
+            ])
+
+    def test_should_run_guards_before_changing_state(self):
+        """Guard-проверка отменяет переход, статус не меняется"""
+        # Arrange
+        machine = make_machine()
+        lamp = Lamp()
+
+        @machine.guard(Light.RED, Light.GREEN)
+        def _never(owner):
+            raise ValueError("запрещено")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="запрещено"):
+            machine.fire(lamp, Light.GREEN)
+        assert lamp.status == Light.RED
+
+    def test_should_return_hook_events(self):
+        """Hooks получают аргументы fire и возвращают события"""
+        # Arrange
+        machine = make_machine()
+        lamp = Lamp()
+
+        @machine.on_transition(Light.RED, Light.GREEN)
+        def _switched(owner, reason):
+            return ("switched", owner.status, reason)
+
+        # Act
+        events = machine.fire(lamp, Light.GREEN, "утро")
+
+        # Assert: hook видит исходный статус, статус меняется после hooks
+        assert lamp.status == Light.GREEN
+        assert events == [("switched", Light.RED, "утро")]
+
+    def test_should_keep_state_when_hook_fails(self):
+        """Исключение в hook отменяет переход: статус без события не меняется"""
+        # Arrange
+        machine = make_machine()
+        lamp = Lamp()
+
+        @machine.on_transition(Light.RED, Light.GREEN)
+        def _broken(owner):
+            raise RuntimeError("hook упал")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            machine.fire(lamp, Light.GREEN)
+        assert lamp.status == Light.RED
+
+    def test_should_reject_undeclared_transition(self):
+        """Переход, которого нет в таблице, запрещён"""
+        machine = make_machine()
+
+        with pytest.raises(ValueError, match="RED → OFF"):
+            machine.fire(Lamp(), Light.OFF)
+        with pytest.raises(ValueError, match="не описан"):
+            machine.guard(Light.RED, Light.OFF)
+
+
+class TestLifecycles:
+    """Тесты жизненных циклов Request и Group"""
+
+    def test_request_status_transitions(self):
+        """RequestStatus отвечает по общей таблице переходов"""
+        assert RequestStatus.DRAFT.can_transition_to(RequestStatus.ACTIVE)
+        assert RequestStatus.ACTIVE.can_transition_to(RequestStatus.CANCELLED)
+        assert not RequestStatus.DRAFT.can_transition_to(RequestStatus.COMPLETED)
+        assert not RequestStatus.COMPLETED.can_transition_to(RequestStatus.ACTIVE)
+        assert RequestStatus.CANCELLED.is_final
+        assert not RequestStatus.ACTIVE.is_final
+
+    def test_group_lifecycle(self):
+        """Группа: FORMING → READY (не меньше 3 участников) → DEPLOYED"""
+        # Arrange
+        group = Group("G-01", "LEADER-1")
+        group.add_member("VOL-1")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="at least 3"):
+            group.mark_ready()
+        group.add_member("VOL-2")
+        group.add_member("VOL-3")
+        group.mark_ready()
+        assert group.status == GroupStatus.READY
+        group.deploy()
+        assert group.status == GroupStatus.DEPLOYED
+        with pytest.raises(ValueError, match="DEPLOYED → READY"):
+            group.mark_ready()
+
+    def test_request_transitions_emit_events(self):
+        """Переходы заявки записывают события"""
+        # Arrange
+        group = Group("G-01", "LEADER-1")
+        for i in range(3):
+            group.add_member(f"VOL-{i}")
+        group.mark_ready()
+        request = Request.create("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+        request.assign_group(group)
+
+        # Act
+        request.activate()
+        request.complete("SUCCESS")
+
+        # Assert
+        events = request.get_events()
+        assert isinstance(events[-2], RequestActivated)
+        assert isinstance(events[-1], RequestCompleted)
+        assert request.status == RequestStatus.COMPLETED
+        with pytest.raises(ValueError, match="COMPLETED → COMPLETED"):
+            request.complete("SUCCESS")
+
+    def test_should_not_complete_draft_request(self):
+        """Черновик нельзя завершить, минуя ACTIVE"""
+        request = Request("REQ-2024-0001", "COORD-1", NORTH_ZONE)
+
+        with pytest.raises(ValueError, match="DRAFT → COMPLETED"):
+            request.complete("ABORTED")
@@ -0,0 +1,60 @@
+"""
+Юнит-тесты для пакетной геометрии Zone (NumPy)
+
+Пакетные методы должны совпадать со скалярными
+"""
+import random
+
+import pytest
+from domain.models.zone import Zone, NORTH_ZONE, SOUTH_ZONE, EAST_ZONE, WEST_ZONE, zones_area_km2
+
+np = pytest.importorskip("numpy")
+
+
+class TestContainsPoints:
+    """Тесты Zone.contains_points"""
+
+    def test_should_match_contains_point(self):
+        """Результат совпадает с contains_point для каждой точки"""
+        # Arrange
+        rng = random.Random(7)
+        lats = [rng.uniform(51.5, 53.0) for _ in range(1_000)]
+        lons = [rng.uniform(23.0, 24.5) for _ in range(1_000)]
+        # Точки на границе зоны
+        lats += [52.0, 52.5, 52.25]
+        lons += [23.5, 24.0, 23.5]
+
+        # Act
+        inside = NORTH_ZONE.contains_points(lats, lons)
+
+        # Assert
+        assert inside.dtype == np.bool_
+        assert inside.tolist() == [
+            NORTH_ZONE.contains_point(lat, lon) for lat, lon in zip(lats, lons)
+        ]
+
+    def test_should_reject_arrays_of_different_shape(self):
+        """Широт и долгот должно быть поровну"""
+        with pytest.raises(ValueError, match="same shape"):
+            NORTH_ZONE.contains_points([52.1, 52.2], [23.6])
+
+
+class TestZonesArea:
+    """Тесты zones_area_km2"""
+
+    def test_should_match_area_km2(self):
+        """Площади совпадают со скалярным area_km2"""
+        # Arrange
+        zones = [NORTH_ZONE, SOUTH_ZONE, EAST_ZONE, WEST_ZONE,
+                 Zone("Polar", (69.0, 70.0, 30.0, 32.0))]
+
+        # Act
+        areas = zones_area_km2([zone.bounds for zone in zones])
+
+        # Assert
+        assert areas == pytest.approx([zone.area_km2() for zone in zones])
+
+    def test_should_reject_wrong_shape(self):
+        """Границы — массив формы (n, 4)"""
+        with pytest.raises(ValueError, match=r"\(n, 4\)"):
+            zones_area_km2([[52.0, 52.5, 23.5]])
@@ -0,0 +1,119 @@
+"""
+Юнит-тесты для ZoneIndex (Domain Service)
+
+Проверка точечных запросов, пересечений и изменения индекса
+"""
+import random
+
+import pytest
+from domain.models.zone import Zone, NORTH_ZONE, SOUTH_ZONE, EAST_ZONE, WEST_ZONE
+from domain.services.zone_index import ZoneIndex
+
+
+class TestZoneIndexQueries:
+    """Тесты запросов к индексу"""
+
+    def test_should_find_zone_containing_point(self):
+        """Точка внутри зоны находит только эту зону"""
+        # Arrange
+        index = ZoneIndex([NORTH_ZONE, SOUTH_ZONE, EAST_ZONE, WEST_ZONE])
+
+        # Act
+        zones = index.zones_at(52.4, 23.7)
+
+        # Assert
+        assert zones == [NORTH_ZONE]
+
+    def test_should_include_zone_boundaries(self):
+        """Граница общая для North и South — точка в обеих зонах"""
+        # Arrange
+        index = ZoneIndex([NORTH_ZONE, SOUTH_ZONE])
+
+        # Act
+        zones = index.zones_at(52.0, 23.75)
+
+        # Assert
+        assert set(zones) == {NORTH_ZONE, SOUTH_ZONE}
+
+    def test_should_return_empty_list_outside_all_zones(self):
+        """Точка вне зон — пустой результат"""
+        index = ZoneIndex([NORTH_ZONE, SOUTH_ZONE])
+
+        assert index.zones_at(10.0, 10.0) == []
+
+    def test_should_find_zones_intersecting_bounds(self):
+        """Пересечение с прямоугольником (касание считается)"""
+        # Arrange
+        index = ZoneIndex([NORTH_ZONE, SOUTH_ZONE, EAST_ZONE, WEST_ZONE])
+
+        # Act
+        zones = index.intersecting((52.35, 52.6, 23.9, 24.1))
+
+        # Assert
+        assert set(zones) == {NORTH_ZONE}
+
+    def test_should_find_oversized_zone(self):
+        """Зона на весь район хранится отдельно, но находится"""
+        # Arrange
+        region = Zone("Region", (50.0, 54.0, 22.0, 26.0))
+        index = ZoneIndex([region, NORTH_ZONE], cell_size=0.01, max_cells_per_zone=100)
+
+        # Act & Assert
+        assert set(index.zones_at(52.4, 23.7)) == {region, NORTH_ZONE}
+        assert index.zones_at(50.5, 25.5) == [region]
+        assert set(index.intersecting((52.1, 52.2, 23.6, 23.7))) == {region, NORTH_ZONE}
+
+    def test_should_match_brute_force_on_many_zones(self):
+        """Результаты совпадают с перебором всех зон"""
+        # Arrange
+        rng = random.Random(42)
+        zones = []
+        for i in range(2_000):
+            lat = rng.uniform(51.0, 53.0)
+            lon = rng.uniform(23.0, 25.0)
+            zones.append(Zone(f"Z-{i}", (lat, lat + rng.uniform(0.01, 0.3),
+                                         lon, lon + rng.uniform(0.01, 0.3))))
+        index = ZoneIndex(zones)
+
+        # Act & Assert
+        for _ in range(200):
+            lat, lon = rng.uniform(51.0, 53.3), rng.uniform(23.0, 25.3)
+            expected = {zone for zone in zones if zone.contains_point(lat, lon)}
+            assert set(index.zones_at(lat, lon)) == expected
+
+
+class TestZoneIndexUpdates:
+    """Тесты добавления и удаления зон"""
+
+    def test_should_not_find_removed_zone(self):
+        """Удалённая зона больше не находится"""
+        # Arrange
+        index = ZoneIndex([NORTH_ZONE, SOUTH_ZONE])
+
+        # Act
+        index.remove(NORTH_ZONE)
+
+        # Assert
+        assert index.zones_at(52.4, 23.7) == []
+        assert NORTH_ZONE not in index
+        assert len(index) == 1
+
+    def test_should_ignore_duplicate_insert(self):
+        """Одинаковые зоны (Value Object) хранятся один раз"""
+        # Arrange
+        index = ZoneIndex()
+
+        # Act
+        index.insert(NORTH_ZONE)
+        index.insert(Zone("North", (52.0, 52.5, 23.5, 24.0)))
+
+        # Assert
+        assert len(index) == 1
+        assert index.zones_at(52.4, 23.7) == [NORTH_ZONE]
+
+    def test_should_not_remove_missing_zone(self):
+        """Нельзя удалить зону, которой нет в индексе"""
+        index = ZoneIndex([NORTH_ZONE])
+
+        with pytest.raises(ValueError, match="отсутствует в индексе"):
+            index.remove(SOUTH_ZONE)
@@ -0,0 +1,118 @@
+"""
+Юнит-тесты для ZoneOverlapDetector
+
+Пересечения зон активных заявок: все пары и проверка одной зоны
+"""
+import random
+
+import pytest
+from domain.exceptions.domain_exceptions import ZoneOverlapException
+from domain.models.group import Group
+from domain.models.request import Request
+from domain.models.zone import Zone, NORTH_ZONE, SOUTH_ZONE
+from domain.services.zone_overlap import ZoneOverlapDetector, overlapping_pairs
+
+
+def make_active_request(request_id: str, zone: Zone) -> Request:
+    group = Group(f"G-{request_id}", "LEADER-1")
+    for i in range(3):
+        group.add_member(f"VOL-{i}")
+    group.mark_ready()
+    request = Request(request_id, "COORD-1", zone)
+    request.assign_group(group)
+    request.activate()
+    return request
+
+
+def brute_force_pairs(rectangles):
+    return sorted(
+        (i, j)
+        for i in range(len(rectangles))
+        for j in range(i + 1, len(rectangles))
+        if rectangles[i][0] < rectangles[j][1] and rectangles[j][0] < rectangles[i][1]
+        and rectangles[i][2] < rectangles[j][3] and rectangles[j][2] < rectangles[i][3]
+    )
+
+
+class TestOverlappingPairs:
+    """Тесты заметающей прямой"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_should_match_brute_force(self, seed):
+        """Результат совпадает с перебором всех пар"""
+        # Arrange
+        rng = random.Random(seed)
+        rectangles = []
+        for _ in range(300):
+            lat, lon = rng.uniform(51.0, 53.0), rng.uniform(23.0, 26.0)
+            rectangles.append((lat, lat + rng.uniform(0.01, 0.4),
+                               lon, lon + rng.uniform(0.01, 0.4)))
+        rectangles.append(rectangles[0])  # дубликат
+
+        # Act
+        pairs = overlapping_pairs(rectangles)
+
+        # Assert
+        assert sorted(pairs) == brute_force_pairs(rectangles)
+
+    def test_should_ignore_shared_borders(self):
+        """Соседние зоны с общей границей не пересекаются"""
+        assert overlapping_pairs([NORTH_ZONE.bounds, SOUTH_ZONE.bounds]) == []
+        assert overlapping_pairs([]) == []
+
+
+class TestZoneOverlapDetector:
+    """Тесты детектора пересечений активных заявок"""
+
+    def test_should_find_overlapping_active_requests(self):
+        """Пара пересекающихся активных заявок и их общий прямоугольник"""
+        # Arrange
+        detector = ZoneOverlapDetector([
+            make_active_request("REQ-1", Zone("A", (52.0, 52.4, 23.5, 24.0))),
+            make_active_request("REQ-2", Zone("B", (52.2, 52.6, 23.8, 24.2))),
+            make_active_request("REQ-3", Zone("C", (51.0, 51.2, 23.0, 23.2))),
+            Request("REQ-4", "COORD-1", Zone("D", (52.0, 52.4, 23.5, 24.0))),
+        ])
+
+        # Act
+        overlaps = detector.find_overlaps()
+
+        # Assert
+        assert len(detector) == 3
+        assert len(overlaps) == 1
+        assert (overlaps[0].first, overlaps[0].second) == ("REQ-1", "REQ-2")
+        assert overlaps[0].bounds == (52.2, 52.4, 23.8, 24.0)
+
+    def test_should_check_new_zone_against_active_set(self):
+        """Новая зона проверяется до change_zone; своя заявка не мешает"""
+        # Arrange
+        first = make_active_request("REQ-1", NORTH_ZONE)
+        second = make_active_request("REQ-2", SOUTH_ZONE)
+        detector = ZoneOverlapDetector([first, second])
+        wide = Zone("Wide", (51.8, 52.2, 23.6, 23.9))
+
+        # Act & Assert
+        assert detector.overlapping(wide) == ["REQ-1", "REQ-2"]
+        assert detector.overlapping(wide, exclude="REQ-1") == ["REQ-2"]
+        detector.ensure_free(Zone("North-2", NORTH_ZONE.bounds), request_id="REQ-1")
+        with pytest.raises(ZoneOverlapException, match="REQ-2"):
+            detector.ensure_free(wide, request_id="REQ-1")
+
+    def test_should_follow_request_changes(self):
+        """track() учитывает смену зоны и завершение заявки"""
+        # Arrange
+        first = make_active_request("REQ-1", NORTH_ZONE)
+        second = make_active_request("REQ-2", Zone("B", (52.2, 52.6, 23.8, 24.2)))
+        detector = ZoneOverlapDetector([first, second])
+
+        # Act
+        first.change_zone(SOUTH_ZONE)
+        detector.track(first)
+        moved = detector.find_overlaps()
+        second.complete("SUCCESS")
+        detector.track(second)
+
+        # Assert
+        assert moved == []
+        assert len(detector) == 1
+        assert detector.overlapping(Zone("B", (52.2, 52.6, 23.8, 24.2))) == []
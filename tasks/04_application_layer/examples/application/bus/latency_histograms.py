@@ -0,0 +1,80 @@
+"""
+LatencyHistograms: Гистограммы времени обработчиков
+
+Предметная область: ПСО «Юго-Запад»
+
+Гистограмма на пару (обработчик, исход ok/error) с фиксированными
+границами корзин, как у Prometheus histogram. Наблюдение — bisect и
+инкремент счётчика; экспорт (endpoint /metrics) — в Infrastructure Layer.
+Квантили считает Prometheus по корзинам (histogram_quantile).
+"""
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+# Границы корзин, секунды (le): от 0.5 мс до 10 с
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Снимок одной гистограммы"""
+    handler: str
+    outcome: str
+    buckets: Tuple[float, ...]
+    counts: Tuple[int, ...]  # по корзинам, последняя — выше всех границ (+Inf)
+    total: float             # сумма наблюдений, секунды
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def cumulative(self) -> List[int]:
+        """Накопленные счётчики (как bucket{le=...} в Prometheus)"""
+        result, running = [], 0
+        for value in self.counts:
+            running += value
+            result.append(running)
+        return result
+
+
+class LatencyHistograms:
+    """Набор гистограмм времени обработчиков"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Границы корзин должны возрастать без повторов")
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # (обработчик, исход) → [счётчики корзин..., сумма]
+        self._series: Dict[Tuple[str, str], List[float]] = {}
+
+    def observe(self, handler: str, seconds: float, outcome: str = "ok") -> None:
+        """Учесть одно выполнение обработчика"""
+        index = bisect_left(self._buckets, seconds)
+        key = (handler, outcome)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self._buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += seconds
+
+    def snapshot(self) -> List[HistogramSnapshot]:
+        """Копия всех гистограмм (отсортирована по обработчику и исходу)"""
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        return [
+            HistogramSnapshot(
+                handler=handler,
+                outcome=outcome,
+                buckets=self._buckets,
+                counts=tuple(int(v) for v in series[:-1]),
+                total=series[-1]
+            )
+            for (handler, outcome), series in items
+        ]
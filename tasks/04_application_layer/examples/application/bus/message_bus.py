@@ -0,0 +1,83 @@
+"""
+MessageBus: Шина команд и запросов
+
+Предметная область: ПСО «Юго-Запад»
+
+Обработчик выбирается по типу сообщения из таблицы, а цепочка
+middleware (логирование, замер времени, повторы, транзакция)
+собирается один раз при регистрации: dispatch — поиск в словаре и
+вызов готовой цепочки.
+
+Команды и запросы идут через разные экземпляры шины: у командной
+шины есть транзакция и повторы, у шины запросов — нет.
+
+    command_bus = MessageBus([LoggingMiddleware(), TimingMiddleware(histograms),
+                              RetryMiddleware((ConcurrencyException,)),
+                              TransactionMiddleware(session_scope)])
+    command_bus.register(CreateRequestCommand, create_request_handler)
+    request_id = command_bus.dispatch(command)
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Sequence
+
+# Следующее звено цепочки: сообщение → результат
+Next = Callable[[Any], Any]
+
+
+class Middleware(ABC):
+    """Звено цепочки вокруг обработчика"""
+
+    @abstractmethod
+    def wrap(self, handler_name: str, next_: Next) -> Next:
+        """
+        Обернуть следующее звено (вызывается один раз при регистрации)
+
+        Args:
+            handler_name: Имя обработчика (для логов и метрик)
+            next_: Следующее звено цепочки
+        """
+        pass
+
+
+class MessageBus:
+    """
+    Шина: тип сообщения → обработчик, обёрнутый в middleware
+
+    Первый middleware в списке — внешний: он видит и время, и ошибки
+    всех следующих звеньев.
+    """
+
+    def __init__(self, middlewares: Sequence[Middleware] = ()):
+        self._middlewares = tuple(middlewares)
+        self._pipelines: Dict[type, Next] = {}
+
+    def register(self, message_type: type, handler: Any) -> None:
+        """
+        Зарегистрировать обработчик сообщения
+
+        Args:
+            message_type: Класс команды или запроса
+            handler: Объект с методом handle(message) или функция
+
+        Raises:
+            ValueError: если для типа уже есть обработчик
+        """
+        if message_type in self._pipelines:
+            raise ValueError(f"Обработчик для {message_type.__name__} уже зарегистрирован")
+        call = getattr(handler, "handle", handler)
+        name = type(handler).__name__ if hasattr(handler, "handle") else handler.__name__
+        for middleware in reversed(self._middlewares):
+            call = middleware.wrap(name, call)
+        self._pipelines[message_type] = call
+
+    def dispatch(self, message: Any) -> Any:
+        """
+        Передать сообщение его обработчику
+
+        Raises:
+            LookupError: если обработчик не зарегистрирован
+        """
+        pipeline = self._pipelines.get(type(message))
+        if pipeline is None:
+            raise LookupError(f"Нет обработчика для {type(message).__name__}")
+        return pipeline(message)
@@ -0,0 +1,119 @@
+"""
+Middlewares: Сквозная логика шины команд и запросов
+
+Предметная область: ПСО «Юго-Запад»
+
+- LoggingMiddleware — начало, результат и ошибки обработчика
+- TimingMiddleware — время обработчика в LatencyHistograms
+- RetryMiddleware — повтор при временных ошибках (например,
+  ConcurrencyException оптимистичной блокировки)
+- TransactionMiddleware — транзакция на одно выполнение обработчика
+"""
+import logging
+import time
+from typing import Callable, ContextManager, Optional, Tuple, Type
+
+from application.bus.latency_histograms import LatencyHistograms
+from application.bus.message_bus import Middleware, Next
+
+
+class LoggingMiddleware(Middleware):
+    """Журнал вызовов обработчиков"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self._logger = logger or logging.getLogger("application.bus")
+
+    def wrap(self, handler_name: str, next_: Next) -> Next:
+        logger = self._logger
+
+        def call(message):
+            logger.debug("%s ← %s", handler_name, type(message).__name__)
+            try:
+                return next_(message)
+            except Exception:
+                logger.exception("%s: ошибка обработки %r", handler_name, message)
+                raise
+        return call
+
+
+class TimingMiddleware(Middleware):
+    """Время обработчика (включая повторы и транзакцию) в гистограммы"""
+
+    def __init__(self, histograms: LatencyHistograms):
+        self._histograms = histograms
+
+    def wrap(self, handler_name: str, next_: Next) -> Next:
+        observe = self._histograms.observe
+        clock = time.perf_counter
+
+        def call(message):
+            start = clock()
+            try:
+                result = next_(message)
+            except Exception:
+                observe(handler_name, clock() - start, "error")
+                raise
+            observe(handler_name, clock() - start, "ok")
+            return result
+        return call
+
+
+class RetryMiddleware(Middleware):
+    """Повтор обработчика при перечисленных исключениях"""
+
+    def __init__(
+        self,
+        retry_on: Tuple[Type[BaseException], ...],
+        attempts: int = 3,
+        backoff: float = 0.01,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            retry_on: Временные ошибки, после которых есть смысл повторить
+            attempts: Всего попыток (включая первую)
+            backoff: Пауза перед повтором, удваивается с каждой попыткой
+            sleep: Функция паузы (в тестах — заглушка)
+        """
+        if attempts < 1:
+            raise ValueError(f"attempts must be >= 1: {attempts}")
+        self._retry_on = retry_on
+        self._attempts = attempts
+        self._backoff = backoff
+        self._sleep = sleep
+
+    def wrap(self, handler_name: str, next_: Next) -> Next:
+        if not self._retry_on or self._attempts == 1:
+            return next_
+        retry_on, attempts, backoff, sleep = (
+            self._retry_on, self._attempts, self._backoff, self._sleep
+        )
+
+        def call(message):
+            for attempt in range(attempts - 1):
+                try:
+                    return next_(message)
+                except retry_on:
+                    sleep(backoff * 2 ** attempt)
+            return next_(message)
+        return call
+
+
+class TransactionMiddleware(Middleware):
+    """Транзакция вокруг одного выполнения обработчика"""
+
+    def __init__(self, transaction: Callable[[], ContextManager]):
+        """
+        Args:
+            transaction: Фабрика контекста транзакции (commit при выходе,
+                rollback при исключении), например session_scope
+        """
+        self._transaction = transaction
+
+    def wrap(self, handler_name: str, next_: Next) -> Next:
+        transaction = self._transaction
+
+        def call(message):
+            with transaction():
+                return next_(message)
+        return call
@@ -0,0 +1,31 @@
+"""
+ChangeRequestZoneCommand: Изменить зону поиска заявки
+
+Предметная область: ПСО «Юго-Запад»
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ChangeRequestZoneCommand:
+    """
+    Команда: Изменить зону поиска заявки
+    
+    Поля:
+    - request_id: ID заявки (REQ-2024-NNNN)
+    - zone_name: Название новой зоны
+    - zone_bounds: Границы зоны (lat_min, lat_max, lon_min, lon_max)
+    """
+    request_id: str
+    zone_name: str
+    zone_bounds: Tuple[float, float, float, float]
+    
+    def __post_init__(self):
+        """Базовая валидация примитивов"""
+        if not self.request_id:
+            raise ValueError("request_id обязателен")
+        if not self.zone_name:
+            raise ValueError("zone_name обязательно")
+        if len(self.zone_bounds) != 4:
+            raise ValueError("zone_bounds должно содержать 4 элемента")
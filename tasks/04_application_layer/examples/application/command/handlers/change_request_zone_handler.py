@@ -0,0 +1,62 @@
+"""
+ChangeRequestZoneHandler: Обработчик команды смены зоны заявки
+
+Предметная область: ПСО «Юго-Запад»
+"""
+from application.command.change_request_zone_command import ChangeRequestZoneCommand
+from domain.models.zone import Zone
+from domain.services.zone_overlap import ZoneOverlapDetector
+
+
+class ChangeRequestZoneHandler:
+    """
+    Handler: Изменить зону поиска заявки
+    
+    Шаги:
+    1. Загрузка заявки из Repository
+    2. Проверка: новая зона не пересекается с зонами других
+       активных заявок (ZoneOverlapDetector.ensure_free)
+    3. request.change_zone (инварианты агрегата)
+    4. Сохранение и обновление набора зон детектора (track)
+    5. Публикация событий (если нужно)
+    """
+    
+    def __init__(
+        self,
+        request_repository,
+        zone_overlaps: ZoneOverlapDetector,
+        event_publisher=None
+    ):
+        """
+        Args:
+            request_repository: Репозиторий заявок
+            zone_overlaps: Зоны активных заявок (общий экземпляр на сервис)
+            event_publisher: Публикация доменных событий (необязательно)
+        """
+        self.request_repository = request_repository
+        self.zone_overlaps = zone_overlaps
+        self.event_publisher = event_publisher
+    
+    def handle(self, command: ChangeRequestZoneCommand) -> None:
+        """
+        Обработать команду ChangeRequestZone
+        
+        Raises:
+            ValueError: заявка не найдена или завершена
+            ZoneOverlapException: зона пересекается с зонами активных заявок
+        """
+        request = self.request_repository.find_by_id(command.request_id)
+        if not request:
+            raise ValueError(f"Request {command.request_id} не найдена")
+        
+        zone = Zone(command.zone_name, command.zone_bounds)
+        self.zone_overlaps.ensure_free(zone, request.request_id)
+        
+        request.change_zone(zone)
+        self.request_repository.save(request)
+        self.zone_overlaps.track(request)
+        
+        if self.event_publisher:
+            for event in request.get_events():
+                self.event_publisher.publish(event)
+            request.clear_events()
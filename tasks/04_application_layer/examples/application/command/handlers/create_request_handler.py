@@ -3,10 +3,12 @@ CreateRequestHandler: Обработчик команды создания за
 
 Предметная область: ПСО «Юго-Запад»
 """
-from datetime import datetime
+from typing import Optional
 from application.command.create_request_command import CreateRequestCommand
+from application.service.request_id_sequence import RequestIdSequence
 from domain.models.request import Request
 from domain.models.zone import Zone
+from domain.services.zone_overlap import ZoneOverlapDetector
 
 
 class CreateRequestHandler:
@@ -14,16 +16,38 @@ class CreateRequestHandler:
     Handler: Создать новую заявку
     
     Шаги:
-    1. Валидация команды
+    1. Валидация команды (и зоны: не пересекается с зонами
+       активных заявок, если передан ZoneOverlapDetector)
     2. Создание агрегата Request
     3. Сохранение через Repository
     4. Публикация событий (если нужно)
     5. Возврат ID заявки
     """
     
-    def __init__(self, request_repository, event_publisher=None):
+    def __init__(
+        self,
+        request_repository,
+        event_publisher=None,
+        *,
+        id_sequence: RequestIdSequence,
+        zone_overlaps: Optional[ZoneOverlapDetector] = None
+    ):
+        """
+        Args:
+            request_repository: Репозиторий заявок
+            event_publisher: Публикация доменных событий (необязательно)
+            id_sequence: Генератор ID — один на сервис, поверх общего
+                хранилища блоков (SqlSequenceBlockStore, Infrastructure
+                Layer). Обязателен: генератор по умолчанию в памяти
+                начинал бы с REQ-YYYY-0001 в каждом обработчике и
+                после каждого перезапуска
+            zone_overlaps: Зоны активных заявок; None — без проверки
+                пересечений
+        """
         self.request_repository = request_repository
         self.event_publisher = event_publisher
+        self.id_sequence = id_sequence
+        self.zone_overlaps = zone_overlaps
     
     def handle(self, command: CreateRequestCommand) -> str:
         """
@@ -31,27 +55,31 @@ class CreateRequestHandler:
         
         Returns:
             ID созданной заявки (REQ-2024-NNNN)
+        
+        Raises:
+            ValueError: некорректные границы зоны
+            ZoneOverlapException: зона пересекается с зонами активных заявок
         """
         # 1. Валидация (примитивы уже проверены в __post_init__)
         self._validate_zone_bounds(command.zone_bounds)
+        zone = Zone(command.zone_name, command.zone_bounds)
+        if self.zone_overlaps is not None:
+            self.zone_overlaps.ensure_free(zone)
         
-        # 2. Генерация ID
+        # 2. Генерация ID (после проверок: номер не тратится на отказ)
         request_id = self._generate_request_id()
         
-        # 3. Создание Zone
-        zone = Zone(command.zone_name, command.zone_bounds)
-        
-        # 4. Создание агрегата Request
+        # 3. Создание агрегата Request
         request = Request(
             request_id=request_id,
             coordinator_id=command.coordinator_id,
             zone=zone
         )
         
-        # 5. Сохранение
+        # 4. Сохранение
         self.request_repository.save(request)
         
-        # 6. Публикация доменных событий (если есть)
+        # 5. Публикация доменных событий (если есть)
         if self.event_publisher:
             for event in request.get_events():
                 self.event_publisher.publish(event)
@@ -66,8 +94,5 @@ class CreateRequestHandler:
             raise ValueError("Некорректные границы зоны")
     
     def _generate_request_id(self) -> str:
-        """Генерация уникального ID заявки"""
-        year = datetime.now().year
-        # В реальности: запрос к БД для получения sequence
-        counter = 1
-        return f"REQ-{year}-{counter:04d}"
+        """Генерация уникального ID заявки (обращение к БД — раз на блок)"""
+        return self.id_sequence.next_id()
@@ -0,0 +1,101 @@
+"""
+RequestIdSequence: Выдача ID заявок блоками (hi/lo)
+
+Предметная область: ПСО «Юго-Запад»
+
+Хранилище (таблица в БД) за одно обращение резервирует блок номеров,
+дальше номера выдаются из памяти. Одно обращение к хранилищу на
+block_size заявок вместо одного на каждую команду.
+
+- счётчик свой на каждый год: REQ-2024-0001, ..., REQ-2025-0001
+- после 9999 формат расширяется: REQ-2024-9999 → REQ-2024-10000
+- номера не переиспользуются: остаток блока при перезапуске сервиса
+  теряется (дырки в нумерации допустимы, повторы — нет)
+"""
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+
+class SequenceBlockStore(ABC):
+    """
+    Port: Хранилище последовательностей
+
+    Реализации: InMemorySequenceBlockStore (примеры и тесты),
+    SqlSequenceBlockStore (Infrastructure Layer)
+    """
+
+    @abstractmethod
+    def reserve(self, name: str, size: int) -> int:
+        """
+        Атомарно зарезервировать size номеров последовательности name
+
+        Returns:
+            Первый номер блока; блок — [first, first + size)
+        """
+        pass
+
+
+class InMemorySequenceBlockStore(SequenceBlockStore):
+    """Последовательности в памяти процесса (примеры и тесты)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next: Dict[str, int] = {}
+
+    def reserve(self, name: str, size: int) -> int:
+        with self._lock:
+            first = self._next.get(name, 1)
+            self._next[name] = first + size
+            return first
+
+
+class RequestIdSequence:
+    """
+    Генератор ID заявок REQ-YYYY-NNNN поверх SequenceBlockStore
+
+    Потокобезопасен; хранилище вызывается только при исчерпании блока
+    или смене года.
+    """
+
+    def __init__(
+        self,
+        store: SequenceBlockStore,
+        block_size: int = 100,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Args:
+            store: Хранилище последовательностей
+            block_size: Номеров в одном блоке
+            clock: Источник текущего времени (год ID)
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be >= 1: {block_size}")
+        self._store = store
+        self._block_size = block_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._year: Optional[int] = None
+        self._next = 0
+        self._limit = 0  # первый номер за пределами текущего блока
+
+    def next_id(self) -> str:
+        """Следующий ID заявки"""
+        year, number = self._next_number()
+        return f"REQ-{year}-{number:04d}"
+
+    def _next_number(self) -> Tuple[int, int]:
+        year = self._clock().year
+        with self._lock:
+            if year != self._year or self._next >= self._limit:
+                # Новый год начинает свою последовательность; остаток
+                # блока прошлого года больше не нужен
+                first = self._store.reserve(f"request_id:{year}", self._block_size)
+                self._year = year
+                self._next = first
+                self._limit = first + self._block_size
+            number = self._next
+            self._next += 1
+            return year, number
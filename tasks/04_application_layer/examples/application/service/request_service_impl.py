@@ -3,11 +3,10 @@ RequestServiceImpl: Фасад прикладного слоя
 
 Предметная область: ПСО «Юго-Запад»
 """
+from application.bus.message_bus import MessageBus
 from application.command.create_request_command import CreateRequestCommand
-from application.command.handlers.create_request_handler import CreateRequestHandler
 from application.query.get_request_by_id_query import GetRequestByIdQuery
 from application.query.dto.request_dto import RequestDto
-from application.query.handlers.get_request_by_id_handler import GetRequestByIdHandler
 
 
 class RequestServiceImpl:
@@ -18,20 +17,25 @@ class RequestServiceImpl:
     - Упрощает вызов прикладных операций (единая точка входа)
     - Инкапсулирует детали обработки команд и запросов
     - Удобен для использования в контроллерах
+    
+    Команды и запросы идут через шины (MessageBus): логирование,
+    метрики, повторы и транзакции добавляются в middleware шины,
+    а не в каждый обработчик.
     """
     
-    def __init__(
-        self,
-        create_request_handler: CreateRequestHandler,
-        get_request_by_id_handler: GetRequestByIdHandler
-    ):
-        self.create_request_handler = create_request_handler
-        self.get_request_by_id_handler = get_request_by_id_handler
+    def __init__(self, command_bus: MessageBus, query_bus: MessageBus):
+        """
+        Args:
+            command_bus: Шина команд (CreateRequestCommand → CreateRequestHandler)
+            query_bus: Шина запросов (GetRequestByIdQuery → GetRequestByIdHandler)
+        """
+        self.command_bus = command_bus
+        self.query_bus = query_bus
     
     def create_request(self, command: CreateRequestCommand) -> str:
         """Создать заявку. Возвращает ID."""
-        return self.create_request_handler.handle(command)
+        return self.command_bus.dispatch(command)
     
     def get_request_by_id(self, query: GetRequestByIdQuery) -> RequestDto:
         """Получить заявку по ID."""
-        return self.get_request_by_id_handler.handle(query)
+        return self.query_bus.dispatch(query)
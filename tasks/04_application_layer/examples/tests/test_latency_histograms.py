@@ -0,0 +1,49 @@
+"""
+Тесты LatencyHistograms: корзины, исходы, снимки
+"""
+import pytest
+
+from application.bus.latency_histograms import LatencyHistograms
+
+
+class TestLatencyHistograms:
+    def test_bucket_bound_should_be_inclusive(self):
+        # Как le в Prometheus: значение на границе попадает в её корзину
+        histograms = LatencyHistograms(buckets=(0.1, 1.0))
+        for seconds in (0.1, 0.10001, 1.0, 2.0):
+            histograms.observe("CreateRequestHandler", seconds)
+
+        [snapshot] = histograms.snapshot()
+
+        assert snapshot.counts == (1, 2, 1)
+        assert snapshot.cumulative() == [1, 3, 4]
+        assert snapshot.count == 4
+        assert snapshot.total == pytest.approx(3.20001)
+
+    def test_should_keep_outcomes_apart(self):
+        histograms = LatencyHistograms(buckets=(0.1,))
+        histograms.observe("CreateRequestHandler", 0.05, "ok")
+        histograms.observe("CreateRequestHandler", 0.5, "error")
+        histograms.observe("AssignGroupHandler", 0.05)
+
+        snapshots = histograms.snapshot()
+
+        assert [(s.handler, s.outcome, s.counts) for s in snapshots] == [
+            ("AssignGroupHandler", "ok", (1, 0)),
+            ("CreateRequestHandler", "error", (0, 1)),
+            ("CreateRequestHandler", "ok", (1, 0)),
+        ]
+
+    def test_snapshot_should_not_change_after_observe(self):
+        histograms = LatencyHistograms(buckets=(0.1,))
+        histograms.observe("CreateRequestHandler", 0.05)
+        [snapshot] = histograms.snapshot()
+
+        histograms.observe("CreateRequestHandler", 0.05)
+
+        assert snapshot.count == 1
+
+    @pytest.mark.parametrize("buckets", [(1.0, 0.1), (0.1, 0.1)])
+    def test_should_reject_unsorted_or_repeated_bounds(self, buckets):
+        with pytest.raises(ValueError, match="Границы корзин"):
+            LatencyHistograms(buckets=buckets)
@@ -0,0 +1,192 @@
+"""
+Тесты MessageBus и middleware шины
+
+Порядок звеньев, повторы с паузами, транзакция на каждую попытку,
+замер времени по исходу ok/error
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import pytest
+
+from application.bus.latency_histograms import LatencyHistograms
+from application.bus.message_bus import MessageBus, Middleware
+from application.bus.middlewares import (
+    RetryMiddleware,
+    TimingMiddleware,
+    TransactionMiddleware,
+)
+from domain.exceptions.domain_exceptions import ConcurrencyException
+
+
+@dataclass(frozen=True)
+class Ping:
+    value: int
+
+
+class PingHandler:
+    def __init__(self, failures: int = 0, error: Exception = None):
+        self.calls = 0
+        self._failures = failures
+        self._error = error or ConcurrencyException("Заявка изменена параллельно")
+
+    def handle(self, message: Ping) -> int:
+        self.calls += 1
+        if self.calls <= self._failures:
+            raise self._error
+        return message.value * 2
+
+
+class Recording(Middleware):
+    """Middleware, записывающий вход и выход в общий журнал"""
+
+    def __init__(self, name: str, log: list):
+        self._name = name
+        self._log = log
+
+    def wrap(self, handler_name, next_):
+        def call(message):
+            self._log.append(f"{self._name}>")
+            try:
+                return next_(message)
+            finally:
+                self._log.append(f"<{self._name}")
+        return call
+
+
+class Transactions:
+    """Фабрика транзакций, запоминающая commit / rollback"""
+
+    def __init__(self):
+        self.log = []
+
+    @contextmanager
+    def __call__(self):
+        self.log.append("begin")
+        try:
+            yield
+        except Exception:
+            self.log.append("rollback")
+            raise
+        self.log.append("commit")
+
+
+class TestMessageBus:
+    def test_should_dispatch_to_registered_handler(self):
+        bus = MessageBus()
+        bus.register(Ping, PingHandler())
+
+        assert bus.dispatch(Ping(21)) == 42
+
+    def test_should_accept_plain_function(self):
+        bus = MessageBus()
+        bus.register(Ping, lambda message: message.value)
+
+        assert bus.dispatch(Ping(7)) == 7
+
+    def test_first_middleware_should_be_outermost(self):
+        log = []
+        bus = MessageBus([Recording("outer", log), Recording("inner", log)])
+        bus.register(Ping, PingHandler())
+
+        bus.dispatch(Ping(1))
+
+        assert log == ["outer>", "inner>", "<inner", "<outer"]
+
+    def test_should_reject_second_handler_for_type(self):
+        bus = MessageBus()
+        bus.register(Ping, PingHandler())
+
+        with pytest.raises(ValueError, match="Ping"):
+            bus.register(Ping, PingHandler())
+
+    def test_should_raise_for_unknown_message(self):
+        with pytest.raises(LookupError, match="Ping"):
+            MessageBus().dispatch(Ping(1))
+
+
+class TestRetryMiddleware:
+    def test_should_retry_with_doubling_backoff(self):
+        pauses = []
+        handler = PingHandler(failures=2)
+        bus = MessageBus([
+            RetryMiddleware((ConcurrencyException,), attempts=3, backoff=0.01, sleep=pauses.append)
+        ])
+        bus.register(Ping, handler)
+
+        assert bus.dispatch(Ping(1)) == 2
+        assert handler.calls == 3
+        assert pauses == [0.01, 0.02]
+
+    def test_should_raise_after_last_attempt(self):
+        pauses = []
+        handler = PingHandler(failures=5)
+        bus = MessageBus([
+            RetryMiddleware((ConcurrencyException,), attempts=3, sleep=pauses.append)
+        ])
+        bus.register(Ping, handler)
+
+        with pytest.raises(ConcurrencyException):
+            bus.dispatch(Ping(1))
+        # После последней попытки паузы нет
+        assert handler.calls == 3
+        assert len(pauses) == 2
+
+    def test_should_not_retry_other_errors(self):
+        handler = PingHandler(failures=1, error=ValueError("Некорректные границы зоны"))
+        bus = MessageBus([RetryMiddleware((ConcurrencyException,), sleep=pytest.fail)])
+        bus.register(Ping, handler)
+
+        with pytest.raises(ValueError):
+            bus.dispatch(Ping(1))
+        assert handler.calls == 1
+
+    def test_should_reject_zero_attempts(self):
+        with pytest.raises(ValueError, match="attempts"):
+            RetryMiddleware((ConcurrencyException,), attempts=0)
+
+
+class TestTransactionMiddleware:
+    def test_should_open_transaction_per_attempt(self):
+        # Повтор снаружи транзакции: каждая попытка — своя транзакция,
+        # неудачная откатывается
+        transactions = Transactions()
+        bus = MessageBus([
+            RetryMiddleware((ConcurrencyException,), sleep=lambda _: None),
+            TransactionMiddleware(transactions),
+        ])
+        bus.register(Ping, PingHandler(failures=1))
+
+        bus.dispatch(Ping(1))
+
+        assert transactions.log == ["begin", "rollback", "begin", "commit"]
+
+
+class TestTimingMiddleware:
+    def test_should_split_ok_and_error(self):
+        histograms = LatencyHistograms()
+        handler = PingHandler(failures=1, error=ValueError("Некорректные границы зоны"))
+        bus = MessageBus([TimingMiddleware(histograms)])
+        bus.register(Ping, handler)
+
+        with pytest.raises(ValueError):
+            bus.dispatch(Ping(1))
+        bus.dispatch(Ping(1))
+        bus.dispatch(Ping(1))
+
+        counts = {(s.handler, s.outcome): s.count for s in histograms.snapshot()}
+        assert counts == {("PingHandler", "error"): 1, ("PingHandler", "ok"): 2}
+
+    def test_should_time_all_attempts_once(self):
+        # TimingMiddleware снаружи RetryMiddleware: одно наблюдение на dispatch
+        histograms = LatencyHistograms()
+        bus = MessageBus([
+            TimingMiddleware(histograms),
+            RetryMiddleware((ConcurrencyException,), sleep=lambda _: None),
+        ])
+        bus.register(Ping, PingHandler(failures=2))
+
+        bus.dispatch(Ping(1))
+
+        [snapshot] = histograms.snapshot()
+        assert (snapshot.outcome, snapshot.count) == ("ok", 1)
@@ -0,0 +1,82 @@
+"""
+Тесты RequestIdSequence: блоки номеров, смена года, расширение формата
+"""
+from datetime import datetime
+
+import pytest
+
+from application.service.request_id_sequence import (
+    InMemorySequenceBlockStore,
+    RequestIdSequence,
+)
+
+
+class CountingStore(InMemorySequenceBlockStore):
+    """Хранилище в памяти, запоминающее обращения reserve()"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def reserve(self, name: str, size: int) -> int:
+        self.calls.append((name, size))
+        return super().reserve(name, size)
+
+
+class Clock:
+    def __init__(self, year: int):
+        self.now = datetime(year, 12, 31)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestBlockReservation:
+    def test_should_reserve_once_per_block(self):
+        store = CountingStore()
+        sequence = RequestIdSequence(store, block_size=3, clock=Clock(2024))
+
+        ids = [sequence.next_id() for _ in range(7)]
+
+        assert ids == [f"REQ-2024-{n:04d}" for n in range(1, 8)]
+        assert store.calls == [("request_id:2024", 3)] * 3
+
+    def test_sequences_over_shared_store_should_not_repeat_ids(self):
+        # Два экземпляра сервиса над одним хранилищем получают разные блоки
+        store = InMemorySequenceBlockStore()
+        first = RequestIdSequence(store, block_size=2, clock=Clock(2024))
+        second = RequestIdSequence(store, block_size=2, clock=Clock(2024))
+
+        ids = [first.next_id(), second.next_id(), first.next_id(), first.next_id()]
+
+        assert ids == ["REQ-2024-0001", "REQ-2024-0003", "REQ-2024-0002", "REQ-2024-0005"]
+
+    def test_should_reject_empty_block(self):
+        with pytest.raises(ValueError, match="block_size"):
+            RequestIdSequence(InMemorySequenceBlockStore(), block_size=0)
+
+
+class TestYearReset:
+    def test_should_start_new_counter_in_new_year(self):
+        store = CountingStore()
+        clock = Clock(2024)
+        sequence = RequestIdSequence(store, block_size=100, clock=clock)
+        sequence.next_id()
+        sequence.next_id()
+
+        clock.now = datetime(2025, 1, 1)
+
+        # Остаток блока 2024 года не используется
+        assert sequence.next_id() == "REQ-2025-0001"
+        assert store.calls == [("request_id:2024", 100), ("request_id:2025", 100)]
+
+
+class TestWidening:
+    def test_should_widen_after_9999(self):
+        store = InMemorySequenceBlockStore()
+        store.reserve("request_id:2024", 9997)  # следующий номер — 9998
+        sequence = RequestIdSequence(store, block_size=2, clock=Clock(2024))
+
+        ids = [sequence.next_id() for _ in range(3)]
+
+        assert ids == ["REQ-2024-9998", "REQ-2024-9999", "REQ-2024-10000"]
@@ -0,0 +1,110 @@
+"""
+Тесты проверки пересечения зон в обработчиках команд
+
+CreateRequestHandler и ChangeRequestZoneHandler спрашивают
+ZoneOverlapDetector до изменения заявки
+"""
+import pytest
+
+from application.command.change_request_zone_command import ChangeRequestZoneCommand
+from application.command.create_request_command import CreateRequestCommand
+from application.command.handlers.change_request_zone_handler import ChangeRequestZoneHandler
+from application.command.handlers.create_request_handler import CreateRequestHandler
+from application.service.request_id_sequence import (
+    InMemorySequenceBlockStore,
+    RequestIdSequence,
+)
+from domain.exceptions.domain_exceptions import ZoneOverlapException
+from domain.models.group import Group
+from domain.models.request import Request
+from domain.models.zone import Zone
+from domain.services.zone_overlap import ZoneOverlapDetector
+
+NORTH = (52.0, 52.5, 23.5, 24.0)
+NORTH_EAST = (52.2, 52.7, 23.8, 24.3)  # пересекается с NORTH
+SOUTH = (51.0, 51.5, 23.5, 24.0)
+
+
+class InMemoryRepository:
+    def __init__(self):
+        self.requests = {}
+
+    def save(self, request):
+        self.requests[request.request_id] = request
+
+    def find_by_id(self, request_id):
+        return self.requests.get(request_id)
+
+
+def active_request(request_id: str, bounds) -> Request:
+    group = Group("G-01", "LEADER-1")
+    for i in range(3):
+        group.add_member(f"VOL-{i}")
+    group.mark_ready()
+    request = Request.create(request_id, "COORD-1", Zone("Active", bounds))
+    request.assign_group(group)
+    request.activate()
+    return request
+
+
+@pytest.fixture
+def repository():
+    repository = InMemoryRepository()
+    repository.save(active_request("REQ-2024-0001", NORTH))
+    return repository
+
+
+@pytest.fixture
+def detector(repository):
+    return ZoneOverlapDetector(repository.requests.values())
+
+
+def make_create_handler(repository, detector) -> CreateRequestHandler:
+    return CreateRequestHandler(
+        repository,
+        id_sequence=RequestIdSequence(InMemorySequenceBlockStore()),
+        zone_overlaps=detector
+    )
+
+
+class TestCreateRequestHandler:
+    def test_should_reject_zone_overlapping_active_request(self, repository, detector):
+        handler = make_create_handler(repository, detector)
+
+        with pytest.raises(ZoneOverlapException, match="REQ-2024-0001"):
+            handler.handle(CreateRequestCommand("COORD-2", "North-East", NORTH_EAST))
+        assert list(repository.requests) == ["REQ-2024-0001"]
+
+    def test_should_create_request_in_free_zone(self, repository, detector):
+        handler = make_create_handler(repository, detector)
+
+        request_id = handler.handle(CreateRequestCommand("COORD-2", "South", SOUTH))
+
+        assert repository.find_by_id(request_id).zone.bounds == SOUTH
+
+
+class TestChangeRequestZoneHandler:
+    def test_should_reject_overlapping_zone(self, repository, detector):
+        repository.save(active_request("REQ-2024-0002", SOUTH))
+        detector.track(repository.find_by_id("REQ-2024-0002"))
+        handler = ChangeRequestZoneHandler(repository, detector)
+
+        with pytest.raises(ZoneOverlapException):
+            handler.handle(ChangeRequestZoneCommand("REQ-2024-0002", "North-East", NORTH_EAST))
+        assert repository.find_by_id("REQ-2024-0002").zone.bounds == SOUTH
+
+    def test_should_move_zone_and_update_detector(self, repository, detector):
+        handler = ChangeRequestZoneHandler(repository, detector)
+
+        # Своя зона не считается пересечением
+        handler.handle(ChangeRequestZoneCommand("REQ-2024-0001", "North-East", NORTH_EAST))
+
+        assert repository.find_by_id("REQ-2024-0001").zone.bounds == NORTH_EAST
+        assert detector.overlapping(Zone("North", NORTH)) == ["REQ-2024-0001"]
+        assert detector.overlapping(Zone("West", (52.0, 52.1, 23.0, 23.6))) == []
+
+    def test_should_reject_unknown_request(self, repository, detector):
+        handler = ChangeRequestZoneHandler(repository, detector)
+
+        with pytest.raises(ValueError, match="не найдена"):
+            handler.handle(ChangeRequestZoneCommand("REQ-2024-9999", "South", SOUTH))
@@ -0,0 +1,65 @@
+"""
+MetricsController: GET /metrics для Prometheus
+
+Входящий адаптер (Driving Adapter): экспорт метрик шины команд/запросов
+Предметная область: ПСО «Юго-Запад»
+
+Гистограммы времени обработчиков (LatencyHistograms, Application Layer)
+отдаются в текстовом формате Prometheus — без prometheus_client:
+
+    pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="ok",le="0.005"} 42
+    pso_handler_latency_seconds_sum{handler="CreateRequestHandler",outcome="ok"} 0.137
+    pso_handler_latency_seconds_count{handler="CreateRequestHandler",outcome="ok"} 57
+
+Подключение:
+    app.include_router(metrics_router)
+    TimingMiddleware(get_latency_histograms())  # в шинах команд и запросов
+"""
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from application.bus.latency_histograms import LatencyHistograms
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+METRIC = "pso_handler_latency_seconds"
+CONTENT_TYPE = "text/plain; version=0.0.4"  # charset добавит PlainTextResponse
+
+# Одни гистограммы на процесс (как кэш ответов)
+_histograms = LatencyHistograms()
+
+
+def get_latency_histograms() -> LatencyHistograms:
+    """Dependency Injection для FastAPI и сборки шин"""
+    return _histograms
+
+
+def render_prometheus(histograms: LatencyHistograms) -> str:
+    """Гистограммы в текстовом формате Prometheus (exposition 0.0.4)"""
+    lines = [
+        f"# HELP {METRIC} Время обработки команды или запроса шиной",
+        f"# TYPE {METRIC} histogram",
+    ]
+    for snapshot in histograms.snapshot():
+        labels = f'handler="{_escape(snapshot.handler)}",outcome="{_escape(snapshot.outcome)}"'
+        bounds = [repr(bound) for bound in snapshot.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, snapshot.cumulative()):
+            lines.append(f'{METRIC}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f"{METRIC}_sum{{{labels}}} {snapshot.total!r}")
+        lines.append(f"{METRIC}_count{{{labels}}} {snapshot.count}")
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+def metrics(histograms: LatencyHistograms = Depends(get_latency_histograms)):
+    """
+    Метрики для Prometheus (scrape)
+
+    **Возвращает:**
+    - Гистограммы времени обработчиков по исходу (ok / error)
+    """
+    return PlainTextResponse(render_prometheus(histograms), media_type=CONTENT_TYPE)
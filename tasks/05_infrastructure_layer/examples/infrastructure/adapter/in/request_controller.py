@@ -4,14 +4,17 @@ RequestController: FastAPI REST endpoints
 Входящий адаптер (Driving Adapter)
 Предметная область: ПСО «Юго-Запад»
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from application.command.create_request_command import CreateRequestCommand
 from application.command.handlers.create_request_handler import CreateRequestHandler
 from application.query.get_request_by_id_query import GetRequestByIdQuery
 from application.query.handlers.get_request_by_id_handler import GetRequestByIdHandler
 from application.query.dto.request_dto import RequestDto
+from .request_response_cache import RequestResponseCache, get_response_cache
 
 router = APIRouter(prefix="/api/requests", tags=["Requests"])
 
@@ -39,12 +42,29 @@ class AssignGroupRequest(BaseModel):
     group_id: str = Field(..., example="G-01")
 
 
+# === Dependencies ===
+# Обработчики собирает точка сборки приложения (репозиторий, генератор
+# ID поверх SqlSequenceBlockStore) и подставляет через
+# app.dependency_overrides. Depends() на сам класс не подходит: FastAPI
+# принял бы аргументы конструктора за параметры HTTP-запроса.
+
+def get_create_request_handler() -> CreateRequestHandler:
+    """Dependency Injection: CreateRequestHandler (переопределяется при сборке)"""
+    raise HTTPException(status_code=501, detail="CreateRequestHandler не подключён")
+
+
+def get_request_by_id_handler() -> GetRequestByIdHandler:
+    """Dependency Injection: GetRequestByIdHandler (переопределяется при сборке)"""
+    raise HTTPException(status_code=501, detail="GetRequestByIdHandler не подключён")
+
+
 # === Endpoints ===
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=CreateRequestResponse)
 def create_request(
     request_data: CreateRequestRequest,
-    handler: CreateRequestHandler = Depends()
+    handler: CreateRequestHandler = Depends(get_create_request_handler),
+    cache: RequestResponseCache = Depends(get_response_cache)
 ):
     """
     Создать новую заявку на поисково-спасательную операцию
@@ -68,6 +88,7 @@ def create_request(
     )
     
     request_id = handler.handle(command)
+    cache.invalidate(request_id)
     
     return CreateRequestResponse(request_id=request_id)
 
@@ -75,27 +96,41 @@ def create_request(
 @router.get("/{request_id}", response_model=RequestDto)
 def get_request(
     request_id: str,
-    handler: GetRequestByIdHandler = Depends()
+    handler: GetRequestByIdHandler = Depends(get_request_by_id_handler),
+    cache: RequestResponseCache = Depends(get_response_cache),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Получить заявку по ID
     
     **Параметры:**
     - `request_id`: ID заявки (например, REQ-2024-0001)
+    - `If-None-Match` (заголовок): ETag из предыдущего ответа
     
     **Возвращает:**
-    - Детали заявки (RequestDto)
+    - Детали заявки (RequestDto) и заголовок ETag
+    - 304 Not Modified без тела, если заявка не изменилась
     
     **Ошибки:**
     - 404: Заявка не найдена
     """
-    query = GetRequestByIdQuery(request_id=request_id)
+    cached = cache.get(request_id)
+    if cached is None:
+        # Поколение читать до загрузки: запись во время чтения не даст
+        # закэшировать устаревший ответ
+        generation = cache.generation()
+        query = GetRequestByIdQuery(request_id=request_id)
+        try:
+            dto = handler.handle(query)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        body = json.dumps(jsonable_encoder(dto), ensure_ascii=False).encode("utf-8")
+        cached = cache.put(request_id, generation, body)
     
-    try:
-        dto = handler.handle(query)
-        return dto
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if cache.matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
 
 @router.post("/{request_id}/assign-group", status_code=status.HTTP_200_OK)
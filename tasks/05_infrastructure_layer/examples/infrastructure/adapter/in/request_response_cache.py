@@ -0,0 +1,143 @@
+"""
+RequestResponseCache: Кэш сериализованных ответов GET /api/requests/{id}
+
+Входящий адаптер (Driving Adapter): кэш HTTP-представлений
+Предметная область: ПСО «Юго-Запад»
+
+Зачем:
+- Дашборды опрашивают заявку каждые несколько секунд, а меняется
+  она редко: повторный опрос не должен доходить до
+  GetRequestByIdHandler и _map_to_dto
+- ETag = хэш сериализованного тела: If-None-Match с текущим ETag →
+  304 без тела
+
+ETag зависит только от содержимого ответа, поэтому одинаков во всех
+воркерах и после перезапуска; изменённая заявка всегда даёт другой
+ETag (ложного 304 нет).
+
+Свежесть: запись через этот процесс сбрасывает ответ сразу
+(invalidate из контроллера), запись другим воркером или сервисом
+станет видна не позже чем через ttl секунд.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Готовый ответ: ETag и сериализованное тело"""
+    etag: str
+    body: bytes
+
+
+class RequestResponseCache:
+    """
+    Кэш ответов по ID заявки (LRU + TTL, не больше max_entries)
+
+    Заполнение защищено от гонки с записью: put принимает номер
+    поколения, прочитанный до загрузки заявки, и ничего не кэширует,
+    если с тех пор был invalidate. Поколение одно на весь кэш — память
+    не растёт с числом изменённых заявок.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Сколько ответов помнить (старейшие вытесняются)
+            ttl: Время жизни ответа, секунды. Это и граница
+                устаревания после записи другим воркером или сервисом,
+                поэтому 5 с — не дольше интервала опроса дашборда.
+                Попадания дают разные клиенты, открывшие одну заявку
+                (кэш общий на процесс); клиент, опрашивающий реже ttl,
+                промахивается, но ETag — хэш тела, и он всё равно
+                получает 304 без тела: промах стоит только вызова
+                обработчика
+            clock: Источник времени (для тестов)
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generation = 0
+        # request_id → (срок действия, ответ); от давних к свежим
+        self._responses: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, request_id: str) -> Optional[CachedResponse]:
+        """Закэшированный ответ или None (нет или истёк TTL)"""
+        with self._lock:
+            entry = self._responses.get(request_id)
+            if entry is None:
+                return None
+            expires_at, cached = entry
+            if expires_at <= self._clock():
+                del self._responses[request_id]
+                return None
+            self._responses.move_to_end(request_id)
+            return cached
+
+    def generation(self) -> int:
+        """Текущее поколение кэша (читать до загрузки из репозитория)"""
+        with self._lock:
+            return self._generation
+
+    def put(self, request_id: str, generation: int, body: bytes) -> CachedResponse:
+        """
+        Закэшировать ответ, если с момента чтения не было invalidate
+
+        Returns:
+            Ответ с ETag (даже если в кэш он не попал)
+        """
+        cached = CachedResponse(etag=self._etag(body), body=body)
+        with self._lock:
+            if self._generation == generation:
+                self._responses[request_id] = (self._clock() + self._ttl, cached)
+                self._responses.move_to_end(request_id)
+                while len(self._responses) > self._max_entries:
+                    self._responses.popitem(last=False)
+        return cached
+
+    def invalidate(self, request_id: str) -> None:
+        """Заявка изменилась: старый ответ удалить, начатые заполнения отменить"""
+        with self._lock:
+            self._generation += 1
+            self._responses.pop(request_id, None)
+
+    @staticmethod
+    def matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Совпадает ли заголовок If-None-Match с ETag (в т.ч. "*" и W/)"""
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or candidate.removeprefix("W/") == etag:
+                return True
+        return False
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+# Один кэш на процесс
+_cache = RequestResponseCache()
+
+
+def get_response_cache() -> RequestResponseCache:
+    """
+    Dependency Injection для FastAPI
+
+    Использование:
+        @router.get("/{request_id}")
+        def get_request(cache: RequestResponseCache = Depends(get_response_cache)):
+            ...
+    """
+    return _cache
@@ -0,0 +1,51 @@
+"""
+Sequence Block Stores: Хранилища блоков номеров для ID заявок
+
+Реализация порта SequenceBlockStore (Application Layer)
+Предметная область: ПСО «Юго-Запад»
+
+- SqlSequenceBlockStore — таблица id_sequences в PostgreSQL; блок
+  резервируется одним INSERT ... ON CONFLICT ... RETURNING
+
+Блоки в файле без БД — FileSequenceBlockSource из лабораторной 02
+(block_leasing_request_id_allocator.py); для тестов —
+InMemorySequenceBlockStore (Application Layer).
+
+Использование:
+    sequence = RequestIdSequence(SqlSequenceBlockStore(), block_size=100)
+    handler = CreateRequestHandler(repository, publisher, id_sequence=sequence)
+"""
+from typing import Callable, ContextManager
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from application.service.request_id_sequence import SequenceBlockStore
+from infrastructure.config.database import session_scope
+
+
+class SqlSequenceBlockStore(SequenceBlockStore):
+    """
+    Блоки номеров в таблице id_sequences (SequenceBlockORM)
+
+    Строка последовательности блокируется на время UPDATE, поэтому
+    параллельные экземпляры сервиса получают непересекающиеся блоки.
+    """
+
+    _RESERVE = text(
+        "INSERT INTO id_sequences (name, next_value) VALUES (:name, 1 + :size) "
+        "ON CONFLICT (name) DO UPDATE "
+        "SET next_value = id_sequences.next_value + :size "
+        "RETURNING next_value - :size"
+    )
+
+    def __init__(self, session_factory: Callable[[], ContextManager[Session]] = session_scope):
+        """
+        Args:
+            session_factory: Контекст транзакции (commit при выходе)
+        """
+        self._session_factory = session_factory
+
+    def reserve(self, name: str, size: int) -> int:
+        with self._session_factory() as session:
+            return session.execute(self._RESERVE, {"name": name, "size": size}).scalar_one()
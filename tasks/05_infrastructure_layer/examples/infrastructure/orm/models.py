@@ -4,7 +4,7 @@ ORM Models: SQLAlchemy модели для Request Service
 Mapping Domain → Database Tables
 Предметная область: ПСО «Юго-Запад»
 """
-from sqlalchemy import Column, String, DateTime, Float, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, Float, Integer, BigInteger, ForeignKey
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime
 
@@ -84,3 +84,16 @@ class GroupMemberORM(Base):
     
     # Relationship: Member → Group
     group = relationship("GroupORM", back_populates="members")
+
+
+class SequenceBlockORM(Base):
+    """
+    ORM: Таблица id_sequences
+    
+    Последовательности для выдачи ID блоками (SqlSequenceBlockStore),
+    например request_id:2024 → следующий свободный номер
+    """
+    __tablename__ = "id_sequences"
+    
+    name = Column(String(100), primary_key=True)
+    next_value = Column(BigInteger, nullable=False, default=1)
@@ -0,0 +1,67 @@
+"""
+Тесты GET /metrics: гистограммы в текстовом формате Prometheus
+"""
+import importlib
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from application.bus.latency_histograms import LatencyHistograms
+
+# "in" — ключевое слово: from infrastructure.adapter.in ... не разобрать
+metrics_controller = importlib.import_module("infrastructure.adapter.in.metrics_controller")
+
+
+def histograms_with_samples() -> LatencyHistograms:
+    histograms = LatencyHistograms(buckets=(0.005, 0.1))
+    histograms.observe("CreateRequestHandler", 0.002, "ok")
+    histograms.observe("CreateRequestHandler", 0.005, "ok")
+    histograms.observe("CreateRequestHandler", 0.25, "error")
+    return histograms
+
+
+class TestRenderPrometheus:
+    def test_should_render_cumulative_buckets_sum_and_count(self):
+        text = metrics_controller.render_prometheus(histograms_with_samples())
+
+        assert text.splitlines() == [
+            "# HELP pso_handler_latency_seconds Время обработки команды или запроса шиной",
+            "# TYPE pso_handler_latency_seconds histogram",
+            'pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="error",le="0.005"} 0',
+            'pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="error",le="0.1"} 0',
+            'pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="error",le="+Inf"} 1',
+            'pso_handler_latency_seconds_sum{handler="CreateRequestHandler",outcome="error"} 0.25',
+            'pso_handler_latency_seconds_count{handler="CreateRequestHandler",outcome="error"} 1',
+            'pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="ok",le="0.005"} 2',
+            'pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="ok",le="0.1"} 2',
+            'pso_handler_latency_seconds_bucket{handler="CreateRequestHandler",outcome="ok",le="+Inf"} 2',
+            'pso_handler_latency_seconds_sum{handler="CreateRequestHandler",outcome="ok"} 0.007',
+            'pso_handler_latency_seconds_count{handler="CreateRequestHandler",outcome="ok"} 2',
+        ]
+        assert text.endswith("\n")
+
+    def test_should_escape_label_values(self):
+        histograms = LatencyHistograms(buckets=(0.1,))
+        histograms.observe('Handler"\\\n', 0.01)
+
+        text = metrics_controller.render_prometheus(histograms)
+
+        assert 'handler="Handler\\"\\\\\\n"' in text
+
+    def test_should_render_only_header_without_samples(self):
+        text = metrics_controller.render_prometheus(LatencyHistograms())
+
+        assert text.count("\n") == 2
+
+
+class TestMetricsEndpoint:
+    def test_should_serve_prometheus_text(self):
+        app = FastAPI()
+        app.include_router(metrics_controller.metrics_router)
+        app.dependency_overrides[metrics_controller.get_latency_histograms] = histograms_with_samples
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'outcome="error",le="+Inf"} 1' in response.text
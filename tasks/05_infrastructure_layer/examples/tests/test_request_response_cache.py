@@ -0,0 +1,196 @@
+"""
+Тесты кэша ответов GET /api/requests/{id}
+
+ETag и 304, сброс при записи, защита от гонки заполнения с записью,
+TTL и вытеснение LRU
+"""
+import importlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from application.query.dto.request_dto import RequestDto
+
+# "in" — ключевое слово: from infrastructure.adapter.in ... не разобрать
+request_controller = importlib.import_module("infrastructure.adapter.in.request_controller")
+response_cache = importlib.import_module("infrastructure.adapter.in.request_response_cache")
+RequestResponseCache = response_cache.RequestResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeGetHandler:
+    """GetRequestByIdHandler над словарём статусов; считает вызовы"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = 0
+        self.during_load = None  # вызывается посреди загрузки (гонка с записью)
+
+    def handle(self, query) -> RequestDto:
+        self.calls += 1
+        if query.request_id not in self.statuses:
+            raise ValueError(f"Request {query.request_id} не найдена")
+        dto = RequestDto(
+            request_id=query.request_id,
+            coordinator_id="COORD-1",
+            status=self.statuses[query.request_id],
+            zone_name="North",
+            zone_bounds=(52.0, 52.5, 23.5, 24.0),
+        )
+        if self.during_load is not None:
+            self.during_load()
+        return dto
+
+
+class FakeCreateHandler:
+    def handle(self, command) -> str:
+        return "REQ-2024-0001"
+
+
+@pytest.fixture
+def cache():
+    return RequestResponseCache(clock=FakeClock())
+
+
+@pytest.fixture
+def get_handler():
+    return FakeGetHandler({"REQ-2024-0001": "DRAFT"})
+
+
+@pytest.fixture
+def client(cache, get_handler):
+    app = FastAPI()
+    app.include_router(request_controller.router)
+    app.dependency_overrides[response_cache.get_response_cache] = lambda: cache
+    app.dependency_overrides[request_controller.get_request_by_id_handler] = lambda: get_handler
+    app.dependency_overrides[request_controller.get_create_request_handler] = FakeCreateHandler
+    return TestClient(app)
+
+
+class TestConditionalGet:
+    def test_should_return_etag_and_serve_repeat_from_cache(self, client, get_handler):
+        first = client.get("/api/requests/REQ-2024-0001")
+        second = client.get("/api/requests/REQ-2024-0001")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["status"] == "DRAFT"
+        assert first.headers["ETag"] == second.headers["ETag"]
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert get_handler.calls == 1
+
+    @pytest.mark.parametrize("header", [
+        "{etag}",
+        "*",
+        "W/{etag}",
+        '"0000000000000000", {etag}',
+        '"0000000000000000",W/{etag}',
+    ])
+    def test_should_answer_304_for_matching_if_none_match(self, client, header):
+        etag = client.get("/api/requests/REQ-2024-0001").headers["ETag"]
+
+        response = client.get(
+            "/api/requests/REQ-2024-0001",
+            headers={"If-None-Match": header.format(etag=etag)}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_should_return_body_for_stale_etag(self, client):
+        response = client.get(
+            "/api/requests/REQ-2024-0001",
+            headers={"If-None-Match": '"0000000000000000"'}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["request_id"] == "REQ-2024-0001"
+
+    def test_should_return_404_for_unknown_request(self, client):
+        assert client.get("/api/requests/REQ-2024-9999").status_code == 404
+
+    def test_etag_should_not_depend_on_cache(self, client, cache):
+        # ETag — хэш тела: после истечения TTL (или в другом воркере) тот же
+        etag = client.get("/api/requests/REQ-2024-0001").headers["ETag"]
+        cache.invalidate("REQ-2024-0001")
+
+        response = client.get("/api/requests/REQ-2024-0001", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+
+class TestInvalidation:
+    def test_create_should_invalidate_cached_response(self, client, get_handler):
+        etag = client.get("/api/requests/REQ-2024-0001").headers["ETag"]
+        get_handler.statuses["REQ-2024-0001"] = "ACTIVE"
+
+        created = client.post("/api/requests", json={
+            "coordinator_id": "COORD-1",
+            "zone_name": "North",
+            "zone_bounds": [52.0, 52.5, 23.5, 24.0],
+        })
+        response = client.get("/api/requests/REQ-2024-0001", headers={"If-None-Match": etag})
+
+        assert created.status_code == 201
+        assert response.status_code == 200
+        assert response.json()["status"] == "ACTIVE"
+        assert response.headers["ETag"] != etag
+        assert get_handler.calls == 2
+
+    def test_should_not_cache_body_loaded_before_concurrent_write(self, client, cache, get_handler):
+        # Запись (invalidate) случилась, пока заявка загружалась:
+        # прочитанное тело может быть старым — в кэш оно не попадает
+        get_handler.during_load = lambda: cache.invalidate("REQ-2024-0001")
+
+        assert client.get("/api/requests/REQ-2024-0001").status_code == 200
+        assert cache.get("REQ-2024-0001") is None
+
+        get_handler.during_load = None
+        client.get("/api/requests/REQ-2024-0001")
+        client.get("/api/requests/REQ-2024-0001")
+        assert get_handler.calls == 2
+
+
+class TestRequestResponseCache:
+    def test_put_should_skip_stale_generation(self, cache):
+        generation = cache.generation()
+        cache.invalidate("REQ-2024-0002")  # запись другой заявки — тоже новое поколение
+
+        cached = cache.put("REQ-2024-0001", generation, b"{}")
+
+        assert cached.etag.startswith('"')
+        assert cache.get("REQ-2024-0001") is None
+
+    def test_entry_should_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = RequestResponseCache(ttl=5.0, clock=clock)
+        cache.put("REQ-2024-0001", cache.generation(), b"{}")
+
+        clock.now = 4.9
+        assert cache.get("REQ-2024-0001") is not None
+        clock.now = 5.0
+        assert cache.get("REQ-2024-0001") is None
+
+    def test_should_evict_least_recently_used_above_max_entries(self):
+        cache = RequestResponseCache(max_entries=2, clock=FakeClock())
+        cache.put("REQ-2024-0001", cache.generation(), b"1")
+        cache.put("REQ-2024-0002", cache.generation(), b"2")
+        cache.get("REQ-2024-0001")  # 0002 становится самым давним
+
+        cache.put("REQ-2024-0003", cache.generation(), b"3")
+
+        assert cache.get("REQ-2024-0002") is None
+        assert cache.get("REQ-2024-0001").body == b"1"
+        assert cache.get("REQ-2024-0003").body == b"3"
+
+    @pytest.mark.parametrize("header", [None, "", '"abc"', 'W/"abc"'])
+    def test_matches_should_reject_other_etags(self, header):
+        assert not RequestResponseCache.matches(header, '"def"')
@@ -7,12 +7,25 @@
 - Публикации событий
 """
 import pytest
+from datetime import datetime
 from unittest.mock import Mock, MagicMock
 from application.command.create_request_command import CreateRequestCommand
 from application.command.handlers.create_request_handler import CreateRequestHandler
+from application.service.request_id_sequence import (
+    InMemorySequenceBlockStore,
+    RequestIdSequence,
+)
 from domain.models.request import Request
 
 
+def make_handler(repository, publisher=None) -> CreateRequestHandler:
+    """Обработчик с генератором ID в памяти (год зафиксирован: 2024)"""
+    sequence = RequestIdSequence(
+        InMemorySequenceBlockStore(), clock=lambda: datetime(2024, 3, 1)
+    )
+    return CreateRequestHandler(repository, publisher, id_sequence=sequence)
+
+
 class TestCreateRequestHandler:
     """Тесты обработчика CreateRequest"""
     
@@ -21,7 +34,7 @@ class TestCreateRequestHandler:
         # Arrange
         mock_repo = Mock()
         mock_publisher = Mock()
-        handler = CreateRequestHandler(mock_repo, mock_publisher)
+        handler = make_handler(mock_repo, mock_publisher)
         
         command = CreateRequestCommand(
             coordinator_id="COORD-1",
@@ -47,7 +60,7 @@ class TestCreateRequestHandler:
         # Arrange
         mock_repo = Mock()
         mock_publisher = Mock()
-        handler = CreateRequestHandler(mock_repo, mock_publisher)
+        handler = make_handler(mock_repo, mock_publisher)
         
         command = CreateRequestCommand(
             coordinator_id="COORD-1",
@@ -68,7 +81,7 @@ class TestCreateRequestHandler:
         """Handler должен валидировать некорректные границы зоны"""
         # Arrange
         mock_repo = Mock()
-        handler = CreateRequestHandler(mock_repo, None)
+        handler = make_handler(mock_repo)
         
         command = CreateRequestCommand(
             coordinator_id="COORD-1",
@@ -84,7 +97,7 @@ class TestCreateRequestHandler:
         """Handler должен возвращать сгенерированный ID"""
         # Arrange
         mock_repo = Mock()
-        handler = CreateRequestHandler(mock_repo, None)
+        handler = make_handler(mock_repo)
         
         command = CreateRequestCommand(
             coordinator_id="COORD-1",
@@ -123,7 +136,7 @@ class TestCreateRequestHandlerEdgeCases:
         mock_repo = Mock()
         mock_repo.save.side_effect = Exception("Database connection error")
         
-        handler = CreateRequestHandler(mock_repo, None)
+        handler = make_handler(mock_repo)
         
         command = CreateRequestCommand(
             coordinator_id="COORD-1",
@@ -5,7 +5,9 @@ RequestProjection: Обработчик событий для синхрониз
 Предметная область: ПСО «Юго-Запад»
 """
 from datetime import datetime
+from typing import List
 from sqlalchemy.orm import Session
+from domain.models.geodesy import rectangle_area_km2, rectangle_areas_km2
 from domain.events.request_events import (
     RequestCreated,
     GroupAssignedToRequest,
@@ -32,29 +34,24 @@ class RequestProjection:
         
         Действие: INSERT в request_views
         """
-        # Загрузка дополнительных данных (coordinator, zone)
-        coordinator = self._fetch_coordinator_data(event.coordinator_id)
-        zone_area = self._calculate_zone_area(event.zone_bounds)
+        # Площадь кэшируется по границам (domain/models/geodesy.py)
+        zone_area = rectangle_area_km2(*event.zone_bounds)
         
-        # Создание проекции
-        view = RequestViewORM(
-            request_id=event.request_id,
-            status="DRAFT",
-            coordinator_id=event.coordinator_id,
-            coordinator_name=coordinator["name"],
-            coordinator_phone=coordinator.get("phone"),
-            zone_name=event.zone_name,
-            zone_area_km2=zone_area,
-            assigned_group_id=None,
-            group_leader_name=None,
-            group_members_count=None,
-            created_at=event.occurred_at,
-            activated_at=None,
-            completed_at=None,
-            duration_minutes=None
-        )
+        self.session.add(self._build_view(event, zone_area))
+        self.session.commit()
+    
+    def on_requests_created(self, events: List[RequestCreated]):
+        """
+        Обработка пачки событий RequestCreated (перестроение проекции)
         
-        self.session.add(view)
+        Действие: площади всех зон одним проходом, один COMMIT
+        """
+        zone_areas = rectangle_areas_km2([event.zone_bounds for event in events])
+        
+        self.session.add_all([
+            self._build_view(event, float(zone_area))
+            for event, zone_area in zip(events, zone_areas)
+        ])
         self.session.commit()
     
     def on_group_assigned(self, event: GroupAssignedToRequest):
@@ -117,6 +114,28 @@ class RequestProjection:
     
     # === Helper Methods ===
     
+    def _build_view(self, event: RequestCreated, zone_area: float) -> RequestViewORM:
+        """Строка проекции для новой заявки"""
+        # Загрузка дополнительных данных (coordinator)
+        coordinator = self._fetch_coordinator_data(event.coordinator_id)
+        
+        return RequestViewORM(
+            request_id=event.request_id,
+            status="DRAFT",
+            coordinator_id=event.coordinator_id,
+            coordinator_name=coordinator["name"],
+            coordinator_phone=coordinator.get("phone"),
+            zone_name=event.zone_name,
+            zone_area_km2=zone_area,
+            assigned_group_id=None,
+            group_leader_name=None,
+            group_members_count=None,
+            created_at=event.occurred_at,
+            activated_at=None,
+            completed_at=None,
+            duration_minutes=None
+        )
+    
     def _fetch_coordinator_data(self, coordinator_id: str) -> dict:
         """Загрузить данные координатора из Write Model"""
         # В реальности: запрос к coordinators таблице
@@ -132,12 +151,6 @@ class RequestProjection:
             "leader_name": "Пётр Петров",
             "members_count": 5
         }
-    
-    def _calculate_zone_area(self, bounds: tuple) -> float:
-        """Вычислить площадь зоны в км²"""
-        lat_min, lat_max, lon_min, lon_max = bounds
-        # Упрощённый расчёт (в реальности: Haversine formula)
-        return abs((lat_max - lat_min) * (lon_max - lon_min)) * 12365.0
 
 
 # === Event Bus Integration ===
@@ -167,3 +180,22 @@ class EventBus:
             handler(event)
         else:
             print(f"⚠️ No handler for event: {event_type}")
+    
+    def publish_many(self, events):
+        """
+        Публикация пачки событий (перестроение Read Model)
+        
+        Подряд идущие RequestCreated проецируются одной пачкой;
+        порядок относительно остальных событий сохраняется.
+        """
+        created = []
+        for event in events:
+            if event.__class__.__name__ == "RequestCreated":
+                created.append(event)
+                continue
+            if created:
+                self.projection.on_requests_created(created)
+                created = []
+            self.publish(event)
+        if created:
+            self.projection.on_requests_created(created)
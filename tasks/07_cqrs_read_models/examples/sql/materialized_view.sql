@@ -3,6 +3,33 @@
 -- ПСО «Юго-Запад»
 -- =====================================================
 
+-- =====================================================
+-- Площадь зоны на эллипсоиде WGS84, км²
+-- Та же формула, что domain/models/geodesy.py (Lab #3):
+--   A = a² (1 − e²) Δλ [F(sin φ2) − F(sin φ1)]
+--   F(s) = s / (2 (1 − e² s²)) + artanh(e s) / (2 e)
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION wgs84_authalic(lat DOUBLE PRECISION)
+RETURNS DOUBLE PRECISION AS $$
+    -- e² = 0.00669437999014, e = 0.0818191908426215
+    SELECT sin(radians(lat)) / (2 * (1 - 0.00669437999014 * sin(radians(lat)) ^ 2))
+         + atanh(0.0818191908426215 * sin(radians(lat))) / (2 * 0.0818191908426215)
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION geodesic_area_km2(
+    lat_min DOUBLE PRECISION,
+    lat_max DOUBLE PRECISION,
+    lon_min DOUBLE PRECISION,
+    lon_max DOUBLE PRECISION
+)
+RETURNS DOUBLE PRECISION AS $$
+    -- a = 6378.137 км
+    SELECT 6378.137 ^ 2 * (1 - 0.00669437999014)
+         * radians(ABS(lon_max - lon_min))
+         * ABS(wgs84_authalic(lat_max) - wgs84_authalic(lat_min))
+$$ LANGUAGE SQL IMMUTABLE PARALLEL SAFE;
+
 -- Создание Materialized View
 CREATE MATERIALIZED VIEW request_view AS
 SELECT 
@@ -18,7 +45,7 @@ SELECT
     -- Данные зоны (денормализовано)
     z.name AS zone_name,
     -- Вычисление площади зоны в км²
-    ABS((z.lat_max - z.lat_min) * (z.lon_max - z.lon_min)) * 12365.0 AS zone_area_km2,
+    geodesic_area_km2(z.lat_min, z.lat_max, z.lon_min, z.lon_max) AS zone_area_km2,
     
     -- Данные группы (денормализовано)
     r.assigned_group_id,